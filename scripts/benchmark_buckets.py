@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the rate limiter token bucket (homematicip.connection.buckets).
+
+Starts N concurrent callers against a bucket and reports the p50/p99 wait time
+and the lateness of each grant. Lateness is the time between the moment a token
+was available for the caller (given FIFO order) and the moment it was granted.
+
+Usage:
+    python scripts/benchmark_buckets.py [--callers 100] [--tokens 10] [--fill-rate 0.01]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from homematicip.connection.buckets import Buckets  # noqa: E402
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def run(callers: int, tokens: int, fill_rate: float) -> None:
+    bucket = Buckets(tokens=tokens, fill_rate=fill_rate)
+    start = time.monotonic()
+    granted: list[float] = []
+
+    async def caller():
+        await bucket.wait_and_take(timeout=callers * fill_rate + 10)
+        granted.append(time.monotonic() - start)
+
+    await asyncio.gather(*(caller() for _ in range(callers)))
+
+    waits = sorted(granted)
+    # in FIFO order the k-th grant is possible once (k - tokens + 1) tokens were refilled
+    lateness = [max(0.0, w - max(0, k - tokens + 1) * fill_rate) for k, w in enumerate(waits)]
+
+    print(f"callers={callers} tokens={tokens} fill_rate={fill_rate}s/token")
+    print(f"total runtime        : {waits[-1] * 1000:8.2f} ms")
+    print(f"wait p50 / p99       : {percentile(waits, 50) * 1000:8.2f} ms / {percentile(waits, 99) * 1000:8.2f} ms")
+    print(
+        f"lateness p50 / p99   : {percentile(lateness, 50) * 1000:8.2f} ms / "
+        f"{percentile(lateness, 99) * 1000:8.2f} ms (mean {statistics.mean(lateness) * 1000:.2f} ms)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--callers", type=int, default=100)
+    parser.add_argument("--tokens", type=int, default=10)
+    parser.add_argument("--fill-rate", type=float, default=0.01, help="seconds per token")
+    args = parser.parse_args()
+    asyncio.run(run(args.callers, args.tokens, args.fill_rate))
+
+
+if __name__ == "__main__":
+    main()
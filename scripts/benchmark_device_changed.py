@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark for websocket DEVICE_CHANGED events of multi-channel devices.
+
+Applies DEVICE_CHANGED events which toggle one channel of a DIN rail switch actuator with 4 channels
+(HmIP-DRSI4) and of a floor terminal block with 12 channels (HmIP-FALMOT-C12) from the demo home and
+reports the best time per event of --repeat rounds. Every event is measured with the current
+load_functionalChannels, which skips the unchanged channels, and with the former one, which parsed
+every channel again and searched the channel list for each of them.
+
+Usage:
+    python scripts/benchmark_device_changed.py [--events 2000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import copy
+import time
+from collections import Counter
+
+from large_home import device_changed_event, load_demo_home
+
+from homematicip.async_home import AsyncHome
+from homematicip.device import BaseDevice
+
+# device id, channel index, attribute and the two values the events alternate between
+DEVICES = {
+    "DIN rail switch (HmIP-DRSI4)": ("3014F7110000000000005521", "1", "on", (True, False)),
+    "floor terminal block (HmIP-FALMOT-C12)": (
+        "3014F7110000000000000049", "1", "valveState", ("ADAPTION_DONE", "ADAPTION_IN_PROGRESS")
+    ),
+}
+
+
+def previous_load_functionalChannels(self, groups, channels):
+    """load_functionalChannels before unchanged channels were skipped."""
+    channels_changed = False
+    for channel in self._rawJSONData["functionalChannels"].values():
+        items = [ch for ch in self.functionalChannels if ch.index == channel["index"]]
+        fc = items[0] if items else None
+        if fc is not None:
+            if fc.update_from_json(channel, groups):
+                channels_changed = True
+        else:
+            fc = self._parse_functionalChannel(channel, groups)
+            channels.append(fc)
+            self.functionalChannels.append(fc)
+            channels_changed = True
+    self.functionalChannelCount = Counter(x.functionalChannelType for x in self.functionalChannels)
+    if channels_changed:
+        self._record_changes(frozenset({"functionalChannels"}), merge=True)
+
+
+def events_for(state: dict, device_id: str, channel: str, attribute: str, values: tuple, count: int) -> list[str]:
+    """DEVICE_CHANGED events which alternate the value of one attribute of one channel."""
+    events = []
+    for i in range(count):
+        device = copy.deepcopy(state["devices"][device_id])
+        device["functionalChannels"][channel][attribute] = values[i % 2]
+        events.append(device_changed_event(device))
+    return events
+
+
+async def run(home: AsyncHome, events: list[str]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        await home._ws_on_message(event)
+    return (time.perf_counter() - start) / len(events)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    state = load_demo_home()
+    home = AsyncHome()
+    home.update_home(copy.deepcopy(state))
+    current = BaseDevice.load_functionalChannels
+
+    for label, (device_id, channel, attribute, values) in DEVICES.items():
+        events = events_for(state, device_id, channel, attribute, values, args.events)
+        channel_count = len(state["devices"][device_id]["functionalChannels"])
+        print(f"{label}, {channel_count} channels")
+        for name, method in (
+            ("skip unchanged channels", current),
+            ("parse every channel", previous_load_functionalChannels),
+        ):
+            BaseDevice.load_functionalChannels = method
+            best = min(asyncio.run(run(home, events)) for _ in range(args.repeat))
+            print(f"  {name:<38}: {best * 1e6:9.2f} us/event")
+        BaseDevice.load_functionalChannels = current
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the from_json parsers generated from the _fields tables (homematicip.base.schema).
+
+Parses homematicip_demo/json_data/home.json with update_home(clear_config=True), i.e. every device
+with its functional channels, every group and the home, and reports the best time of --repeat
+rounds. With --against the same measurement runs on the src tree of a git revision in a subprocess,
+e.g. the last commit before the field tables, to compare with the hand-written parsers they
+replaced.
+
+Usage:
+    python scripts/benchmark_from_json.py [--repeat 200] [--against 60ee4a6]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+DEMO_HOME = os.path.join(ROOT, "homematicip_demo", "json_data", "home.json")
+
+
+def measure(src: str, repeat: int) -> float:
+    """Return the best time to parse the demo home with the homematicip package in src."""
+    sys.path.insert(0, src)
+    import logging
+
+    from homematicip.async_home import AsyncHome
+
+    # the demo devices log warnings for unsupported features, keep the benchmark output readable
+    logging.disable(logging.WARNING)
+    with open(DEMO_HOME, encoding="UTF-8") as f:
+        state = json.load(f)
+    home = AsyncHome()
+    return min(_timed(lambda: home.update_home(state, clear_config=True)) for _ in range(repeat))
+
+
+def measure_revision(revision: str, repeat: int) -> float:
+    """Export src of revision with git archive and run measure on it in a new interpreter."""
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, "src.tar")
+        subprocess.run(["git", "-C", ROOT, "archive", "-o", archive, revision, "src"], check=True)
+        with tarfile.open(archive) as tar:
+            tar.extractall(tmp, filter="data")
+        result = subprocess.run(
+            [sys.executable, __file__, "--src", os.path.join(tmp, "src"), "--repeat", str(repeat), "--raw"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--against", metavar="REVISION", help="also measure the src tree of this git revision")
+    parser.add_argument("--src", default=os.path.join(ROOT, "src"), help=argparse.SUPPRESS)
+    parser.add_argument("--raw", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.raw:
+        print(measure(args.src, args.repeat))
+        return
+
+    results = {"working tree": measure(args.src, args.repeat)}
+    if args.against:
+        results[args.against] = measure_revision(args.against, args.repeat)
+    for label, best in results.items():
+        print(f"{'parse demo home, ' + label:<40}: {best * 1000:9.2f} ms best of {args.repeat}")
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the id indexes of AsyncHome (search_device_by_id, search_channel, ...).
+
+Builds a synthetic home with N devices and measures a full update_home, a refresh of
+the same state (full and incremental), the search methods and websocket DEVICE_CHANGED handling. Run with
+--linear to measure the former linear searches for comparison and with --lazy to keep devices as raw json
+until they are accessed (AsyncHome.lazy_materialization).
+
+Usage:
+    python scripts/benchmark_home_index.py [--devices 2000] [--linear] [--lazy]
+"""
+
+import argparse
+import asyncio
+import copy
+import gc
+import tracemalloc
+
+from large_home import build_large_home, device_changed_event, timed
+
+from homematicip.async_home import AsyncHome
+
+
+class LinearSearchHome(AsyncHome):
+    """AsyncHome with the linear searches used before the indexes were introduced."""
+
+    def search_device_by_id(self, deviceID):
+        for d in self.devices:
+            if d.id == deviceID:
+                return d
+        return None
+
+    def search_group_by_id(self, groupID):
+        for g in self.groups:
+            if g.id == groupID:
+                return g
+        return None
+
+    def search_channel(self, device_id, channel_index):
+        found_device = [d for d in self.devices if d.id == device_id]
+        d = found_device[0] if found_device else None
+        if d is not None:
+            found_channel = [ch for ch in d.functionalChannels if ch.index == channel_index]
+            return found_channel[0] if found_channel else None
+        return None
+
+
+def object_memory(home_type, lazy: bool, payload: dict) -> int:
+    """Return the memory allocated by an initial update_home of a fresh home, without the payload itself."""
+    home = home_type()
+    home.lazy_materialization = lazy
+    gc.collect()
+    tracemalloc.start()
+    home.update_home(payload)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--linear", action="store_true", help="use the former linear searches")
+    parser.add_argument("--lazy", action="store_true", help="materialize devices and channels on first access")
+    args = parser.parse_args()
+
+    state = build_large_home(args.devices)
+    home = LinearSearchHome() if args.linear else AsyncHome()
+    home.lazy_materialization = args.lazy
+    device_ids = list(state["devices"])
+    print(f"devices={len(device_ids)} groups={len(state['groups'])} linear={args.linear} lazy={args.lazy}")
+
+    # every update gets a fresh payload like a download would, copying it is not part of the measurement
+    payloads = [copy.deepcopy(state) for _ in range(4)]
+    timed("update_home (initial)", lambda: home.update_home(payloads[0]))
+    print(f"{'memory of the objects':<40}: {object_memory(type(home), args.lazy, payloads[3]) / 1024 / 1024:9.2f} MB")
+    timed("update_home (refresh)", lambda: home.update_home(payloads[1]))
+    timed("update_home (incremental refresh)", lambda: home.update_home(payloads[2], incremental=True))
+    timed("search_device_by_id", lambda: [home.search_device_by_id(i) for i in device_ids], len(device_ids))
+    timed("search_channel", lambda: [home.search_channel(i, 1) for i in device_ids], len(device_ids))
+
+    events = [device_changed_event(state["devices"][i]) for i in device_ids[-200:]]
+
+    def dispatch():
+        loop = asyncio.new_event_loop()
+        for event in events:
+            loop.run_until_complete(home._ws_on_message(event))
+        loop.close()
+
+    timed("DEVICE_CHANGED event", dispatch, len(events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the json codecs (homematicip.base.json_codec).
+
+Decodes and encodes homematicip_demo/json_data/home.json (the body of home/getCurrentState) and a
+DEVICE_CHANGED websocket frame of one of its devices with every installed backend and reports the best
+time of --repeat rounds. Backends which are not installed are listed as such.
+
+Usage:
+    python scripts/benchmark_json_codecs.py [--repeat 50]
+"""
+
+import argparse
+import json
+import time
+
+from large_home import DEMO_HOME, device_changed_event
+
+from homematicip.base.json_codec import JSON_CODECS, default_json_codec, get_json_codec
+
+
+def best(func, arg, repeat: int, number: int) -> float:
+    """the best time of a call of func(arg) of repeat rounds of number calls"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        times.append((time.perf_counter() - start) / number)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with open(DEMO_HOME, "rb") as file:
+        content = file.read()
+    state = json.loads(content)
+    frame = device_changed_event(next(iter(state["devices"].values())))
+    print(f"home.json: {len(content) / 1024:.0f} KB, websocket frame: {len(frame)} bytes")
+    print(f"default codec: {default_json_codec().name}")
+
+    print(f"{'codec':<10}{'decode state':>16}{'encode state':>16}{'decode frame':>16}")
+    for name in JSON_CODECS:
+        try:
+            codec = get_json_codec(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>16}")
+            continue
+        print(
+            f"{name:<10}"
+            f"{best(codec.loads, content, args.repeat, 5) * 1e3:13.2f} ms"
+            f"{best(codec.dumps, state, args.repeat, 5) * 1e3:13.2f} ms"
+            f"{best(codec.loads, frame, args.repeat, 200) * 1e6:13.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the event loop blocking of AsyncHome.get_current_state_async.
+
+A ticker task sleeps 1 ms in a loop and records how late it wakes up while the state of a
+synthetic home with N devices is decoded and parsed. The longest delay is the time the loop
+was blocked, e.g. for websocket heartbeats. The download is faked by a response body, so only
+decoding and parsing are measured; with parse_state_off_loop=False the body is decoded on the
+loop like httpx does.
+
+Usage:
+    python scripts/benchmark_loop_blocking.py [--devices 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from large_home import build_large_home
+
+from homematicip.async_home import AsyncHome
+from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.rest_connection import RestResult
+
+
+def create_home(content: bytes, off_loop: bool) -> AsyncHome:
+    home = AsyncHome()
+    home._connection_context = ConnectionContext(accesspoint_id="3014F711A000000000000000")
+    home.parse_state_off_loop = off_loop
+
+    async def download(path, body=None, custom_header=None, decode_json=True):
+        if decode_json:
+            return RestResult(status=200, json=json.loads(content))
+        return RestResult(status=200, content=content)
+
+    home._rest_call_async = download
+    return home
+
+
+async def measure(label: str, coro) -> None:
+    delays: list[float] = []
+    done = False
+
+    async def ticker():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            delays.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await coro
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+    print(f"{label:<32}: {elapsed * 1000:8.2f} ms total, loop blocked up to {max(delays) * 1000:8.2f} ms")
+
+
+async def run(device_count: int) -> None:
+    content = json.dumps(build_large_home(device_count)).encode()
+    print(f"devices={device_count} payload={len(content) / 1024:.0f} KB")
+    for off_loop in (False, True):
+        home = create_home(content, off_loop)
+        mode = "off loop" if off_loop else "on loop"
+        await measure(f"initial load ({mode})", home.get_current_state_async())
+        await measure(f"refresh ({mode})", home.get_current_state_async())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(run(args.devices))
+
+
+if __name__ == "__main__":
+    main()
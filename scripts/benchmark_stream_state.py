@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark for AsyncHome.stream_current_state.
+
+Feeds the home/getCurrentState body of a synthetic home with N devices in chunks, like httpx receives
+it, to an empty AsyncHome and reports the best time of --repeat rounds and the tracemalloc peak until
+the home is built: buffered, where the chunks are joined to the whole body which is then decoded and
+parsed with update_home, and streamed, where every entry is applied as soon as it is complete. The
+download itself is not part of the measurement.
+
+Usage:
+    python scripts/benchmark_stream_state.py [--devices 2000] [--chunk-size 16384] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from large_home import build_large_home
+
+from homematicip.async_home import AsyncHome
+from homematicip.base.json_codec import JsonCodec
+from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.rest_connection import RestResult
+
+
+def chunks(content: bytes, chunk_size: int):
+    return [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+
+async def download(home: AsyncHome, body: list[bytes], stream: bool) -> None:
+    async def rest_call(path, body_=None, custom_header=None, decode_json=True, on_chunk=None):
+        if on_chunk is not None:
+            for chunk in body:
+                on_chunk(chunk)
+            return RestResult(200)
+        content = b"".join(body)
+        if not decode_json:
+            return RestResult(200, content=content)
+        return RestResult(200, json=json.loads(content))
+
+    home._rest_call_async = rest_call
+    home.stream_current_state = stream
+    await home.get_current_state_async()
+
+
+def new_home() -> AsyncHome:
+    home = AsyncHome()
+    home.init_with_context(ConnectionContext(json_codec=JsonCodec()), use_rate_limiting=False)
+    return home
+
+
+def elapsed(body: list[bytes], stream: bool) -> float:
+    home = new_home()
+    start = time.perf_counter()
+    asyncio.run(download(home, body, stream))
+    return time.perf_counter() - start
+
+
+def peak_memory(body: list[bytes], stream: bool) -> int:
+    home = new_home()
+    tracemalloc.start()
+    asyncio.run(download(home, body, stream))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=16384)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    content = json.dumps(build_large_home(args.devices)).encode()
+    body = chunks(content, args.chunk_size)
+    del content
+    print(f"devices={args.devices} body={sum(map(len, body)) / 1024:.0f} KB chunks={len(body)}")
+    for label, stream in (("buffered + update_home", False), ("stream_current_state", True)):
+        best = min(elapsed(body, stream) for _ in range(args.repeat))
+        peak = peak_memory(body, stream)
+        print(f"{label:<26}: {best * 1000:9.2f} ms, peak {peak / 1024 / 1024:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the warm start of AsyncHome from a state snapshot (AsyncHome.restore_snapshot_async).
+
+Writes the snapshot of a synthetic home with N devices and measures how long a fresh AsyncHome
+needs until it can serve reads: restored from the snapshot, with and without lazy_materialization,
+compared to decoding the downloaded json body and parsing it with update_home (cold start without
+the download itself).
+
+Usage:
+    python scripts/benchmark_warm_start.py [--devices 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+from large_home import build_large_home
+
+from homematicip.async_home import AsyncHome
+from homematicip.state_snapshot import dump_state, write_snapshot
+
+
+async def restore(path: str, lazy: bool) -> float:
+    home = AsyncHome()
+    home.snapshot_path = path
+    home.lazy_materialization = lazy
+    start = time.perf_counter()
+    assert await home.restore_snapshot_async(reconcile=False)
+    return time.perf_counter() - start
+
+
+def cold_start(content: bytes, lazy: bool) -> float:
+    home = AsyncHome()
+    home.lazy_materialization = lazy
+    start = time.perf_counter()
+    home.update_home(json.loads(content))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--devices", type=int, default=2000)
+    args = parser.parse_args()
+
+    state = build_large_home(args.devices)
+    content = json.dumps(state).encode()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "state.snapshot")
+        write_snapshot(path, dump_state(state))
+        size = os.path.getsize(path)
+        print(f"devices={args.devices} json={len(content) / 1024:.0f} KB snapshot={size / 1024:.0f} KB")
+        for lazy in (False, True):
+            mode = "lazy" if lazy else "eager"
+            cold = min(cold_start(content, lazy) for _ in range(5))
+            warm = min(asyncio.run(restore(path, lazy)) for _ in range(5))
+            print(f"{'json + update_home (' + mode + ')':<40}: {cold * 1000:9.2f} ms")
+            print(f"{'restore_snapshot_async (' + mode + ')':<40}: {warm * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Helpers for the benchmark scripts: build a synthetic large home state from the demo home.
+
+The devices of homematicip_demo/json_data/home.json are cloned with new ids until the requested
+number of devices is reached. Group memberships of the cloned channels are kept, and the groups
+list the cloned channels as members like the cloud does.
+"""
+
+import copy
+import json
+import logging
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+DEMO_HOME = os.path.join(ROOT, "homematicip_demo", "json_data", "home.json")
+
+# the cloned demo devices log warnings for unsupported features, keep the benchmark output readable
+logging.disable(logging.WARNING)
+
+
+def load_demo_home() -> dict:
+    with open(DEMO_HOME, encoding="UTF-8") as f:
+        return json.load(f)
+
+
+def build_large_home(device_count: int = 2000) -> dict:
+    """Return a getCurrentState payload with device_count devices."""
+    state = load_demo_home()
+    templates = list(state["devices"].values())
+
+    # (template device id, channel index) -> groups listing that channel as member
+    members: dict[tuple[str, int], list[dict]] = {}
+    for group in state["groups"].values():
+        for ref in group.get("channels", []):
+            members.setdefault((ref["deviceId"], ref["channelIndex"]), []).append(group)
+
+    i = 0
+    while len(state["devices"]) < device_count:
+        template = templates[i % len(templates)]
+        clone = copy.deepcopy(template)
+        clone["id"] = f"3014F711{i:016X}"
+        for channel in clone["functionalChannels"].values():
+            channel["deviceId"] = clone["id"]
+            for group in members.get((template["id"], channel["index"]), []):
+                group["channels"].append({"channelIndex": channel["index"], "deviceId": clone["id"]})
+        state["devices"][clone["id"]] = clone
+        i += 1
+    return state
+
+
+def device_changed_event(device: dict) -> str:
+    return json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": device}}})
+
+
+def timed(label: str, func, ops: int = 1):
+    """Run func once and print the elapsed time in total and per operation."""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}: {elapsed * 1000:9.2f} ms total, {elapsed / ops * 1e6:9.2f} us/op")
+    return elapsed
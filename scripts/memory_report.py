@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Memory report per object type, measured with tracemalloc.
+
+Every device of homematicip_demo/json_data/home.json is parsed --copies times (from a fresh copy
+of its json like after a download, including its functional channels). The memory still allocated
+afterwards, divided by the number of copies, is reported per device type together with the share
+of its channels. Run with --release-raw-json to drop the retained raw json after parsing like
+AsyncHome(retain_raw_json=False) does.
+
+Usage:
+    python scripts/memory_report.py [--copies 200] [--release-raw-json]
+"""
+
+import argparse
+import copy
+import gc
+import tracemalloc
+from collections import defaultdict
+
+from large_home import load_demo_home
+
+from homematicip.async_home import AsyncHome
+
+
+def measure(home: AsyncHome, raw: dict, copies: int, release_raw_json: bool) -> tuple[int, int, int]:
+    """Return the bytes per device including its channels, the bytes of the channels and the channel count."""
+    gc.collect()
+    start = tracemalloc.take_snapshot()
+    templates = [copy.deepcopy(raw) for _ in range(copies)]
+    devices = []
+    for js in templates:
+        d = home._parse_device(js)
+        d.load_functionalChannels([], [])
+        if release_raw_json:
+            d.release_raw_json()
+        devices.append(d)
+    del templates, js
+    gc.collect()
+    end = tracemalloc.take_snapshot()
+
+    total = sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+    channel_share = 0
+    channels = devices[0].functionalChannels
+    if channels:
+        # measure the channels alone by dropping them and looking at what is freed
+        before = tracemalloc.get_traced_memory()[0]
+        for d in devices:
+            d.functionalChannels = []
+        gc.collect()
+        channel_share = before - tracemalloc.get_traced_memory()[0]
+    return total // copies, channel_share // copies, len(channels)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--release-raw-json", action="store_true", help="drop the retained raw json after parsing")
+    args = parser.parse_args()
+
+    home = AsyncHome()
+    by_type: dict[str, dict] = {}
+    for raw in load_demo_home()["devices"].values():
+        by_type.setdefault(raw["type"], raw)
+
+    tracemalloc.start()
+    rows = []
+    for device_type, raw in sorted(by_type.items()):
+        per_device, per_channels, channel_count = measure(home, raw, args.copies, args.release_raw_json)
+        rows.append((device_type, per_device, per_channels, channel_count))
+    tracemalloc.stop()
+
+    print(f"copies={args.copies} release_raw_json={args.release_raw_json}")
+    print(f"{'device type':<50} {'bytes/device':>12} {'channels':>8} {'bytes/channel':>13}")
+    totals = defaultdict(int)
+    for device_type, per_device, per_channels, channel_count in rows:
+        per_channel = per_channels // channel_count if channel_count else 0
+        print(f"{device_type:<50} {per_device:>12} {channel_count:>8} {per_channel:>13}")
+        totals["device"] += per_device
+        totals["channels"] += channel_count
+        totals["channel_bytes"] += per_channels
+    print(
+        f"{'average':<50} {totals['device'] // len(rows):>12} "
+        f"{totals['channels'] / len(rows):>8.1f} {totals['channel_bytes'] // max(1, totals['channels']):>13}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,21 @@
 import asyncio
-import json
+import contextlib
+import time
 import warnings
 from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+import aiohttp
 import httpx
 
 from homematicip.access_point_update_state import AccessPointUpdateState
 from homematicip.base.channel_event import ChannelEvent
 from homematicip.base.code_state_event import CodeStateEvent
+from homematicip.base.enums import UNKNOWN_VALUES
+from homematicip.base.event_router import EventRouter, RoutedEvent, Subscription
+from homematicip.base.helpers import IdLookup
+from homematicip.base.json_codec import JsonCodec, default_json_codec
 from homematicip.class_maps import *
 from homematicip.client import Client
 from homematicip.connection.client_characteristics_builder import (
@@ -18,12 +26,17 @@ from homematicip.connection.connection_context import (
     ConnectionContextBuilder,
 )
 from homematicip.connection.connection_factory import ConnectionFactory
+from homematicip.connection.dispatch_queue import DispatchStats
+from homematicip.connection.offline_queue import OfflineCommandQueue
+from homematicip.connection.rest_connection import RestResult
 from homematicip.connection.websocket_handler import WebsocketHandler
+from homematicip.connection.websocket_message import WebsocketMessage
 from homematicip.device import *
 from homematicip.EventHook import *
 from homematicip.exceptions.connection_exceptions import (
     HmipAuthenticationError,
     HmipConnectionError,
+    HmipThrottlingError,
 )
 from homematicip.exceptions.home_exceptions import HomeNotInitializedError
 from homematicip.group import *
@@ -31,10 +44,230 @@ from homematicip.location import Location
 from homematicip.oauth_otk import OAuthOTK
 from homematicip.rule import *
 from homematicip.securityEvent import *
+from homematicip.state_snapshot import dump_state, read_snapshot, write_snapshot
+from homematicip.state_stream import StateStreamDecoder
 from homematicip.weather import Weather
 
+if TYPE_CHECKING:
+    import os
+    from concurrent.futures import Executor
+
 LOGGER = logging.getLogger(__name__)
 
+#: Events which carry the attributes they changed in changed_fields.
+_CHANGED_EVENTS = frozenset(
+    (EventType.DEVICE_CHANGED, EventType.GROUP_CHANGED, EventType.CLIENT_CHANGED, EventType.HOME_CHANGED)
+)
+#: The entity whose complete state each coalescable event carries.
+_COALESCING_KEYS = {
+    "DEVICE_CHANGED": "device",
+    "GROUP_CHANGED": "group",
+    "CLIENT_CHANGED": "client",
+}
+
+
+def _coalescing_key(event: dict) -> tuple | None:
+    """returns the key of the entity a change replaces completely, None if the event can't be coalesced"""
+    event_type = event.get("pushEventType")
+    if event_type == "HOME_CHANGED":
+        return (event_type,)
+    kind = _COALESCING_KEYS.get(event_type)
+    if kind is None:
+        return None
+    return event_type, event[kind]["id"]
+
+
+#: Events which are routed by their own branch of _ws_on_message.
+_SELF_ROUTED_EVENTS = frozenset((EventType.DEVICE_CHANNEL_EVENT, EventType.DEVICE_CODE_STATE_EVENT))
+
+
+class _IdIndex:
+    """Dict backed id -> object index over one of the object lists of the home.
+
+    The index follows the list it was built for. If that list is replaced or changed without
+    calling added()/removed(), or an indexed object changed its id, the next lookup rebuilds it."""
+
+    __slots__ = ("_items", "_count", "_by_id")
+
+    def __init__(self):
+        self._items: list | None = None
+        self._count = 0
+        self._by_id: dict = {}
+
+    def rebuild(self, items: list):
+        # in place, so IdLookup views handed out by lookup() stay valid.
+        # The first of several objects with the same id wins like in a linear search.
+        self._by_id.clear()
+        for x in items:
+            self._by_id.setdefault(x.id, x)
+        self._items = items
+        self._count = len(items)
+
+    def lookup(self, items: list) -> IdLookup:
+        """Return a live IdLookup view of items to pass to the from_json methods."""
+        if items is not self._items or len(items) != self._count:
+            self.rebuild(items)
+        return IdLookup(self._by_id)
+
+    def get(self, items: list, key):
+        if items is not self._items or len(items) != self._count:
+            self.rebuild(items)
+        obj = self._by_id.get(key)
+        if obj is not None and obj.id != key:
+            self.rebuild(items)
+            obj = self._by_id.get(key)
+        return obj
+
+    def added(self, items: list, obj):
+        """Call after obj was appended to items."""
+        if items is self._items and len(items) == self._count + 1:
+            self._by_id.setdefault(obj.id, obj)
+            self._count += 1
+
+    def removed(self, items: list, obj):
+        """Call after obj was removed from items."""
+        if items is self._items and len(items) == self._count - 1:
+            if self._by_id.get(obj.id) is obj:
+                del self._by_id[obj.id]
+            self._count -= 1
+
+    def clear(self):
+        self._items = None
+        self._count = 0
+        self._by_id.clear()
+
+
+class _MaterializingLookup(IdLookup):
+    """Device lookup of a home with lazy_materialization. Pending devices are materialized when they are looked up."""
+
+    __slots__ = ("_home",)
+
+    def __init__(self, lookup: IdLookup, home: "AsyncHome"):
+        super().__init__(lookup._by_id)
+        self._home = home
+
+    def __iter__(self):
+        return iter(self._home.devices)
+
+    def __len__(self):
+        return len(self._by_id) + len(self._home._pending_devices)
+
+    def get(self, id_, default=None):
+        obj = self._by_id.get(id_)
+        if obj is None and id_ in self._home._pending_devices:
+            obj = self._home._materialize_device(id_)
+        return default if obj is None else obj
+
+
+@dataclass
+class HomeStateChanges:
+    """The objects an incremental update_home added, re-parsed or removed.
+    The home itself is listed in changed if its own json changed."""
+
+    added: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    #: number of devices, clients and groups which were skipped because their json did not change
+    unchanged: int = 0
+
+
+def _is_unchanged(obj: HomeMaticIPObject, js) -> bool:
+    """Return True if js equals the json obj was parsed from last time.
+
+    The retained raw json serves as fingerprint. A dict compare stops at the first difference and needs
+    no extra memory. The very same dict object could have been modified in place, so it counts as changed."""
+    return js is not obj._rawJSONData and js == obj._rawJSONData
+
+
+def _unchanged_keys(json_state: dict, snapshot: dict) -> set:
+    """Return the (collection, id) keys of snapshot whose raw json equals the one in json_state.
+
+    snapshot maps (collection, id) to the raw json an object was parsed from, the home is stored
+    as ("home", None). Runs in a worker thread, so it only reads the given dicts."""
+    unchanged = set()
+    for key, raw in snapshot.items():
+        collection, id_ = key
+        js = json_state[collection] if id_ is None else json_state[collection].get(id_)
+        if js is not None and js is not raw and js == raw:
+            unchanged.add(key)
+    return unchanged
+
+
+def _decode_state(content: bytes, serialize: bool, codec: JsonCodec) -> tuple[dict, bytes | None]:
+    """Decode a downloaded state and serialize it for the snapshot. Runs in a worker thread."""
+    json_state = codec.loads(content)
+    return json_state, dump_state(json_state) if serialize else None
+
+
+class _StreamedState:
+    """Reads a home/getCurrentState body while it downloads, see AsyncHome.stream_current_state.
+
+    With a home, which has to be empty, devices and clients are built as their entries arrive. Groups link
+    devices, so they wait until all devices were read, and the functional channels, which link groups, are
+    loaded by finish() once the body is complete, like _update_objects does it. Without a home the entries
+    are only collected in json_state."""
+
+    def __init__(self, home: "AsyncHome | None", keep_state: bool):
+        self.home = home
+        self.decoder = StateStreamDecoder()
+        self.held_groups: list[tuple[str, dict]] = []
+        self.meta_groups: list[dict] = []
+        self.devices_done = False
+        #: the top level values which are not streamed, e.g. "home"
+        self.values: dict = {}
+        #: the complete state if keep_state is set or there is no home to build
+        self.json_state: dict | None = {} if keep_state or home is None else None
+
+    def feed(self, chunk: bytes):
+        self._apply(self.decoder.feed(chunk))
+
+    def finish(self) -> dict:
+        """applies the rest of the body, creates the meta groups and loads the functional channels.
+        Returns the json of the home."""
+        self._apply(self.decoder.close())
+        missing = {"devices", "clients", "groups", "home"} - self.decoder.completed
+        if missing:
+            raise ValueError(f"The current state has no {', '.join(sorted(missing))}")
+        if self.home is not None:
+            self.home._add_meta_groups(self.meta_groups, None)
+            self.home._load_functionalChannels()
+        return self.values["home"]
+
+    def _apply(self, items: list):
+        for key, id_, value in items:
+            if self.json_state is not None:
+                if id_ is None:
+                    self.json_state[key] = value
+                else:
+                    self.json_state.setdefault(key, {})[id_] = value
+            if id_ is None:
+                self.values[key] = value
+            elif self.home is not None:
+                self._build(key, id_, value)
+
+        if self.home is not None and not self.devices_done and "devices" in self.decoder.completed:
+            self.devices_done = True
+            for id_, raw in self.held_groups:
+                self.home._update_group_json(id_, raw, None, _is_unchanged, self.meta_groups)
+            self.held_groups.clear()
+
+    def _build(self, key: str, id_: str, value: dict):
+        home = self.home
+        if key == "devices":
+            try:
+                home._update_device_json(id_, value, None, _is_unchanged, None)
+            except Exception as err:
+                LOGGER.exception(
+                    "An exception in _get_devices (device-id %s) of type %s occurred", id_, type(err).__name__
+                )
+        elif key == "clients":
+            home._update_client_json(id_, value, None, _is_unchanged)
+        elif key == "groups":
+            if self.devices_done:
+                home._update_group_json(id_, value, None, _is_unchanged, self.meta_groups)
+            else:
+                self.held_groups.append((id_, value))
+
 
 class AsyncHome(HomeMaticIPObject):
     """this class represents the 'Home' of the homematic ip"""
@@ -50,6 +283,7 @@ class AsyncHome(HomeMaticIPObject):
 
         # Connection Stuff
         self._connection_context: ConnectionContext | None = None
+        self._json_codec: JsonCodec | None = None
         self._websocket_client: WebsocketHandler | None = None
 
         self._auth_token: str | None = None
@@ -58,6 +292,16 @@ class AsyncHome(HomeMaticIPObject):
         self._on_create = []
         self._on_channel_event = []
         self.onEvent = EventHook()
+        #: Routes the websocket events to the handlers subscribed to their device, channel, group, type or class.
+        self.event_router = EventRouter()
+        #: Seconds the changes of a device, group, client or the home are held back so that a burst of them
+        #: is applied once with the newest state. 0 applies every change at once.
+        self.event_coalescing_window: float = 0.0
+        #: Number of changes replaced by a newer change of the same entity within the window.
+        self.coalesced_event_count: int = 0
+        # (event type, id) -> [newest event, number of replaced events]
+        self._deferred_events: dict[tuple, list] = {}
+        self._deferred_events_timer: asyncio.TimerHandle | None = None
 
         # Home Attributes
         self.apExchangeClientId = None
@@ -79,6 +323,11 @@ class AsyncHome(HomeMaticIPObject):
         self.weather = None
         self.accessPointUpdateStates = {}
 
+        #: Keep devices as raw json until they are accessed and load their channels on first access.
+        self.lazy_materialization: bool = False
+        # id -> raw json of the devices which were not materialized yet
+        self._pending_devices: dict[str, dict] = {}
+
         # collections of all devices, clients, groups, channels and rules
         self.devices = []
         self.clients = []
@@ -87,6 +336,56 @@ class AsyncHome(HomeMaticIPObject):
         self.rules = []
         self.functionalHomes = []
 
+        # id indexes over the collections above
+        self._device_index = _IdIndex()
+        self._client_index = _IdIndex()
+        self._group_index = _IdIndex()
+        self._rule_index = _IdIndex()
+        self._channel_index: dict[tuple[str, int], FunctionalChannel] = {}
+
+        #: Seconds a completed get_current_state_async result is reused by later calls. 0 disables reuse.
+        self.current_state_max_age: float = 0.0
+        self._current_state_task: asyncio.Future | None = None
+        self._current_state_clear_config = False
+        self._last_current_state_time: float | None = None
+
+        #: Default for update_home(incremental=...). Only re-parse objects whose json changed on a refresh.
+        self.incremental_update: bool = False
+        #: The changes found by the last incremental update_home, None if it was a full update.
+        self.last_state_changes: HomeStateChanges | None = None
+        #: Keep the raw json of devices and channels after parsing. Without it an incremental update has
+        #: nothing to compare with and re-parses every device.
+        self.retain_raw_json: bool = True
+        #: Decode and pre-parse the state in get_current_state_async in a worker thread instead of on the loop.
+        self.parse_state_off_loop: bool = False
+        #: Thread pool for parse_state_off_loop. None uses the default executor of the loop.
+        self.state_executor: Executor | None = None
+        #: Read the home/getCurrentState body in chunks in get_current_state_async and decode it while it
+        #: downloads, instead of buffering and decoding the whole body first. The first state is built while
+        #: it downloads, a refresh is applied once the body is complete. See homematicip.state_stream.
+        #: Takes precedence over parse_state_off_loop.
+        self.stream_current_state: bool = False
+
+        #: File of the warm-start snapshot. If set, every get_current_state_async stores the downloaded state
+        #: there and restore_snapshot_async loads it. See homematicip.state_snapshot.
+        self.snapshot_path: str | os.PathLike | None = None
+        #: time.time() at which the state the home holds was downloaded, None before the first state.
+        self.state_timestamp: float | None = None
+        #: True while the home holds a state restored from the snapshot which was not reconciled yet.
+        self.state_from_snapshot: bool = False
+        #: The background refresh started by restore_snapshot_async.
+        self.snapshot_reconcile_task: asyncio.Task | None = None
+
+        #: Keep serving the last known state (or the snapshot) if the cloud can't be reached instead of
+        #: leaving the home empty. Commands are queued in offline_commands meanwhile.
+        self.offline_fallback: bool = False
+        #: True while the last download failed and the home serves an old state. See state_age.
+        self.offline: bool = False
+        #: Commands sent while offline, flushed through the connection after the next successful download.
+        self.offline_commands = OfflineCommandQueue()
+        #: The background flush of offline_commands.
+        self.offline_flush_task: asyncio.Task | None = None
+
     async def init_async(
         self,
         access_point_id: str,
@@ -111,10 +410,32 @@ class AsyncHome(HomeMaticIPObject):
                 DeprecationWarning,
                 stacklevel=2,
             )
-        self._connection_context = await ConnectionContextBuilder.build_context_async(accesspoint_id=access_point_id,
-                                                                                      auth_token=auth_token)
+        try:
+            self._connection_context = await ConnectionContextBuilder.build_context_async(
+                accesspoint_id=access_point_id, auth_token=auth_token
+            )
+        except httpx.HTTPError as err:
+            context = await self._snapshot_context_async(access_point_id, auth_token) if self.offline_fallback else None
+            if context is None:
+                raise
+            LOGGER.warning("Could not look up the cloud urls (%s), using the ones of the state snapshot", err)
+            self._connection_context = context
+        if self._json_codec is not None:
+            self._connection_context.json_codec = self._json_codec
         self._connection = ConnectionFactory.create_connection(self._connection_context, use_rate_limiting)
 
+    async def _snapshot_context_async(self, access_point_id: str, auth_token: str | None) -> ConnectionContext | None:
+        """builds a connection context with the urls stored in the snapshot of the same access point"""
+        if self.snapshot_path is None:
+            return None
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(self.state_executor, read_snapshot, self.snapshot_path)
+        if snapshot is None or snapshot.metadata.get("accesspoint_id") != access_point_id:
+            return None
+        return ConnectionContextBuilder.build_context_with_urls(
+            access_point_id, snapshot.metadata["rest_url"], snapshot.metadata["websocket_url"], auth_token
+        )
+
     def init_with_context(
         self,
         context: ConnectionContext,
@@ -122,9 +443,28 @@ class AsyncHome(HomeMaticIPObject):
         httpx_client_session: httpx.AsyncClient | None = None,
     ):
         self._connection_context = context
+        if self._json_codec is not None:
+            context.json_codec = self._json_codec
         self._connection = ConnectionFactory.create_connection(self._connection_context, use_rate_limiting,
                                                                httpx_client_session)
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        """The json codec of the connection context, used for the rest calls, the home state and the
+        websocket frames. Defaults to the fastest installed backend, see default_json_codec. A codec set
+        before init_async or init_with_context replaces the one of the context."""
+        if self._connection_context is not None:
+            return self._connection_context.json_codec
+        if self._json_codec is None:
+            self._json_codec = default_json_codec()
+        return self._json_codec
+
+    @json_codec.setter
+    def json_codec(self, codec: JsonCodec) -> None:
+        self._json_codec = codec
+        if self._connection_context is not None:
+            self._connection_context.json_codec = codec
+
     def set_auth_token(self, auth_token):
         """Sets the auth token for the connection. This is only necessary, if not already set in init function"""
         if self._connection_context:
@@ -135,9 +475,14 @@ class AsyncHome(HomeMaticIPObject):
     def _clear_configuration(self):
         """Clears all objects from the home"""
         self.devices = []
+        self._pending_devices = {}
         self.clients = []
         self.groups = []
         self.channels = []
+        self._device_index.clear()
+        self._client_index.clear()
+        self._group_index.clear()
+        self._channel_index = {}
 
     def from_json(self, js_home):
         super().from_json(js_home)
@@ -214,13 +559,21 @@ class AsyncHome(HomeMaticIPObject):
             HomeNotInitializedError: if the home is not initialized
             Exception: if the download fails
         """
+        result = await self._download_current_state_async()
+        return result.json
+
+    async def _download_current_state_async(self, decode_json: bool = True,
+                                            on_chunk: Callable[[bytes], None] | None = None) -> RestResult:
         if self._connection_context is None:
             raise HomeNotInitializedError
 
         client_characteristics = ClientCharacteristicsBuilder.get(self._connection_context.accesspoint_id)
-        result = await self._rest_call_async(
-            "home/getCurrentState", client_characteristics
-        )
+        if on_chunk is not None:
+            result = await self._rest_call_async("home/getCurrentState", client_characteristics, on_chunk=on_chunk)
+        else:
+            result = await self._rest_call_async(
+                "home/getCurrentState", client_characteristics, decode_json=decode_json
+            )
 
         if not result.success:
             if result.status == 403:
@@ -231,18 +584,250 @@ class AsyncHome(HomeMaticIPObject):
                 f"Could not get the current configuration. Error: {result.status} {result.status_text}"
             )
 
-        return result.json
+        return result
 
-    async def get_current_state_async(self, clear_config: bool = False):
+    async def get_current_state_async(self, clear_config: bool = False, max_age: float | None = None):
         """downloads the current configuration and parses it into self
 
+        Concurrent calls share a single download and parse: a call made while another one is in flight
+        waits for and returns that result instead of downloading the state again. A call with
+        clear_config=True only joins an in-flight call which clears the config as well.
+
         Args:
             clear_config(bool): if set to true, this function will remove all old objects
             from self.devices, self.client, ... to have a fresh config instead of reparsing them
+            max_age(float): reuse the last completed refresh if it finished less than max_age seconds ago
+            instead of downloading again. Defaults to self.current_state_max_age. Ignored with clear_config
         """
         logger.debug("Run get_current_state_async")
-        json_state = await self.download_configuration_async()
-        return self.update_home(json_state, clear_config)
+        if max_age is None:
+            max_age = self.current_state_max_age
+
+        in_flight = self._current_state_task
+        while in_flight is not None and not in_flight.done():
+            if self._current_state_clear_config or not clear_config:
+                logger.debug("Join in-flight get_current_state_async")
+                return await asyncio.shield(in_flight)
+            # a clearing refresh must not reuse a partial one, wait for it and run our own unless another
+            # caller waiting for the same refresh started a clearing one meanwhile, which is joined then
+            with contextlib.suppress(Exception):
+                await asyncio.shield(in_flight)
+            in_flight = self._current_state_task
+        if (
+            not clear_config
+            and max_age > 0
+            and self._last_current_state_time is not None
+            and time.monotonic() - self._last_current_state_time < max_age
+        ):
+            logger.debug("Reuse current state of the last refresh")
+            return True
+
+        self._current_state_clear_config = clear_config
+        self._current_state_task = asyncio.ensure_future(self._download_and_update_home(clear_config))
+        return await asyncio.shield(self._current_state_task)
+
+    async def _download_and_update_home(self, clear_config: bool):
+        try:
+            if self.stream_current_state:
+                result, serialized = await self._stream_and_update_home(clear_config)
+            elif self.parse_state_off_loop:
+                result, serialized = await self._download_and_update_home_off_loop(clear_config)
+            else:
+                json_state = await self.download_configuration_async()
+                # serialize before update_home, afterwards the objects share the dicts of the state
+                serialized = dump_state(json_state) if self.snapshot_path is not None else None
+                result = self.update_home(json_state, clear_config)
+        except (HmipAuthenticationError, HmipThrottlingError):
+            raise
+        except HmipConnectionError as err:
+            await self._go_offline_async(err)
+            raise
+        self._last_current_state_time = time.monotonic()
+        self.state_timestamp = time.time()
+        self.state_from_snapshot = False
+        self._go_online()
+        if serialized is not None:
+            await self._write_snapshot_async(serialized, self.state_timestamp)
+        return result
+
+    @property
+    def state_age(self) -> float | None:
+        """seconds since the state the home holds was downloaded, None before the first state"""
+        if self.state_timestamp is None:
+            return None
+        return time.time() - self.state_timestamp
+
+    @property
+    def stale(self) -> bool:
+        """True if the home serves an old state: offline or restored from the snapshot and not reconciled yet.
+        Live states are kept up to date by the websocket events."""
+        return self.offline or self.state_from_snapshot
+
+    async def _go_offline_async(self, err: Exception):
+        """switches to offline mode after a failed download if offline_fallback is set and there is a state
+        to serve. An empty home restores the snapshot first."""
+        if not self.offline_fallback or self.offline:
+            return
+        if self.state_timestamp is None and not await self.restore_snapshot_async(reconcile=False):
+            return
+        LOGGER.warning("Cloud not reachable (%s), serving the state of %.0f seconds ago offline", err, self.state_age)
+        self.offline = True
+        self._connection.set_offline_queue(self.offline_commands)
+
+    def _go_online(self):
+        """leaves offline mode after a successful download and flushes the queued commands in the background"""
+        if self.offline:
+            LOGGER.info("Cloud reachable again, leaving offline mode")
+            self.offline = False
+            self._connection.set_offline_queue(None)
+        if len(self.offline_commands) and (self.offline_flush_task is None or self.offline_flush_task.done()):
+            self.offline_flush_task = asyncio.ensure_future(self.offline_commands.flush(self._connection))
+
+    async def _stream_and_update_home(self, clear_config: bool):
+        """downloads the current state in chunks and decodes the devices, clients and groups while the
+        body arrives.
+
+        If the home is empty or clear_config is set, the objects are built on a staging home while the
+        body downloads and adopted once it is complete. Otherwise the decoded entries are applied through
+        update_home once the body is complete, so a download which breaks off leaves the home as it was."""
+        keep_state = self.snapshot_path is not None
+        rebuild = clear_config or not (self._devices or self._pending_devices or self.groups or self.clients)
+        target = None
+        if rebuild:
+            target = AsyncHome(self._connection)
+            target.lazy_materialization = self.lazy_materialization
+        streamed = _StreamedState(target, keep_state)
+
+        await self._download_current_state_async(on_chunk=streamed.feed)
+        js_home = streamed.finish()
+        serialized = dump_state(streamed.json_state) if keep_state else None
+        if not rebuild:
+            return self.update_home(streamed.json_state), serialized
+
+        self._adopt_objects(target)
+        self.last_state_changes = None
+        result = self.update_home_only(js_home, clear_config=True)
+        self._release_raw_json(self._devices)
+        return result, serialized
+
+    async def _download_and_update_home_off_loop(self, clear_config: bool):
+        """downloads the current state, decodes and pre-parses it in self.state_executor and applies it.
+
+        If the home is empty or clear_config is set, all objects are built in the executor on a staging
+        home and adopted in one step. Otherwise the executor finds the objects whose json did not change
+        and only the changed ones are parsed on the loop."""
+        loop = asyncio.get_running_loop()
+        result = await self._download_current_state_async(decode_json=False)
+        json_state, serialized = await loop.run_in_executor(
+            self.state_executor, _decode_state, result.content, self.snapshot_path is not None, self.json_codec
+        )
+
+        if clear_config or not (self._devices or self._pending_devices or self.groups or self.clients):
+            staging = AsyncHome(self._connection)
+            staging.lazy_materialization = self.lazy_materialization
+            await loop.run_in_executor(self.state_executor, staging._update_objects, json_state, None)
+            self._adopt_objects(staging)
+            self.last_state_changes = None
+            result = self.update_home_only(json_state["home"], clear_config=True)
+            self._release_raw_json(self._devices)
+            return result, serialized
+
+        snapshot = self._raw_json_snapshot()
+        unchanged = await loop.run_in_executor(self.state_executor, _unchanged_keys, json_state, snapshot)
+
+        def is_unchanged(obj, js):
+            key = ("home", None) if obj is self else (self._state_collection(obj), obj.id)
+            # an object changed by a websocket event meanwhile no longer holds the compared json
+            return key in unchanged and obj._rawJSONData is snapshot[key]
+
+        return self._apply_state(json_state, False, self.incremental_update, is_unchanged), serialized
+
+    async def _write_snapshot_async(self, serialized: bytes, saved_at: float):
+        """compresses and writes a serialized state to self.snapshot_path in self.state_executor.
+        A failing write is logged, the state itself was applied already."""
+        loop = asyncio.get_running_loop()
+        metadata = {}
+        if self._connection_context is not None and self._connection_context.rest_url is not None:
+            # the urls let init_async start offline if the lookup fails, credentials are never stored
+            metadata = {
+                "accesspoint_id": self._connection_context.accesspoint_id,
+                "rest_url": self._connection_context.rest_url,
+                "websocket_url": self._connection_context.websocket_url,
+            }
+        try:
+            await loop.run_in_executor(
+                self.state_executor, write_snapshot, self.snapshot_path, serialized, saved_at, metadata
+            )
+        except OSError as err:
+            LOGGER.warning("Could not write the state snapshot %s: %s", self.snapshot_path, err)
+
+    async def restore_snapshot_async(self, reconcile: bool = True) -> bool:
+        """restores the state stored in self.snapshot_path by an earlier get_current_state_async.
+
+        The snapshot is read and decoded in self.state_executor and applied through update_home, so the
+        devices, groups and the home can be read right away. Combined with lazy_materialization this takes
+        a few milliseconds even for large homes. state_timestamp tells when the restored state was
+        downloaded and state_from_snapshot is True until a download replaced it.
+
+        Args:
+            reconcile(bool): start a get_current_state_async in the background (snapshot_reconcile_task)
+            which brings the restored objects up to date. Set incremental_update to only re-parse and
+            fire update events for the objects which changed since the snapshot.
+
+        Returns:
+            True if a snapshot was restored, False if there is none or it was written by an incompatible
+            version.
+        """
+        if self.snapshot_path is None:
+            return False
+        loop = asyncio.get_running_loop()
+        snapshot = await loop.run_in_executor(self.state_executor, read_snapshot, self.snapshot_path)
+        if snapshot is None:
+            return False
+
+        self.update_home(snapshot.json_state, clear_config=True)
+        self.state_timestamp = snapshot.saved_at
+        self.state_from_snapshot = True
+        LOGGER.debug("Restored state snapshot taken %.0f seconds ago", snapshot.age)
+        if reconcile:
+            self.snapshot_reconcile_task = asyncio.ensure_future(self._reconcile_snapshot_async())
+        return True
+
+    async def _reconcile_snapshot_async(self):
+        try:
+            await self.get_current_state_async()
+        except Exception as err:
+            LOGGER.warning("Could not reconcile the restored state snapshot: %s", err)
+            return False
+        return True
+
+    def _raw_json_snapshot(self) -> dict:
+        """returns the raw json of the home, its devices, clients and groups keyed by (collection, id)"""
+        snapshot = {("home", None): self._rawJSONData}
+        for collection, items in (("devices", self._devices), ("clients", self.clients), ("groups", self.groups)):
+            for x in items:
+                snapshot[(collection, x.id)] = x._rawJSONData
+        return snapshot
+
+    @staticmethod
+    def _state_collection(obj) -> str:
+        if isinstance(obj, BaseDevice):
+            return "devices"
+        if isinstance(obj, Group):
+            return "groups"
+        return "clients"
+
+    def _adopt_objects(self, staging: "AsyncHome"):
+        """replaces devices, clients, groups and channels by the ones parsed into staging"""
+        self._devices = staging._devices
+        self._pending_devices = staging._pending_devices
+        self.clients = staging.clients
+        self.groups = staging.groups
+        self._channels = staging._channels
+        self._device_index = staging._device_index
+        self._client_index = staging._client_index
+        self._group_index = staging._group_index
+        self._channel_index = staging._channel_index
 
     async def wait_for_websocket_connection_async(
         self,
@@ -379,7 +964,7 @@ class AsyncHome(HomeMaticIPObject):
             await asyncio.sleep(delay)
             delay = min(delay * 2, max_delay)
 
-    def update_home(self, json_state, clear_config: bool = False):
+    def update_home(self, json_state, clear_config: bool = False, incremental: bool | None = None):
         """parse a given json configuration into self.
         This will update the whole home including devices, clients and groups.
 
@@ -387,19 +972,54 @@ class AsyncHome(HomeMaticIPObject):
             json_state(dict): the json configuration as dictionary
             clear_config(bool): if set to true, this function will remove all old objects
             from self.devices, self.client, ... to have a fresh config instead of reparsing them
+            incremental(bool): only re-parse devices, clients, groups and the home if their json differs from
+            the json they were parsed from last time. The update, create and remove events are fired for
+            exactly these objects and the changes are stored in self.last_state_changes.
+            Defaults to self.incremental_update and is ignored if clear_config is set.
         """
 
+        if incremental is None:
+            incremental = self.incremental_update
+        return self._apply_state(json_state, clear_config, incremental, _is_unchanged if incremental else None)
+
+    def _apply_state(self, json_state, clear_config: bool, incremental: bool, is_unchanged: Callable | None):
+        """parses json_state into self. Objects for which is_unchanged(obj, js) is true are skipped.
+        The changes are stored and their events fired only if incremental is set."""
         if clear_config:
             self._clear_configuration()
+        changes = None
+        if is_unchanged is not None and not clear_config:
+            changes = HomeStateChanges()
+            self._update_objects(json_state, changes, is_unchanged)
+        else:
+            self._update_objects(json_state, None)
+
+        return self._apply_home_json(json_state["home"], clear_config, incremental, is_unchanged, changes)
+
+    def _apply_home_json(self, js_home, clear_config: bool, incremental: bool, is_unchanged: Callable | None,
+                         changes: HomeStateChanges | None):
+        """the last step of _apply_state: parses the home itself and fires the events of the changes"""
+        if changes is None:
+            self.last_state_changes = None
+            result = self.update_home_only(js_home, clear_config)
+            self._release_raw_json(self._devices)
+            return result
+
+        if not is_unchanged(self, js_home):
+            self.update_home_only(js_home)
+            changes.changed.append(self)
+        self.last_state_changes = changes if incremental else None
+        if incremental:
+            self._fire_state_changes(changes)
+        self._release_raw_json(self._devices)
+        return True
 
-        self._get_devices(json_state)
-        self._get_clients(json_state)
-        self._get_groups(json_state)
-        self._load_functionalChannels()
-
-        js_home = json_state["home"]
-
-        return self.update_home_only(js_home, clear_config)
+    def _update_objects(self, json_state, changes: HomeStateChanges | None, is_unchanged: Callable = _is_unchanged):
+        """updates the devices, clients, groups and the functional channels of the changed devices"""
+        devices = self._get_devices(json_state, changes, is_unchanged)
+        self._get_clients(json_state, changes, is_unchanged)
+        self._get_groups(json_state, changes, is_unchanged)
+        self._load_functionalChannels(devices)
 
     def update_home_only(self, js_home, clear_config: bool = False):
         """parse a given home json configuration into self.
@@ -415,110 +1035,231 @@ class AsyncHome(HomeMaticIPObject):
             self.rules = []
             self.functionalHomes = []
 
-        self.from_json(js_home)
+        self.update_from_json(js_home)
         self._get_functionalHomes(js_home)
 
         return True
 
-    def _get_devices(self, json_state):
-        self.devices = [x for x in self.devices if x.id in json_state["devices"]]
+    def _fire_state_changes(self, changes: HomeStateChanges):
+        """fires the create, update and remove events for the changes of an incremental update_home"""
+        for obj in changes.removed:
+            obj.fire_remove_event(obj, event_type=self._state_event_types(obj)[2], obj=obj)
+        for obj in changes.added:
+            self.fire_create_event(obj._rawJSONData, event_type=self._state_event_types(obj)[0], obj=obj)
+        for obj in changes.changed:
+            obj.fire_update_event(obj._rawJSONData, event_type=self._state_event_types(obj)[1], obj=obj)
+
+    def _state_event_types(self, obj) -> tuple[EventType, EventType, EventType]:
+        """returns the added, changed and removed event type matching obj"""
+        if obj is self:
+            return EventType.HOME_CHANGED, EventType.HOME_CHANGED, EventType.HOME_CHANGED
+        if isinstance(obj, BaseDevice):
+            return EventType.DEVICE_ADDED, EventType.DEVICE_CHANGED, EventType.DEVICE_REMOVED
+        if isinstance(obj, Group):
+            return EventType.GROUP_ADDED, EventType.GROUP_CHANGED, EventType.GROUP_REMOVED
+        return EventType.CLIENT_ADDED, EventType.CLIENT_CHANGED, EventType.CLIENT_REMOVED
+
+    def _get_devices(self, json_state, changes: HomeStateChanges | None = None,
+                     is_unchanged: Callable = _is_unchanged) -> list | None:
+        """updates the devices from json_state.
+
+        Returns the devices which were parsed if changes are tracked, otherwise None (all devices)."""
+        self._drop_missing_devices(lambda d: d.id in json_state["devices"], changes)
+        self._pending_devices = {}
+        parsed = [] if changes is not None else None
         for id_, raw in json_state["devices"].items():
             try:
-                _device = self.search_device_by_id(id_)
-                if _device:
-                    _device.from_json(raw)
-                else:
-                    self.devices.append(self._parse_device(raw))
+                self._update_device_json(id_, raw, changes, is_unchanged, parsed)
             except Exception as err:
                 LOGGER.exception(
                     "An exception in _get_devices (device-id %s) of type %s occurred",
                     id_,
                     type(err).__name__,
                 )
-                return
+                break
+        return parsed
+
+    def _drop_missing_devices(self, keep: Callable, changes: HomeStateChanges | None):
+        """removes the devices for which keep(device) is false"""
+        if changes is not None:
+            changes.removed.extend(x for x in self._devices if not keep(x))
+        self._devices = [x for x in self._devices if keep(x)]
+        self._device_index.rebuild(self._devices)
+
+    def _update_device_json(self, id_: str, raw: dict, changes: HomeStateChanges | None,
+                            is_unchanged: Callable, parsed: list | None):
+        """updates or creates the device id_ from raw and returns it, None if it is kept as raw json. Its
+        functional channels are not loaded. The device is appended to parsed unless it is unchanged."""
+        _device = self._device_index.get(self._devices, id_)
+        if _device is None and self.lazy_materialization:
+            self._pending_devices[raw["id"]] = raw
+            return None
+        if _device:
+            if changes is not None:
+                if is_unchanged(_device, raw):
+                    changes.unchanged += 1
+                    return _device
+                changes.changed.append(_device)
+            _device.update_from_json(raw)
+        else:
+            _device = self._parse_device(raw)
+            self._add_device(_device)
+            if changes is not None:
+                changes.added.append(_device)
+        if parsed is not None:
+            parsed.append(_device)
+        return _device
 
     def _parse_device(self, json_state):
-        try:
-            deviceType = DeviceType.from_str(json_state["type"])
-            d = self._typeClassMap[deviceType](self._connection)
-            d.from_json(json_state)
-            return d
-        except:
-            d = self._typeClassMap[DeviceType.BASE_DEVICE](self._connection)
-            d.from_json(json_state)
-            LOGGER.warning("There is no class for device '%s' yet", json_state["type"])
-            return d
+        device_class = self._typeClassMap.get(DeviceType.from_str(json_state["type"]))
+        if device_class is None:
+            if UNKNOWN_VALUES.record("device", json_state["type"]):
+                LOGGER.warning("There is no class for device '%s' yet", json_state["type"])
+        else:
+            try:
+                d = device_class(self._connection)
+                d.from_json(json_state)
+                return d
+            except Exception:
+                if UNKNOWN_VALUES.record("deviceParseError", json_state["type"]):
+                    LOGGER.exception("Could not parse device '%s', using the base class", json_state["type"])
+        d = self._typeClassMap[DeviceType.BASE_DEVICE](self._connection)
+        d.from_json(json_state)
+        return d
 
     def _get_rules(self, json_state):
         self.rules = [
             x for x in self.rules if x.id in json_state["ruleMetaDatas"]
         ]
+        self._rule_index.rebuild(self.rules)
         for id_, raw in json_state["ruleMetaDatas"].items():
             _rule = self.search_rule_by_id(id_)
             if _rule:
                 _rule.from_json(raw)
             else:
-                self.rules.append(self._parse_rule(raw))
+                _rule = self._parse_rule(raw)
+                self.rules.append(_rule)
+                self._rule_index.added(self.rules, _rule)
 
     def _parse_rule(self, json_state):
-        try:
-            ruleType = AutomationRuleType.from_str(json_state["type"])
-            r = self._typeRuleMap[ruleType](self._connection)
-            r.from_json(json_state)
-            return r
-        except:
-            r = Rule(self._connection)
-            r.from_json(json_state)
-            LOGGER.warning("There is no class for rule  '%s' yet", json_state["type"])
-            return r
-
-    def _get_clients(self, json_state):
-        self.clients = [x for x in self.clients if x.id in json_state["clients"]]
+        rule_class = self._typeRuleMap.get(AutomationRuleType.from_str(json_state["type"]))
+        if rule_class is None:
+            if UNKNOWN_VALUES.record("rule", json_state["type"]):
+                LOGGER.warning("There is no class for rule  '%s' yet", json_state["type"])
+        else:
+            try:
+                r = rule_class(self._connection)
+                r.from_json(json_state)
+                return r
+            except Exception:
+                if UNKNOWN_VALUES.record("ruleParseError", json_state["type"]):
+                    LOGGER.exception("Could not parse rule '%s', using the base class", json_state["type"])
+        r = Rule(self._connection)
+        r.from_json(json_state)
+        return r
+
+    def _get_clients(self, json_state, changes: HomeStateChanges | None = None,
+                     is_unchanged: Callable = _is_unchanged):
+        self._drop_missing_clients(lambda c: c.id in json_state["clients"], changes)
         for id_, raw in json_state["clients"].items():
-            _client = self.search_client_by_id(id_)
-            if _client:
-                _client.from_json(raw)
-            else:
-                c = Client(self._connection)
-                c.from_json(raw)
-                self.clients.append(c)
+            self._update_client_json(id_, raw, changes, is_unchanged)
+
+    def _drop_missing_clients(self, keep: Callable, changes: HomeStateChanges | None):
+        """removes the clients for which keep(client) is false"""
+        if changes is not None:
+            changes.removed.extend(x for x in self.clients if not keep(x))
+        self.clients = [x for x in self.clients if keep(x)]
+        self._client_index.rebuild(self.clients)
+
+    def _update_client_json(self, id_: str, raw: dict, changes: HomeStateChanges | None, is_unchanged: Callable):
+        """updates or creates the client id_ from raw and returns it"""
+        _client = self.search_client_by_id(id_)
+        if _client:
+            if changes is not None:
+                if is_unchanged(_client, raw):
+                    changes.unchanged += 1
+                    return _client
+                changes.changed.append(_client)
+            _client.update_from_json(raw)
+        else:
+            _client = Client(self._connection)
+            _client.from_json(raw)
+            self._add_client(_client)
+            if changes is not None:
+                changes.added.append(_client)
+        return _client
 
     def _parse_group(self, json_state):
         g = None
         if json_state["type"] == "META":
             g = MetaGroup(self._connection)
-            g.from_json(json_state, self.devices, self.groups)
-        else:
-            try:
-                groupType = GroupType.from_str(json_state["type"])
-                g = self._typeGroupMap[groupType](self._connection)
-                g.from_json(json_state, self.devices)
-            except:
-                g = self._typeGroupMap[GroupType.GROUP](self._connection)
-                g.from_json(json_state, self.devices)
+            g.from_json(json_state, self._devices_lookup(), self._groups_lookup())
+            return g
+        group_class = self._typeGroupMap.get(GroupType.from_str(json_state["type"]))
+        if group_class is None:
+            if UNKNOWN_VALUES.record("group", json_state["type"]):
                 LOGGER.warning(
                     "There is no class for group '%s' yet", json_state["type"]
                 )
+        else:
+            try:
+                g = group_class(self._connection)
+                g.from_json(json_state, self._devices_lookup())
+                return g
+            except Exception:
+                if UNKNOWN_VALUES.record("groupParseError", json_state["type"]):
+                    LOGGER.exception("Could not parse group '%s', using the base class", json_state["type"])
+        g = self._typeGroupMap[GroupType.GROUP](self._connection)
+        g.from_json(json_state, self._devices_lookup())
         return g
 
-    def _get_groups(self, json_state):
-        self.groups = [x for x in self.groups if x.id in json_state["groups"]]
+    def _get_groups(self, json_state, changes: HomeStateChanges | None = None,
+                    is_unchanged: Callable = _is_unchanged):
+        self._drop_missing_groups(lambda g: g.id in json_state["groups"], changes)
         metaGroups = []
         for id_, raw in json_state["groups"].items():
-            _group = self.search_group_by_id(id_)
-            if _group:
-                if isinstance(_group, MetaGroup):
-                    _group.from_json(raw, self.devices, self.groups)
-                else:
-                    _group.from_json(raw, self.devices)
+            self._update_group_json(id_, raw, changes, is_unchanged, metaGroups)
+        self._add_meta_groups(metaGroups, changes)
+
+    def _drop_missing_groups(self, keep: Callable, changes: HomeStateChanges | None):
+        """removes the groups for which keep(group) is false"""
+        if changes is not None:
+            changes.removed.extend(x for x in self.groups if not keep(x))
+        self.groups = [x for x in self.groups if keep(x)]
+        self._group_index.rebuild(self.groups)
+
+    def _update_group_json(self, id_: str, raw: dict, changes: HomeStateChanges | None, is_unchanged: Callable,
+                           metaGroups: list):
+        """updates or creates the group id_ from raw and returns it. New meta groups are appended to
+        metaGroups and created by _add_meta_groups once the groups they contain exist, None is returned."""
+        _group = self.search_group_by_id(id_)
+        if _group:
+            if changes is not None:
+                if is_unchanged(_group, raw):
+                    changes.unchanged += 1
+                    return _group
+                changes.changed.append(_group)
+            if isinstance(_group, MetaGroup):
+                _group.update_from_json(raw, self._devices_lookup(), self._groups_lookup())
             else:
-                group_type = raw["type"]
-                if group_type == "META":
-                    metaGroups.append(raw)
-                else:
-                    self.groups.append(self._parse_group(raw))
+                _group.update_from_json(raw, self._devices_lookup())
+        else:
+            group_type = raw["type"]
+            if group_type == "META":
+                metaGroups.append(raw)
+            else:
+                _group = self._parse_group(raw)
+                self._add_group(_group)
+                if changes is not None:
+                    changes.added.append(_group)
+        return _group
+
+    def _add_meta_groups(self, metaGroups: list, changes: HomeStateChanges | None):
         for mg in metaGroups:
-            self.groups.append(self._parse_group(mg))
+            _group = self._parse_group(mg)
+            self._add_group(_group)
+            if changes is not None:
+                changes.added.append(_group)
 
     def _get_functionalHomes(self, json_state):
         """loads the functional homes."""
@@ -536,7 +1277,7 @@ class AsyncHome(HomeMaticIPObject):
                         self._connection
                     )
                     self.functionalHomes.append(existing)
-                existing.from_json(functionalHome, self.groups)
+                existing.from_json(functionalHome, self._groups_lookup())
             except:
                 if existing is None:
                     existing = FunctionalHome(self._connection)
@@ -544,12 +1285,123 @@ class AsyncHome(HomeMaticIPObject):
                     LOGGER.warning(
                         "There is no class for functionalHome '%s' yet", solution
                     )
-                existing.from_json(functionalHome, self.groups)
-
-    def _load_functionalChannels(self):
-        """loads the functional channels for all devices"""
-        for d in self.devices:
-            d.load_functionalChannels(self.groups, self.channels)
+                existing.from_json(functionalHome, self._groups_lookup())
+
+    def _load_functionalChannels(self, devices: list | None = None):
+        """loads the functional channels for the given devices, all materialized devices if None"""
+        groups = self._groups_lookup()
+        for d in self._devices if devices is None else devices:
+            self._load_device_channels(d, groups)
+
+    def _load_device_channels(self, device: BaseDevice, groups: IdLookup | None = None):
+        """loads (or with lazy_materialization defers) the functional channels of the device"""
+        if groups is None:
+            groups = self._groups_lookup()
+        if self.lazy_materialization and device.defer_functionalChannels(groups, self._channels):
+            return
+        device.load_functionalChannels(groups, self._channels)
+        self._index_channels(device)
+
+    @property
+    def devices(self) -> list:
+        """all devices of the home. With lazy_materialization the pending devices are created on this access."""
+        if self._pending_devices:
+            self._materialize_devices()
+        return self._devices
+
+    @devices.setter
+    def devices(self, value: list):
+        self._devices = value
+
+    @property
+    def channels(self) -> list:
+        """all functional channels of the home. With lazy_materialization all devices and their channels are
+        created on this access."""
+        if self.lazy_materialization:
+            for d in self.devices:
+                d.load_deferred_functionalChannels()
+        return self._channels
+
+    @channels.setter
+    def channels(self, value: list):
+        self._channels = value
+
+    def _materialize_device(self, device_id: str, raw: dict | None = None) -> BaseDevice | None:
+        """creates the pending device with the given id from its raw json, or from raw if it is given, e.g.
+        the json of a websocket event which replaces the pending one"""
+        pending = self._pending_devices.pop(device_id)
+        if raw is None:
+            raw = pending
+        try:
+            device = self._parse_device(raw)
+        except Exception as err:
+            LOGGER.exception(
+                "An exception in _materialize_device (device-id %s) of type %s occurred",
+                device_id,
+                type(err).__name__,
+            )
+            return None
+        self._add_device(device)
+        self._load_device_channels(device)
+        self._release_raw_json([device])
+        return device
+
+    def _materialize_devices(self):
+        for device_id in list(self._pending_devices):
+            self._materialize_device(device_id)
+
+    def _devices_lookup(self) -> IdLookup:
+        """returns an id lookup of the devices to link them in the from_json methods"""
+        lookup = self._device_index.lookup(self._devices)
+        if self.lazy_materialization:
+            return _MaterializingLookup(lookup, self)
+        return lookup
+
+    def _groups_lookup(self) -> IdLookup:
+        """returns an id lookup of the groups to link them in the from_json methods"""
+        return self._group_index.lookup(self.groups)
+
+    def _add_device(self, device: Device):
+        self._devices.append(device)
+        self._device_index.added(self._devices, device)
+
+    def _remove_device(self, device: Device):
+        self._devices.remove(device)
+        self._device_index.removed(self._devices, device)
+        for ch in device.functionalChannels:
+            key = (device.id, ch.index)
+            if self._channel_index.get(key) is ch:
+                del self._channel_index[key]
+
+    def _add_group(self, group: Group):
+        self.groups.append(group)
+        self._group_index.added(self.groups, group)
+
+    def _remove_group(self, group: Group):
+        self.groups.remove(group)
+        self._group_index.removed(self.groups, group)
+
+    def _add_client(self, client: Client):
+        self.clients.append(client)
+        self._client_index.added(self.clients, client)
+
+    def _remove_client(self, client: Client):
+        self.clients.remove(client)
+        self._client_index.removed(self.clients, client)
+
+    def _release_raw_json(self, devices: list):
+        """drops the raw json of the given devices and their channels unless self.retain_raw_json is set"""
+        if not self.retain_raw_json:
+            for d in devices:
+                d.release_raw_json()
+
+    def _index_channels(self, device: Device):
+        """adds the functional channels of the device to the (device_id, channel_index) index"""
+        if device._pending_channels is not None:
+            # search_channel indexes deferred channels once they are loaded
+            return
+        for ch in device.functionalChannels:
+            self._channel_index[(device.id, ch.index)] = ch
 
     def get_functionalHome(self, functionalHomeType: type) -> FunctionalHome | None:
         """gets the specified functionalHome
@@ -567,10 +1419,10 @@ class AsyncHome(HomeMaticIPObject):
         :param deviceID: the device to search for
         :return: the Device object or None if it couldn't find a device
         """
-        for d in self.devices:
-            if d.id == deviceID:
-                return d
-        return None
+        device = self._device_index.get(self._devices, deviceID)
+        if device is None and deviceID in self._pending_devices:
+            device = self._materialize_device(deviceID)
+        return device
 
     def search_channel(self, device_id, channel_index) -> FunctionalChannel | None:
         """searches a channel by given deviceID and channelIndex.
@@ -578,11 +1430,17 @@ class AsyncHome(HomeMaticIPObject):
         :param channel_index: the channel to search for
         :return: the FunctionalChannel object or None if it couldn't find a channel
         """
-        found_device = [d for d in self.devices if d.id == device_id]
-        d = found_device[0] if found_device else None
-        if d is not None:
-            found_channel = [ch for ch in d.functionalChannels if ch.index == channel_index]
-            return found_channel[0] if found_channel else None
+        d = self.search_device_by_id(device_id)
+        if d is None:
+            return None
+        key = (device_id, channel_index)
+        ch = self._channel_index.get(key)
+        if ch is not None and ch.device is d and ch.index == channel_index:
+            return ch
+        for ch in d.functionalChannels:
+            if ch.index == channel_index:
+                self._channel_index[key] = ch
+                return ch
         return None
 
     def search_group_by_id(self, groupID) -> Group | None:
@@ -591,10 +1449,7 @@ class AsyncHome(HomeMaticIPObject):
         :param groupID: the group to search for
         :return: the group object or None if it couldn't find a group
         """
-        for g in self.groups:
-            if g.id == groupID:
-                return g
-        return None
+        return self._group_index.get(self.groups, groupID)
 
     def search_client_by_id(self, clientID) -> Client | None:
         """searches a client by given id
@@ -602,10 +1457,7 @@ class AsyncHome(HomeMaticIPObject):
         :param clientID: the client to search for
         :return: the client object or None if it couldn't find a client
         """
-        for c in self.clients:
-            if c.id == clientID:
-                return c
-        return None
+        return self._client_index.get(self.clients, clientID)
 
     def search_rule_by_id(self, ruleID) -> Rule | None:
         """searches a rule by given id
@@ -613,10 +1465,7 @@ class AsyncHome(HomeMaticIPObject):
         :param ruleID: the rule to search for
         :return: the rule object or None if it couldn't find a rule
         """
-        for r in self.rules:
-            if r.id == ruleID:
-                return r
-        return None
+        return self._rule_index.get(self.rules, ruleID)
 
     def get_security_zones_activation(self) -> tuple[bool, bool]:
         """returns the value of the security zones if they are armed or not
@@ -831,14 +1680,24 @@ class AsyncHome(HomeMaticIPObject):
             "home/startInclusionModeForDevice", body=data
         )
 
-    async def enable_events(self, additional_message_handler: Callable | None = None):
-        """Connect to Websocket and listen for events"""
+    async def enable_events(self, additional_message_handler: Callable | None = None,
+                            aiohttp_client_session: aiohttp.ClientSession | None = None):
+        """Connect to Websocket and listen for events
+
+        Args:
+            additional_message_handler(Callable): called with every message, like the handler of the home. Text
+                frames are a WebsocketMessage, the raw text as str whose ``json`` property is a read-only
+                view of the frame the home decoded, so there is no need to decode it again.
+            aiohttp_client_session(aiohttp.ClientSession): the session to connect with if you want to use a
+                custom one. It is left open by disable_events_async. Without it the websocket handler keeps
+                a session of its own for all reconnects until disable_events_async
+        """
         if self._websocket_client:
             if self._websocket_client.is_running():
                 return
             await self._websocket_client.stop()
 
-        self._websocket_client = WebsocketHandler()
+        self._websocket_client = WebsocketHandler(aiohttp_client_session)
         self._websocket_client.add_on_message_handler(self._ws_on_message)
         if additional_message_handler:
             self._websocket_client.add_on_message_handler(additional_message_handler)
@@ -851,109 +1710,232 @@ class AsyncHome(HomeMaticIPObject):
         if self._websocket_client:
             await self._websocket_client.stop()
             self._websocket_client = None
+        self._flush_deferred_events()
+
+    async def close_connection_async(self):
+        """Close the pooled http client of the rest connection.
+        An httpx client passed to init_with_context is left open."""
+        if self._connection is not None:
+            await self._connection.close()
 
     async def _ws_on_message(self, message) -> None:
         LOGGER.debug(message)
-        js = json.loads(message)
+        # a WebsocketMessage is decoded once for the dispatch queue, this handler and the additional ones
+        js = message.decoded() if isinstance(message, WebsocketMessage) else self.json_codec.loads(message)
         event_list = []
+        deferred = False
         for event in js["events"].values():
-            try:
-                pushEventType = EventType(event["pushEventType"])
-                LOGGER.debug(pushEventType)
-                obj = None
-                if pushEventType == EventType.GROUP_CHANGED:
-                    data = event["group"]
-                    obj = self.search_group_by_id(data["id"])
-                    if obj is None:
-                        obj = self._parse_group(data)
-                        self.groups.append(obj)
-                        pushEventType = EventType.GROUP_ADDED
-                        self.fire_create_event(obj, event_type=pushEventType, obj=obj)
-                    if type(obj) is MetaGroup:
-                        obj.from_json(data, self.devices, self.groups)
-                    else:
-                        obj.from_json(data, self.devices)
-                    obj.fire_update_event(data, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.HOME_CHANGED:
-                    data = event["home"]
-                    obj = self
-                    obj.update_home_only(data)
-                    obj.fire_update_event(data, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.CLIENT_ADDED:
-                    data = event["client"]
-                    obj = Client(self._connection)
-                    obj.from_json(data)
-                    self.clients.append(obj)
-                elif pushEventType == EventType.CLIENT_CHANGED:
-                    data = event["client"]
-                    obj = self.search_client_by_id(data["id"])
-                    obj.from_json(data)
-                    obj.fire_update_event(data, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.CLIENT_REMOVED:
-                    obj = self.search_client_by_id(event["id"])
-                    self.clients.remove(obj)
-                    obj.fire_remove_event(obj, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.DEVICE_ADDED:
-                    data = event["device"]
-                    obj = self._parse_device(data)
-                    obj.load_functionalChannels(self.groups, self.channels)
-                    self.devices.append(obj)
-                    self.fire_create_event(data, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.DEVICE_CHANGED:
-                    data = event["device"]
+            if self.event_coalescing_window > 0:
+                key = _coalescing_key(event)
+                if key is not None:
+                    self._defer_event(key, event)
+                    deferred = True
+                    continue
+                if self._deferred_events:
+                    # keep the order of the deferred changes and this event
+                    self._flush_deferred_events()
+            self._handle_event(event, event_list)
+        if event_list or not deferred:
+            self.onEvent.fire(event_list)
+
+    def _defer_event(self, key: tuple, event: dict):
+        """keeps event until the coalescing window of its entity ends. A newer change of the same entity
+        replaces it, the newest one is applied once."""
+        deferred = self._deferred_events.get(key)
+        if deferred is not None:
+            deferred[0] = event
+            deferred[1] += 1
+            self.coalesced_event_count += 1
+            return
+        self._deferred_events[key] = [event, 0]
+        if self._deferred_events_timer is None:
+            loop = asyncio.get_running_loop()
+            self._deferred_events_timer = loop.call_later(self.event_coalescing_window, self._flush_deferred_events)
+
+    def _flush_deferred_events(self):
+        """applies the deferred changes in the order their entities changed first"""
+        if self._deferred_events_timer is not None:
+            self._deferred_events_timer.cancel()
+            self._deferred_events_timer = None
+        deferred = list(self._deferred_events.values())
+        self._deferred_events.clear()
+        if not deferred:
+            return
+        event_list = []
+        for event, collapsed in deferred:
+            self._handle_event(event, event_list, collapsed)
+        self.onEvent.fire(event_list)
+
+    def _handle_event(self, event: dict, event_list: list, collapsed: int = 0):
+        """applies one websocket event to the home, fires the handlers of the affected objects and appends
+        the event to event_list for onEvent. collapsed is the number of older changes the event replaced."""
+        try:
+            pushEventType = EventType(event["pushEventType"])
+            LOGGER.debug(pushEventType)
+            obj = None
+            skipped_id = None  # a device kept as raw json, onEvent gets its id instead of the object
+            if pushEventType == EventType.GROUP_CHANGED:
+                data = event["group"]
+                obj = self.search_group_by_id(data["id"])
+                if obj is None:
+                    obj = self._parse_group(data)
+                    self._add_group(obj)
+                    pushEventType = EventType.GROUP_ADDED
+                    self.fire_create_event(obj, event_type=pushEventType, obj=obj)
+                if type(obj) is MetaGroup:
+                    obj.update_from_json(data, self._devices_lookup(), self._groups_lookup())
+                else:
+                    obj.update_from_json(data, self._devices_lookup())
+                obj.fire_update_event(data, event_type=pushEventType, obj=obj)
+            elif pushEventType == EventType.HOME_CHANGED:
+                data = event["home"]
+                obj = self
+                obj.update_home_only(data)
+                obj.fire_update_event(data, event_type=pushEventType, obj=obj)
+            elif pushEventType == EventType.CLIENT_ADDED:
+                data = event["client"]
+                obj = Client(self._connection)
+                obj.from_json(data)
+                self._add_client(obj)
+            elif pushEventType == EventType.CLIENT_CHANGED:
+                data = event["client"]
+                obj = self.search_client_by_id(data["id"])
+                obj.update_from_json(data)
+                obj.fire_update_event(data, event_type=pushEventType, obj=obj)
+            elif pushEventType == EventType.CLIENT_REMOVED:
+                obj = self.search_client_by_id(event["id"])
+                self._remove_client(obj)
+                obj.fire_remove_event(obj, event_type=pushEventType, obj=obj)
+            elif pushEventType == EventType.DEVICE_ADDED:
+                data = event["device"]
+                obj = self._parse_device(data)
+                self._add_device(obj)
+                self._load_device_channels(obj)
+                self.fire_create_event(data, event_type=pushEventType, obj=obj)
+                self._release_raw_json([obj])
+            elif pushEventType == EventType.DEVICE_CHANGED:
+                data = event["device"]
+                if self._is_unobserved_pending_device(data["id"], pushEventType):
+                    # no subscription can see a device which was never accessed, just keep the new json
+                    self._pending_devices[data["id"]] = data
+                    skipped_id = data["id"]
+                elif data["id"] in self._pending_devices:
+                    # created from the event itself, so every field is new to the subscribers
+                    obj = self._materialize_device(data["id"], data)
+                    if obj is not None:
+                        obj._record_changes(frozenset(k for k in obj.__dict__ if k[0] != "_"), merge=True)
+                        obj.fire_update_event(data, event_type=pushEventType, obj=obj)
+                else:
                     obj = self.search_device_by_id(data["id"])
                     if obj is None:  # no DEVICE_ADDED Event?
                         obj = self._parse_device(data)
-                        self.devices.append(obj)
+                        self._add_device(obj)
                         pushEventType = EventType.DEVICE_ADDED
                         self.fire_create_event(data, event_type=pushEventType, obj=obj)
                     else:
-                        obj.from_json(data)
-                    obj.load_functionalChannels(self.groups, self.channels)
+                        obj.update_from_json(data)
+                    self._load_device_channels(obj)
                     obj.fire_update_event(data, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.DEVICE_REMOVED:
+                    self._release_raw_json([obj])
+            elif pushEventType == EventType.DEVICE_REMOVED:
+                if self._is_unobserved_pending_device(event["id"], pushEventType):
+                    del self._pending_devices[event["id"]]
+                    skipped_id = event["id"]
+                else:
                     obj = self.search_device_by_id(event["id"])
                     obj.fire_remove_event(obj, event_type=pushEventType, obj=obj)
-                    self.devices.remove(obj)
-                elif pushEventType == EventType.DEVICE_CHANNEL_EVENT:
-                    channel_event = ChannelEvent()
-                    channel_event.from_json(event)
+                    self._remove_device(obj)
+            elif pushEventType == EventType.DEVICE_CHANNEL_EVENT:
+                channel_event = ChannelEvent()
+                channel_event.from_json(event)
+                if not self._is_unobserved_pending_device(channel_event.deviceId, pushEventType):
                     ch = self.search_channel(channel_event.deviceId, channel_event.channelIndex)
                     if ch is not None:
                         ch.fire_channel_event(channel_event)
-                elif pushEventType == EventType.DEVICE_CODE_STATE_EVENT:
-                    # Emitted by HmIP-WKP (keypad) when a code is entered.
-                    # Observed codeStates: "KNOWN_CODE_ID_RECEIVED" (valid),
-                    # "UNKNOWN_CODE_DETECTED" (wrong). The raw string is
-                    # forwarded so consumers can match any future state
-                    # without library changes.
-                    code_state_event = CodeStateEvent()
-                    code_state_event.from_json(event)
+                    if self.event_router:
+                        self._route_event(
+                            pushEventType, ch, channel_event,
+                            (("channel", (channel_event.deviceId, channel_event.channelIndex)),
+                             ("device", channel_event.deviceId)),
+                        )
+            elif pushEventType == EventType.DEVICE_CODE_STATE_EVENT:
+                # Emitted by HmIP-WKP (keypad) when a code is entered.
+                # Observed codeStates: "KNOWN_CODE_ID_RECEIVED" (valid),
+                # "UNKNOWN_CODE_DETECTED" (wrong). The raw string is
+                # forwarded so consumers can match any future state
+                # without library changes.
+                code_state_event = CodeStateEvent()
+                code_state_event.from_json(event)
+                if not self._is_unobserved_pending_device(code_state_event.deviceId, pushEventType):
                     device = self.search_device_by_id(code_state_event.deviceId)
                     if device is not None:
                         device.fire_code_state_event(code_state_event)
-                elif pushEventType == EventType.GROUP_REMOVED:
-                    obj = self.search_group_by_id(event["id"])
-                    obj.fire_remove_event(obj, event_type=pushEventType, obj=obj)
-                    self.groups.remove(obj)
-                elif pushEventType == EventType.GROUP_ADDED:
-                    group = event["group"]
-                    obj = self._parse_group(group)
-                    self.groups.append(obj)
-                    self.fire_create_event(obj, event_type=pushEventType, obj=obj)
-                elif pushEventType == EventType.SECURITY_JOURNAL_CHANGED:
-                    pass  # data is just none so nothing to do here
-
-                # TODO: implement INCLUSION_REQUESTED, NONE
+                    if self.event_router:
+                        self._route_event(pushEventType, device, code_state_event,
+                                          (("device", code_state_event.deviceId),))
+            elif pushEventType == EventType.GROUP_REMOVED:
+                obj = self.search_group_by_id(event["id"])
+                obj.fire_remove_event(obj, event_type=pushEventType, obj=obj)
+                self._remove_group(obj)
+            elif pushEventType == EventType.GROUP_ADDED:
+                group = event["group"]
+                obj = self._parse_group(group)
+                self._add_group(obj)
+                self.fire_create_event(obj, event_type=pushEventType, obj=obj)
+            elif pushEventType == EventType.SECURITY_JOURNAL_CHANGED:
+                pass  # data is just none so nothing to do here
+
+            # TODO: implement INCLUSION_REQUESTED, NONE
+            if self.event_router and pushEventType not in _SELF_ROUTED_EVENTS:
+                self._route_event(pushEventType, obj, event, collapsed=collapsed)
+            if skipped_id is not None:
+                event_list.append({"eventType": pushEventType, "data": None, "id": skipped_id})
+            else:
                 event_list.append({"eventType": pushEventType, "data": obj})
-            except ValueError:  # pragma: no cover
-                LOGGER.warning(
-                    "Unknown EventType '%s' Data: %s", event["pushEventType"], event
-                )
+        except ValueError:  # pragma: no cover
+            LOGGER.warning(
+                "Unknown EventType '%s' Data: %s", event["pushEventType"], event
+            )
 
-            except Exception as err:  # pragma: no cover
-                LOGGER.exception(err)
-        self.onEvent.fire(event_list)
+        except Exception as err:  # pragma: no cover
+            LOGGER.exception(err)
+
+    def subscribe(self, handler: Callable[[RoutedEvent], None], **key) -> Subscription:
+        """Call handler(RoutedEvent) for the websocket events of one device, channel, group, event type or
+        object class. See EventRouter.subscribe for the keys. Unlike onEvent the handler only runs for
+        the matching events.
+
+        Returns:
+            the Subscription, call its unsubscribe() to remove the handler
+        """
+        return self.event_router.subscribe(handler, **key)
+
+    def _is_unobserved_pending_device(self, device_id: str, event_type: EventType) -> bool:
+        """returns True if the device was never materialized and no subscription to the device, its
+        channels, the event type or an object class would see the event"""
+        return device_id in self._pending_devices and not self.event_router.wants_device(device_id, event_type)
+
+    def _route_event(self, event_type: EventType, obj, data, keys: tuple = (), collapsed: int = 0):
+        """dispatches an event to the subscriptions of its type, the classes of obj, obj itself and keys.
+        A DEVICE_CHANGED is also dispatched to the subscriptions of the channels it changed."""
+        router = self.event_router
+        keys = (("event", event_type), *keys)
+        if isinstance(obj, BaseDevice):
+            keys += (("device", obj.id),)
+        elif isinstance(obj, Group):
+            keys += (("group", obj.id),)
+        if obj is not None:
+            keys += router.class_keys(obj)
+        changed = obj.changed_fields if obj is not None and event_type in _CHANGED_EVENTS else frozenset()
+        router.dispatch(RoutedEvent(event_type, obj, data, changed, collapsed), keys)
+
+        if event_type == EventType.DEVICE_CHANGED and "functionalChannels" in changed:
+            for ch in obj.functionalChannels:
+                if ch.changed_fields:
+                    router.dispatch(
+                        RoutedEvent(event_type, ch, data, ch.changed_fields, collapsed),
+                        (("channel", (obj.id, ch.index)), *router.class_keys(ch)),
+                    )
 
     def websocket_is_connected(self):
         """returns if the websocket is connected."""
@@ -983,6 +1965,12 @@ class AsyncHome(HomeMaticIPObject):
             return 0
         return self._websocket_client.reconnect_attempt_count()
 
+    def websocket_dispatch_stats(self) -> DispatchStats | None:
+        """Returns the depth, lag and dropped messages of the websocket dispatch queue, None without websocket."""
+        if self._websocket_client is None:
+            return None
+        return self._websocket_client.dispatch_stats()
+
     def websocket_last_disconnect_reason(self) -> str | None:
         """Returns the last websocket disconnect or reconnect reason."""
         if self._websocket_client is None:
@@ -1,9 +1,51 @@
 import logging
+import sys
+from collections import Counter
 from enum import StrEnum, auto
 
 logger = logging.getLogger(__name__)
 
 
+class UnknownValueRegistry:
+    """Counts values which could not be decoded, e.g. enum values or types without a class, per kind.
+
+    The first occurrence of a value is reported by record() so it is logged once instead of on every
+    occurrence. seen() returns the values and their counts."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self):
+        self._counts: dict[str, Counter] = {}
+
+    def record(self, kind: str, value) -> bool:
+        """Count an occurrence of value. Returns True if it is the first one."""
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif value is not None and not isinstance(value, (int, float, bool)):
+            value = repr(value)
+        counts = self._counts.get(kind)
+        if counts is None:
+            counts = self._counts[kind] = Counter()
+        counts[value] += 1
+        return counts[value] == 1
+
+    def seen(self, kind: str | None = None) -> dict:
+        """Return {value: count} of one kind or {kind: {value: count}} of all kinds."""
+        if kind is not None:
+            return dict(self._counts.get(kind, ()))
+        return {k: dict(v) for k, v in self._counts.items()}
+
+    def clear(self) -> None:
+        self._counts.clear()
+
+
+#: The values from_str could not decode, per enum class name. The parsers of AsyncHome and the devices
+#: also record types they have no class for ("device", "group", "rule", "functionalChannel") and, apart
+#: from those, types whose class failed to parse the json ("deviceParseError", "groupParseError",
+#: "ruleParseError", "functionalChannelParseError").
+UNKNOWN_VALUES = UnknownValueRegistry()
+
+
 class AutoNameEnum(StrEnum):
     """auto() will generate the name of the attribute as value"""
 
@@ -14,21 +56,33 @@ class AutoNameEnum(StrEnum):
     def from_str(cls, text: str, default=None):
         """this function will create the enum object based on its string value
 
+        Unknown values are counted in UNKNOWN_VALUES and logged the first time they occur.
+
         Args:
             text(str): the string value of the enum
             default(AutoNameEnum): a default value if text could not be used
         Returns:
             the enum object or None if the text is None or the default value
         """
+        try:
+            # the value map is precomputed by Enum, a lookup avoids the exception of cls(text)
+            member = cls._value2member_map_.get(text)
+        except TypeError:
+            member = None
+        if member is not None:
+            return member
         if text is None:
             return None
-        try:
-            return cls(text)
-        except:
+        if UNKNOWN_VALUES.record(cls.__name__, text):
             logger.warning(
                 "'%s' isn't a valid option for class '%s'", text, cls.__name__
             )
-            return default
+        return default
+
+    @classmethod
+    def unknown_values(cls) -> dict:
+        """Return the values from_str could not decode for this enum and how often they occurred."""
+        return UNKNOWN_VALUES.seen(cls.__name__)
 
 
 class AcousticAlarmTiming(AutoNameEnum):
@@ -731,3 +785,15 @@ class CliActions(AutoNameEnum):
     SET_SWITCH_STATE = auto()
     RESET_ENERGY_COUNTER = auto()
     SEND_DOOR_COMMAND = auto()
+
+
+class RequestPriority(AutoNameEnum):
+    INTERACTIVE = auto()
+    NORMAL = auto()
+    BULK = auto()
+
+
+class WebsocketOverflowPolicy(AutoNameEnum):
+    BLOCK = auto()
+    DROP_OLDEST = auto()
+    COALESCE = auto()
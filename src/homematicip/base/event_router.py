@@ -0,0 +1,175 @@
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+from homematicip.base.enums import EventType
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RoutedEvent:
+    """An event handed to the handlers of EventRouter subscriptions."""
+
+    #: the push event type, e.g. DEVICE_CHANGED or DEVICE_CHANNEL_EVENT
+    event_type: EventType
+    #: the device, channel, group, client or home the event is about. None if it is unknown
+    obj: Any
+    #: the json of the event, the ChannelEvent or the CodeStateEvent
+    data: Any = None
+    #: the attributes changed by the event, see HomeMaticIPObject.changed_fields
+    changed_fields: frozenset[str] = frozenset()
+    #: the number of older changes of the entity this one replaced, see AsyncHome.event_coalescing_window
+    collapsed: int = 0
+
+
+class Subscription:
+    """Handle of a handler registered with EventRouter.subscribe."""
+
+    __slots__ = ("_router", "_token", "handler", "key")
+
+    def __init__(self, router: "EventRouter", key: tuple, handler: Callable[[RoutedEvent], None], token: int):
+        self._router = router
+        self._token = token
+        self.key = key
+        self.handler = handler
+
+    @property
+    def active(self) -> bool:
+        return self._token in self._router._handlers.get(self.key, ())
+
+    def unsubscribe(self) -> None:
+        """Remove the handler in O(1). Unsubscribing twice does nothing."""
+        self._router._remove(self)
+
+
+class EventRouter:
+    """Routes the websocket events to the handlers subscribed to their device, channel, group, event type
+    or object class.
+
+    The handlers of a key are kept in a dict, so an event is dispatched by looking up the keys it matches
+    instead of running every handler, and a subscription is removed without searching a list::
+
+        sub = home.event_router.subscribe(handler, channel=("3014F711A000000000000001", 1))
+        ...
+        sub.unsubscribe()
+    """
+
+    def __init__(self):
+        self._handlers: dict[tuple, dict[int, Callable[[RoutedEvent], None]]] = {}
+        self._tokens = count()
+        # device id -> number of device and channel subscriptions of the device
+        self._device_refs: Counter = Counter()
+        # concrete type -> keys of the subscribed classes it is a subclass of
+        self._class_keys: dict[type, tuple[tuple, ...]] = {}
+        # number of subscribed classes
+        self._class_count = 0
+
+    def __len__(self) -> int:
+        return sum(len(handlers) for handlers in self._handlers.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._handlers)
+
+    def subscribe(
+        self,
+        handler: Callable[[RoutedEvent], None],
+        *,
+        device_id: str | None = None,
+        channel: tuple[str, int] | None = None,
+        group_id: str | None = None,
+        event_type: EventType | None = None,
+        object_type: type | None = None,
+    ) -> Subscription:
+        """Call handler(RoutedEvent) for the events matching exactly one of the keys.
+
+        Args:
+            device_id(str): the events of a device and its channels
+            channel(tuple): the events of the channel (device id, channel index), including a DEVICE_CHANGED
+                which changed the channel
+            group_id(str): the events of a group
+            event_type(EventType): all events of this type
+            object_type(type): the events of all objects which are instances of this class. Channels
+                of a changed device are included
+
+        Returns:
+            the Subscription to unsubscribe with
+        """
+        keys = [
+            (kind, value)
+            for kind, value in (
+                ("device", device_id),
+                ("channel", None if channel is None else tuple(channel)),
+                ("group", group_id),
+                ("event", event_type),
+                ("class", object_type),
+            )
+            if value is not None
+        ]
+        if len(keys) != 1:
+            raise ValueError("subscribe needs exactly one of device_id, channel, group_id, event_type, object_type")
+        key = keys[0]
+        handlers = self._handlers.get(key)
+        if handlers is None:
+            handlers = self._handlers[key] = {}
+            if key[0] == "class":
+                self._class_keys.clear()
+                self._class_count += 1
+        token = next(self._tokens)
+        handlers[token] = handler
+        device = self._device_of(key)
+        if device is not None:
+            self._device_refs[device] += 1
+        return Subscription(self, key, handler, token)
+
+    def _remove(self, subscription: Subscription) -> None:
+        handlers = self._handlers.get(subscription.key)
+        if handlers is None or handlers.pop(subscription._token, None) is None:
+            return
+        if not handlers:
+            del self._handlers[subscription.key]
+            if subscription.key[0] == "class":
+                self._class_keys.clear()
+                self._class_count -= 1
+        device = self._device_of(subscription.key)
+        if device is not None:
+            self._device_refs[device] -= 1
+            if not self._device_refs[device]:
+                del self._device_refs[device]
+
+    @staticmethod
+    def _device_of(key: tuple) -> str | None:
+        if key[0] == "device":
+            return key[1]
+        if key[0] == "channel":
+            return key[1][0]
+        return None
+
+    def wants_device(self, device_id: str, event_type: EventType | None = None) -> bool:
+        """Return True if a subscription could receive an event of the device: one to the device or one of
+        its channels, to event_type or to any object class."""
+        return device_id in self._device_refs or self._class_count > 0 or ("event", event_type) in self._handlers
+
+    def class_keys(self, obj) -> tuple[tuple, ...]:
+        """Return the keys of the subscribed classes obj is an instance of."""
+        cls = type(obj)
+        keys = self._class_keys.get(cls)
+        if keys is None:
+            keys = self._class_keys[cls] = tuple(("class", c) for c in cls.__mro__ if ("class", c) in self._handlers)
+        return keys
+
+    def dispatch(self, event: RoutedEvent, keys: Iterable[tuple]) -> None:
+        """Run the handlers subscribed to the given keys with event. A failing handler is logged and does
+        not keep the others from running."""
+        for key in keys:
+            handlers = self._handlers.get(key)
+            if not handlers:
+                continue
+            for handler in tuple(handlers.values()):
+                try:
+                    handler(event)
+                except Exception:
+                    LOGGER.exception("Error in the event handler %r for %s", handler, key)
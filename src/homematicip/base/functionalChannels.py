@@ -1,21 +1,40 @@
-from collections import defaultdict
 from collections.abc import Iterable
 from typing import Any
 
 from homematicip.base.enums import *
+from homematicip.base.helpers import IdLookup, id_lookup
 from homematicip.base.homematicip_object import HomeMaticIPObject
+from homematicip.base.schema import Field, compile_fields
 from homematicip.commands import functional_channel_commands
 from homematicip.group import Group
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _functional_channel_type(value):
+    # unknown types are counted and logged by Device._parse_functionalChannel, keep them as string
+    return FunctionalChannelType._value2member_map_.get(value, value)
+
+
+_parse_functional_channel_fields = compile_fields(
+    (
+        Field("index"),
+        Field("groupIndex"),
+        Field("label"),
+        Field("channelRole", optional=True),
+        Field("functionalChannelType", converter=_functional_channel_type),
+    )
+)
+
+
 class FunctionalChannel(HomeMaticIPObject):
     """this is the base class for the functional channels"""
 
+    __slots__ = ("_on_channel_event_handler",)
+
     def __init__(self, device, connection):
         super().__init__(connection)
-        self._on_channel_event_handler = []
+        self._on_channel_event_handler = ()
         self.index = -1
         self.groupIndex = -1
         self.label = ""
@@ -29,6 +48,8 @@ class FunctionalChannel(HomeMaticIPObject):
     def add_on_channel_event_handler(self, handler):
         """Adds an event handler to the update method. Fires when a device
         is updated."""
+        if not self._on_channel_event_handler:
+            self._on_channel_event_handler = []
         self._on_channel_event_handler.append(handler)
 
     def fire_channel_event(self, *args, **kwargs):
@@ -45,22 +66,21 @@ class FunctionalChannel(HomeMaticIPObject):
             groups(Iterable[Group]): the groups for referencing
         """
         self._connection = self.device._connection
-        self.index = js["index"]
-        self.groupIndex = js["groupIndex"]
-        self.label = js["label"]
-        self.set_attr_from_dict("channelRole", js)
-        self.functionalChannelType = FunctionalChannelType.from_str(
-            js["functionalChannelType"], js["functionalChannelType"]
-        )
+        _parse_functional_channel_fields(self, js)
+        groups = id_lookup(groups)
         self.groups = []
         for gid in js["groups"]:
-            for g in groups:
-                if g.id == gid:
-                    self.groups.append(g)
-                    break
+            g = groups.get(gid)
+            if g is not None:
+                self.groups.append(g)
 
         super().from_json(js)
 
+    def links_groups(self, groups: IdLookup) -> bool:
+        """Return True if groups resolves the group ids of the channel json to the objects in self.groups."""
+        linked = [g for g in map(groups.get, self._rawJSONData["groups"]) if g is not None]
+        return len(linked) == len(self.groups) and all(a is b for a, b in zip(linked, self.groups, strict=True))
+
     def __str__(self):
         return "{} {} Index({})".format(
             self.functionalChannelType,
@@ -68,6 +88,29 @@ class FunctionalChannel(HomeMaticIPObject):
             self.index,
         )
 
+_parse_device_base_channel_fields = compile_fields(
+    (
+        Field("unreach"),
+        Field("lowBat"),
+        Field("routerModuleSupported"),
+        Field("routerModuleEnabled"),
+        Field("rssiDeviceValue"),
+        Field("rssiPeerValue"),
+        Field("dutyCycle"),
+        Field("configPending"),
+    )
+)
+#: The optional features of DEVICE_BASE channels and the attribute they enable.
+_DEVICE_BASE_FEATURE_ATTRIBUTES = (
+    ("IFeatureDeviceCoProError", "coProFaulty"),
+    ("IFeatureDeviceCoProRestart", "coProRestartNeeded"),
+    ("IFeatureDeviceCoProUpdate", "coProUpdateFailure"),
+    ("IFeatureDeviceOverheated", "deviceOverheated"),
+    ("IFeatureDeviceOverloaded", "deviceOverloaded"),
+    ("IFeatureDeviceTemperatureOutOfRange", "temperatureOutOfRange"),
+    ("IFeatureDeviceUndervoltage", "deviceUndervoltage"),
+)
+
 
 class DeviceBaseChannel(FunctionalChannel):
     """this is the representative of the DEVICE_BASE channel"""
@@ -92,30 +135,13 @@ class DeviceBaseChannel(FunctionalChannel):
 
     def from_json(self, js, groups: Iterable[Group]):
         super().from_json(js, groups)
-        self.unreach = js["unreach"]
-        self.lowBat = js["lowBat"]
-        self.routerModuleSupported = js["routerModuleSupported"]
-        self.routerModuleEnabled = js["routerModuleEnabled"]
-        self.rssiDeviceValue = js["rssiDeviceValue"]
-        self.rssiPeerValue = js["rssiPeerValue"]
-        self.dutyCycle = js["dutyCycle"]
-        self.configPending = js["configPending"]
+        _parse_device_base_channel_fields(self, js)
         # Optional feature flags can be missing in newer payloads; default to False
-        sof = defaultdict(lambda: False, js.get("supportedOptionalFeatures") or {})
-        if sof.get("IFeatureDeviceCoProError", False):
-            self.coProFaulty = js.get("coProFaulty")
-        if sof.get("IFeatureDeviceCoProRestart", False):
-            self.coProRestartNeeded = js.get("coProRestartNeeded")
-        if sof.get("IFeatureDeviceCoProUpdate", False):
-            self.coProUpdateFailure = js.get("coProUpdateFailure")
-        if sof.get("IFeatureDeviceOverheated", False):
-            self.deviceOverheated = js.get("deviceOverheated")
-        if sof.get("IFeatureDeviceOverloaded", False):
-            self.deviceOverloaded = js.get("deviceOverloaded")
-        if sof.get("IFeatureDeviceTemperatureOutOfRange", False):
-            self.temperatureOutOfRange = js.get("temperatureOutOfRange")
-        if sof.get("IFeatureDeviceUndervoltage", False):
-            self.deviceUndervoltage = js.get("deviceUndervoltage")
+        sof = js.get("supportedOptionalFeatures")
+        if sof:
+            for feature, attr in _DEVICE_BASE_FEATURE_ATTRIBUTES:
+                if sof.get(feature, False):
+                    setattr(self, attr, js.get(attr))
 
 
 class DeviceBlockingChannel(FunctionalChannel):
@@ -229,6 +255,13 @@ class DeviceBlockingWithTeachableCodeChannel(DeviceBlockingChannel):
 class SwitchChannel(FunctionalChannel):
     """this is the representative of the SWITCH_CHANNEL channel"""
 
+    _fields = (
+        Field("on"),
+        Field("powerUpSwitchState", default=""),
+        Field("profileMode"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.on = False
@@ -236,13 +269,6 @@ class SwitchChannel(FunctionalChannel):
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.on = js["on"]
-        self.powerUpSwitchState = js.get("powerUpSwitchState", "")
-        self.profileMode = js["profileMode"]
-        self.userDesiredProfileMode = js["userDesiredProfileMode"]
-
     def set_switch_state(self, on=True):
         return self._run_non_async(self.async_set_switch_state, on)
 
@@ -278,6 +304,17 @@ class ExternalSwitchChannel(SwitchChannel):
 class AccelerationSensorChannel(FunctionalChannel):
     """this is the representative of the ACCELERATION_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("accelerationSensorEventFilterPeriod", optional=True),
+        Field("accelerationSensorMode", converter=AccelerationSensorMode, optional=True),
+        Field("accelerationSensorNeutralPosition", converter=AccelerationSensorNeutralPosition, optional=True),
+        Field("accelerationSensorSensitivity", converter=AccelerationSensorSensitivity, optional=True),
+        Field("accelerationSensorTriggerAngle", optional=True),
+        Field("accelerationSensorTriggered", optional=True),
+        Field("notificationSoundTypeHighToLow", converter=NotificationSoundType, optional=True),
+        Field("notificationSoundTypeLowToHigh", converter=NotificationSoundType, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float:
@@ -301,25 +338,6 @@ class AccelerationSensorChannel(FunctionalChannel):
         #:NotificationSoundType:
         self.notificationSoundTypeLowToHigh = NotificationSoundType.SOUND_NO_SOUND
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("accelerationSensorEventFilterPeriod", js)
-        self.set_attr_from_dict("accelerationSensorMode", js, AccelerationSensorMode)
-        self.set_attr_from_dict(
-            "accelerationSensorNeutralPosition", js, AccelerationSensorNeutralPosition
-        )
-        self.set_attr_from_dict(
-            "accelerationSensorSensitivity", js, AccelerationSensorSensitivity
-        )
-        self.set_attr_from_dict("accelerationSensorTriggerAngle", js)
-        self.set_attr_from_dict("accelerationSensorTriggered", js)
-        self.set_attr_from_dict(
-            "notificationSoundTypeHighToLow", js, NotificationSoundType
-        )
-        self.set_attr_from_dict(
-            "notificationSoundTypeLowToHigh", js, NotificationSoundType
-        )
-
     def set_acceleration_sensor_mode(self, mode: AccelerationSensorMode):
         return self._run_non_async(self.async_set_acceleration_sensor_mode, mode)
 
@@ -399,6 +417,27 @@ class AccelerationSensorChannel(FunctionalChannel):
 class BlindChannel(FunctionalChannel):
     """this is the representative of the BLIND_CHANNEL channel"""
 
+    _fields = (
+        Field("blindModeActive"),
+        Field("bottomToTopReferenceTime"),
+        Field("changeOverDelay"),
+        Field("delayCompensationValue"),
+        Field("endpositionAutoDetectionEnabled"),
+        Field("previousShutterLevel"),
+        Field("previousSlatsLevel"),
+        Field("processing"),
+        Field("profileMode"),
+        Field("shutterLevel"),
+        Field("slatsLevel"),
+        Field("selfCalibrationInProgress"),
+        Field("supportingDelayCompensation"),
+        Field("supportingEndpositionAutoDetection"),
+        Field("supportingSelfCalibration"),
+        Field("slatsReferenceTime"),
+        Field("topToBottomReferenceTime"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.blindModeActive = False
@@ -420,30 +459,6 @@ class BlindChannel(FunctionalChannel):
         self.topToBottomReferenceTime = 0.0
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.blindModeActive = js["blindModeActive"]
-        self.bottomToTopReferenceTime = js["bottomToTopReferenceTime"]
-        self.changeOverDelay = js["changeOverDelay"]
-        self.delayCompensationValue = js["delayCompensationValue"]
-        self.endpositionAutoDetectionEnabled = js["endpositionAutoDetectionEnabled"]
-        self.previousShutterLevel = js["previousShutterLevel"]
-        self.previousSlatsLevel = js["previousSlatsLevel"]
-        self.processing = js["processing"]
-        self.profileMode = js["profileMode"]
-        self.shutterLevel = js["shutterLevel"]
-        self.slatsLevel = js["slatsLevel"]
-        self.selfCalibrationInProgress = js["selfCalibrationInProgress"]
-        self.supportingDelayCompensation = js["supportingDelayCompensation"]
-        self.supportingEndpositionAutoDetection = js[
-            "supportingEndpositionAutoDetection"
-        ]
-        self.supportingSelfCalibration = js["supportingSelfCalibration"]
-        self.slatsReferenceTime = js["slatsReferenceTime"]
-        self.topToBottomReferenceTime = js["topToBottomReferenceTime"]
-        self.userDesiredProfileMode = js["userDesiredProfileMode"]
-
     def set_slats_level(self, slatsLevel=0.0, shutterLevel=None):
         """sets the slats and shutter level
 
@@ -509,6 +524,17 @@ class BlindChannel(FunctionalChannel):
 class DeviceBaseFloorHeatingChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_BASE_FLOOR_HEATING channel"""
 
+    _fields = (
+        Field("coolingEmergencyValue", optional=True),
+        Field("frostProtectionTemperature", optional=True),
+        Field("heatingEmergencyValue", optional=True),
+        Field("minimumFloorHeatingValvePosition", optional=True),
+        Field("pulseWidthModulationAtLowFloorHeatingValvePositionEnabled", optional=True),
+        Field("temperatureOutOfRange", optional=True),
+        Field("valveProtectionDuration", optional=True),
+        Field("valveProtectionSwitchingInterval", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.coolingEmergencyValue = 0
@@ -520,17 +546,6 @@ class DeviceBaseFloorHeatingChannel(DeviceBaseChannel):
         self.valveProtectionDuration = 0
         self.valveProtectionSwitchingInterval = 20
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("coolingEmergencyValue", js)
-        self.set_attr_from_dict("frostProtectionTemperature", js)
-        self.set_attr_from_dict("heatingEmergencyValue", js)
-        self.set_attr_from_dict("minimumFloorHeatingValvePosition", js)
-        self.set_attr_from_dict("pulseWidthModulationAtLowFloorHeatingValvePositionEnabled", js)
-        self.set_attr_from_dict("temperatureOutOfRange", js)
-        self.set_attr_from_dict("valveProtectionDuration", js)
-        self.set_attr_from_dict("valveProtectionSwitchingInterval", js)
-
     def set_minimum_floor_heating_valve_position(
             self, minimumFloorHeatingValvePosition: float
     ):
@@ -558,14 +573,14 @@ class DeviceBaseFloorHeatingChannel(DeviceBaseChannel):
 class DeviceOperationLockChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_OPERATIONLOCK channel"""
 
+    _fields = (
+        Field("operationLockActive"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.operationLockActive = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.operationLockActive = js["operationLockActive"]
-
     def set_operation_lock(self, operationLock=True):
         return self._run_non_async(self.async_set_operation_lock, operationLock)
 
@@ -582,18 +597,18 @@ class DeviceOperationLockChannelWithSabotage(DeviceOperationLockChannel):
 class DimmerChannel(FunctionalChannel):
     """this is the representative of the DIMMER_CHANNEL channel"""
 
+    _fields = (
+        Field("dimLevel"),
+        Field("profileMode"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.dimLevel = 0
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.dimLevel = js["dimLevel"]
-        self.profileMode = js["profileMode"]
-        self.userDesiredProfileMode = js["userDesiredProfileMode"]
-
     def set_dim_level(self, dimLevel=0.0):
         return self._run_non_async(self.async_set_dim_level, dimLevel)
 
@@ -606,6 +621,13 @@ class DimmerChannel(FunctionalChannel):
 class DoorChannel(FunctionalChannel):
     """this is the representative of the DoorChannel channel"""
 
+    _fields = (
+        Field("doorState"),
+        Field("on"),
+        Field("processing"),
+        Field("ventilationPositionSupported"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.doorState = DoorState.POSITION_UNKNOWN
@@ -613,13 +635,6 @@ class DoorChannel(FunctionalChannel):
         self.processing = False
         self.ventilationPositionSupported = True
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.doorState = js["doorState"]
-        self.on = js["on"]
-        self.processing = js["processing"]
-        self.ventilationPositionSupported = js["ventilationPositionSupported"]
-
     def send_door_command(self, doorCommand=DoorCommand.STOP):
         return self._run_non_async(self.async_send_door_command, doorCommand)
 
@@ -632,6 +647,16 @@ class DoorChannel(FunctionalChannel):
 class DoorLockChannel(FunctionalChannel):
     """This respresents of the DoorLockChannel"""
 
+    _fields = (
+        Field("autoRelockDelay"),
+        Field("doorHandleType"),
+        Field("doorLockDirection"),
+        Field("doorLockNeutralPosition"),
+        Field("doorLockTurns"),
+        Field("lockState", converter=LockState),
+        Field("motorState", converter=MotorState),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.autoRelockDelay = False
@@ -642,17 +667,6 @@ class DoorLockChannel(FunctionalChannel):
         self.lockState = LockState.UNLOCKED
         self.motorState = MotorState.STOPPED
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.autoRelockDelay = js["autoRelockDelay"]
-        self.doorHandleType = js["doorHandleType"]
-        self.doorLockDirection = js["doorLockDirection"]
-        self.doorLockNeutralPosition = js["doorLockNeutralPosition"]
-        self.doorLockTurns = js["doorLockTurns"]
-        self.lockState = LockState.from_str(js["lockState"])
-        self.motorState = MotorState.from_str(js["motorState"])
-
     def set_lock_state(self, doorLockState: LockState, pin=""):
         """sets the door lock state
 
@@ -685,6 +699,21 @@ class DoorLockChannel(FunctionalChannel):
 class DoorLockProChannel(DoorLockChannel):
     """This represents the DOOR_LOCK_PRO_CHANNEL channel (HmIP-DLP)"""
 
+    _fields = (
+        Field("autoRelockEnabled", default=False),
+        Field("doorLockEndStopOffsetLocked", default=""),
+        Field("doorLockEndStopOffsetOpen", default=""),
+        Field("doorLockInputActionLongPress", default=""),
+        Field("doorLockInputActionShortPress", default=""),
+        Field("doorOpeningDirection", default=""),
+        Field("lockSilenceMode", default=""),
+        Field("lockStateChangeReason", default=""),
+        Field("sabotageAcceleration", default=False),
+        Field("sabotageBattery", default=False),
+        Field("sabotageMagneticField", default=False),
+        Field("sabotageVertical", default=False),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.autoRelockEnabled = False
@@ -700,49 +729,44 @@ class DoorLockProChannel(DoorLockChannel):
         self.sabotageMagneticField = False
         self.sabotageVertical = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.autoRelockEnabled = js.get("autoRelockEnabled", False)
-        self.doorLockEndStopOffsetLocked = js.get("doorLockEndStopOffsetLocked", "")
-        self.doorLockEndStopOffsetOpen = js.get("doorLockEndStopOffsetOpen", "")
-        self.doorLockInputActionLongPress = js.get("doorLockInputActionLongPress", "")
-        self.doorLockInputActionShortPress = js.get("doorLockInputActionShortPress", "")
-        self.doorOpeningDirection = js.get("doorOpeningDirection", "")
-        self.lockSilenceMode = js.get("lockSilenceMode", "")
-        self.lockStateChangeReason = js.get("lockStateChangeReason", "")
-        self.sabotageAcceleration = js.get("sabotageAcceleration", False)
-        self.sabotageBattery = js.get("sabotageBattery", False)
-        self.sabotageMagneticField = js.get("sabotageMagneticField", False)
-        self.sabotageVertical = js.get("sabotageVertical", False)
-
 
 class DoorLockSensorBaseChannel(FunctionalChannel):
     """This represents the DOOR_LOCK_SENSOR_BASE_CHANNEL channel"""
 
+    _fields = (
+        Field("lockState", converter=LockState, default="UNLOCKED"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.lockState = LockState.UNLOCKED
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.lockState = LockState.from_str(js.get("lockState", "UNLOCKED"))
-
 
 class MagneticDoorSensorChannel(FunctionalChannel):
     """This represents the MAGNETIC_DOOR_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("eventDelay", default=0),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.eventDelay = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.eventDelay = js.get("eventDelay", 0)
-
 
 class DoorSwitchChannel(FunctionalChannel):
     """this is the representative of the DOOR_SWITCH_CHANNEL channel"""
 
+    _fields = (
+        Field("impulseDuration", optional=True),
+        Field("processing", optional=True),
+        Field("doorLockActive", optional=True),
+        Field("internalLinkConfiguration", optional=True),
+        Field("multiModeInputMode", converter=MultiModeInputMode, optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.impulseDuration = 0
@@ -753,16 +777,6 @@ class DoorSwitchChannel(FunctionalChannel):
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("impulseDuration", js)
-        self.set_attr_from_dict("processing", js)
-        self.set_attr_from_dict("doorLockActive", js)
-        self.set_attr_from_dict("internalLinkConfiguration", js)
-        self.set_attr_from_dict("multiModeInputMode", js, MultiModeInputMode)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-        self.set_attr_from_dict("userDesiredProfileMode", js, ProfileMode)
-
     def send_start_impulse(self):
         return self._run_non_async(self.async_send_start_impulse)
 
@@ -775,6 +789,21 @@ class DoorSwitchChannel(FunctionalChannel):
 class EnergySensorInterfaceChannel(FunctionalChannel):
     """EnergySensorInterfaceChannel"""
 
+    _fields = (
+        Field("connectedEnergySensorType"),
+        Field("currentGasFlow"),
+        Field("currentPowerConsumption"),
+        Field("energyCounterOne"),
+        Field("energyCounterOneType"),
+        Field("energyCounterThree"),
+        Field("energyCounterThreeType"),
+        Field("energyCounterTwo"),
+        Field("energyCounterTwoType"),
+        Field("gasVolume"),
+        Field("gasVolumePerImpulse"),
+        Field("impulsesPerKWH"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.connectedEnergySensorType = None
@@ -790,33 +819,18 @@ class EnergySensorInterfaceChannel(FunctionalChannel):
         self.gasVolumePerImpulse = None
         self.impulsesPerKWH = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.connectedEnergySensorType = js["connectedEnergySensorType"]
-        self.currentGasFlow = js["currentGasFlow"]
-        self.currentPowerConsumption = js["currentPowerConsumption"]
-        self.energyCounterOne = js["energyCounterOne"]
-        self.energyCounterOneType = js["energyCounterOneType"]
-        self.energyCounterThree = js["energyCounterThree"]
-        self.energyCounterThreeType = js["energyCounterThreeType"]
-        self.energyCounterTwo = js["energyCounterTwo"]
-        self.energyCounterTwoType = js["energyCounterTwoType"]
-        self.gasVolume = js["gasVolume"]
-        self.gasVolumePerImpulse = js["gasVolumePerImpulse"]
-        self.impulsesPerKWH = js["impulsesPerKWH"]
-
 
 class ImpulseOutputChannel(FunctionalChannel):
     """this is the representation of the IMPULSE_OUTPUT_CHANNEL"""
 
+    _fields = (
+        Field("impulseDuration"),
+        Field("processing"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.impulseDuration = js["impulseDuration"]
-        self.processing = js["processing"]
-
     def send_start_impulse(self):
         """Toggle Wall mounted Garage Door Controller."""
         return self._run_non_async(self.async_send_start_impulse)
@@ -830,6 +844,14 @@ class ImpulseOutputChannel(FunctionalChannel):
 class MultiModeInputChannel(FunctionalChannel):
     """this is the representative of the MULTI_MODE_INPUT_CHANNEL channel"""
 
+    _fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType, optional=True),
+        Field("multiModeInputMode", converter=MultiModeInputMode, optional=True),
+        Field("windowState", converter=WindowState, optional=True),
+        Field("doorBellSensorEventTimestamp", optional=True),
+        Field("corrosionPreventionActive", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_OPEN
@@ -838,14 +860,6 @@ class MultiModeInputChannel(FunctionalChannel):
         self.doorBellSensorEventTimestamp = None
         self.corrosionPreventionActive = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("binaryBehaviorType", js, BinaryBehaviorType)
-        self.set_attr_from_dict("multiModeInputMode", js, MultiModeInputMode)
-        self.set_attr_from_dict("windowState", js, WindowState)
-        self.set_attr_from_dict("doorBellSensorEventTimestamp", js)
-        self.set_attr_from_dict("corrosionPreventionActive", js)
-
     def __str__(self):
         return f"{super().__str__()} binaryBehaviorType({self.binaryBehaviorType}) channelRole({self.channelRole}) multiModeInputMode({self.multiModeInputMode}) windowState({self.windowState}) doorBellSensorEventTimestamp({self.doorBellSensorEventTimestamp}) corrosionPreventionActive({self.corrosionPreventionActive})"
 
@@ -853,6 +867,13 @@ class MultiModeInputChannel(FunctionalChannel):
 class MultiModeLockInputChannel(MultiModeInputChannel):
     """this is the representative of the MULTI_MODE_LOCK_INPUT_CHANNEL channel"""
 
+    _fields = (
+        Field("actionParameter", optional=True),
+        Field("eventDelay", optional=True),
+        Field("glassBroken", optional=True),
+        Field("lockState", converter=LockState, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actionParameter = None
@@ -860,17 +881,19 @@ class MultiModeLockInputChannel(MultiModeInputChannel):
         self.glassBroken = False
         self.lockState = LockState.UNLOCKED
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("actionParameter", js)
-        self.set_attr_from_dict("eventDelay", js)
-        self.set_attr_from_dict("glassBroken", js)
-        self.set_attr_from_dict("lockState", js, LockState)
-
 
 class MultiModeInputDimmerChannel(DimmerChannel):
     """this is the representative of the MULTI_MODE_INPUT_DIMMER_CHANNEL channel"""
 
+    _fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType, optional=True),
+        Field("dimLevel", optional=True),
+        Field("multiModeInputMode", converter=MultiModeInputMode, optional=True),
+        Field("on", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_CLOSE
@@ -880,19 +903,18 @@ class MultiModeInputDimmerChannel(DimmerChannel):
         self.profileMode = ProfileMode.AUTOMATIC
         self.userDesiredProfileMode = ProfileMode.AUTOMATIC
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("binaryBehaviorType", js, BinaryBehaviorType)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("multiModeInputMode", js, MultiModeInputMode)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-        self.set_attr_from_dict("userDesiredProfileMode", js, ProfileMode)
-
 
 class MultiModeInputSwitchChannel(SwitchChannel):
     """this is the representative of the MULTI_MODE_INPUT_SWITCH_CHANNEL channel"""
 
+    _fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType, optional=True),
+        Field("multiModeInputMode", converter=MultiModeInputMode, optional=True),
+        Field("on", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_OPEN
@@ -901,14 +923,6 @@ class MultiModeInputSwitchChannel(SwitchChannel):
         self.profileMode = ProfileMode.MANUAL
         self.userDesiredProfileMode = ProfileMode.MANUAL
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("binaryBehaviorType", js, BinaryBehaviorType)
-        self.set_attr_from_dict("multiModeInputMode", js, MultiModeInputMode)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-        self.set_attr_from_dict("userDesiredProfileMode", js, ProfileMode)
-
 
 class NotificationLightChannel(DimmerChannel, SwitchChannel):
     """this is the representative of the NOTIFICATION_LIGHT_CHANNEL channel"""
@@ -1012,6 +1026,31 @@ class NotificationLightChannel(DimmerChannel, SwitchChannel):
 class ShadingChannel(FunctionalChannel):
     """this is the representative of the SHADING_CHANNEL channel"""
 
+    _fields = (
+        Field("automationDriveSpeed", converter=DriveSpeed, optional=True),
+        Field("manualDriveSpeed", converter=DriveSpeed, optional=True),
+        Field("favoritePrimaryShadingPosition", optional=True),
+        Field("favoriteSecondaryShadingPosition", optional=True),
+        Field("primaryCloseAdjustable", optional=True),
+        Field("primaryOpenAdjustable", optional=True),
+        Field("primaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("secondaryCloseAdjustable", optional=True),
+        Field("secondaryOpenAdjustable", optional=True),
+        Field("secondaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("primaryShadingLevel", optional=True),
+        Field("secondaryShadingLevel", optional=True),
+        Field("previousPrimaryShadingLevel", optional=True),
+        Field("previousSecondaryShadingLevel", optional=True),
+        Field("identifyOemSupported", optional=True),
+        Field("productId", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+        Field("shadingDriveVersion", optional=True),
+        Field("shadingPackagePosition", converter=ShadingPackagePosition, optional=True),
+        Field("shadingPositionAdjustmentActive", optional=True),
+        Field("shadingPositionAdjustmentClientId", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.automationDriveSpeed = DriveSpeed.CREEP_SPEED
@@ -1038,39 +1077,6 @@ class ShadingChannel(FunctionalChannel):
         self.shadingPositionAdjustmentActive = None
         self.shadingPositionAdjustmentClientId = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("automationDriveSpeed", js, DriveSpeed)
-        self.set_attr_from_dict("manualDriveSpeed", js, DriveSpeed)
-
-        self.set_attr_from_dict("favoritePrimaryShadingPosition", js)
-        self.set_attr_from_dict("favoriteSecondaryShadingPosition", js)
-
-        self.set_attr_from_dict("primaryCloseAdjustable", js)
-        self.set_attr_from_dict("primaryOpenAdjustable", js)
-        self.set_attr_from_dict("primaryShadingStateType", js, ShadingStateType)
-        self.set_attr_from_dict("secondaryCloseAdjustable", js)
-        self.set_attr_from_dict("secondaryOpenAdjustable", js)
-        self.set_attr_from_dict("secondaryShadingStateType", js, ShadingStateType)
-
-        self.set_attr_from_dict("primaryShadingLevel", js)
-        self.set_attr_from_dict("secondaryShadingLevel", js)
-
-        self.set_attr_from_dict("previousPrimaryShadingLevel", js)
-        self.set_attr_from_dict("previousSecondaryShadingLevel", js)
-
-        self.set_attr_from_dict("identifyOemSupported", js)
-        self.set_attr_from_dict("productId", js)
-
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-        self.set_attr_from_dict("userDesiredProfileMode", js, ProfileMode)
-
-        self.set_attr_from_dict("shadingDriveVersion", js)
-        self.set_attr_from_dict("shadingPackagePosition", js, ShadingPackagePosition)
-        self.set_attr_from_dict("shadingPositionAdjustmentActive", js)
-        self.set_attr_from_dict("shadingPositionAdjustmentClientId", js)
-
     def set_primary_shading_level(self, primaryShadingLevel: float):
         return self._run_non_async(self.async_set_primary_shading_level, primaryShadingLevel)
 
@@ -1111,6 +1117,23 @@ class ShadingChannel(FunctionalChannel):
 class ShutterChannel(FunctionalChannel):
     """this is the representative of the SHUTTER_CHANNEL channel"""
 
+    _fields = (
+        Field("shutterLevel"),
+        Field("changeOverDelay"),
+        Field("delayCompensationValue"),
+        Field("bottomToTopReferenceTime"),
+        Field("topToBottomReferenceTime"),
+        Field("endpositionAutoDetectionEnabled"),
+        Field("previousShutterLevel"),
+        Field("processing"),
+        Field("profileMode"),
+        Field("selfCalibrationInProgress"),
+        Field("supportingDelayCompensation"),
+        Field("supportingEndpositionAutoDetection"),
+        Field("supportingSelfCalibration"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.shutterLevel = 0
@@ -1128,25 +1151,6 @@ class ShutterChannel(FunctionalChannel):
         self.supportingSelfCalibration = False
         self.userDesiredProfileMode = "AUTOMATIC"
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.shutterLevel = js["shutterLevel"]
-        self.changeOverDelay = js["changeOverDelay"]
-        self.delayCompensationValue = js["delayCompensationValue"]
-        self.bottomToTopReferenceTime = js["bottomToTopReferenceTime"]
-        self.topToBottomReferenceTime = js["topToBottomReferenceTime"]
-        self.endpositionAutoDetectionEnabled = js["endpositionAutoDetectionEnabled"]
-        self.previousShutterLevel = js["previousShutterLevel"]
-        self.processing = js["processing"]
-        self.profileMode = js["profileMode"]
-        self.selfCalibrationInProgress = js["selfCalibrationInProgress"]
-        self.supportingDelayCompensation = js["supportingDelayCompensation"]
-        self.supportingEndpositionAutoDetection = js[
-            "supportingEndpositionAutoDetection"
-        ]
-        self.supportingSelfCalibration = js["supportingSelfCalibration"]
-        self.userDesiredProfileMode = js["userDesiredProfileMode"]
-
     def set_shutter_stop(self):
         return self._run_non_async(self.async_set_shutter_stop)
 
@@ -1181,6 +1185,17 @@ class ShutterChannel(FunctionalChannel):
 class SwitchMeasuringChannel(SwitchChannel):
     """this is the representative of the SWITCH_MEASURING_CHANNEL channel"""
 
+    _fields = (
+        Field("currentDetectionBehavior", optional=True),
+        Field("currentPowerConsumption", optional=True),
+        Field("energyCounter", optional=True),
+        Field("energyCounterTwo", optional=True),
+        Field("energyCounterTwoType", optional=True),
+        Field("energyMeterMode", optional=True),
+        Field("powerMeasuringCategory", optional=True),
+        Field("powerUpSwitchState", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.currentDetectionBehavior: str | None = None
@@ -1192,17 +1207,6 @@ class SwitchMeasuringChannel(SwitchChannel):
         self.powerMeasuringCategory: str | None = None
         self.powerUpSwitchState: str | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("currentDetectionBehavior", js)
-        self.set_attr_from_dict("currentPowerConsumption", js)
-        self.set_attr_from_dict("energyCounter", js)
-        self.set_attr_from_dict("energyCounterTwo", js)
-        self.set_attr_from_dict("energyCounterTwoType", js)
-        self.set_attr_from_dict("energyMeterMode", js)
-        self.set_attr_from_dict("powerMeasuringCategory", js)
-        self.set_attr_from_dict("powerUpSwitchState", js)
-
     def reset_energy_counter(self):
         return self._run_non_async(self.async_reset_energy_counter)
 
@@ -1214,6 +1218,19 @@ class SwitchMeasuringChannel(SwitchChannel):
 class TiltVibrationSensorChannel(FunctionalChannel):
     """this is the representative of the TILT_VIBRATION_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("absoluteAngle", optional=True),
+        Field("accelerationSensorEventFilterPeriod", optional=True),
+        Field("accelerationSensorMode", converter=AccelerationSensorMode, optional=True),
+        Field("accelerationSensorNeutralPosition", converter=AccelerationSensorNeutralPosition, optional=True),
+        Field("accelerationSensorSecondTriggerAngle", optional=True),
+        Field("accelerationSensorSensitivity", converter=AccelerationSensorSensitivity, optional=True),
+        Field("accelerationSensorTriggerAngle", optional=True),
+        Field("accelerationSensorTriggered", optional=True),
+        Field("tiltState", optional=True),
+        Field("tiltVisualization", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.absoluteAngle = None
@@ -1227,19 +1244,6 @@ class TiltVibrationSensorChannel(FunctionalChannel):
         self.tiltState: str | None = None
         self.tiltVisualization: str | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("absoluteAngle", js)
-        self.set_attr_from_dict("accelerationSensorEventFilterPeriod", js)
-        self.set_attr_from_dict("accelerationSensorMode", js, AccelerationSensorMode)
-        self.set_attr_from_dict("accelerationSensorNeutralPosition", js, AccelerationSensorNeutralPosition)
-        self.set_attr_from_dict("accelerationSensorSecondTriggerAngle", js)
-        self.set_attr_from_dict("accelerationSensorSensitivity", js, AccelerationSensorSensitivity)
-        self.set_attr_from_dict("accelerationSensorTriggerAngle", js)
-        self.set_attr_from_dict("accelerationSensorTriggered", js)
-        self.set_attr_from_dict("tiltState", js)
-        self.set_attr_from_dict("tiltVisualization", js)
-
     def set_acceleration_sensor_mode(self, mode: AccelerationSensorMode):
         return self._run_non_async(self.async_set_acceleration_sensor_mode, mode)
 
@@ -1291,6 +1295,15 @@ class TiltVibrationSensorChannel(FunctionalChannel):
 class WallMountedThermostatProChannel(FunctionalChannel):
     """this is the representative of the WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL channel"""
 
+    _fields = (
+        Field("temperatureOffset"),
+        Field("setPointTemperature"),
+        Field("display", converter=ClimateControlDisplay),
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.display = ClimateControlDisplay.ACTUAL
@@ -1300,15 +1313,6 @@ class WallMountedThermostatProChannel(FunctionalChannel):
         self.humidity = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.temperatureOffset = js["temperatureOffset"]
-        self.setPointTemperature = js["setPointTemperature"]
-        self.display = ClimateControlDisplay.from_str(js["display"])
-        self.actualTemperature = js["actualTemperature"]
-        self.humidity = js["humidity"]
-        self.vaporAmount = js["vaporAmount"]
-
     def set_display(
             self, display: ClimateControlDisplay = ClimateControlDisplay.ACTUAL
     ):
@@ -1325,18 +1329,28 @@ class WallMountedThermostatProChannel(FunctionalChannel):
 class WallMountedThermostatWithCarbonChannel(WallMountedThermostatProChannel):
     """this is the representative of the WALL_MOUNTED_THERMOSTAT_WITH_CARBON_DIOXIDE_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("carbonDioxideConcentration", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.carbonDioxideConcentration = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("carbonDioxideConcentration", js)
-
 
 class WaterSensorChannel(FunctionalChannel):
     """this is the representative of the WATER_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("acousticAlarmSignal", converter=AcousticAlarmSignal),
+        Field("acousticAlarmTiming", converter=AcousticAlarmTiming),
+        Field("acousticWaterAlarmTrigger", converter=WaterAlarmTrigger),
+        Field("inAppWaterAlarmTrigger", converter=WaterAlarmTrigger),
+        Field("moistureDetected"),
+        Field("sirenWaterAlarmTrigger", converter=WaterAlarmTrigger),
+        Field("waterlevelDetected"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -1348,26 +1362,6 @@ class WaterSensorChannel(FunctionalChannel):
         self.sirenWaterAlarmTrigger = WaterAlarmTrigger.NO_ALARM
         self.waterlevelDetected = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.acousticAlarmSignal = AcousticAlarmSignal.from_str(
-            js["acousticAlarmSignal"]
-        )
-        self.acousticAlarmTiming = AcousticAlarmTiming.from_str(
-            js["acousticAlarmTiming"]
-        )
-        self.acousticWaterAlarmTrigger = WaterAlarmTrigger.from_str(
-            js["acousticWaterAlarmTrigger"]
-        )
-        self.inAppWaterAlarmTrigger = WaterAlarmTrigger.from_str(
-            js["inAppWaterAlarmTrigger"]
-        )
-        self.moistureDetected = js["moistureDetected"]
-        self.sirenWaterAlarmTrigger = WaterAlarmTrigger.from_str(
-            js["sirenWaterAlarmTrigger"]
-        )
-        self.waterlevelDetected = js["waterlevelDetected"]
-
     def set_acoustic_alarm_signal(self, acousticAlarmSignal: AcousticAlarmSignal):
         return self._run_non_async(
             self.async_set_acoustic_alarm_signal, acousticAlarmSignal
@@ -1440,6 +1434,13 @@ class WaterSensorChannel(FunctionalChannel):
 class AccessControllerChannel(DeviceBaseChannel):
     """this is the representative of the ACCESS_CONTROLLER_CHANNEL channel"""
 
+    _fields = (
+        Field("dutyCycleLevel", optional=True),
+        Field("accessPointPriority", optional=True),
+        Field("signalBrightness", optional=True),
+        Field("filteredMulticastRoutingEnabled", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.dutyCycleLevel = 0.0
@@ -1447,61 +1448,54 @@ class AccessControllerChannel(DeviceBaseChannel):
         self.signalBrightness = 0
         self.filteredMulticastRoutingEnabled = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("dutyCycleLevel", js)
-        self.set_attr_from_dict("accessPointPriority", js)
-        self.set_attr_from_dict("signalBrightness", js)
-        self.set_attr_from_dict("filteredMulticastRoutingEnabled", js)
-
 
 class DeviceSabotageChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_SABOTAGE channel"""
 
+    _fields = (
+        Field("sabotage"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.sabotage = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.sabotage = js["sabotage"]
-
 
 class DeviceIncorrectPositionedChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_INCORRECT_POSITIONED channel"""
 
+    _fields = (
+        Field("incorrectPositioned"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.incorrectPositioned = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.incorrectPositioned = js["incorrectPositioned"]
-
 
 class DevicePermanentFullRxChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_PERMANENT_FULL_RX channel"""
 
+    _fields = (
+        Field("permanentFullRx"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.permanentFullRx = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.permanentFullRx = js["permanentFullRx"]
-
 
 class AccessAuthorizationChannel(FunctionalChannel):
     """this represents ACCESS_AUTHORIZATION_CHANNEL channel"""
 
+    _fields = (
+        Field("authorized"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.authorized = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.authorized = js["authorized"]
-
     def pull_latch(self, pin: str | None = None):
         """Trigger the latch via this access-authorization channel.
 
@@ -1519,6 +1513,14 @@ class AccessAuthorizationChannel(FunctionalChannel):
 class HeatingThermostatChannel(FunctionalChannel):
     """this is the representative of the HEATING_THERMOSTAT_CHANNEL channel"""
 
+    _fields = (
+        Field("temperatureOffset"),
+        Field("valvePosition"),
+        Field("valveState", converter=ValveState),
+        Field("setPointTemperature"),
+        Field("valveActualTemperature"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float: the offset temperature for the thermostat (+/- 3.5)
@@ -1534,28 +1536,20 @@ class HeatingThermostatChannel(FunctionalChannel):
         #:bool: must the adaption re-run?
         self.automaticValveAdaptionNeeded = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.temperatureOffset = js["temperatureOffset"]
-        self.valvePosition = js["valvePosition"]
-        self.valveState = ValveState.from_str(js["valveState"])
-        self.setPointTemperature = js["setPointTemperature"]
-        self.valveActualTemperature = js["valveActualTemperature"]
-
 
 class ShutterContactChannel(FunctionalChannel):
     """this is the representative of the SHUTTER_CONTACT_CHANNEL channel"""
 
+    _fields = (
+        Field("windowState", converter=WindowState),
+        Field("eventDelay"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.windowState = WindowState.CLOSED
         self.eventDelay = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.windowState = WindowState.from_str(js["windowState"])
-        self.eventDelay = js["eventDelay"]
-
 
 class RotaryHandleChannel(ShutterContactChannel):
     """this is the representative of the ROTARY_HANDLE_CHANNEL channel"""
@@ -1564,36 +1558,43 @@ class RotaryHandleChannel(ShutterContactChannel):
 class ContactInterfaceChannel(ShutterContactChannel):
     """this is the representative of the CONTACT_INTERFACE_CHANNEL channel"""
 
+    _fields = (
+        Field("alarmContactType", converter=AlarmContactType),
+        Field("contactType", converter=ContactType),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.alarmContactType = AlarmContactType.WINDOW_DOOR_CONTACT
         self.contactType = ContactType.NORMALLY_CLOSE
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.alarmContactType = AlarmContactType.from_str(js["alarmContactType"])
-        self.contactType = ContactType.from_str(js["contactType"])
-
 
 class ClimateSensorChannel(FunctionalChannel):
     """this is the representative of the CLIMATE_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actualTemperature = 0
         self.humidity = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.actualTemperature = js["actualTemperature"]
-        self.humidity = js["humidity"]
-        self.vaporAmount = js["vaporAmount"]
-
 
 class DoorLockSensorChannel(FunctionalChannel):
     """This respresents of the DoorLockSensorChannel"""
 
+    _fields = (
+        Field("doorLockDirection"),
+        Field("doorLockNeutralPosition"),
+        Field("doorLockTurns"),
+        Field("lockState", converter=LockState),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.doorLockDirection = False
@@ -1601,45 +1602,50 @@ class DoorLockSensorChannel(FunctionalChannel):
         self.doorLockTurns = False
         self.lockState = LockState.UNLOCKED
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.doorLockDirection = js["doorLockDirection"]
-        self.doorLockNeutralPosition = js["doorLockNeutralPosition"]
-        self.doorLockTurns = js["doorLockTurns"]
-        self.lockState = LockState.from_str(js["lockState"])
-
 
 class WallMountedThermostatWithoutDisplayChannel(ClimateSensorChannel):
     """this is the representative of the WALL_MOUNTED_THERMOSTAT_WITHOUT_DISPLAY_CHANNEL channel"""
 
+    _fields = (
+        Field("temperatureOffset"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.temperatureOffset = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.temperatureOffset = js["temperatureOffset"]
-
 
 class AnalogRoomControlChannel(FunctionalChannel):
     """this is the representative of the ANALOG_ROOM_CONTROL_CHANNEL channel"""
 
+    _fields = (
+        Field("actualTemperature", optional=True),
+        Field("setPointTemperature", optional=True),
+        Field("temperatureOffset", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actualTemperature = 0
         self.setPointTemperature = 0
         self.temperatureOffset = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("actualTemperature", js)
-        self.set_attr_from_dict("setPointTemperature", js)
-        self.set_attr_from_dict("temperatureOffset", js)
-
 
 class SmokeDetectorChannel(FunctionalChannel):
     """this is the representative of the SMOKE_DETECTOR_CHANNEL channel"""
 
+    _fields = (
+        Field("smokeDetectorAlarmType", converter=SmokeDetectorAlarmType),
+        Field("chamberDegraded", optional=True),
+        Field("dirtLevel", optional=True),
+        Field("smokeDetectorGroupAssignment", optional=True),
+        Field("smokeEventRepeatingActive", optional=True),
+        Field("lastSmokeAlarmTimestamp", optional=True),
+        Field("lastSmokeTestTimestamp", optional=True),
+        Field("smokeAlarmCounter", optional=True),
+        Field("smokeTestCounter", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.smokeDetectorAlarmType = SmokeDetectorAlarmType.IDLE_OFF
@@ -1652,24 +1658,21 @@ class SmokeDetectorChannel(FunctionalChannel):
         self.smokeAlarmCounter: int | None = None
         self.smokeTestCounter: int | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.smokeDetectorAlarmType = SmokeDetectorAlarmType.from_str(
-            js["smokeDetectorAlarmType"]
-        )
-        self.set_attr_from_dict("chamberDegraded", js)
-        self.set_attr_from_dict("dirtLevel", js)
-        self.set_attr_from_dict("smokeDetectorGroupAssignment", js)
-        self.set_attr_from_dict("smokeEventRepeatingActive", js)
-        self.set_attr_from_dict("lastSmokeAlarmTimestamp", js)
-        self.set_attr_from_dict("lastSmokeTestTimestamp", js)
-        self.set_attr_from_dict("smokeAlarmCounter", js)
-        self.set_attr_from_dict("smokeTestCounter", js)
-
 
 class DeviceGlobalPumpControlChannel(DeviceBaseChannel):
     """this is the representative of the DEVICE_GLOBAL_PUMP_CONTROL channel"""
 
+    _fields = (
+        Field("globalPumpControl"),
+        Field("heatingValveType", converter=HeatingValveType),
+        Field("heatingLoadType", converter=HeatingLoadType),
+        Field("coolingEmergencyValue"),
+        Field("frostProtectionTemperature"),
+        Field("heatingEmergencyValue"),
+        Field("valveProtectionDuration"),
+        Field("valveProtectionSwitchingInterval"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.globalPumpControl = False
@@ -1681,22 +1684,20 @@ class DeviceGlobalPumpControlChannel(DeviceBaseChannel):
         self.valveProtectionSwitchingInterval = 20
         self.coolingEmergencyValue = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.globalPumpControl = js["globalPumpControl"]
-        self.heatingValveType = HeatingValveType.from_str(js["heatingValveType"])
-        self.heatingLoadType = HeatingLoadType.from_str(js["heatingLoadType"])
-        self.coolingEmergencyValue = js["coolingEmergencyValue"]
-
-        self.frostProtectionTemperature = js["frostProtectionTemperature"]
-        self.heatingEmergencyValue = js["heatingEmergencyValue"]
-        self.valveProtectionDuration = js["valveProtectionDuration"]
-        self.valveProtectionSwitchingInterval = js["valveProtectionSwitchingInterval"]
-
 
 class MotionDetectionChannel(FunctionalChannel):
     """this is the representative of the MOTION_DETECTION_CHANNEL channel"""
 
+    _fields = (
+        Field("motionDetected"),
+        Field("illumination"),
+        Field("motionBufferActive"),
+        Field("motionDetected"),
+        Field("motionDetectionSendInterval", converter=MotionDetectionSendInterval),
+        Field("numberOfBrightnessMeasurements"),
+        Field("currentIllumination"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.currentIllumination = None
@@ -1709,22 +1710,21 @@ class MotionDetectionChannel(FunctionalChannel):
         self.motionSensorZones: str | None = None
         self.numberOfBrightnessMeasurements = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.motionDetected = js["motionDetected"]
-        self.illumination = js["illumination"]
-        self.motionBufferActive = js["motionBufferActive"]
-        self.motionDetected = js["motionDetected"]
-        self.motionDetectionSendInterval = MotionDetectionSendInterval.from_str(
-            js["motionDetectionSendInterval"]
-        )
-        self.numberOfBrightnessMeasurements = js["numberOfBrightnessMeasurements"]
-        self.currentIllumination = js["currentIllumination"]
-
 
 class PresenceDetectionChannel(FunctionalChannel):
     """this is the representative of the PRESENCE_DETECTION_CHANNEL channel"""
 
+    _fields = (
+        Field("presenceDetected"),
+        Field("currentIllumination"),
+        Field("illumination"),
+        Field("motionBufferActive"),
+        Field("motionDetectionSendInterval", converter=MotionDetectionSendInterval),
+        Field("motionSensorZoneSensitivityMap", optional=True),
+        Field("motionSensorZones", optional=True),
+        Field("numberOfBrightnessMeasurements"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.presenceDetected = False
@@ -1734,23 +1734,17 @@ class PresenceDetectionChannel(FunctionalChannel):
         self.motionDetectionSendInterval = MotionDetectionSendInterval.SECONDS_30
         self.numberOfBrightnessMeasurements = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.presenceDetected = js["presenceDetected"]
-        self.currentIllumination = js["currentIllumination"]
-        self.illumination = js["illumination"]
-        self.motionBufferActive = js["motionBufferActive"]
-        self.motionDetectionSendInterval = MotionDetectionSendInterval.from_str(
-            js["motionDetectionSendInterval"]
-        )
-        self.set_attr_from_dict("motionSensorZoneSensitivityMap", js)
-        self.set_attr_from_dict("motionSensorZones", js)
-        self.numberOfBrightnessMeasurements = js["numberOfBrightnessMeasurements"]
-
 
 class MultiModeInputBlindChannel(BlindChannel):
     """this is the representative of the MULTI_MODE_INPUT_BLIND_CHANNEL channel"""
 
+    _fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType),
+        Field("multiModeInputMode", converter=MultiModeInputMode),
+        Field("favoritePrimaryShadingPosition"),
+        Field("favoriteSecondaryShadingPosition"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_CLOSE
@@ -1758,18 +1752,25 @@ class MultiModeInputBlindChannel(BlindChannel):
         self.favoritePrimaryShadingPosition = 0.0
         self.favoriteSecondaryShadingPosition = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.binaryBehaviorType = BinaryBehaviorType.from_str(js["binaryBehaviorType"])
-        self.multiModeInputMode = MultiModeInputMode.from_str(js["multiModeInputMode"])
-        self.favoritePrimaryShadingPosition = js["favoritePrimaryShadingPosition"]
-        self.favoriteSecondaryShadingPosition = js["favoriteSecondaryShadingPosition"]
-
 
 class WeatherSensorChannel(FunctionalChannel):
     """this is the representative of the WEATHER_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("illumination"),
+        Field("illuminationThresholdSunshine"),
+        Field("storm"),
+        Field("sunshine"),
+        Field("todaySunshineDuration"),
+        Field("totalSunshineDuration"),
+        Field("windSpeed"),
+        Field("windValueType", converter=WindValueType),
+        Field("yesterdaySunshineDuration"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actualTemperature = 0
@@ -1785,25 +1786,17 @@ class WeatherSensorChannel(FunctionalChannel):
         self.windValueType = WindValueType.AVERAGE_VALUE
         self.yesterdaySunshineDuration = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.actualTemperature = js["actualTemperature"]
-        self.humidity = js["humidity"]
-        self.illumination = js["illumination"]
-        self.illuminationThresholdSunshine = js["illuminationThresholdSunshine"]
-        self.storm = js["storm"]
-        self.sunshine = js["sunshine"]
-        self.todaySunshineDuration = js["todaySunshineDuration"]
-        self.totalSunshineDuration = js["totalSunshineDuration"]
-        self.windSpeed = js["windSpeed"]
-        self.windValueType = WindValueType.from_str(js["windValueType"])
-        self.yesterdaySunshineDuration = js["yesterdaySunshineDuration"]
-        self.vaporAmount = js["vaporAmount"]
-
 
 class WeatherSensorPlusChannel(WeatherSensorChannel):
     """this is the representative of the WEATHER_SENSOR_PLUS_CHANNEL channel"""
 
+    _fields = (
+        Field("raining"),
+        Field("todayRainCounter"),
+        Field("totalRainCounter"),
+        Field("yesterdayRainCounter"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.raining = False
@@ -1811,33 +1804,33 @@ class WeatherSensorPlusChannel(WeatherSensorChannel):
         self.totalRainCounter = 0
         self.yesterdayRainCounter = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.raining = js["raining"]
-        self.todayRainCounter = js["todayRainCounter"]
-        self.totalRainCounter = js["totalRainCounter"]
-        self.yesterdayRainCounter = js["yesterdayRainCounter"]
-
 
 class WeatherSensorProChannel(WeatherSensorPlusChannel):
     """this is the representative of the WEATHER_SENSOR_PRO_CHANNEL channel"""
 
+    _fields = (
+        Field("weathervaneAlignmentNeeded"),
+        Field("windDirection"),
+        Field("windDirectionVariation"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.weathervaneAlignmentNeeded = False
         self.windDirection = 0
         self.windDirectionVariation = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.weathervaneAlignmentNeeded = js["weathervaneAlignmentNeeded"]
-        self.windDirection = js["windDirection"]
-        self.windDirectionVariation = js["windDirectionVariation"]
-
 
 class SingleKeyChannel(FunctionalChannel):
     """this is the representative of the SINGLE_KEY_CHANNEL channel"""
 
+    _fields = (
+        Field("acousticSendStateEnabled", optional=True),
+        Field("actionParameter", optional=True),
+        Field("doorBellSensorEventTimestamp", optional=True),
+        Field("doublePressTime", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.acousticSendStateEnabled = None
@@ -1845,13 +1838,6 @@ class SingleKeyChannel(FunctionalChannel):
         self.doorBellSensorEventTimestamp = None
         self.doublePressTime = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("acousticSendStateEnabled", js)
-        self.set_attr_from_dict("actionParameter", js)
-        self.set_attr_from_dict("doorBellSensorEventTimestamp", js)
-        self.set_attr_from_dict("doublePressTime", js)
-
 
 class RotaryWheelChannel(FunctionalChannel):
     """this is the representative of the ROTARY_WHEEL_CHANNEL channel.
@@ -1860,14 +1846,14 @@ class RotaryWheelChannel(FunctionalChannel):
     rotation direction (CLOCK_WISE / COUNTER_CLOCK_WISE).
     """
 
+    _fields = (
+        Field("rotationDirection", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.rotationDirection = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("rotationDirection", js)
-
 
 class AlarmSirenChannel(FunctionalChannel):
     """this is the representative of the ALARM_SIREN_CHANNEL channel"""
@@ -1880,6 +1866,13 @@ class FloorTeminalBlockChannel(FunctionalChannel):
 class FloorTerminalBlockLocalPumpChannel(FunctionalChannel):
     """this is the representative of the FLOOR_TERMINAL_BLOCK_LOCAL_PUMP_CHANNEL  channel"""
 
+    _fields = (
+        Field("pumpFollowUpTime"),
+        Field("pumpLeadTime"),
+        Field("pumpProtectionDuration"),
+        Field("pumpProtectionSwitchingInterval"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.pumpFollowUpTime = 0
@@ -1887,13 +1880,6 @@ class FloorTerminalBlockLocalPumpChannel(FunctionalChannel):
         self.pumpProtectionDuration = 0
         self.pumpProtectionSwitchingInterval = 20
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.pumpFollowUpTime = js["pumpFollowUpTime"]
-        self.pumpLeadTime = js["pumpLeadTime"]
-        self.pumpProtectionDuration = js["pumpProtectionDuration"]
-        self.pumpProtectionSwitchingInterval = js["pumpProtectionSwitchingInterval"]
-
 
 class HeatDemandChannel(FunctionalChannel):
     """this is the representative of the HEAT_DEMAND_CHANNEL channel"""
@@ -1906,6 +1892,16 @@ class DehumidifierDemandChannel(FunctionalChannel):
 class PassageDetectorChannel(FunctionalChannel):
     """this is the representative of the PASSAGE_DETECTOR_CHANNEL channel"""
 
+    _fields = (
+        Field("leftCounter"),
+        Field("leftRightCounterDelta"),
+        Field("passageBlindtime"),
+        Field("passageDirection", converter=PassageDirection),
+        Field("passageSensorSensitivity"),
+        Field("passageTimeout"),
+        Field("rightCounter"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.leftCounter = 0
@@ -1916,20 +1912,18 @@ class PassageDetectorChannel(FunctionalChannel):
         self.passageTimeout = 0.0
         self.rightCounter = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.leftCounter = js["leftCounter"]
-        self.leftRightCounterDelta = js["leftRightCounterDelta"]
-        self.passageBlindtime = js["passageBlindtime"]
-        self.passageDirection = PassageDirection.from_str(js["passageDirection"])
-        self.passageSensorSensitivity = js["passageSensorSensitivity"]
-        self.passageTimeout = js["passageTimeout"]
-        self.rightCounter = js["rightCounter"]
-
 
 class InternalSwitchChannel(FunctionalChannel):
     """this is the representative of the INTERNAL_SWITCH_CHANNEL channel"""
 
+    _fields = (
+        Field("frostProtectionTemperature"),
+        Field("heatingValveType", converter=HeatingValveType),
+        Field("internalSwitchOutputEnabled"),
+        Field("valveProtectionDuration"),
+        Field("valveProtectionSwitchingInterval"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.frostProtectionTemperature = 0
@@ -1938,14 +1932,6 @@ class InternalSwitchChannel(FunctionalChannel):
         self.valveProtectionDuration = 0
         self.valveProtectionSwitchingInterval = 0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.frostProtectionTemperature = js["frostProtectionTemperature"]
-        self.heatingValveType = HeatingValveType.from_str(js["heatingValveType"])
-        self.internalSwitchOutputEnabled = js["internalSwitchOutputEnabled"]
-        self.valveProtectionDuration = js["valveProtectionDuration"]
-        self.valveProtectionSwitchingInterval = js["valveProtectionSwitchingInterval"]
-
     def __str__(self):
         return f"{super().__str__()} frostProtectionTemperature({self.frostProtectionTemperature}) heatingValveType({self.heatingValveType}) internalSwitchOutputEnabled({self.internalSwitchOutputEnabled}) valveProtectionDuration({self.valveProtectionDuration}) valveProtectionSwitchingInterval({self.valveProtectionSwitchingInterval})"
 
@@ -1953,6 +1939,13 @@ class InternalSwitchChannel(FunctionalChannel):
 class LightSensorChannel(FunctionalChannel):
     """this is the representative of the LIGHT_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("averageIllumination"),
+        Field("currentIllumination"),
+        Field("highestIllumination"),
+        Field("lowestIllumination"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float:the average illumination value
@@ -1964,13 +1957,6 @@ class LightSensorChannel(FunctionalChannel):
         #:float:the lowest illumination value
         self.lowestIllumination = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.averageIllumination = js["averageIllumination"]
-        self.currentIllumination = js["currentIllumination"]
-        self.highestIllumination = js["highestIllumination"]
-        self.lowestIllumination = js["lowestIllumination"]
-
 
 class GenericInputChannel(FunctionalChannel):
     """this is the representative of the GENERIC_INPUT_CHANNEL channel"""
@@ -1979,32 +1965,43 @@ class GenericInputChannel(FunctionalChannel):
 class AnalogOutputChannel(FunctionalChannel):
     """this is the representative of the ANALOG_OUTPUT_CHANNEL channel"""
 
+    _fields = (
+        Field("analogOutputLevel"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float:the analog output level (Volt?)
         self.analogOutputLevel = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.analogOutputLevel = js["analogOutputLevel"]
-
 
 class DeviceRechargeableWithSabotage(DeviceSabotageChannel):
     """this is the representative of the DEVICE_RECHARGEABLE_WITH_SABOTAGE channel"""
 
+    _fields = (
+        Field("badBatteryHealth", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:bool:is the battery in a bad condition
         self.badBatteryHealth = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("badBatteryHealth", js)
-
 
 class FloorTerminalBlockMechanicChannel(FunctionalChannel):
     """this is the representative of the class FLOOR_TERMINAL_BLOCK_MECHANIC_CHANNEL(FunctionalChannel) channel"""
 
+    _fields = (
+        Field("valveState", converter=ValveState, optional=True),
+        Field("valvePosition", optional=True),
+        Field("dewPointAlarmActive", optional=True),
+        Field("emergencyOperationActive", optional=True),
+        Field("externalClockActive", optional=True),
+        Field("frostProtectionActive", optional=True),
+        Field("humidityLimiterAlarm", optional=True),
+        Field("humidityLimiterPreAlarm", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:ValveState:the current valve state
@@ -2017,18 +2014,6 @@ class FloorTerminalBlockMechanicChannel(FunctionalChannel):
         self.humidityLimiterAlarm = False
         self.humidityLimiterPreAlarm = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("valveState", js, ValveState)
-        if "valvePosition" in js:
-            self.set_attr_from_dict("valvePosition", js)
-        self.set_attr_from_dict("dewPointAlarmActive", js)
-        self.set_attr_from_dict("emergencyOperationActive", js)
-        self.set_attr_from_dict("externalClockActive", js)
-        self.set_attr_from_dict("frostProtectionActive", js)
-        self.set_attr_from_dict("humidityLimiterAlarm", js)
-        self.set_attr_from_dict("humidityLimiterPreAlarm", js)
-
 
 class ChangeOverChannel(FunctionalChannel):
     """this is the representative of the CHANGE_OVER_CHANNEL channel"""
@@ -2037,20 +2022,30 @@ class ChangeOverChannel(FunctionalChannel):
 class MainsFailureChannel(FunctionalChannel):
     """this is the representative of the MAINS_FAILURE_CHANNEL channel"""
 
+    _fields = (
+        Field("powerMainsFailure", optional=True),
+        Field("genericAlarmSignal", converter=AlarmSignalType, optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.powerMainsFailure = False
         self.genericAlarmSignal = AlarmSignalType.NO_ALARM
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("powerMainsFailure", js)
-        self.set_attr_from_dict("genericAlarmSignal", js, AlarmSignalType)
-
 
 class UniversalActuatorChannel(FunctionalChannel):
     """this is the representative of the UniversalActuatorChannel UNIVERSAL_ACTUATOR_CHANNEL"""
 
+    _fields = (
+        Field("dimLevel"),
+        Field("on"),
+        Field("profileMode"),
+        Field("relayMode"),
+        Field("userDesiredProfileMode"),
+        Field("ventilationLevel"),
+        Field("ventilationState"),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2062,16 +2057,6 @@ class UniversalActuatorChannel(FunctionalChannel):
         self.ventilationLevel = 0.0  # 0.35,
         self.ventilationState = None  # "VENTILATION"
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.dimLevel = js["dimLevel"]
-        self.on = js["on"]
-        self.profileMode = js["profileMode"]
-        self.relayMode = js["relayMode"]
-        self.userDesiredProfileMode = js["userDesiredProfileMode"]
-        self.ventilationLevel = js["ventilationLevel"]
-        self.ventilationState = js["ventilationState"]
-
     def __str__(self):
         return f"{super().__str__()} channelRole({self.channelRole}) dimLevel({self.dimLevel}) ventilationLevel({self.ventilationLevel}) ventilationState({self.ventilationState}) on({self.on}) profileMode({self.profileMode}) relayMode({self.relayMode})"
 
@@ -2079,6 +2064,11 @@ class UniversalActuatorChannel(FunctionalChannel):
 class RainDetectionChannel(FunctionalChannel):
     """this is the representative of the TILT_VIBRATION_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("rainSensorSensitivity", optional=True),
+        Field("raining", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float:
@@ -2086,15 +2076,16 @@ class RainDetectionChannel(FunctionalChannel):
         #:bool:
         self.raining = False
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("rainSensorSensitivity", js)
-        self.set_attr_from_dict("raining", js)
-
 
 class TemperatureDifferenceSensor2Channel(FunctionalChannel):
     """this is the representative of the TEMPERATURE_SENSOR_2_EXTERNAL_DELTA_CHANNEL channel"""
 
+    _fields = (
+        Field("temperatureExternalDelta", optional=True),
+        Field("temperatureExternalOne", optional=True),
+        Field("temperatureExternalTwo", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         #:float:
@@ -2104,12 +2095,6 @@ class TemperatureDifferenceSensor2Channel(FunctionalChannel):
         #:float:
         self.temperatureExternalTwo = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("temperatureExternalDelta", js)
-        self.set_attr_from_dict("temperatureExternalOne", js)
-        self.set_attr_from_dict("temperatureExternalTwo", js)
-
 
 class ExternalBaseChannel(FunctionalChannel):
     """this represents the EXTERNAL_BASE_CHANNEL function-channel for external devices"""
@@ -2124,6 +2109,16 @@ class ExternalBaseChannel(FunctionalChannel):
 class ExternalUniversalLightChannel(FunctionalChannel):
     """this represents the EXTERNAL_UNIVERSAL_LIGHT_CHANNEL function-channel for external devices"""
 
+    _fields = (
+        Field("colorTemperature", optional=True),
+        Field("dimLevel", optional=True),
+        Field("hue", optional=True),
+        Field("maximumColorTemperature", optional=True),
+        Field("minimalColorTemperature", optional=True),
+        Field("on", optional=True),
+        Field("saturationLevel", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2135,17 +2130,6 @@ class ExternalUniversalLightChannel(FunctionalChannel):
         self.on = None
         self.saturationLevel = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("colorTemperature", js)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("hue", js)
-        self.set_attr_from_dict("maximumColorTemperature", js)
-        self.set_attr_from_dict("minimalColorTemperature", js)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("saturationLevel", js)
-
     async def set_dim_level_async(self, dim_level: float):
         """Set the dim level of the light channel."""
         return await functional_channel_commands.set_dim_level_async(
@@ -2162,6 +2146,16 @@ class ExternalUniversalLightChannel(FunctionalChannel):
 class OpticalSignalChannel(FunctionalChannel):
     """this class represents the OPTICAL_SIGNAL_CHANNEL"""
 
+    _fields = (
+        Field("dimLevel", optional=True),
+        Field("on", optional=True),
+        Field("opticalSignalBehaviour", converter=OpticalSignalBehaviour, optional=True),
+        Field("powerUpSwitchState", optional=True),
+        Field("profileMode", optional=True),
+        Field("simpleRGBColorState", converter=RGBColorState),
+        Field("userDesiredProfileMode", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2174,17 +2168,6 @@ class OpticalSignalChannel(FunctionalChannel):
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("opticalSignalBehaviour", js, OpticalSignalBehaviour)
-        self.set_attr_from_dict("powerUpSwitchState", js)
-        self.set_attr_from_dict("profileMode", js)
-        self.simpleRGBColorState = RGBColorState.from_str(js["simpleRGBColorState"])
-        self.set_attr_from_dict("userDesiredProfileMode", js)
-
     def __str__(self):
         return f"{super().__str__()} dimLevel({self.dimLevel}) on({self.on}) opticalSignalBehaviour({self.opticalSignalBehaviour}) powerUpSwitchState({self.powerUpSwitchState}) profileMode({self.profileMode}) simpleRGBColorState({self.simpleRGBColorState}) userDesiredProfileMode({self.userDesiredProfileMode})"
 
@@ -2192,6 +2175,14 @@ class OpticalSignalChannel(FunctionalChannel):
 class CarbonDioxideSensorChannel(FunctionalChannel):
     """Representation of the CarbonDioxideSensorChannel Channel"""
 
+    _fields = (
+        Field("actualTemperature", optional=True),
+        Field("carbonDioxideConcentration", optional=True),
+        Field("carbonDioxideVisualisationEnabled", optional=True),
+        Field("humidity", optional=True),
+        Field("vaporAmount", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actualTemperature = None
@@ -2200,18 +2191,27 @@ class CarbonDioxideSensorChannel(FunctionalChannel):
         self.humidity = None
         self.vaporAmount = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("actualTemperature", js)
-        self.set_attr_from_dict("carbonDioxideConcentration", js)
-        self.set_attr_from_dict("carbonDioxideVisualisationEnabled", js)
-        self.set_attr_from_dict("humidity", js)
-        self.set_attr_from_dict("vaporAmount", js)
-
 
 class ParticulateMatterSensorChannel(FunctionalChannel):
     """Representation of the PARTICULATE_MATTER_SENSOR_CHANNEL channel"""
 
+    _fields = (
+        Field("actualTemperature", optional=True),
+        Field("humidity", optional=True),
+        Field("airQualityIndexTen", optional=True),
+        Field("airQualityIndexTwoPointFive", optional=True),
+        Field("particulateMassConcentrationOne", optional=True),
+        Field("particulateMassConcentrationOneAverage", optional=True),
+        Field("particulateMassConcentrationTen", optional=True),
+        Field("particulateMassConcentrationTenAverage", optional=True),
+        Field("particulateMassConcentrationTwoPointFive", optional=True),
+        Field("particulateMassConcentrationTwoPointFiveAverage", optional=True),
+        Field("particulateNumberConcentrationOne", optional=True),
+        Field("particulateNumberConcentrationTen", optional=True),
+        Field("particulateNumberConcentrationTwoPointFive", optional=True),
+        Field("particulateTypicalSize", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.actualTemperature = None
@@ -2229,27 +2229,35 @@ class ParticulateMatterSensorChannel(FunctionalChannel):
         self.particulateNumberConcentrationTwoPointFive = None
         self.particulateTypicalSize = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("actualTemperature", js)
-        self.set_attr_from_dict("humidity", js)
-        self.set_attr_from_dict("airQualityIndexTen", js)
-        self.set_attr_from_dict("airQualityIndexTwoPointFive", js)
-        self.set_attr_from_dict("particulateMassConcentrationOne", js)
-        self.set_attr_from_dict("particulateMassConcentrationOneAverage", js)
-        self.set_attr_from_dict("particulateMassConcentrationTen", js)
-        self.set_attr_from_dict("particulateMassConcentrationTenAverage", js)
-        self.set_attr_from_dict("particulateMassConcentrationTwoPointFive", js)
-        self.set_attr_from_dict("particulateMassConcentrationTwoPointFiveAverage", js)
-        self.set_attr_from_dict("particulateNumberConcentrationOne", js)
-        self.set_attr_from_dict("particulateNumberConcentrationTen", js)
-        self.set_attr_from_dict("particulateNumberConcentrationTwoPointFive", js)
-        self.set_attr_from_dict("particulateTypicalSize", js)
-
 
 class AccessControllerWiredChannel(DeviceBaseChannel):
     """this is the representative of the ACCESS_CONTROLLER_WIRED_CHANNEL channel"""
 
+    _fields = (
+        Field("accessPointPriority", optional=True),
+        Field("busConfigMismatch", optional=True),
+        Field("busMode", optional=True),
+        Field("controlsMountingOrientation", optional=True),
+        Field("deviceCommunicationError", optional=True),
+        Field("deviceDriveError", optional=True),
+        Field("deviceDriveModeError", optional=True),
+        Field("deviceOperationMode", optional=True),
+        Field("devicePowerFailureDetected", optional=True),
+        Field("displayContrast", optional=True),
+        Field("index", optional=True),
+        Field("label", optional=True),
+        Field("lockJammed", optional=True),
+        Field("mountingOrientation", optional=True),
+        Field("multicastRoutingEnabled", optional=True),
+        Field("particulateMatterSensorCommunicationError", optional=True),
+        Field("particulateMatterSensorError", optional=True),
+        Field("powerShortCircuit", optional=True),
+        Field("powerSupplyCurrent", optional=True),
+        Field("profilePeriodLimitReached", optional=True),
+        Field("shortCircuitDataLine", optional=True),
+        Field("signalBrightness", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.accessPointPriority = None
@@ -2275,35 +2283,20 @@ class AccessControllerWiredChannel(DeviceBaseChannel):
         self.shortCircuitDataLine = None
         self.signalBrightness = 0.0
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.set_attr_from_dict("accessPointPriority", js)
-        self.set_attr_from_dict("busConfigMismatch", js)
-        self.set_attr_from_dict("busMode", js)
-        self.set_attr_from_dict("controlsMountingOrientation", js)
-        self.set_attr_from_dict("deviceCommunicationError", js)
-        self.set_attr_from_dict("deviceDriveError", js)
-        self.set_attr_from_dict("deviceDriveModeError", js)
-        self.set_attr_from_dict("deviceOperationMode", js)
-        self.set_attr_from_dict("devicePowerFailureDetected", js)
-        self.set_attr_from_dict("displayContrast", js)
-        self.set_attr_from_dict("index", js)
-        self.set_attr_from_dict("label", js)
-        self.set_attr_from_dict("lockJammed", js)
-        self.set_attr_from_dict("mountingOrientation", js)
-        self.set_attr_from_dict("multicastRoutingEnabled", js)
-        self.set_attr_from_dict("particulateMatterSensorCommunicationError", js)
-        self.set_attr_from_dict("particulateMatterSensorError", js)
-        self.set_attr_from_dict("powerShortCircuit", js)
-        self.set_attr_from_dict("powerSupplyCurrent", js)
-        self.set_attr_from_dict("profilePeriodLimitReached", js)
-        self.set_attr_from_dict("shortCircuitDataLine", js)
-        self.set_attr_from_dict("signalBrightness", js)
-
 
 class OpticalSignalGroupChannel(FunctionalChannel):
     """this class represents the OPTICAL_SIGNAL_GROUP_CHANNEL"""
 
+    _fields = (
+        Field("dimLevel", optional=True),
+        Field("on", optional=True),
+        Field("opticalSignalBehaviour", converter=OpticalSignalBehaviour, optional=True),
+        Field("powerUpSwitchState", optional=True),
+        Field("profileMode", optional=True),
+        Field("simpleRGBColorState", converter=RGBColorState),
+        Field("userDesiredProfileMode", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2316,17 +2309,6 @@ class OpticalSignalGroupChannel(FunctionalChannel):
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("opticalSignalBehaviour", js, OpticalSignalBehaviour)
-        self.set_attr_from_dict("powerUpSwitchState", js)
-        self.set_attr_from_dict("profileMode", js)
-        self.simpleRGBColorState = RGBColorState.from_str(js["simpleRGBColorState"])
-        self.set_attr_from_dict("userDesiredProfileMode", js)
-
     def __str__(self):
         return f"{super().__str__()} dimLevel({self.dimLevel}) on({self.on}) opticalSignalBehaviour({self.opticalSignalBehaviour}) powerUpSwitchState({self.powerUpSwitchState}) profileMode({self.profileMode}) simpleRGBColorState({self.simpleRGBColorState}) userDesiredProfileMode({self.userDesiredProfileMode})"
 
@@ -2334,6 +2316,30 @@ class OpticalSignalGroupChannel(FunctionalChannel):
 class UniversalLightChannel(FunctionalChannel):
     """Represents Universal Light Channel."""
 
+    _fields = (
+        Field("channelActive", optional=True),
+        Field("colorTemperature", optional=True),
+        Field("controlGearFailure", optional=True),
+        Field("connectedDeviceUnreach", optional=True),
+        Field("dim2WarmActive", optional=True),
+        Field("dimLevel", optional=True),
+        Field("hardwareColorTemperatureColdWhite", optional=True),
+        Field("hardwareColorTemperatureWarmWhite", optional=True),
+        Field("hue", optional=True),
+        Field("humanCentricLightActive", optional=True),
+        Field("lampFailure", optional=True),
+        Field("lightSceneId", optional=True),
+        Field("limitFailure", optional=True),
+        Field("maximumColorTemperature", optional=True),
+        Field("minimalColorTemperature", optional=True),
+        Field("on", optional=True),
+        Field("onMinLevel", optional=True),
+        Field("powerUpSwitchState", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("rampTime", optional=True),
+        Field("saturationLevel", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2359,31 +2365,6 @@ class UniversalLightChannel(FunctionalChannel):
         self.rampTime: int = None
         self.saturationLevel: float = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("channelActive", js)
-        self.set_attr_from_dict("colorTemperature", js)
-        self.set_attr_from_dict("controlGearFailure", js)
-        self.set_attr_from_dict("connectedDeviceUnreach", js)
-        self.set_attr_from_dict("dim2WarmActive", js)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("hardwareColorTemperatureColdWhite", js)
-        self.set_attr_from_dict("hardwareColorTemperatureWarmWhite", js)
-        self.set_attr_from_dict("hue", js)
-        self.set_attr_from_dict("humanCentricLightActive", js)
-        self.set_attr_from_dict("lampFailure", js)
-        self.set_attr_from_dict("lightSceneId", js)
-        self.set_attr_from_dict("limitFailure", js)
-        self.set_attr_from_dict("maximumColorTemperature", js)
-        self.set_attr_from_dict("minimalColorTemperature", js)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("onMinLevel", js)
-        self.set_attr_from_dict("powerUpSwitchState", js)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-        self.set_attr_from_dict("rampTime", js)
-        self.set_attr_from_dict("saturationLevel", js)
-
     async def set_dim_level_async(self, dim_level: float):
         """Set the dim level of the light channel."""
         return await functional_channel_commands.set_dim_level_async(
@@ -2424,20 +2405,25 @@ class UniversalLightChannel(FunctionalChannel):
 class UniversalLightChannelGroup(UniversalLightChannel):
     """Universal-Light-Channel-Group."""
 
+    _fields = (
+        Field("channelSelections", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
         self.channelSelections: list = []
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("channelSelections", js)
-
 
 class CodeProtectedPrimaryActionChannel(FunctionalChannel):
     """this is the representative of the CODE_PROTECTED_PRIMARY_ACTION_CHANNEL channel (HmIP-WKP)"""
 
+    _fields = (
+        Field("actionCodeConfigured", optional=True),
+        Field("actionParameter", optional=True),
+        Field("authorized", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2445,13 +2431,6 @@ class CodeProtectedPrimaryActionChannel(FunctionalChannel):
         self.actionParameter: str | None = None
         self.authorized: bool | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("actionCodeConfigured", js)
-        self.set_attr_from_dict("actionParameter", js)
-        self.set_attr_from_dict("authorized", js)
-
 
 class CodeProtectedSecondaryActionChannel(FunctionalChannel):
     """this is the representative of the CODE_PROTECTED_SECONDARY_ACTION_CHANNEL channel (HmIP-WKP)"""
@@ -2460,6 +2439,12 @@ class CodeProtectedSecondaryActionChannel(FunctionalChannel):
 class CodeProtectedSingleActionChannel(FunctionalChannel):
     """this is the representative of the CODE_PROTECTED_SINGLE_ACTION_CHANNEL channel (HmIP-FWI)"""
 
+    _fields = (
+        Field("actionParameter", optional=True),
+        Field("authorized", optional=True),
+        Field("codeSelections", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2467,17 +2452,18 @@ class CodeProtectedSingleActionChannel(FunctionalChannel):
         self.authorized: bool | None = None
         self.codeSelections: list = []
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-
-        self.set_attr_from_dict("actionParameter", js)
-        self.set_attr_from_dict("authorized", js)
-        self.set_attr_from_dict("codeSelections", js)
-
 
 class WateringActuatorChannel(FunctionalChannel):
     """this is the representative of the WATERING_ACTUATOR_CHANNEL channel"""
 
+    _fields = (
+        Field("waterFlow", default=None),
+        Field("waterVolume", default=None),
+        Field("waterVolumeSinceOpen", default=None),
+        Field("wateringActive", default=None),
+        Field("wateringOnTime", default=None),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
 
@@ -2487,14 +2473,6 @@ class WateringActuatorChannel(FunctionalChannel):
         self.wateringActive: bool | None = None
         self.wateringOnTime: float | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        super().from_json(js, groups)
-        self.waterFlow = js.get("waterFlow")
-        self.waterVolume = js.get("waterVolume")
-        self.waterVolumeSinceOpen = js.get("waterVolumeSinceOpen")
-        self.wateringActive = js.get("wateringActive")
-        self.wateringOnTime = js.get("wateringOnTime")
-
     async def reset_water_volume_async(self):
         """Resets the water volume counter of the specified device."""
         return await functional_channel_commands.reset_water_volume_async(
@@ -2563,6 +2541,20 @@ class NotificationMp3SoundChannel(FunctionalChannel):
     which can play MP3 sounds and show optical signals for various alarm conditions.
     """
 
+    _fields = (
+        Field("dimLevel", optional=True),
+        Field("lightSoundNotificationSettings", optional=True),
+        Field("mp3ErrorState", optional=True),
+        Field("noSoundLowBat", optional=True),
+        Field("on", optional=True),
+        Field("opticalSignalBehaviour", optional=True),
+        Field("playingFileActive", optional=True),
+        Field("profileMode", optional=True),
+        Field("simpleRGBColorState", optional=True),
+        Field("soundFile", optional=True),
+        Field("volumeLevel", optional=True),
+    )
+
     def __init__(self, device, connection):
         super().__init__(device, connection)
         self.dimLevel: float = 0.0
@@ -2577,21 +2569,6 @@ class NotificationMp3SoundChannel(FunctionalChannel):
         self.soundFile: str | None = None
         self.volumeLevel: float | None = None
 
-    def from_json(self, js, groups: Iterable[Group]):
-        """Update the channel attributes from a JSON dictionary."""
-        super().from_json(js, groups)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("lightSoundNotificationSettings", js)
-        self.set_attr_from_dict("mp3ErrorState", js)
-        self.set_attr_from_dict("noSoundLowBat", js)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("opticalSignalBehaviour", js)
-        self.set_attr_from_dict("playingFileActive", js)
-        self.set_attr_from_dict("profileMode", js)
-        self.set_attr_from_dict("simpleRGBColorState", js)
-        self.set_attr_from_dict("soundFile", js)
-        self.set_attr_from_dict("volumeLevel", js)
-
     async def set_rgb_dim_level_async(
         self,
         rgb_color_state: str,
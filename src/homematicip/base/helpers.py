@@ -1,11 +1,45 @@
 import codecs
-import json
 import logging
 import re
 
+from homematicip.base.json_codec import JsonCodec
+
 LOGGER = logging.getLogger(__name__)
 
 
+class IdLookup:
+    """Read-only collection of homematicip objects which resolves ids in O(1).
+
+    It iterates like the list of objects it was built from and is passed to the from_json
+    methods to link groups, devices and channels without scanning lists."""
+
+    __slots__ = ("_by_id",)
+
+    def __init__(self, by_id: dict):
+        self._by_id = by_id
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def get(self, id_, default=None):
+        return self._by_id.get(id_, default)
+
+
+def id_lookup(objects) -> IdLookup:
+    """Return an IdLookup for the given objects. An IdLookup is returned as it is.
+
+    If several objects share an id, the first one wins like in a linear search."""
+    if isinstance(objects, IdLookup):
+        return objects
+    by_id = {}
+    for obj in objects:
+        by_id.setdefault(obj.id, obj)
+    return IdLookup(by_id)
+
+
 def get_functional_channel(channel_type, js):
     for channel in js["functionalChannels"].values():
         if channel["functionalChannelType"] == channel_type:
@@ -61,14 +95,17 @@ def bytes2str(b):
     )
 
 
-def handle_config(json_state: str, anonymize: bool) -> str:
+def handle_config(json_state: str, anonymize: bool, codec: JsonCodec | None = None) -> str:
+    """Return json_state as indented json, with anonymized ids and without the refresh token if anonymize
+    is set. Pass the codec of the connection context, e.g. AsyncHome.json_codec. Without one the standard
+    library is used, the output is the same for every codec."""
     if "errorCode" in json_state:
         LOGGER.error(
             "Could not get the current configuration. Error: %s",
             json_state["errorCode"],
         )
         return None
-    c = json.dumps(json_state, indent=4, sort_keys=True)
+    c = (codec or JsonCodec()).dumps_pretty(json_state)
     if anonymize:
         # generate dummy guids
         c = anonymizeConfig(
@@ -1,33 +1,98 @@
 import asyncio
 import logging
 from datetime import datetime
+from types import MappingProxyType
 
 from homematicip.base.enums import AutoNameEnum
+from homematicip.base.schema import install_fields, intern_attribute_names
 from homematicip.connection.rest_connection import RestConnection, RestResult
 
 LOGGER = logging.getLogger(__name__)
 
 
+_MISSING = object()
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+#: Shared by all objects without handlers, replaced by a list on the first registration.
+_NO_HANDLERS = ()
+#: Stands in for the raw json of objects which released it.
+_RELEASED_JSON = MappingProxyType({})
+
+
+def _values_differ(old, new) -> bool:
+    """Compare two attribute values. Nested objects like the weather are recreated on every update,
+    they count as changed only if they were parsed from different json."""
+    if old is new:
+        return False
+    if type(old) in _SCALAR_TYPES:
+        return type(old) is not type(new) or old != new
+    if isinstance(old, HomeMaticIPObject) and isinstance(new, HomeMaticIPObject):
+        return type(old) is not type(new) or old._rawJSONData != new._rawJSONData
+    if isinstance(old, list) and isinstance(new, list):
+        return len(old) != len(new) or any(_values_differ(a, b) for a, b in zip(old, new, strict=True))
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() != new.keys() or any(_values_differ(v, new[k]) for k, v in old.items())
+    try:
+        return bool(old != new)
+    except Exception:
+        return True
+
+
 class HomeMaticIPObject:
     """This class represents a generic homematic ip object to make
     basic requests to the access point"""
 
+    # The bookkeeping every object carries lives in slots. The attributes parsed from json stay in the
+    # instance __dict__ because set_attr_from_dict adds them dynamically.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_connection",
+        "_on_remove",
+        "_on_update",
+        "_rawJSONData",
+        "_dictAttributes",
+        "_version",
+        "_changed_fields",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # classes describing their json in a field table get a generated from_json, see base/schema.py
+        if "_fields" in cls.__dict__:
+            install_fields(cls)
+
     def __init__(self, connection):
         self._connection: RestConnection = connection
         #: List with remove handlers.
-        self._on_remove = []
+        self._on_remove = _NO_HANDLERS
         #: List with update handlers.
-        self._on_update = []
+        self._on_update = _NO_HANDLERS
 
         #:the raw json data of the object
         self._rawJSONData = {}
 
-        # list[str]:List of all attributes which were added via set_attr_from_dict
-        self._dictAttributes = []
+        # tuple[str]:All attributes which were added via set_attr_from_dict
+        self._dictAttributes = ()
+
+        self._version = 0
+        self._changed_fields: frozenset[str] = frozenset()
+
+    @property
+    def version(self) -> int:
+        """Increases every time an update through update_from_json changed at least one attribute."""
+        return self._version
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """The names of the attributes changed by the last update through update_from_json."""
+        return self._changed_fields
 
     def on_remove(self, handler):
         """Adds an event handler to the remove method. Fires when a device
         is removed."""
+        if not self._on_remove:
+            self._on_remove = []
         self._on_remove.append(handler)
 
     def fire_remove_event(self, *args, **kwargs):
@@ -38,6 +103,8 @@ class HomeMaticIPObject:
     def on_update(self, handler):
         """Adds an event handler to the update method. Fires when a device
         is updated."""
+        if not self._on_update:
+            self._on_update = []
         self._on_update.append(handler)
 
     def fire_update_event(self, *args, **kwargs):
@@ -63,14 +130,22 @@ class HomeMaticIPObject:
         loop = self._get_or_create_loop()
         return loop.run_until_complete(self._connection.async_post(path, body, custom_header))
 
-    async def _rest_call_async(self, path, body=None, custom_header: dict | None = None):
+    async def _rest_call_async(self, path, body=None, custom_header: dict | None = None, decode_json: bool = True,
+                               on_chunk=None):
         """Run a rest call async
 
         Args:
             path (str): the path to call without base url
             body (dict): the body to send
             custom_header (dict): the custom header to send. This will be merged with the default header
+            decode_json (bool): set to False to get the undecoded response body in RestResult.content
+            on_chunk (Callable): called with every chunk of the response body while it downloads, the body
+                is not kept then
         """
+        if on_chunk is not None:
+            return await self._connection.async_post(path, body, custom_header, on_chunk=on_chunk)
+        if not decode_json:
+            return await self._connection.async_post(path, body, custom_header, decode_json=False)
         return await self._connection.async_post(path, body, custom_header)
 
     def from_json(self, js) -> None:
@@ -80,7 +155,45 @@ class HomeMaticIPObject:
         """
         self._rawJSONData = js
 
-    def fromtimestamp(self, timestamp):
+    def release_raw_json(self) -> None:
+        """Drop the retained raw json to save memory. An incremental update treats the object as changed
+        afterwards because there is nothing to compare with."""
+        self._rawJSONData = _RELEASED_JSON
+
+    def update_from_json(self, js, *args, **kwargs) -> frozenset[str]:
+        """Run from_json and record which public attributes changed their value.
+
+        The names are stored in changed_fields and version is increased if anything changed.
+
+        :return: the names of the changed attributes
+        """
+        before = self.__dict__.copy()
+        self.from_json(js, *args, **kwargs)
+        changed = []
+        for k, new in self.__dict__.items():
+            old = before.get(k, _MISSING)
+            if old is new or k[0] == "_":
+                continue
+            if old is _MISSING or _values_differ(old, new):
+                changed.append(k)
+        changed = frozenset(changed)
+        self._record_changes(changed)
+        return changed
+
+    def _record_changes(self, changed: frozenset[str], merge: bool = False) -> None:
+        """Store the changed fields of an update. With merge they are added to the ones of the current
+        update, e.g. the channels loaded after the device itself, and version is increased only once."""
+        if merge:
+            if changed and not self._changed_fields:
+                self._version += 1
+            self._changed_fields |= changed
+            return
+        self._changed_fields = changed
+        if changed:
+            self._version += 1
+
+    @staticmethod
+    def fromtimestamp(timestamp):
         """internal helper function which will create a datetime object from a timestamp"""
         if timestamp is None or timestamp <= 0:
             return None
@@ -115,7 +228,7 @@ class HomeMaticIPObject:
 
         self.__dict__[attr] = value
         if addToStrOutput and attr not in self._dictAttributes:
-            self._dictAttributes.append(attr)
+            self._dictAttributes = intern_attribute_names(self._dictAttributes + (attr,))
 
     def str_from_attr_map(self) -> str:
         """this method will return a string with all key/values which were added via the set_attr_from_dict method"""
@@ -0,0 +1,102 @@
+import functools
+import json
+from typing import Any
+
+
+class JsonCodec:
+    """Encodes and decodes json with the standard library.
+
+    A codec is configured once per ConnectionContext (``ConnectionContext.json_codec``) and used for the
+    request bodies, the responses including home/getCurrentState, the websocket frames and the config
+    dumps of handle_config. OrjsonCodec and MsgspecCodec do the same several times faster if orjson or
+    msgspec is installed, default_json_codec picks the fastest one available. Their pretty dumps are the
+    ones of the standard library, so an optional library never changes what users see.
+
+    loads raises ValueError for input which is not valid json, whatever the backend.
+    """
+
+    name = "json"
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Return obj as compact utf-8 encoded json, like httpx encodes a json body."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+    def dumps_pretty(self, obj: Any) -> str:
+        """Return obj as json indented by four spaces with sorted keys, the same for every backend."""
+        return json.dumps(obj, indent=4, sort_keys=True)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """JsonCodec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.loads = orjson.loads
+        self.dumps = orjson.dumps
+
+
+class MsgspecCodec(JsonCodec):
+    """JsonCodec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self.dumps = msgspec.json.Encoder().encode
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as err:
+            raise ValueError(str(err)) from err
+
+
+#: the codecs by name, fastest first
+JSON_CODECS: dict[str, type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+
+def get_json_codec(name: str) -> JsonCodec:
+    """Return a new codec of the backend name ("orjson", "msgspec" or "json").
+
+    @raises ValueError: If there is no backend of that name
+    @raises ImportError: If the library of the backend is not installed
+    """
+    try:
+        codec_class = JSON_CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unknown json codec '{name}', use one of {', '.join(JSON_CODECS)}") from None
+    return codec_class()
+
+
+@functools.cache
+def _fastest_codec_class() -> type[JsonCodec]:
+    for name, codec_class in JSON_CODECS.items():
+        try:
+            get_json_codec(name)
+        except ImportError:
+            continue
+        return codec_class
+    return JsonCodec
+
+
+def default_json_codec() -> JsonCodec:
+    """Return a new codec of the fastest installed backend: orjson, msgspec or else the standard library.
+
+    Every ConnectionContext and AsyncHome gets its own codec from it, which can be replaced separately."""
+    return _fastest_codec_class()()
@@ -0,0 +1,151 @@
+"""Declarative field tables for the from_json parsers.
+
+A class lists the json keys it reads in ``_fields`` instead of writing a from_json method::
+
+    class DoorChannel(FunctionalChannel):
+        _fields = (
+            Field("doorState", converter=DoorState),
+            Field("processing", optional=True),
+        )
+
+When the class is created a from_json is generated from the table of the class and the tables of
+its parents up to the next hand-written from_json, which is called first. The generated code reads
+every field directly, without the per attribute calls of set_attr_from_dict, and produces the same
+objects as the equivalent hand-written method. Classes without an own __init__ get one which sets
+the attributes of their fields to Field.initial, so new device or channel types can be added as
+data with define_class.
+"""
+
+import keyword
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from homematicip.base.enums import AutoNameEnum
+
+#: Objects of one class mostly share the same attribute names, so they share the tuple listing them.
+_ATTRIBUTE_NAMES: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+#: Marks a Field without a default.
+MISSING: Any = type("MissingType", (), {"__repr__": lambda self: "MISSING"})()
+
+
+def intern_attribute_names(names: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the shared tuple equal to names."""
+    return _ATTRIBUTE_NAMES.setdefault(names, names)
+
+
+@dataclass(frozen=True)
+class Field:
+    """A json key which is parsed into an attribute.
+
+    Args:
+        key(str): the key in the json object
+        attr(str): the name of the attribute. Set this to None(default) to use key
+        converter: called with the json value. An AutoNameEnum is converted with its from_str
+        optional(bool): like set_attr_from_dict the attribute is only set if the key is in the json
+            and listed in str_from_attr_map. Otherwise the key is required
+        default: the value of a missing key. Only for fields which are not optional
+        str_output(bool): should an optional attribute be returned via __str__()
+        initial: the value the generated __init__ sets the attribute to
+    """
+
+    key: str
+    attr: str | None = None
+    converter: Callable[[Any], Any] | None = None
+    optional: bool = False
+    default: Any = MISSING
+    str_output: bool = True
+    initial: Any = None
+
+    def __post_init__(self):
+        if self.attr is None:
+            object.__setattr__(self, "attr", self.key)
+        if not self.attr.isidentifier() or keyword.iskeyword(self.attr):
+            raise ValueError(f"'{self.attr}' isn't a valid attribute name")
+        if self.optional and self.default is not MISSING:
+            raise ValueError(f"optional field '{self.key}' can't have a default")
+
+
+def _field_lines(fields: tuple[Field, ...], namespace: dict[str, Any]) -> list[str]:
+    """Return the statements applying fields to self from js and add the converters to namespace."""
+    lines = []
+    optional = any(f.optional for f in fields)
+    if optional:
+        lines += ["    d = self.__dict__", "    names = self._dictAttributes"]
+    for i, f in enumerate(fields):
+        value = f"js[{f.key!r}]"
+        if f.default is not MISSING:
+            namespace[f"_default{i}"] = f.default
+            value = f"js.get({f.key!r}, _default{i})"
+        if f.converter is not None:
+            converter = f.converter
+            if isinstance(converter, type) and issubclass(converter, AutoNameEnum):
+                converter = converter.from_str
+            namespace[f"_convert{i}"] = converter
+            value = f"_convert{i}({value})"
+        if not f.optional:
+            lines.append(f"    self.{f.attr} = {value}")
+            continue
+        lines += [f"    if {f.key!r} in js:", f"        d[{f.attr!r}] = {value}"]
+        if f.str_output:
+            lines += [f"        if {f.attr!r} not in names:", f"            names += ({f.attr!r},)"]
+    if optional:
+        lines += ["    if names is not self._dictAttributes:", "        self._dictAttributes = _intern(names)"]
+    return lines
+
+
+def _generate(signature: str, head: list[str], fields: tuple[Field, ...], namespace: dict[str, Any]):
+    namespace["_intern"] = intern_attribute_names
+    lines = [f"def {signature}:", *head, *_field_lines(fields, namespace)]
+    if len(lines) == 1:
+        lines.append("    pass")
+    exec("\n".join(lines), namespace)  # the source is built from validated names only
+    return namespace[signature.split("(", 1)[0]]
+
+
+def compile_fields(fields: Iterable[Field]) -> Callable[[Any, dict], None]:
+    """Generate a function parse(obj, js) which applies the fields to obj.
+
+    Required fields are assigned like ``obj.attr = js[key]``, optional fields like
+    ``obj.set_attr_from_dict(attr, js)``, both in the given order."""
+    return _generate("parse(self, js)", [], tuple(fields), {})
+
+
+def install_fields(cls: type) -> None:
+    """Generate from_json (and __init__ if the class has none) of cls from its _fields."""
+    if "from_json" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} defines both _fields and from_json")
+    own = tuple(cls.__dict__["_fields"])
+
+    base_from_json = super(cls, cls).from_json
+    base_from_json, inherited = getattr(base_from_json, "_schema", (base_from_json, ()))
+    fields = inherited + own
+    from_json = _generate(
+        "from_json(self, js, *args, **kwargs)",
+        ["    _base(self, js, *args, **kwargs)"],
+        fields,
+        {"_base": base_from_json},
+    )
+    from_json._schema = (base_from_json, fields)
+    from_json.__doc__ = f"this method will parse the {cls.__name__} object from a json object"
+    from_json.__qualname__ = f"{cls.__qualname__}.from_json"
+    cls.from_json = from_json
+
+    if "__init__" not in cls.__dict__:
+        base_init = super(cls, cls).__init__
+
+        def __init__(self, *args, **kwargs):
+            base_init(self, *args, **kwargs)
+            for f in own:
+                setattr(self, f.attr, f.initial)
+
+        __init__.__qualname__ = f"{cls.__qualname__}.__init__"
+        cls.__init__ = __init__
+
+
+def define_class(name: str, base: type, fields: Iterable[Field], doc: str | None = None) -> type:
+    """Create a subclass of base which parses the given fields, e.g. for a new functional channel type.
+
+    The class still has to be registered in the maps of homematicip.class_maps."""
+    return type(name, (base,), {"__doc__": doc, "__module__": base.__module__, "_fields": tuple(fields)})
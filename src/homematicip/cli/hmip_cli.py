@@ -136,7 +136,7 @@ async def run(config: homematicip.HmipConfig, home: AsyncHome, logger: logging.L
         command_entered = True
         json_state = await home.download_configuration_async()
 
-        output = handle_config(json_state, args.anonymize)
+        output = handle_config(json_state, args.anonymize, home.json_codec)
         if output:
             print(output)
 
@@ -8,3 +8,20 @@ THROTTLE_STATUS_CODE: int = 429
 # Initial rate limiter settings
 RATE_LIMITER_TOKENS: int = 10  # Number of tokens in the bucket
 RATE_LIMITER_FILL_RATE: int = 8  # Fill rate of the bucket in tokens per second
+
+# Adaptive (AIMD) rate limiter settings
+RATE_LIMITER_DECREASE_FACTOR: float = 0.5  # The rate is multiplied by this factor on every 429 response
+RATE_LIMITER_INCREASE_AFTER: int = 10  # Number of successful requests in a row before the rate is raised
+RATE_LIMITER_INCREASE_STEP: float = 0.1  # The rate is raised by this share of the configured rate
+RATE_LIMITER_MAX_SLOWDOWN: int = 8  # The rate never drops below the configured rate divided by this value
+RATE_LIMITER_MAX_THROTTLE_RETRIES: int = 5  # Number of times a throttled request is re-queued
+RATE_LIMITER_MAX_RETRY_AFTER: float = 3600.0  # Longest Retry-After in seconds the bucket pauses for
+
+# Pooled http client settings used when the connection owns its httpx client
+HTTP_MAX_CONNECTIONS: int = 10  # Maximum number of concurrent connections
+HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 5  # Maximum number of idle keep-alive connections
+HTTP_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle keep-alive connection is kept open
+
+# Offline mode settings
+OFFLINE_QUEUE_SIZE: int = 50  # Maximum number of commands queued while the cloud is unreachable
+OFFLINE_QUEUE_MAX_AGE: float = 300.0  # Seconds a queued command may wait, older ones are dropped when flushing
@@ -1,63 +1,162 @@
 import asyncio
 import time
+from collections import deque
+
+# Tolerance for float rounding when comparing fractional token counts.
+_EPSILON = 1e-9
 
 
 class Buckets:
     """Class to manage the rate limiting of the HomematicIP Cloud API.
-    The implementation is based on the token bucket algorithm."""
+    The implementation is based on the token bucket algorithm.
+
+    Tokens refill continuously (fractional) based on the monotonic clock. Callers which have to wait are
+    queued in strict FIFO order and woken up exactly at the instant enough tokens are available for the
+    caller at the head of the queue."""
 
-    def __init__(self, tokens: int, fill_rate: int):
+    def __init__(self, tokens: int, fill_rate: float):
         """Initialize the Buckets with a token bucket algorithm.
 
         :param tokens: The number of tokens in the bucket.
-        :param fill_rate: The fill rate of the bucket in tokens every x seconds."""
+        :param fill_rate: The fill rate of the bucket: one token is added every x seconds."""
         self.capacity: int = tokens
-        self._tokens:int  = tokens
-        self.fill_rate: int = fill_rate
-        self.timestamp: float = time.time()
-        self.lock: asyncio.Lock = asyncio.Lock()
+        self._tokens: float = float(tokens)
+        self.fill_rate: float = fill_rate
+        self.timestamp: float = time.monotonic()
+        self._waiters: deque[tuple[asyncio.Future, int]] = deque()
+        self._wakeup: asyncio.TimerHandle | None = None
 
     async def take(self, tokens: int = 1) -> bool:
         """Get a single token from the bucket. Return True if successful, False otherwise.
 
+        Callers already waiting in wait_and_take are served first, so take() fails while the queue is not empty.
+
         :param tokens: The number of tokens to take from the bucket. Default is 1.
         :return: True if successful, False otherwise.
         """
-        async with self.lock:
-            if tokens <= await self.tokens():
-                self._tokens -= tokens
-                return True
+        self._refill()
+        if not self._waiters and tokens <= self._tokens + _EPSILON:
+            self._consume(tokens)
+            return True
         return False
 
-    async def wait_and_take(self, timeout: int = 120, tokens: int = 1) -> bool:
+    async def wait_and_take(self, timeout: float = 120, tokens: int = 1) -> bool:
         """Wait until a token is available and then take it. Return True if successful, False otherwise.
 
         :param timeout: The maximum time to wait for a token in seconds. Default is 120 seconds.
         :param tokens: The number of tokens to take from the bucket. Default is 1.
         :return: True if successful, False otherwise.
+        :raises TimeoutError: If no token could be taken within timeout.
+        :raises ValueError: If more tokens are requested than the bucket can hold.
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot take {tokens} tokens from a bucket with capacity {self.capacity}.")
+
+        if await self.take(tokens):
+            return True
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((waiter, tokens))
+        self._schedule_wakeup()
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            self._abandon(waiter, tokens)
+            raise TimeoutError("Timeout while waiting for token.") from None
+        except asyncio.CancelledError:
+            self._abandon(waiter, tokens)
+            raise
+        return True
+
+    def release(self, tokens: int = 1) -> None:
+        """Return tokens which were taken but not used to the bucket.
+
+        :param tokens: The number of tokens to return. Default is 1.
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + tokens)
+        if self._waiters:
+            self._dispatch()
+
+    def set_fill_rate(self, fill_rate: float) -> None:
+        """Change the fill rate. Tokens refilled so far are kept, waiters are rescheduled for the new rate.
+
+        :param fill_rate: The new fill rate: one token is added every x seconds.
         """
-        start_time = time.time()
-        while True:
-            # Hold the lock for the check + decrement so concurrent callers
-            # cannot both observe enough tokens and both take them. Release
-            # before sleeping so a refill can complete and other waiters can
-            # try in the meantime.
-            async with self.lock:
-                if tokens <= await self.tokens():
-                    self._tokens -= tokens
-                    return True
-
-            if time.time() - start_time > timeout:
-                raise TimeoutError("Timeout while waiting for token.")
-
-            await asyncio.sleep(1)  # Wait for a second before checking again
-
-    async def tokens(self):
+        self._refill()
+        self.fill_rate = fill_rate
+        if self._waiters:
+            self._schedule_wakeup()
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and stop refilling it for the given number of seconds.
+
+        :param seconds: The time in seconds until the bucket starts refilling again.
+        """
+        self._refill()
+        self._tokens = 0.0
+        self.timestamp = max(self.timestamp, time.monotonic() + seconds)
+        if self._waiters:
+            self._schedule_wakeup()
+
+    async def tokens(self) -> float:
         """Get the number of tokens in the bucket. Refill the bucket if necessary."""
-        if self._tokens < self.capacity:
-            now = time.time()
-            delta = int((now - self.timestamp) / self.fill_rate)
-            if delta > 0:
-                self._tokens = min(self.capacity, self._tokens + delta)
-                self.timestamp = now
+        self._refill()
         return self._tokens
+
+    def waiting(self) -> int:
+        """Return the number of callers currently waiting for a token."""
+        return len(self._waiters)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now < self.timestamp:
+            # paused
+            return
+        if self._tokens < self.capacity:
+            self._tokens = min(self.capacity, self._tokens + (now - self.timestamp) / self.fill_rate)
+        self.timestamp = now
+
+    def _consume(self, tokens: int) -> None:
+        self._tokens = max(0.0, self._tokens - tokens)
+
+    def _dispatch(self) -> None:
+        """Hand out tokens to the waiters in FIFO order and schedule the next wakeup."""
+        self._wakeup = None
+        self._refill()
+        while self._waiters:
+            waiter, tokens = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if tokens > self._tokens + _EPSILON:
+                break
+            self._waiters.popleft()
+            self._consume(tokens)
+            waiter.set_result(True)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        """Arm a timer for the instant the head of the queue can be served."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        if not self._waiters:
+            return
+        missing = self._waiters[0][1] - self._tokens
+        # tokens accrue from self.timestamp on, which lies in the future while paused
+        delay = max(0.0, self.timestamp - time.monotonic() + missing * self.fill_rate)
+        self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _abandon(self, waiter: asyncio.Future, tokens: int) -> None:
+        """Remove a timed out or cancelled waiter. Tokens already granted to it are returned to the bucket."""
+        if waiter.done() and not waiter.cancelled():
+            self._tokens = min(self.capacity, self._tokens + tokens)
+        else:
+            waiter.cancel()
+            for entry in self._waiters:
+                if entry[0] is waiter:
+                    self._waiters.remove(entry)
+                    break
+        self._dispatch()
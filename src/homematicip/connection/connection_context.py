@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from ssl import SSLContext
 
 import httpx
 
+from homematicip.base.enums import WebsocketOverflowPolicy
+from homematicip.base.json_codec import JsonCodec, default_json_codec
 from homematicip.connection.client_characteristics_builder import (
     ClientCharacteristicsBuilder,
 )
@@ -23,7 +25,11 @@ class ConnectionContextBuilder:
                                   websocket_connect_timeout: int = 30,
                                   websocket_message_stale_timeout: int = 1800,
                                   websocket_initial_backoff: int = 8,
-                                  websocket_max_backoff: int = 900):
+                                  websocket_max_backoff: int = 900,
+                                  websocket_dispatch_queue_size: int = 1000,
+                                  websocket_overflow_policy: WebsocketOverflowPolicy = WebsocketOverflowPolicy.BLOCK,
+                                  websocket_handler_concurrency: int = 1,
+                                  websocket_handler_timeout: float | None = None):
         """
         Create a new connection context and lookup urls
 
@@ -34,25 +40,22 @@ class ConnectionContextBuilder:
         :param httpx_client_session: The httpx client session if you want to use a custom one
         :param ssl_ctx: ssl context to use
         :return: a new ConnectionContext
-        """
-        ctx = ConnectionContext()
-        ctx.accesspoint_id = accesspoint_id
-        ctx.client_auth_token = ClientTokenBuilder.build_client_token(accesspoint_id)
-        ctx.ssl_ctx = ssl_ctx
-        ctx.enforce_ssl = enforce_ssl
-        ctx.websocket_heartbeat_interval = websocket_heartbeat_interval
-        ctx.websocket_connect_timeout = websocket_connect_timeout
-        ctx.websocket_message_stale_timeout = websocket_message_stale_timeout
-        ctx.websocket_initial_backoff = websocket_initial_backoff
-        ctx.websocket_max_backoff = websocket_max_backoff
 
+        The websocket_* parameters are stored on the context unchanged, see ConnectionContext.
+        """
+        ctx = cls._new_context(accesspoint_id, auth_token, enforce_ssl, ssl_ctx,
+                               websocket_heartbeat_interval=websocket_heartbeat_interval,
+                               websocket_connect_timeout=websocket_connect_timeout,
+                               websocket_message_stale_timeout=websocket_message_stale_timeout,
+                               websocket_initial_backoff=websocket_initial_backoff,
+                               websocket_max_backoff=websocket_max_backoff,
+                               websocket_dispatch_queue_size=websocket_dispatch_queue_size,
+                               websocket_overflow_policy=websocket_overflow_policy,
+                               websocket_handler_concurrency=websocket_handler_concurrency,
+                               websocket_handler_timeout=websocket_handler_timeout)
         cc = ClientCharacteristicsBuilder.get(accesspoint_id)
         ctx.rest_url, ctx.websocket_url = await ConnectionUrlResolver().lookup_urls_async(cc, lookup_url, enforce_ssl,
                                                                                           ssl_ctx, httpx_client_session)
-
-        if auth_token is not None:
-            ctx.auth_token = auth_token
-
         return ctx
 
     @classmethod
@@ -65,7 +68,11 @@ class ConnectionContextBuilder:
                       websocket_connect_timeout: int = 30,
                       websocket_message_stale_timeout: int = 1800,
                       websocket_initial_backoff: int = 8,
-                      websocket_max_backoff: int = 900):
+                      websocket_max_backoff: int = 900,
+                      websocket_dispatch_queue_size: int = 1000,
+                      websocket_overflow_policy: WebsocketOverflowPolicy = WebsocketOverflowPolicy.BLOCK,
+                      websocket_handler_concurrency: int = 1,
+                      websocket_handler_timeout: float | None = None):
         """
         Create a new connection context and lookup urls
 
@@ -75,24 +82,77 @@ class ConnectionContextBuilder:
         :param enforce_ssl: Disable ssl verification by setting enforce_ssl to False
         :param ssl_ctx: ssl context to use
         :return: a new ConnectionContext
-        """
-        ctx = ConnectionContext()
-        ctx.accesspoint_id = accesspoint_id
-        ctx.client_auth_token = ClientTokenBuilder.build_client_token(accesspoint_id)
-        ctx.ssl_ctx = ssl_ctx
-        ctx.enforce_ssl = enforce_ssl
-        ctx.websocket_heartbeat_interval = websocket_heartbeat_interval
-        ctx.websocket_connect_timeout = websocket_connect_timeout
-        ctx.websocket_message_stale_timeout = websocket_message_stale_timeout
-        ctx.websocket_initial_backoff = websocket_initial_backoff
-        ctx.websocket_max_backoff = websocket_max_backoff
 
+        The websocket_* parameters are stored on the context unchanged, see ConnectionContext.
+        """
+        ctx = cls._new_context(accesspoint_id, auth_token, enforce_ssl, ssl_ctx,
+                               websocket_heartbeat_interval=websocket_heartbeat_interval,
+                               websocket_connect_timeout=websocket_connect_timeout,
+                               websocket_message_stale_timeout=websocket_message_stale_timeout,
+                               websocket_initial_backoff=websocket_initial_backoff,
+                               websocket_max_backoff=websocket_max_backoff,
+                               websocket_dispatch_queue_size=websocket_dispatch_queue_size,
+                               websocket_overflow_policy=websocket_overflow_policy,
+                               websocket_handler_concurrency=websocket_handler_concurrency,
+                               websocket_handler_timeout=websocket_handler_timeout)
         cc = ClientCharacteristicsBuilder.get(accesspoint_id)
         ctx.rest_url, ctx.websocket_url = ConnectionUrlResolver().lookup_urls(cc, lookup_url, enforce_ssl, ssl_ctx)
+        return ctx
+
+    @classmethod
+    def build_context_with_urls(cls, accesspoint_id: str, rest_url: str, websocket_url: str,
+                                auth_token: str | None = None,
+                                enforce_ssl: bool = True,
+                                ssl_ctx: SSLContext | str | bool | None = None,
+                                websocket_heartbeat_interval: int = 30,
+                                websocket_connect_timeout: int = 30,
+                                websocket_message_stale_timeout: int = 1800,
+                                websocket_initial_backoff: int = 8,
+                                websocket_max_backoff: int = 900,
+                                websocket_dispatch_queue_size: int = 1000,
+                                websocket_overflow_policy: WebsocketOverflowPolicy = WebsocketOverflowPolicy.BLOCK,
+                                websocket_handler_concurrency: int = 1,
+                                websocket_handler_timeout: float | None = None):
+        """
+        Create a new connection context with known urls, e.g. from an earlier lookup, without a lookup
 
+        :param accesspoint_id: Access point id
+        :param rest_url: The rest url returned by the lookup
+        :param websocket_url: The websocket url returned by the lookup
+        :param auth_token: The Auth Token if exists. If no one is provided None will be used
+        :param enforce_ssl: Disable ssl verification by setting enforce_ssl to False
+        :param ssl_ctx: ssl context to use
+        :return: a new ConnectionContext
+
+        The websocket_* parameters are stored on the context unchanged, see ConnectionContext.
+        """
+        ctx = cls._new_context(accesspoint_id, auth_token, enforce_ssl, ssl_ctx,
+                               websocket_heartbeat_interval=websocket_heartbeat_interval,
+                               websocket_connect_timeout=websocket_connect_timeout,
+                               websocket_message_stale_timeout=websocket_message_stale_timeout,
+                               websocket_initial_backoff=websocket_initial_backoff,
+                               websocket_max_backoff=websocket_max_backoff,
+                               websocket_dispatch_queue_size=websocket_dispatch_queue_size,
+                               websocket_overflow_policy=websocket_overflow_policy,
+                               websocket_handler_concurrency=websocket_handler_concurrency,
+                               websocket_handler_timeout=websocket_handler_timeout)
+        ctx.rest_url = rest_url
+        ctx.websocket_url = websocket_url
+        return ctx
+
+    @classmethod
+    def _new_context(cls, accesspoint_id: str, auth_token: str | None, enforce_ssl: bool,
+                     ssl_ctx: SSLContext | str | bool | None, **websocket_settings) -> "ConnectionContext":
+        """Create the context every builder starts from, the caller sets the urls."""
+        ctx = ConnectionContext(
+            accesspoint_id=accesspoint_id,
+            client_auth_token=ClientTokenBuilder.build_client_token(accesspoint_id),
+            enforce_ssl=enforce_ssl,
+            ssl_ctx=ssl_ctx,
+            **websocket_settings,
+        )
         if auth_token is not None:
             ctx.auth_token = auth_token
-
         return ctx
 
 
@@ -112,3 +172,8 @@ class ConnectionContext:
     websocket_message_stale_timeout: int = 1800
     websocket_initial_backoff: int = 8
     websocket_max_backoff: int = 900
+    websocket_dispatch_queue_size: int = 1000
+    websocket_overflow_policy: WebsocketOverflowPolicy = WebsocketOverflowPolicy.BLOCK
+    websocket_handler_concurrency: int = 1
+    websocket_handler_timeout: float | None = None
+    json_codec: JsonCodec = field(default_factory=default_json_codec)
@@ -1,3 +1,5 @@
+import httpx
+
 from homematicip.connection.connection_context import ConnectionContext
 from homematicip.connection.rate_limited_rest_connection import (
     RateLimitedRestConnection,
@@ -10,8 +12,11 @@ class ConnectionFactory:
 
     @staticmethod
     def create_connection(context: ConnectionContext, use_rate_limited_connection: bool = True,
-                          httpx_client_session=None) -> RestConnection:
-        """creates a connection object with the given context"""
+                          httpx_client_session=None, limits: httpx.Limits | None = None) -> RestConnection:
+        """creates a connection object with the given context
+
+        If no httpx_client_session is given, the connection owns a pooled httpx client configured with limits
+        (or RestConnection.default_limits()). Close it with ``await connection.close()`` when done."""
         if use_rate_limited_connection:
-            return RateLimitedRestConnection(context, httpx_client_session=httpx_client_session)
-        return RestConnection(context, httpx_client_session=httpx_client_session)
+            return RateLimitedRestConnection(context, httpx_client_session=httpx_client_session, limits=limits)
+        return RestConnection(context, httpx_client_session=httpx_client_session, limits=limits)
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from homematicip.base.enums import WebsocketOverflowPolicy
+from homematicip.connection.websocket_message import WebsocketMessage
+
+_CHANGED_EVENT_KEYS = {"DEVICE_CHANGED": "device", "GROUP_CHANGED": "group", "CLIENT_CHANGED": "client"}
+
+
+def entity_coalesce_key(data: Any) -> Hashable | None:
+    """Return (event type, id) if the websocket message data holds a single DEVICE_CHANGED, GROUP_CHANGED or
+    CLIENT_CHANGED event. A later message with the same key carries the complete newer state of the entity.
+    HOME_CHANGED is keyed by its type. Other messages return None and are never coalesced. A WebsocketMessage
+    keeps the decoded frame for the handlers."""
+    try:
+        events = (data.decoded() if isinstance(data, WebsocketMessage) else json.loads(data))["events"]
+        if len(events) != 1:
+            return None
+        (event,) = events.values()
+        event_type = event["pushEventType"]
+        if event_type == "HOME_CHANGED":
+            return (event_type,)
+        return (event_type, event[_CHANGED_EVENT_KEYS[event_type]]["id"])
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+@dataclass
+class DispatchStats:
+    """Counters of the dispatch queue of a WebsocketHandler."""
+
+    #: messages waiting for the handlers right now
+    depth: int = 0
+    #: the largest depth seen
+    max_depth: int = 0
+    #: messages dropped by WebsocketOverflowPolicy.DROP_OLDEST
+    dropped: int = 0
+    #: messages replaced by a newer one by WebsocketOverflowPolicy.COALESCE
+    coalesced: int = 0
+    #: times the receive loop waited for free space
+    blocked: int = 0
+    #: seconds the last dispatched message waited in the queue
+    last_lag: float = 0.0
+    #: the longest wait of a message in the queue
+    max_lag: float = 0.0
+
+
+class DispatchQueue:
+    """Bounded FIFO between the websocket receive loop and the message handlers.
+
+    put() is called by the receive loop, get() by the dispatcher. If the queue is full, put() applies the
+    overflow policy: BLOCK waits for free space, DROP_OLDEST drops the oldest message and COALESCE replaces
+    the queued message with the same coalesce_key in place, or waits like BLOCK if there is none.
+    """
+
+    def __init__(self, maxsize: int, policy: WebsocketOverflowPolicy = WebsocketOverflowPolicy.BLOCK,
+                 coalesce_key: Callable[[Any], Hashable | None] = entity_coalesce_key,
+                 stats: DispatchStats | None = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._coalesce_key = coalesce_key
+        self.stats = stats if stats is not None else DispatchStats()
+        # entries are [message, time queued, coalesce key]
+        self._entries: deque[list] = deque()
+        self._by_key: dict[Hashable, list] = {}
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def put(self, message: Any, data: Any = None) -> None:
+        """Queue message. data is passed to coalesce_key and defaults to message."""
+        key = None
+        if self.policy is WebsocketOverflowPolicy.COALESCE:
+            key = self._coalesce_key(message if data is None else data)
+        while len(self._entries) >= self.maxsize:
+            if self.policy is WebsocketOverflowPolicy.DROP_OLDEST:
+                self._forget(self._entries.popleft())
+                self.stats.dropped += 1
+                break
+            if key is not None and key in self._by_key:
+                # keep the position and the queue time of the replaced message
+                self._by_key[key][0] = message
+                self.stats.coalesced += 1
+                return
+            self.stats.blocked += 1
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        entry = [message, time.monotonic(), key]
+        self._entries.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self.stats.max_depth = max(self.stats.max_depth, len(self._entries))
+        self._not_empty.set()
+
+    async def get(self) -> Any | None:
+        """Return the oldest message. Returns None once the queue is closed and empty."""
+        while not self._entries:
+            if self._closed:
+                return None
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        entry = self._entries.popleft()
+        self._forget(entry)
+        self._not_full.set()
+        lag = time.monotonic() - entry[1]
+        self.stats.last_lag = lag
+        self.stats.max_lag = max(self.stats.max_lag, lag)
+        return entry[0]
+
+    def close(self) -> None:
+        """Let get() return None after the queued messages."""
+        self._closed = True
+        self._not_empty.set()
+
+    def _forget(self, entry: list) -> None:
+        key = entry[2]
+        if key is not None and self._by_key.get(key) is entry:
+            del self._by_key[key]
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from homematicip.base.enums import RequestPriority
+from homematicip.connection import OFFLINE_QUEUE_MAX_AGE, OFFLINE_QUEUE_SIZE
+from homematicip.connection.request_priority import (
+    get_request_priority,
+    request_priority,
+)
+from homematicip.exceptions.connection_exceptions import (
+    HmipConnectionError,
+    HmipOfflineQueueFullError,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def is_command(url: str) -> bool:
+    """Return True if a request to url changes something and may be queued while offline.
+
+    Reads (home/getCurrentState, ...) and the auth requests are never queued."""
+    return not url.startswith("auth/") and not url.rsplit("/", 1)[-1].startswith("get")
+
+
+@dataclass
+class QueuedCommand:
+    url: str
+    data: dict | None
+    custom_header: dict | None
+    priority: RequestPriority | None
+    future: asyncio.Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class OfflineCommandQueue:
+    """Bounded FIFO of the commands sent while the cloud is unreachable.
+
+    RestConnection.async_post puts commands in here while the queue is attached to the connection
+    (RestConnection.set_offline_queue) and returns at once. flush() sends them later in their original
+    order through the connection, so a RateLimitedRestConnection applies its rate limit as usual.
+    """
+
+    def __init__(self, maxsize: int = OFFLINE_QUEUE_SIZE, max_age: float | None = OFFLINE_QUEUE_MAX_AGE):
+        """
+        :param maxsize: The maximum number of queued commands. Further commands raise HmipOfflineQueueFullError.
+        :param max_age: Commands older than max_age seconds are dropped instead of sent when the queue is flushed,
+            a light switched on an hour ago should not be switched on now. None keeps them forever.
+        """
+        self.maxsize = maxsize
+        self.max_age = max_age
+        self._commands: deque[QueuedCommand] = deque()
+        #: Number of commands dropped because they were too old when the queue was flushed.
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def put(self, url: str, data: dict | None = None, custom_header: dict | None = None) -> asyncio.Future:
+        """Queue a command and return the future of its RestResult, resolved when the command was sent.
+
+        @raises HmipOfflineQueueFullError: If maxsize commands are queued already
+        """
+        if len(self._commands) >= self.maxsize:
+            raise HmipOfflineQueueFullError(f"Offline command queue is full ({self.maxsize} commands)")
+        future = asyncio.get_running_loop().create_future()
+        self._commands.append(QueuedCommand(url, data, custom_header, get_request_priority(), future))
+        LOGGER.debug("Queued %s while offline (%s queued)", url, len(self._commands))
+        return future
+
+    async def flush(self, connection) -> bool:
+        """Send the queued commands in order through connection, which must not have this queue attached.
+
+        A command which fails with a network error stays at the head of the queue and flushing stops.
+        Every other result or exception is handed to the future of the command.
+
+        @return: True if the queue is empty afterwards
+        """
+        while self._commands:
+            command = self._commands[0]
+            if command.future.cancelled():
+                self._commands.popleft()
+                continue
+            if self.max_age is not None and time.monotonic() - command.queued_at > self.max_age:
+                self._commands.popleft()
+                self.expired += 1
+                LOGGER.warning("Dropping %s queued %.0f seconds ago", command.url, time.monotonic() - command.queued_at)
+                command.future.set_exception(HmipConnectionError(f"{command.url} expired in the offline queue"))
+                continue
+
+            try:
+                if command.priority is None:
+                    result = await connection.async_post(command.url, command.data, command.custom_header)
+                else:
+                    with request_priority(command.priority):
+                        result = await connection.async_post(command.url, command.data, command.custom_header)
+            except Exception as err:
+                self._commands.popleft()
+                if not command.future.done():
+                    command.future.set_exception(err)
+                continue
+
+            if result.status == -1:
+                LOGGER.debug("Still offline, %s commands stay queued", len(self._commands))
+                return False
+            self._commands.popleft()
+            if not command.future.done():
+                command.future.set_result(result)
+        return True
+
+    def clear(self) -> None:
+        """Drop all queued commands and cancel their futures."""
+        while self._commands:
+            self._commands.popleft().future.cancel()
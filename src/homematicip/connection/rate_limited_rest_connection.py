@@ -1,9 +1,38 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+
 import httpx
 
-from homematicip.connection import RATE_LIMITER_FILL_RATE, RATE_LIMITER_TOKENS
+from homematicip.base.enums import RequestPriority
+from homematicip.connection import (
+    RATE_LIMITER_DECREASE_FACTOR,
+    RATE_LIMITER_FILL_RATE,
+    RATE_LIMITER_INCREASE_AFTER,
+    RATE_LIMITER_INCREASE_STEP,
+    RATE_LIMITER_MAX_SLOWDOWN,
+    RATE_LIMITER_MAX_THROTTLE_RETRIES,
+    RATE_LIMITER_TOKENS,
+)
 from homematicip.connection.buckets import Buckets
 from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.request_priority import get_request_priority
 from homematicip.connection.rest_connection import RestConnection, RestResult
+from homematicip.exceptions.connection_exceptions import HmipThrottlingError
+
+LOGGER = logging.getLogger(__name__)
+
+#: Token timeouts in a row after which the dispatcher gives up on the queued requests.
+_MAX_DISPATCH_TIMEOUTS = 3
+
+#: Share of the tokens each priority gets while the bucket is saturated.
+DEFAULT_PRIORITY_WEIGHTS: dict[RequestPriority, int] = {
+    RequestPriority.INTERACTIVE: 8,
+    RequestPriority.NORMAL: 3,
+    RequestPriority.BULK: 1,
+}
 
 
 class RateLimitedRestConnection(RestConnection):
@@ -12,18 +41,194 @@ class RateLimitedRestConnection(RestConnection):
                  context: ConnectionContext,
                  tokens: int = RATE_LIMITER_TOKENS,
                  fill_rate: int = RATE_LIMITER_FILL_RATE,
-                 httpx_client_session: httpx.AsyncClient | None = None):
+                 httpx_client_session: httpx.AsyncClient | None = None,
+                 limits: httpx.Limits | None = None,
+                 priority_weights: dict[RequestPriority, int] | None = None,
+                 default_priority: RequestPriority = RequestPriority.NORMAL,
+                 token_timeout: float = 120,
+                 max_throttle_retries: int = RATE_LIMITER_MAX_THROTTLE_RETRIES):
         """Initialize the RateLimitedRestConnection with a token bucket algorithm.
 
+        Requests which have to wait for a token are queued per priority. Freed tokens are handed out by
+        weighted round robin over the non-empty queues, so interactive requests keep a bounded latency
+        even while a bulk job saturates the bucket. The priority of a request is taken from
+        homematicip.connection.request_priority.request_priority() or falls back to default_priority.
+
+        The rate adapts to the cloud (AIMD): every 429 response cuts the rate by RATE_LIMITER_DECREASE_FACTOR,
+        pauses the bucket for the announced Retry-After and re-queues the throttled request. After
+        RATE_LIMITER_INCREASE_AFTER 2xx responses in a row the rate is raised again by
+        RATE_LIMITER_INCREASE_STEP of the configured rate, which is also the upper bound. A 5xx response
+        starts the streak over and leaves the rate as it is.
+
         :param context: The connection context.
         :param tokens: The number of tokens in the bucket. Default is 10.
-        :param fill_rate: The fill rate of the bucket in tokens per second. Default is 8.
+        :param fill_rate: The fill rate of the bucket: one token every x seconds. Default is 8.
         :param httpx_client_session: The httpx client session if you want to use a custom one.
+        :param limits: Pool limits for the owned httpx client. Ignored if a httpx client session is given.
+        :param priority_weights: Weight per priority. Default is DEFAULT_PRIORITY_WEIGHTS.
+        :param default_priority: Priority of requests made outside of request_priority(). Default is NORMAL.
+        :param token_timeout: The maximum time in seconds a request waits for a token. Default is 120.
+        :param max_throttle_retries: How often a throttled request is re-queued before HmipThrottlingError is
+            raised. Default is 5.
         """
-        super().__init__(context, httpx_client_session=httpx_client_session)
+        super().__init__(context, httpx_client_session=httpx_client_session, limits=limits)
         self._buckets = Buckets(tokens=tokens, fill_rate=fill_rate)
+        self._priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS)
+        if priority_weights is not None:
+            self._priority_weights.update(priority_weights)
+        self._default_priority = default_priority
+        self._token_timeout = token_timeout
+        self._lanes: dict[RequestPriority, deque[asyncio.Future]] = {p: deque() for p in self._priority_weights}
+        self._lane_credit: dict[RequestPriority, int] = dict.fromkeys(self._priority_weights, 0)
+        self._dispatcher: asyncio.Task | None = None
+
+        self._max_throttle_retries = max_throttle_retries
+        self._max_rate: float = 1 / fill_rate
+        self._min_rate: float = self._max_rate / RATE_LIMITER_MAX_SLOWDOWN
+        self._rate: float = self._max_rate
+        self._success_streak = 0
+        self._throttle_events = 0
+        self._last_decrease: float | None = None
+
+    async def async_post(self, url: str, data: dict | None = None, custom_header: dict | None = None,
+                         decode_json: bool = True, on_chunk: Callable[[bytes], None] | None = None) -> RestResult:
+        """Post data to the HomematicIP Cloud API.
+
+        @raises HmipThrottlingError: If the request is still throttled after max_throttle_retries attempts
+        """
+        queued = self._queue_if_offline(url, data, custom_header)
+        if queued is not None:
+            return queued
+        priority = get_request_priority() or self._default_priority
+        retries = 0
+        while True:
+            await self._acquire_token(priority)
+            try:
+                result = await super().async_post(url, data, custom_header, decode_json, on_chunk)
+            except HmipThrottlingError as err:
+                self._on_throttled(err.retry_after)
+                if retries >= self._max_throttle_retries:
+                    raise
+                retries += 1
+                LOGGER.warning("Request was throttled, re-queue it (attempt %s of %s)", retries,
+                               self._max_throttle_retries)
+                continue
+
+            if 200 <= result.status < 300:
+                self._on_success()
+            elif result.status >= 500:
+                # the cloud is struggling, this is no reason to send faster
+                self._success_streak = 0
+            return result
+
+    def current_rate(self) -> float:
+        """Return the learned rate in requests per second."""
+        return self._rate
+
+    def current_fill_rate(self) -> float:
+        """Return the learned fill rate of the bucket: one token every x seconds."""
+        return 1 / self._rate
+
+    def throttle_event_count(self) -> int:
+        """Return the number of 429 responses received so far."""
+        return self._throttle_events
+
+    def _on_throttled(self, retry_after: float | None) -> None:
+        """Multiplicative decrease of the rate and pause the bucket until the cloud accepts requests again."""
+        self._throttle_events += 1
+        self._success_streak = 0
+        now = time.monotonic()
+        # requests in flight at the same time all run into the same limit, decrease only once for them
+        if self._last_decrease is None or now - self._last_decrease >= 1 / self._rate:
+            self._last_decrease = now
+            self._rate = max(self._min_rate, self._rate * RATE_LIMITER_DECREASE_FACTOR)
+            self._buckets.set_fill_rate(1 / self._rate)
+            LOGGER.warning("Throttled by the cloud, lowered rate to %.3f requests per second", self._rate)
+        self._buckets.pause(retry_after or 0.0)
+
+    def _on_success(self) -> None:
+        """Additive increase of the rate after a streak of 2xx responses."""
+        self._success_streak += 1
+        if self._success_streak < RATE_LIMITER_INCREASE_AFTER or self._rate >= self._max_rate:
+            return
+        self._success_streak = 0
+        self._rate = min(self._max_rate, self._rate + self._max_rate * RATE_LIMITER_INCREASE_STEP)
+        self._buckets.set_fill_rate(1 / self._rate)
+        LOGGER.debug("Raised rate to %.3f requests per second", self._rate)
+
+    def queued_requests(self) -> dict[RequestPriority, int]:
+        """Return the number of requests waiting for a token per priority."""
+        return {priority: sum(not w.done() for w in lane) for priority, lane in self._lanes.items()}
+
+    async def _acquire_token(self, priority: RequestPriority) -> None:
+        if not any(self._lanes.values()) and await self._buckets.take():
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append(waiter)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            async with asyncio.timeout(self._token_timeout):
+                await waiter
+        except TimeoutError:
+            self._abandon(waiter)
+            raise TimeoutError("Timeout while waiting for token.") from None
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    def _abandon(self, waiter: asyncio.Future) -> None:
+        """Give up a timed out or cancelled request. A token the dispatcher granted it in the meantime is
+        returned to the bucket, otherwise the dispatcher skips the request."""
+        if not waiter.done():
+            waiter.cancel()
+        elif not waiter.cancelled() and waiter.exception() is None:
+            self._buckets.release()
+
+    async def _dispatch(self) -> None:
+        """Take tokens from the bucket and hand them to the queued requests until all lanes are empty.
+
+        The receiving lane is chosen only after the token was taken, so a request queued while waiting
+        for the token is already considered for it. If the bucket yields no token for
+        _MAX_DISPATCH_TIMEOUTS token timeouts in a row, the requests still queued fail with TimeoutError."""
+        timeouts = 0
+        while any(self._lanes.values()):
+            try:
+                await self._buckets.wait_and_take(timeout=self._token_timeout)
+            except TimeoutError:
+                timeouts += 1
+                if timeouts >= _MAX_DISPATCH_TIMEOUTS:
+                    self._fail_waiters()
+                    return
+                continue
+            timeouts = 0
+            waiter = self._next_waiter()
+            if waiter is None:
+                # every queued request gave up while we waited for the token
+                self._buckets.release()
+                return
+            waiter.set_result(None)
+
+    def _fail_waiters(self) -> None:
+        """Fail every queued request with TimeoutError and empty the lanes."""
+        for lane in self._lanes.values():
+            while lane:
+                waiter = lane.popleft()
+                if not waiter.done():
+                    waiter.set_exception(TimeoutError("Timeout while waiting for token."))
+
+    def _next_waiter(self) -> asyncio.Future | None:
+        """Pop the next request by smooth weighted round robin over the non-empty lanes."""
+        for lane in self._lanes.values():
+            while lane and lane[0].done():
+                lane.popleft()
+        active = [p for p, lane in self._lanes.items() if lane]
+        if not active:
+            return None
 
-    async def async_post(self, url: str, data: dict | None = None, custom_header: dict | None = None) -> RestResult:
-        """Post data to the HomematicIP Cloud API."""
-        await self._buckets.wait_and_take()
-        return await super().async_post(url, data, custom_header)
+        for priority in active:
+            self._lane_credit[priority] += self._priority_weights[priority]
+        chosen = max(active, key=self._lane_credit.__getitem__)
+        self._lane_credit[chosen] -= sum(self._priority_weights[p] for p in active)
+        return self._lanes[chosen].popleft()
@@ -0,0 +1,34 @@
+import contextlib
+from contextvars import ContextVar
+
+from homematicip.base.enums import RequestPriority
+
+_current_priority: ContextVar[RequestPriority | None] = ContextVar("hmip_request_priority", default=None)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority):
+    """Run all cloud requests inside the with-block with the given priority.
+
+    The priority is used by RateLimitedRestConnection to schedule requests when the rate limit is reached.
+    It applies to every call made in the block, e.g. the async_set_* methods of channels and groups::
+
+        with request_priority(RequestPriority.INTERACTIVE):
+            await channel.async_turn_off()
+
+        with request_priority(RequestPriority.BULK):
+            for group in home.groups:
+                await group.set_label_async(...)
+
+    :param priority: The priority for the requests.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def get_request_priority() -> RequestPriority | None:
+    """Return the priority set via request_priority() for the current context or None if there is none."""
+    return _current_priority.get()
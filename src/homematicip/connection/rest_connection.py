@@ -1,7 +1,11 @@
+import asyncio
 import contextlib
-import json
 import logging
+import math
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from ssl import SSLContext
 from typing import Any
 
@@ -11,9 +15,14 @@ from homematicip.connection import (
     ATTR_ACCESSPOINT_ID,
     ATTR_AUTH_TOKEN,
     ATTR_CLIENT_AUTH,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    RATE_LIMITER_MAX_RETRY_AFTER,
     THROTTLE_STATUS_CODE,
 )
 from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.offline_queue import OfflineCommandQueue, is_command
 from homematicip.exceptions.connection_exceptions import HmipThrottlingError
 
 LOGGER = logging.getLogger(__name__)
@@ -43,13 +52,18 @@ class RestResult:
     exception: Exception | None = None
     success: bool = False
     text: str = ""
+    #: the undecoded response body if the request was sent with decode_json=False
+    content: bytes = b""
+    #: the future of the real result if the request was queued while offline (status 202). success is
+    #: False for such a result, the command was not executed and may still be dropped.
+    queued: asyncio.Future | None = None
 
     def __post_init__(self):
         self.status_text = httpx.codes.get_reason_phrase(self.status)
         if self.status_text == "":
             self.status_text = "No status code"
 
-        self.success = 200 <= self.status < 300
+        self.success = 200 <= self.status < 300 and self.queued is None
 
 
 @dataclass
@@ -59,19 +73,80 @@ class RestConnection:
     _verify = None
     _log_status_exceptions = True
     _httpx_client_session: httpx.AsyncClient | None = None
+    _limits: httpx.Limits | None = None
+    _owned_client: httpx.AsyncClient | None = None
+    _owned_client_loop: asyncio.AbstractEventLoop | None = None
+    _owned_client_verify = None
+    _offline_queue: OfflineCommandQueue | None = None
 
     def __init__(self, context: ConnectionContext, httpx_client_session: httpx.AsyncClient | None = None,
-                 log_status_exceptions: bool = True):
+                 log_status_exceptions: bool = True, limits: httpx.Limits | None = None):
         """Initialize the RestConnection object.
 
+        If no httpx client session is given, the connection creates its own pooled client on the first
+        request and keeps it (and its keep-alive connections) until close() is called.
+
         @param context: The connection context
         @param httpx_client_session: The httpx client session if you want to use a custom one
         @param log_status_exceptions: If status exceptions should be logged
+        @param limits: Pool limits for the owned httpx client. Ignored if a httpx client session is given
         """
         LOGGER.debug("Initialize new RestConnection")
         self.update_connection_context(context)
         self._log_status_exceptions = log_status_exceptions
         self._httpx_client_session = httpx_client_session
+        self._limits = limits if limits is not None else self.default_limits()
+        self._owned_client = None
+        self._owned_client_loop = None
+        self._owned_client_verify = None
+        self._offline_queue = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @staticmethod
+    def default_limits() -> httpx.Limits:
+        """Return the default pool limits of the owned httpx client."""
+        return httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+
+    async def close(self) -> None:
+        """Close the pooled httpx client owned by this connection.
+
+        An externally supplied httpx client session is left open, its lifecycle belongs to the caller.
+        The connection stays usable, the next request opens a new pool.
+        """
+        client = self._owned_client
+        loop = self._owned_client_loop
+        self._owned_client = None
+        self._owned_client_loop = None
+        if client is None or client.is_closed:
+            return
+        if loop is not asyncio.get_running_loop():
+            # Pooled sockets belong to the loop which opened them and cannot be closed from here.
+            LOGGER.debug("Dropping pooled http client of a different event loop")
+            return
+        await client.aclose()
+
+    def set_offline_queue(self, queue: OfflineCommandQueue | None) -> None:
+        """Queue commands in queue instead of sending them, None sends them again.
+
+        While a queue is set async_post returns a RestResult with status 202, success False and the future
+        of the real result in RestResult.queued for every command. The command may still be dropped after
+        OfflineCommandQueue.max_age, then the future raises HmipConnectionError. Reads are still sent."""
+        self._offline_queue = queue
+
+    def _queue_if_offline(self, url: str, data: dict | None, custom_header: dict | None) -> RestResult | None:
+        """Return the RestResult of the queued command if the connection is offline and url is a command."""
+        if self._offline_queue is None or not is_command(url):
+            return None
+        return RestResult(status=202, queued=self._offline_queue.put(url, data, custom_header))
 
     def update_connection_context(self, context: ConnectionContext) -> None:
         self._context: ConnectionContext = context
@@ -111,14 +186,22 @@ class RestConnection:
 
         return value
 
-    async def async_post(self, url: str, data: dict | None = None, custom_header: dict | None = None) -> RestResult:
+    async def async_post(self, url: str, data: dict | None = None, custom_header: dict | None = None,
+                         decode_json: bool = True, on_chunk: Callable[[bytes], None] | None = None) -> RestResult:
         """Send an async post request to cloud with json data. Returns a json result.
         @param url: The path of the url to send the request to
         @param data: The data to send as json
         @param custom_header: A custom header to send. Replaces the default header
+        @param decode_json: Set to False to get the undecoded body in RestResult.content instead of RestResult.json
+        @param on_chunk: Called with every chunk of a successful response body while it downloads. The body is
+            neither kept nor decoded then. An exception raised by on_chunk ends the request and is passed on
         @return: The result as a RestResult object
         @raises HmipThrottlingError: If the cloud returns a 429 status code (throttling active)
+        @raises HmipOfflineQueueFullError: If the command has to be queued while offline and the queue is full
         """
+        queued = self._queue_if_offline(url, data, custom_header)
+        if queued is not None:
+            return queued
         full_url = self._build_url(self._context.rest_url, url)
         try:
             data_logging = self._redact_sensitive_data(data or {})
@@ -128,18 +211,18 @@ class RestConnection:
                 header = custom_header
 
             LOGGER.debug("Sending post request to url %s. Data is: %s", full_url, data_logging)
+            if on_chunk is not None:
+                return await self._stream_request_async(full_url, data, header, on_chunk)
             r = await self._execute_request_async(full_url, data, header)
             LOGGER.debug("Got response %s.", r.status_code)
-
-            if r.status_code == THROTTLE_STATUS_CODE:
-                LOGGER.error("Got error 429 (Throttling active)")
-                raise HmipThrottlingError
-
-            r.raise_for_status()
+            self._check_status(r)
 
             result = RestResult(status=r.status_code)
-            with contextlib.suppress(json.JSONDecodeError):
-                result.json = r.json()
+            if not decode_json:
+                result.content = r.content
+                return result
+            with contextlib.suppress(ValueError):
+                result.json = self._context.json_codec.loads(r.content)
 
             return result
         except httpx.RequestError as exc:
@@ -158,17 +241,86 @@ class RestConnection:
     async def _execute_request_async(self, url: str, data: dict | None = None, header: dict | None = None):
         """Execute a request async. Uses the httpx client session if available.
         @param url: The path of the url to send the request to
-        @param data: The data to send as json
+        @param data: The data to send as json, encoded with the json codec of the connection context
         @param custom_header: A custom header to send. Replaces the default header
         @return: The result as a RestResult object
         """
-        if self._httpx_client_session is None:
-            async with httpx.AsyncClient(verify=self._verify) as client:
-                result = await client.post(url, json=data, headers=header)
-        else:
-            result = await self._httpx_client_session.post(url, json=data, headers=header)
+        client = await self._get_client()
+        content = None if data is None else self._context.json_codec.dumps(data)
+        return await client.post(url, content=content, headers=header)
 
-        return result
+    async def _stream_request_async(self, url: str, data: dict | None, header: dict | None,
+                                    on_chunk: Callable[[bytes], None]) -> RestResult:
+        """Execute a request async and pass the response body to on_chunk while it downloads."""
+        client = await self._get_client()
+        content = None if data is None else self._context.json_codec.dumps(data)
+        async with client.stream("POST", url, content=content, headers=header) as r:
+            LOGGER.debug("Got response %s.", r.status_code)
+            if r.status_code >= 400:
+                # the error text is needed for the RestResult
+                await r.aread()
+            self._check_status(r)
+            async for chunk in r.aiter_bytes():
+                on_chunk(chunk)
+        return RestResult(status=r.status_code)
+
+    def _check_status(self, r: httpx.Response) -> None:
+        """@raises HmipThrottlingError for a 429 response and httpx.HTTPStatusError for any other error status"""
+        if r.status_code == THROTTLE_STATUS_CODE:
+            LOGGER.error("Got error 429 (Throttling active)")
+            raise HmipThrottlingError(retry_after=self._get_retry_after(r))
+
+        r.raise_for_status()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the httpx client to send requests with.
+
+        This is the externally supplied session if any, otherwise the pooled client owned by this connection.
+        The owned client is (re)created lazily if it does not exist yet, was closed, belongs to another event
+        loop or was built with a different ssl verification than the current connection context requires.
+        """
+        if self._httpx_client_session is not None:
+            return self._httpx_client_session
+
+        loop = asyncio.get_running_loop()
+        if self._owned_client is not None and (
+                self._owned_client.is_closed
+                or self._owned_client_loop is not loop
+                or self._owned_client_verify != self._verify
+        ):
+            await self.close()
+
+        if self._owned_client is None:
+            LOGGER.debug("Create pooled http client")
+            self._owned_client = httpx.AsyncClient(verify=self._verify, limits=self._limits)
+            self._owned_client_loop = loop
+            self._owned_client_verify = self._verify
+
+        return self._owned_client
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response) -> float | None:
+        """Return the seconds from the Retry-After header of a response or None if it is missing or invalid.
+
+        Negative, infinite and nan delays are invalid. Longer delays are cut to RATE_LIMITER_MAX_RETRY_AFTER,
+        so a broken header cannot pause the rate limiter for good.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            seconds = max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+        if not math.isfinite(seconds) or seconds < 0:
+            return None
+        return min(seconds, RATE_LIMITER_MAX_RETRY_AFTER)
 
     @staticmethod
     def _build_url(base_url: str, path: str) -> str:
@@ -1,13 +1,16 @@
 import asyncio
 import contextlib
 import inspect
+import json
 import logging
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from dataclasses import replace
+from typing import Any
 
 import aiohttp
-from aiohttp import WSMessage
 
+from homematicip.base.enums import WebsocketOverflowPolicy
 from homematicip.connection import (
     ATTR_ACCESSPOINT_ID,
     ATTR_AUTH_TOKEN,
@@ -17,9 +20,18 @@ from homematicip.connection.connection_context import (
     ConnectionContext,
     ConnectionContextBuilder,
 )
+from homematicip.connection.dispatch_queue import (
+    DispatchQueue,
+    DispatchStats,
+    entity_coalesce_key,
+)
+from homematicip.connection.websocket_message import WebsocketMessage
 
 LOGGER = logging.getLogger(__name__)
 
+# ends the lane of a message handler
+_LANE_END = object()
+
 
 class WebsocketHandler:
     """
@@ -27,7 +39,15 @@ class WebsocketHandler:
     Supports automatic reconnect, adding handlers, and status queries.
     """
 
-    def __init__(self):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession | None = None):
+        """Initialize the WebsocketHandler.
+
+        If no aiohttp client session is given, the handler creates its own session on the first connect and
+        keeps it, with its connector and DNS cache, for every reconnect until stop() is called.
+
+        @param aiohttp_client_session: The aiohttp client session if you want to use a custom one. It is
+            never closed by the handler
+        """
         self.INITIAL_BACKOFF = 8
         self.MAX_BACKOFF = 900
         self.HEARTBEAT_INTERVAL = 30
@@ -43,6 +63,28 @@ class WebsocketHandler:
         self.STALE_CHECK_INTERVAL = 60
         self.STALE_WARNING_SECONDS = 300
         self.STALE_ERROR_SECONDS = 1800
+        # Received messages wait in a bounded queue for the message handlers,
+        # so a slow handler does not keep the socket (and its heartbeats)
+        # from being read. See DispatchQueue for the overflow policies.
+        self.DISPATCH_QUEUE_SIZE = 1000
+        self.OVERFLOW_POLICY = WebsocketOverflowPolicy.BLOCK
+        self.COALESCE_KEY: Callable[[Any], Hashable | None] = entity_coalesce_key
+        # With more than one, every async message handler gets a lane of its
+        # own and the lanes run concurrently, at most this many handler calls
+        # at a time. Each handler still sees the messages in order.
+        self.HANDLER_CONCURRENCY = 1
+        # Seconds an async message handler may take per message, None waits forever.
+        self.HANDLER_TIMEOUT: float | None = None
+        # Decodes text frames. Every frame is decoded once and handed to the
+        # message handlers as WebsocketMessage, see there. Set from the json
+        # codec of the connection context on start.
+        self.JSON_LOADS: Callable[[str], Any] = json.loads
+        # Seconds the connector of the owned session caches the resolved
+        # addresses of the cloud host. A re-lookup of the host clears it.
+        self.DNS_CACHE_TTL = 300
+        self._aiohttp_client_session = aiohttp_client_session
+        self._owned_session: aiohttp.ClientSession | None = None
+        self._owned_session_loop: asyncio.AbstractEventLoop | None = None
         self._stop_event = asyncio.Event()
         self._websocket_connected = asyncio.Event()
         self._reconnect_task = None
@@ -60,6 +102,8 @@ class WebsocketHandler:
         self._on_disconnected_handler: list[Callable] = []
         self._on_reconnect_handler: list[Callable] = []
         self._on_stale_handler: list[Callable] = []
+        self._dispatch_stats = DispatchStats()
+        self._dispatch_queue: DispatchQueue | None = None
 
     def add_on_connected_handler(self, handler: Callable):
         """Adds a handler that is called when the connection is established."""
@@ -74,7 +118,8 @@ class WebsocketHandler:
         self._on_reconnect_handler.append(handler)
 
     def add_on_message_handler(self, handler: Callable):
-        """Adds a handler for incoming messages."""
+        """Adds a handler for incoming messages. Text frames are passed as WebsocketMessage, a str which
+        carries the decoded frame (``message.json``), binary frames as bytes."""
         self._on_message_handlers.append(handler)
 
     def add_on_stale_handler(self, handler: Callable):
@@ -118,55 +163,72 @@ class WebsocketHandler:
                 )
                 self._stale_warning_fired = True
 
-    async def _call_handlers(self, handlers, *args):
+    async def _call_handlers(self, handlers, *args, timeout: float | None = None):
         """Helper function to call handlers (sync and async)."""
         for handler in handlers:
-            try:
-                if inspect.iscoroutinefunction(handler):
+            await self._call_handler(handler, *args, timeout=timeout)
+
+    @staticmethod
+    async def _call_handler(handler, *args, timeout: float | None = None):
+        """Calls a sync or async handler and logs its errors. An async handler is cancelled after timeout seconds."""
+        handler_name = getattr(handler, "__name__", repr(handler))
+        try:
+            if inspect.iscoroutinefunction(handler):
+                if timeout is None:
                     await handler(*args)
                 else:
-                    handler(*args)
-            except Exception:
-                handler_name = getattr(handler, "__name__", repr(handler))
-                LOGGER.exception("Error in handler '%s'", handler_name)
+                    await asyncio.wait_for(handler(*args), timeout)
+            else:
+                handler(*args)
+        except TimeoutError:
+            LOGGER.error("Handler '%s' timed out after %s seconds", handler_name, timeout)
+        except Exception:
+            LOGGER.exception("Error in handler '%s'", handler_name)
 
     async def _connect(self, context: ConnectionContext):
+        # one dispatcher for all connections, so a reconnect does not wait until the handlers are through
+        # with the messages of the lost connection; they are handled in the background meanwhile
+        async with self._dispatching():
+            await self._connect_loop(context)
+
+    async def _connect_loop(self, context: ConnectionContext):
         backoff = self.INITIAL_BACKOFF
         while not self._stop_event.is_set():
             try:
                 if self._reconnect_attempt_count >= self.RELOOKUP_AFTER_ATTEMPTS:
                     context = await self._relookup_context(context)
+                    self._clear_dns_cache()
                 LOGGER.info("Connect to %s", context.websocket_url)
 
-                async with aiohttp.ClientSession() as session:
-                    ws = await asyncio.wait_for(
-                        session.ws_connect(
-                            context.websocket_url,
-                            headers={
-                                ATTR_AUTH_TOKEN: context.auth_token,
-                                ATTR_CLIENT_AUTH: context.client_auth_token,
-                                ATTR_ACCESSPOINT_ID: context.accesspoint_id
-                            },
-                            heartbeat=self.HEARTBEAT_INTERVAL,
-                            ssl=(
-                                context.ssl_ctx
-                                if context.ssl_ctx is not None
-                                else context.enforce_ssl
-                            ),
+                session = await self._get_session()
+                ws = await asyncio.wait_for(
+                    session.ws_connect(
+                        context.websocket_url,
+                        headers={
+                            ATTR_AUTH_TOKEN: context.auth_token,
+                            ATTR_CLIENT_AUTH: context.client_auth_token,
+                            ATTR_ACCESSPOINT_ID: context.accesspoint_id
+                        },
+                        heartbeat=self.HEARTBEAT_INTERVAL,
+                        ssl=(
+                            context.ssl_ctx
+                            if context.ssl_ctx is not None
+                            else context.enforce_ssl
                         ),
-                        timeout=self.CONNECT_TIMEOUT,
+                    ),
+                    timeout=self.CONNECT_TIMEOUT,
+                )
+                async with ws:
+                    backoff = self.INITIAL_BACKOFF
+                    self._reconnect_attempt_count = 0
+                    LOGGER.info(
+                        "WebSocket connection established to %s.",
+                        context.websocket_url,
                     )
-                    async with ws:
-                        backoff = self.INITIAL_BACKOFF
-                        self._reconnect_attempt_count = 0
-                        LOGGER.info(
-                            "WebSocket connection established to %s.",
-                            context.websocket_url,
-                        )
-                        self._websocket_connected.set()
-                        self._disconnect_notified = False
-                        await self._call_handlers(self._on_connected_handler)
-                        await self._listen(ws)
+                    self._websocket_connected.set()
+                    self._disconnect_notified = False
+                    await self._call_handlers(self._on_connected_handler)
+                    await self._listen(ws)
 
             except TimeoutError:
                 reason = (
@@ -184,6 +246,53 @@ class WebsocketHandler:
             finally:
                 await self._cleanup()
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session to connect with.
+
+        This is the externally supplied session if any, otherwise the session owned by this handler. The
+        owned session is (re)created lazily if it does not exist yet, was closed or belongs to another
+        event loop. aiohttp keeps the default ssl contexts for the whole process, so together with the
+        connector and its DNS cache nothing is rebuilt on a reconnect.
+        """
+        if self._aiohttp_client_session is not None:
+            return self._aiohttp_client_session
+
+        loop = asyncio.get_running_loop()
+        if self._owned_session is not None and (
+                self._owned_session.closed or self._owned_session_loop is not loop
+        ):
+            await self.close_session()
+
+        if self._owned_session is None:
+            LOGGER.debug("Create websocket client session")
+            self._owned_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(use_dns_cache=True, ttl_dns_cache=self.DNS_CACHE_TTL)
+            )
+            self._owned_session_loop = loop
+        return self._owned_session
+
+    def _clear_dns_cache(self):
+        """Forget the cached addresses of the owned session, so the next connect resolves the host again."""
+        if self._owned_session is not None and not self._owned_session.closed:
+            self._owned_session.connector.clear_dns_cache()
+
+    async def close_session(self):
+        """Close the aiohttp session owned by the handler. A session passed to the constructor is left open.
+
+        stop() closes it, the next start opens a new one.
+        """
+        session = self._owned_session
+        loop = self._owned_session_loop
+        self._owned_session = None
+        self._owned_session_loop = None
+        if session is None or session.closed:
+            return
+        if loop is not asyncio.get_running_loop():
+            # The connector's sockets belong to the loop which opened them and cannot be closed from here.
+            LOGGER.debug("Dropping websocket client session of a different event loop")
+            return
+        await session.close()
+
     async def _relookup_context(self, context: ConnectionContext) -> ConnectionContext:
         try:
             refreshed = await ConnectionContextBuilder.build_context_async(
@@ -197,6 +306,7 @@ class WebsocketHandler:
                 websocket_initial_backoff=context.websocket_initial_backoff,
                 websocket_max_backoff=context.websocket_max_backoff,
             )
+            refreshed.json_codec = context.json_codec
         except Exception:
             LOGGER.exception("Re-lookup of websocket host failed, keeping current host")
             return context
@@ -204,7 +314,66 @@ class WebsocketHandler:
             LOGGER.info("Re-resolved websocket host to %s", refreshed.websocket_url)
         return refreshed
 
+    @contextlib.asynccontextmanager
+    async def _dispatching(self):
+        """Runs _dispatch for the messages put into _dispatch_queue in a task of its own. On leaving the
+        block the messages queued so far are handled first, unless it is left by an exception."""
+        queue = DispatchQueue(self.DISPATCH_QUEUE_SIZE, self.OVERFLOW_POLICY, self.COALESCE_KEY, self._dispatch_stats)
+        self._dispatch_queue = queue
+        dispatcher = asyncio.create_task(self._dispatch(queue))
+        try:
+            yield queue
+            queue.close()
+            await dispatcher
+        finally:
+            if not dispatcher.done():
+                dispatcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await dispatcher
+            self._dispatch_queue = None
+
     async def _listen(self, ws):
+        """Receives messages until the connection ends and queues them for the dispatcher of _dispatching.
+        Returns without waiting for their handlers."""
+        await self._receive(ws, self._dispatch_queue)
+
+    async def _dispatch(self, queue: DispatchQueue):
+        if self.HANDLER_CONCURRENCY <= 1:
+            while (message := await queue.get()) is not None:
+                await self._handle_ws_message(message)
+            return
+
+        semaphore = asyncio.Semaphore(self.HANDLER_CONCURRENCY)
+        lanes: dict[Callable, tuple[asyncio.Queue, asyncio.Task]] = {}
+        try:
+            while (message := await queue.get()) is not None:
+                for handler in tuple(self._on_message_handlers):
+                    if not inspect.iscoroutinefunction(handler):
+                        await self._call_handler(handler, message)
+                        continue
+                    lane = lanes.get(handler)
+                    if lane is None:
+                        lane_queue = asyncio.Queue(self.DISPATCH_QUEUE_SIZE)
+                        lane = lanes[handler] = (
+                            lane_queue, asyncio.create_task(self._run_lane(handler, lane_queue, semaphore))
+                        )
+                    # a full lane holds back the dispatcher, which holds back the receive loop
+                    await lane[0].put(message)
+            for lane_queue, _ in lanes.values():
+                await lane_queue.put(_LANE_END)
+            await asyncio.gather(*(task for _, task in lanes.values()))
+        finally:
+            for _, task in lanes.values():
+                task.cancel()
+            await asyncio.gather(*(task for _, task in lanes.values()), return_exceptions=True)
+
+    async def _run_lane(self, handler: Callable, lane_queue: asyncio.Queue, semaphore: asyncio.Semaphore):
+        """Runs handler for the messages of its lane one after another."""
+        while (data := await lane_queue.get()) is not _LANE_END:
+            async with semaphore:
+                await self._call_handler(handler, data, timeout=self.HANDLER_TIMEOUT)
+
+    async def _receive(self, ws, queue: DispatchQueue):
         while not self._stop_event.is_set():
             try:
                 msg = await asyncio.wait_for(
@@ -228,7 +397,10 @@ class WebsocketHandler:
             if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                 self._last_message_time = time.monotonic()
                 self._message_count += 1
-                await self._handle_ws_message(msg)
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    await queue.put(WebsocketMessage(msg.data, self.JSON_LOADS))
+                else:
+                    await queue.put(msg.data)
             elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED):
                 LOGGER.info("WebSocket closed by server.")
                 break
@@ -236,9 +408,9 @@ class WebsocketHandler:
                 LOGGER.error("Error in websocket: %s", msg)
                 break
 
-    async def _handle_ws_message(self, message: WSMessage):
+    async def _handle_ws_message(self, message: WebsocketMessage | bytes):
         try:
-            await self._call_handlers(self._on_message_handlers, message.data)
+            await self._call_handlers(self._on_message_handlers, message, timeout=self.HANDLER_TIMEOUT)
         except Exception:
             LOGGER.exception("Error handling message")
 
@@ -266,6 +438,11 @@ class WebsocketHandler:
         self.MESSAGE_STALE_TIMEOUT = context.websocket_message_stale_timeout
         self.INITIAL_BACKOFF = context.websocket_initial_backoff
         self.MAX_BACKOFF = context.websocket_max_backoff
+        self.DISPATCH_QUEUE_SIZE = context.websocket_dispatch_queue_size
+        self.OVERFLOW_POLICY = context.websocket_overflow_policy
+        self.HANDLER_CONCURRENCY = context.websocket_handler_concurrency
+        self.HANDLER_TIMEOUT = context.websocket_handler_timeout
+        self.JSON_LOADS = context.json_codec.loads
 
     async def start(self, context: ConnectionContext):
         async with self._task_lock:
@@ -295,6 +472,7 @@ class WebsocketHandler:
                 with contextlib.suppress(asyncio.CancelledError):
                     await self._staleness_task
                 self._staleness_task = None
+            await self.close_session()
         await self._cleanup()
         LOGGER.info("[Stop] WebSocket client stopped.")
 
@@ -328,6 +506,12 @@ class WebsocketHandler:
             return None
         return time.monotonic() - self._last_message_time
 
+    def dispatch_stats(self) -> DispatchStats:
+        """Returns the queue depth, the lag and the dropped and coalesced messages of the dispatch queue."""
+        stats = replace(self._dispatch_stats)
+        stats.depth = len(self._dispatch_queue) if self._dispatch_queue is not None else 0
+        return stats
+
     def reconnect_attempt_count(self) -> int:
         """Returns the number of reconnect attempts in the current outage."""
         return self._reconnect_attempt_count
@@ -0,0 +1,100 @@
+import json
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any
+
+_UNDECODED = object()
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only view of decoded json. Dicts and lists are wrapped, everything else is immutable."""
+    if isinstance(value, dict):
+        return ReadOnlyDict(value)
+    if isinstance(value, list):
+        return ReadOnlyList(value)
+    return value
+
+
+class ReadOnlyDict(Mapping):
+    """Read-only view of a decoded json object. Nested objects and arrays are wrapped when they are read."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getitem__(self, key):
+        return freeze(self._data[key])
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyDict({self._data!r})"
+
+
+class ReadOnlyList(Sequence):
+    """Read-only view of a decoded json array."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: list):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(self._data[index])
+        return freeze(self._data[index])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ReadOnlyList):
+            other = other._data
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return self._data == list(other)
+
+    def __repr__(self) -> str:
+        return f"ReadOnlyList({self._data!r})"
+
+
+class WebsocketMessage(str):
+    """A text frame received by the WebsocketHandler.
+
+    The message is the raw text of the frame, so handlers which expect a string keep working. The frame is
+    decoded at most once, when it is first needed, and the result is shared by everyone handling it:
+    the coalesce key of the dispatch queue, AsyncHome and the additional message handlers, which read it
+    through the read-only ``json`` view instead of decoding the text again.
+    """
+
+    def __new__(cls, raw: str, loads: Callable[[str], Any] = json.loads):
+        message = super().__new__(cls, raw)
+        message._loads = loads
+        message._decoded = _UNDECODED
+        return message
+
+    @property
+    def raw(self) -> str:
+        """the text of the frame as plain str"""
+        return str.__str__(self)
+
+    def decoded(self) -> Any:
+        """Return the decoded frame. It is shared with the other handlers and must not be changed.
+
+        @raises ValueError: If the frame is not valid json. The error is raised again on the next call.
+        """
+        if self._decoded is _UNDECODED:
+            self._decoded = self._loads(self.raw)
+        return self._decoded
+
+    @property
+    def json(self) -> Any:
+        """read-only view of the decoded frame"""
+        return freeze(self.decoded())
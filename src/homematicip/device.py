@@ -1,15 +1,64 @@
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import ClassVar
 
 from homematicip.base.enums import *
 from homematicip.base.functionalChannels import FunctionalChannel
-from homematicip.base.helpers import get_functional_channel, get_functional_channels
+from homematicip.base.helpers import (
+    get_functional_channel,
+    get_functional_channels,
+    id_lookup,
+)
 from homematicip.base.homematicip_object import HomeMaticIPObject
+from homematicip.base.schema import Field, compile_fields
 from homematicip.group import Group
 
 LOGGER = logging.getLogger(__name__)
 
+#: The attributes every Device takes from its base channel.
+_parse_base_channel_fields = compile_fields(
+    (
+        Field("lowBat", optional=True),
+        Field("unreach", optional=True),
+        Field("rssiDeviceValue", optional=True),
+        Field("rssiPeerValue", optional=True),
+        Field("configPending", optional=True),
+        Field("dutyCycle", optional=True),
+        Field("routerModuleSupported"),
+        Field("routerModuleEnabled"),
+    )
+)
+#: Compiled parsers of the attributes in Device._supportedFeatureAttributeMap per feature.
+_feature_parsers: dict[tuple[str, tuple[str, ...]], Callable] = {}
+
+
+def _feature_parser(feature: str) -> Callable:
+    attributes = tuple(Device._supportedFeatureAttributeMap[feature])
+    key = (feature, attributes)
+    parser = _feature_parsers.get(key)
+    if parser is None:
+        parser = _feature_parsers[key] = compile_fields(Field(a, optional=True) for a in attributes)
+    return parser
+
+
+def _install_channel_fields(cls: type) -> None:
+    """Generate from_json of a Device subclass from its _channel_fields, see Device.__init_subclass__."""
+    if "from_json" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} defines both _channel_fields and from_json")
+    parse = compile_fields(cls.__dict__["_channel_fields"])
+    channel_type = cls.__dict__.get("_channel_type")
+
+    def from_json(self, js):
+        # cooperative like a hand-written from_json, some devices inherit from two device classes
+        super(cls, self).from_json(js)
+        c = get_functional_channel(channel_type or self._baseChannel, js)
+        if c:
+            parse(self, c)
+
+    from_json.__doc__ = f"this method will parse the {cls.__name__} object from a json object"
+    from_json.__qualname__ = f"{cls.__qualname__}.from_json"
+    cls.from_json = from_json
+
 
 class BaseDevice(HomeMaticIPObject):
     """Base device class. This is the foundation for homematicip and external (hue) devices"""
@@ -27,6 +76,8 @@ class BaseDevice(HomeMaticIPObject):
         self.firmwareVersion = None
         self.modelType = ""
         self.permanentlyReachable = False
+        # (groups, channels) the functional channels are loaded with on first access if they were deferred
+        self._pending_channels: tuple | None = None
         self.functionalChannels = []
         self.functionalChannelCount = Counter()
         self.deviceType = None
@@ -53,42 +104,119 @@ class BaseDevice(HomeMaticIPObject):
         if "deviceArchetype" in js:
             self.deviceArchetype = DeviceArchetype.from_str(js["deviceArchetype"])
 
+    @property
+    def functionalChannels(self) -> list[FunctionalChannel]:
+        """the functional channels of the device. Deferred channels are loaded on first access."""
+        self.load_deferred_functionalChannels()
+        return self._functionalChannels
+
+    @functionalChannels.setter
+    def functionalChannels(self, value: list[FunctionalChannel]):
+        self._functionalChannels = value
+        self._channel_map = None
+
+    def _channels_by_index(self) -> dict[int, FunctionalChannel]:
+        """the loaded channels by index. Built on first use and dropped when functionalChannels is assigned,
+        load_functionalChannels adds the channels it creates"""
+        channels = self.functionalChannels
+        if self._channel_map is None:
+            self._channel_map = {ch.index: ch for ch in channels if ch is not None}
+        return self._channel_map
+
+    def release_raw_json(self) -> None:
+        """Drop the retained raw json of the device and its channels.
+        Deferred channels still need the json of the device, so it is kept until they are loaded."""
+        if self._pending_channels is None:
+            super().release_raw_json()
+        for fc in self._functionalChannels:
+            fc.release_raw_json()
+
+    def defer_functionalChannels(
+            self, groups: Iterable[Group], channels: list[FunctionalChannel]
+    ) -> bool:
+        """Load the functionalChannels on first access of functionalChannels instead of now.
+        If channels were loaded before, they are updated right away so their handlers see the change.
+
+        :return: True if loading was deferred
+        """
+        if self._functionalChannels:
+            self.load_functionalChannels(groups, channels)
+            return False
+        self._pending_channels = (groups, channels)
+        self.functionalChannelCount = Counter(
+            FunctionalChannelType.from_str(ch["functionalChannelType"], ch["functionalChannelType"])
+            for ch in self._rawJSONData["functionalChannels"].values()
+        )
+        return True
+
+    def load_deferred_functionalChannels(self) -> None:
+        """Load the functionalChannels now if defer_functionalChannels deferred them."""
+        if self._pending_channels is not None:
+            groups, channels = self._pending_channels
+            self._pending_channels = None
+            self.load_functionalChannels(groups, channels)
+
     def load_functionalChannels(
             self, groups: Iterable[Group], channels: Iterable[FunctionalChannel]
     ):
-        """this function will load the functionalChannels into the device"""
+        """this function will load the functionalChannels into the device.
+        If a channel changed or was added, "functionalChannels" is recorded as changed field of the device.
+
+        A channel whose json equals the json it was parsed from last time is not parsed again, the cloud
+        sends all channels of a device on every change but mostly only one of them changed. It is parsed
+        again if one of its groups was replaced by a new object, e.g. after GROUP_REMOVED and GROUP_ADDED."""
+        channels_changed = False
+        if not self._functionalChannels:
+            # a deferred device counted its channels from the json already
+            self.functionalChannelCount = Counter()
+        count = self.functionalChannelCount
+        by_index = self._channels_by_index()
+        groups = id_lookup(groups)
         for channel in self._rawJSONData["functionalChannels"].values():
-            items = [
-                ch for ch in self.functionalChannels if ch.index == channel["index"]
-            ]
-            fc = items[0] if items else None
-
-            if fc is not None:
-                fc.from_json(channel, groups)
-            else:
+            fc = by_index.get(channel["index"])
+            if fc is None:
                 fc = self._parse_functionalChannel(channel, groups)
                 channels.append(fc)
-                self.functionalChannels.append(fc)
-
-        self.functionalChannelCount = Counter(
-            x.functionalChannelType for x in self.functionalChannels
-        )
+                self._functionalChannels.append(fc)
+                if fc is not None:
+                    by_index[fc.index] = fc
+                    count[fc.functionalChannelType] += 1
+                channels_changed = True
+            elif channel is not fc._rawJSONData and channel == fc._rawJSONData and fc.links_groups(groups):
+                fc._rawJSONData = channel
+                fc._record_changes(frozenset())
+            else:
+                channel_type = fc.functionalChannelType
+                if fc.update_from_json(channel, groups):
+                    channels_changed = True
+                    if fc.functionalChannelType != channel_type:
+                        count[channel_type] -= 1
+                        if not count[channel_type]:
+                            del count[channel_type]
+                        count[fc.functionalChannelType] += 1
+
+        if channels_changed:
+            self._record_changes(frozenset({"functionalChannels"}), merge=True)
 
     def _parse_functionalChannel(self, json_state, groups: Iterable[Group]) -> FunctionalChannel:
         fc = None
-        channel_type = FunctionalChannelType.from_str(json_state["functionalChannelType"])
-        if not channel_type in self._typeFunctionalChannelMap:
-            LOGGER.warning(
-                "There is no class for functionalChannel '%s' yet",
-                json_state["functionalChannelType"],
-            )
+        channel_class = self._typeFunctionalChannelMap.get(
+            FunctionalChannelType.from_str(json_state["functionalChannelType"])
+        )
+        if channel_class is None:
+            if UNKNOWN_VALUES.record("functionalChannel", json_state["functionalChannelType"]):
+                LOGGER.warning(
+                    "There is no class for functionalChannel '%s' yet",
+                    json_state["functionalChannelType"],
+                )
             return self._parse_default_functional_channel(json_state, groups)
 
         try:
-            fc = self._typeFunctionalChannelMap[channel_type](self, self._connection)
+            fc = channel_class(self, self._connection)
             fc.from_json(json_state, groups)
-        except Exception:  # pragma: no cover
-            LOGGER.exception("Error while parsing functionalChannel\nJS: %s", json_state)
+        except Exception:
+            if UNKNOWN_VALUES.record("functionalChannelParseError", json_state["functionalChannelType"]):
+                LOGGER.exception("Error while parsing functionalChannel\nJS: %s", json_state)
 
         return fc
 
@@ -105,6 +233,12 @@ class BaseDevice(HomeMaticIPObject):
         if isinstance(channel_type, str):
             channel_type = FunctionalChannelType.from_str(channel_type, channel_type)
 
+        if index is not None:
+            channel = self._channels_by_index().get(index)
+            if channel is not None and channel.functionalChannelType == channel_type:
+                return channel
+            return None
+
         for channel in self.functionalChannels:
             if channel.functionalChannelType != channel_type:
                 continue
@@ -167,10 +301,18 @@ class Device(BaseDevice):
         "IOptionalFeatureDeviceSwitchChannelMode": ["switchChannelMode"]
     }
 
+    def __init_subclass__(cls, **kwargs):
+        """Most devices copy some fields of one of their functional channels. Such a class lists them in
+        _channel_fields, a table of base.schema.Field, and names the channel type in _channel_type, by default
+        the base channel of the device. from_json is generated from the table like from _fields."""
+        super().__init_subclass__(**kwargs)
+        if "_channel_fields" in cls.__dict__:
+            _install_channel_fields(cls)
+
     def __init__(self, connection):
         super().__init__(connection)
 
-        self._on_code_state_event_handler = []
+        self._on_code_state_event_handler = ()
 
         self.liveUpdateState = None
         self.updateState = DeviceUpdateState.UP_TO_DATE
@@ -225,22 +367,14 @@ class Device(BaseDevice):
         self.liveUpdateState = LiveUpdateState.from_str(js["liveUpdateState"])
         c = get_functional_channel(self._baseChannel, js)
         if c:
-            self.set_attr_from_dict("lowBat", c)
-            self.set_attr_from_dict("unreach", c)
-            self.set_attr_from_dict("rssiDeviceValue", c)
-            self.set_attr_from_dict("rssiPeerValue", c)
-            self.set_attr_from_dict("configPending", c)
-            self.set_attr_from_dict("dutyCycle", c)
-            self.routerModuleSupported = c["routerModuleSupported"]
-            self.routerModuleEnabled = c["routerModuleEnabled"]
+            _parse_base_channel_fields(self, c)
 
             sof = c.get("supportedOptionalFeatures")
             if sof:
                 for k, v in sof.items():
                     if v:
                         if k in Device._supportedFeatureAttributeMap:
-                            for attribute in Device._supportedFeatureAttributeMap[k]:
-                                self.set_attr_from_dict(attribute, c)
+                            _feature_parser(k)(self, c)
                         else:  # pragma: no cover
                             LOGGER.warning(
                                 "Optional Device Feature '%s' is not yet supported",
@@ -256,6 +390,8 @@ class Device(BaseDevice):
         Fired with a :class:`CodeStateEvent` when the cloud reports
         a ``DEVICE_CODE_STATE_EVENT`` for this device (HmIP-WKP keypad).
         """
+        if not self._on_code_state_event_handler:
+            self._on_code_state_event_handler = []
         self._on_code_state_event_handler.append(handler)
 
     def fire_code_state_event(self, *args, **kwargs):
@@ -322,6 +458,12 @@ class ExternalDevice(BaseDevice):
 
 
 class HomeControlUnit(Device):
+    _channel_fields = (
+        Field("dutyCycleLevel", optional=True),
+        Field("accessPointPriority", optional=True),
+        Field("signalBrightness", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.dutyCycleLevel = 0.0
@@ -329,16 +471,14 @@ class HomeControlUnit(Device):
         self.signalBrightness = 0
         self._baseChannel = "ACCESS_CONTROLLER_CHANNEL"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(self._baseChannel, js)
-        if c:
-            self.set_attr_from_dict("dutyCycleLevel", c)
-            self.set_attr_from_dict("accessPointPriority", c)
-            self.set_attr_from_dict("signalBrightness", c)
-
 
 class HomeControlAccessPoint(Device):
+    _channel_fields = (
+        Field("dutyCycleLevel", optional=True),
+        Field("accessPointPriority", optional=True),
+        Field("signalBrightness", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.dutyCycleLevel = 0.0
@@ -346,55 +486,41 @@ class HomeControlAccessPoint(Device):
         self.signalBrightness = 0
         self._baseChannel = "ACCESS_CONTROLLER_CHANNEL"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(self._baseChannel, js)
-        if c:
-            self.set_attr_from_dict("dutyCycleLevel", c)
-            self.set_attr_from_dict("accessPointPriority", c)
-            self.set_attr_from_dict("signalBrightness", c)
-
 
 class WiredDinRailAccessPoint(Device):
+    _channel_fields = (
+        Field("accessPointPriority", optional=True),
+        Field("signalBrightness", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.accessPointPriority = 0
         self.signalBrightness = 0
         self._baseChannel = "ACCESS_CONTROLLER_WIRED_CHANNEL"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(self._baseChannel, js)
-        if c:
-            self.set_attr_from_dict("accessPointPriority", c)
-            self.set_attr_from_dict("signalBrightness", c)
-
 
 class SabotageDevice(Device):
+    _channel_fields = (
+        Field("sabotage", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.sabotage = None
         self._baseChannel = "DEVICE_SABOTAGE"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(self._baseChannel, js)
-        if c:
-            self.set_attr_from_dict("sabotage", c)
-
 
 class OperationLockableDevice(Device):
+    _channel_fields = (
+        Field("operationLockActive", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.operationLockActive = None
         self._baseChannel = "DEVICE_OPERATIONLOCK"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(self._baseChannel, js)
-        if c:
-            self.set_attr_from_dict("operationLockActive", c)
-
     def set_operation_lock(self, operationLock=True):
         return self._run_non_async(lambda: self.set_operation_lock_async(operationLock))
 
@@ -406,6 +532,15 @@ class OperationLockableDevice(Device):
 class HeatingThermostat(OperationLockableDevice):
     """HMIP-eTRV (Radiator Thermostat)"""
 
+    _channel_type = "HEATING_THERMOSTAT_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("valvePosition"),
+        Field("valveState", converter=ValveState),
+        Field("setPointTemperature"),
+        Field("valveActualTemperature"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float: the offset temperature for the thermostat (+/- 3.5)
@@ -421,16 +556,6 @@ class HeatingThermostat(OperationLockableDevice):
         #:bool: must the adaption re-run?
         self.automaticValveAdaptionNeeded = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("HEATING_THERMOSTAT_CHANNEL", js)
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.valvePosition = c["valvePosition"]
-            self.valveState = ValveState.from_str(c["valveState"])
-            self.setPointTemperature = c["setPointTemperature"]
-            self.valveActualTemperature = c["valveActualTemperature"]
-
     def __str__(self):
         return f"{super().__str__()} valvePosition({self.valvePosition}) valveState({self.valveState}) temperatureOffset({self.temperatureOffset}) setPointTemperature({self.setPointTemperature}) valveActualTemperature({self.valveActualTemperature})"
 
@@ -438,6 +563,15 @@ class HeatingThermostat(OperationLockableDevice):
 class HeatingThermostatCompact(SabotageDevice):
     """HMIP-eTRV-C (Heating-thermostat compact without display)"""
 
+    _channel_type = "HEATING_THERMOSTAT_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("valvePosition"),
+        Field("valveState", converter=ValveState),
+        Field("setPointTemperature"),
+        Field("valveActualTemperature"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float: the offset temperature for the thermostat (+/- 3.5)
@@ -453,16 +587,6 @@ class HeatingThermostatCompact(SabotageDevice):
         #:bool: must the adaption re-run?
         self.automaticValveAdaptionNeeded = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("HEATING_THERMOSTAT_CHANNEL", js)
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.valvePosition = c["valvePosition"]
-            self.valveState = ValveState.from_str(c["valveState"])
-            self.setPointTemperature = c["setPointTemperature"]
-            self.valveActualTemperature = c["valveActualTemperature"]
-
     def __str__(self):
         return f"{super().__str__()} valvePosition({self.valvePosition}) valveState({self.valveState}) temperatureOffset({self.temperatureOffset}) setPointTemperature({self.setPointTemperature}) valveActualTemperature({self.valveActualTemperature})"
 
@@ -470,6 +594,15 @@ class HeatingThermostatCompact(SabotageDevice):
 class HeatingThermostatEvo(OperationLockableDevice):
     """HMIP-eTRV-E (Heating-thermostat new evo version)"""
 
+    _channel_type = "HEATING_THERMOSTAT_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("valvePosition"),
+        Field("valveState", converter=ValveState),
+        Field("setPointTemperature"),
+        Field("valveActualTemperature"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float: the offset temperature for the thermostat (+/- 3.5)
@@ -485,16 +618,6 @@ class HeatingThermostatEvo(OperationLockableDevice):
         #:bool: must the adaption re-run?
         self.automaticValveAdaptionNeeded = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("HEATING_THERMOSTAT_CHANNEL", js)
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.valvePosition = c["valvePosition"]
-            self.valveState = ValveState.from_str(c["valveState"])
-            self.setPointTemperature = c["setPointTemperature"]
-            self.valveActualTemperature = c["valveActualTemperature"]
-
     def __str__(self):
         return f"{super().__str__()} valvePosition({self.valvePosition}) valveState({self.valveState}) temperatureOffset({self.temperatureOffset}) setPointTemperature({self.setPointTemperature}) valveActualTemperature({self.valveActualTemperature})"
 
@@ -502,18 +625,17 @@ class HeatingThermostatEvo(OperationLockableDevice):
 class ShutterContact(SabotageDevice):
     """HMIP-SWDO (Door / Window Contact - optical) / HMIP-SWDO-I (Door / Window Contact Invisible - optical)"""
 
+    _channel_type = "SHUTTER_CONTACT_CHANNEL"
+    _channel_fields = (
+        Field("windowState", converter=WindowState),
+        Field("eventDelay"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windowState = WindowState.CLOSED
         self.eventDelay = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SHUTTER_CONTACT_CHANNEL", js)
-        if c:
-            self.windowState = WindowState.from_str(c["windowState"])
-            self.eventDelay = c["eventDelay"]
-
     def __str__(self):
         return f"{super().__str__()} windowState({self.windowState})"
 
@@ -521,18 +643,17 @@ class ShutterContact(SabotageDevice):
 class ShutterContactMagnetic(Device):
     """HMIP-SWDM /  HMIP-SWDM-B2  (Door / Window Contact - magnetic )"""
 
+    _channel_type = "SHUTTER_CONTACT_CHANNEL"
+    _channel_fields = (
+        Field("windowState", converter=WindowState),
+        Field("eventDelay"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windowState = WindowState.CLOSED
         self.eventDelay = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SHUTTER_CONTACT_CHANNEL", js)
-        if c:
-            self.windowState = WindowState.from_str(c["windowState"])
-            self.eventDelay = c["eventDelay"]
-
     def __str__(self):
         return f"{super().__str__()} windowState({self.windowState})"
 
@@ -544,18 +665,17 @@ class ShutterContactOpticalPlus(ShutterContact):
 class ContactInterface(SabotageDevice):
     """HMIP-SCI (Contact Interface Sensor)"""
 
+    _channel_type = "CONTACT_INTERFACE_CHANNEL"
+    _channel_fields = (
+        Field("windowState", converter=WindowState),
+        Field("eventDelay"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windowState = WindowState.CLOSED
         self.eventDelay = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("CONTACT_INTERFACE_CHANNEL", js)
-        if c:
-            self.windowState = WindowState.from_str(c["windowState"])
-            self.eventDelay = c["eventDelay"]
-
     def __str__(self):
         return f"{super().__str__()} windowState({self.windowState})"
 
@@ -563,18 +683,17 @@ class ContactInterface(SabotageDevice):
 class RotaryHandleSensor(SabotageDevice):
     """HMIP-SRH"""
 
+    _channel_type = "ROTARY_HANDLE_CHANNEL"
+    _channel_fields = (
+        Field("windowState", converter=WindowState),
+        Field("eventDelay"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windowState = WindowState.CLOSED
         self.eventDelay = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("ROTARY_HANDLE_CHANNEL", js)
-        if c:
-            self.windowState = WindowState.from_str(c["windowState"])
-            self.eventDelay = c["eventDelay"]
-
     def __str__(self):
         return f"{super().__str__()} windowState({self.windowState})"
 
@@ -582,20 +701,19 @@ class RotaryHandleSensor(SabotageDevice):
 class TemperatureHumiditySensorOutdoor(Device):
     """HMIP-STHO (Temperature and Humidity Sensor outdoor)"""
 
+    _channel_type = "CLIMATE_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0
         self.humidity = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("CLIMATE_SENSOR_CHANNEL", js)
-        if c:
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.vaporAmount = c["vaporAmount"]
-
     def __str__(self):
         return f"{super().__str__()} actualTemperature({self.actualTemperature}) humidity({self.humidity}) vaporAmount({self.vaporAmount})"
 
@@ -603,6 +721,14 @@ class TemperatureHumiditySensorOutdoor(Device):
 class TemperatureHumiditySensorWithoutDisplay(Device):
     """HMIP-STH (Temperature and Humidity Sensor without display - indoor)"""
 
+    _channel_type = "WALL_MOUNTED_THERMOSTAT_WITHOUT_DISPLAY_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.temperatureOffset = 0
@@ -610,17 +736,6 @@ class TemperatureHumiditySensorWithoutDisplay(Device):
         self.humidity = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(
-            "WALL_MOUNTED_THERMOSTAT_WITHOUT_DISPLAY_CHANNEL", js
-        )
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.vaporAmount = c["vaporAmount"]
-
     def __str__(self):
         return f"{super().__str__()} actualTemperature({self.actualTemperature}) humidity({self.humidity}) vaporAmount({self.vaporAmount})"
 
@@ -628,6 +743,16 @@ class TemperatureHumiditySensorWithoutDisplay(Device):
 class TemperatureHumiditySensorDisplay(Device):
     """HMIP-STHD (Temperature and Humidity Sensor with display - indoor)"""
 
+    _channel_type = "WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("display", converter=ClimateControlDisplay),
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("setPointTemperature"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.temperatureOffset = 0
@@ -637,17 +762,6 @@ class TemperatureHumiditySensorDisplay(Device):
         self.setPointTemperature = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL", js)
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.display = ClimateControlDisplay.from_str(c["display"])
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.setPointTemperature = c["setPointTemperature"]
-            self.vaporAmount = c["vaporAmount"]
-
     def set_display(self, display: ClimateControlDisplay = ClimateControlDisplay.ACTUAL):
         return self._run_non_async(lambda: self.set_display_async(display))
 
@@ -666,15 +780,14 @@ class WallMountedThermostatPro(
 ):
     """HMIP-WTH, HMIP-WTH-2 (Wall Thermostat with Humidity Sensor) / HMIP-BWTH (Brand Wall Thermostat with Humidity Sensor)"""
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL", js)
-        if c:
-            self.temperatureOffset = c["temperatureOffset"]
-            self.display = ClimateControlDisplay.from_str(c["display"])
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.setPointTemperature = c["setPointTemperature"]
+    _channel_type = "WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL"
+    _channel_fields = (
+        Field("temperatureOffset"),
+        Field("display", converter=ClimateControlDisplay),
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("setPointTemperature"),
+    )
 
 
 class WiredCarbonTemperatureHumiditySensorDisplay(Device):
@@ -694,20 +807,19 @@ class RoomControlDevice(WallMountedThermostatPro):
 class RoomControlDeviceAnalog(Device):
     """ALPHA-IP-RBGa   (ALpha IP Wall Thermostat Display analog)"""
 
+    _channel_type = "ANALOG_ROOM_CONTROL_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature", optional=True),
+        Field("setPointTemperature", optional=True),
+        Field("temperatureOffset", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0.0
         self.setPointTemperature = 0.0
         self.temperatureOffset = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("ANALOG_ROOM_CONTROL_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("actualTemperature", c)
-            self.set_attr_from_dict("setPointTemperature", c)
-            self.set_attr_from_dict("temperatureOffset", c)
-
 
 class WallMountedThermostatBasicHumidity(WallMountedThermostatPro):
     """HMIP-WTH-B (Wall Thermostat – basic)"""
@@ -717,6 +829,19 @@ class WallMountedThermostatBasicHumidity(WallMountedThermostatPro):
 class SmokeDetector(Device):
     """HMIP-SWSD, HmIP-SWSD-2 (Smoke Alarm with Q label)"""
 
+    _channel_type = "SMOKE_DETECTOR_CHANNEL"
+    _channel_fields = (
+        Field("smokeDetectorAlarmType", converter=SmokeDetectorAlarmType, optional=True),
+        Field("chamberDegraded", optional=True),
+        Field("dirtLevel", optional=True),
+        Field("smokeDetectorGroupAssignment", optional=True),
+        Field("smokeEventRepeatingActive", optional=True),
+        Field("lastSmokeAlarmTimestamp", optional=True),
+        Field("lastSmokeTestTimestamp", optional=True),
+        Field("smokeAlarmCounter", optional=True),
+        Field("smokeTestCounter", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.smokeDetectorAlarmType = SmokeDetectorAlarmType.IDLE_OFF
@@ -729,20 +854,6 @@ class SmokeDetector(Device):
         self.smokeAlarmCounter = None
         self.smokeTestCounter = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SMOKE_DETECTOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("smokeDetectorAlarmType", c, enum_type=SmokeDetectorAlarmType)
-            self.set_attr_from_dict("chamberDegraded", c)
-            self.set_attr_from_dict("dirtLevel", c)
-            self.set_attr_from_dict("smokeDetectorGroupAssignment", c)
-            self.set_attr_from_dict("smokeEventRepeatingActive", c)
-            self.set_attr_from_dict("lastSmokeAlarmTimestamp", c)
-            self.set_attr_from_dict("lastSmokeTestTimestamp", c)
-            self.set_attr_from_dict("smokeAlarmCounter", c)
-            self.set_attr_from_dict("smokeTestCounter", c)
-
 
 class FloorTerminalBlock6(Device):
     """HMIP-FAL230-C6 (Floor Heating Actuator - 6 channels, 230 V)"""
@@ -803,6 +914,17 @@ class FloorTerminalBlock10(FloorTerminalBlock6):
 class FloorTerminalBlock12(Device):
     """HMIP-FALMOT-C12 (Floor Heating Actuator – 12x channels, motorised)"""
 
+    _channel_type = "DEVICE_BASE_FLOOR_HEATING"
+    _channel_fields = (
+        Field("coolingEmergencyValue", optional=True),
+        Field("frostProtectionTemperature", optional=True),
+        Field("heatingEmergencyValue", optional=True),
+        Field("minimumFloorHeatingValvePosition", optional=True),
+        Field("pulseWidthModulationAtLowFloorHeatingValvePositionEnabled", optional=True),
+        Field("valveProtectionDuration", optional=True),
+        Field("valveProtectionSwitchingInterval", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.frostProtectionTemperature = 0.0
@@ -815,18 +937,6 @@ class FloorTerminalBlock12(Device):
 
         self._baseChannel = "DEVICE_BASE_FLOOR_HEATING"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DEVICE_BASE_FLOOR_HEATING", js)
-        if c:
-            self.set_attr_from_dict("coolingEmergencyValue", c)
-            self.set_attr_from_dict("frostProtectionTemperature", c)
-            self.set_attr_from_dict("heatingEmergencyValue", c)
-            self.set_attr_from_dict("minimumFloorHeatingValvePosition", c)
-            self.set_attr_from_dict("pulseWidthModulationAtLowFloorHeatingValvePositionEnabled", c)
-            self.set_attr_from_dict("valveProtectionDuration", c)
-            self.set_attr_from_dict("valveProtectionSwitchingInterval", c)
-
     def set_minimum_floor_heating_valve_position(self, minimumFloorHeatingValvePosition: float):
         """sets the minimum floot heating valve position
 
@@ -869,20 +979,19 @@ class WiredFloorTerminalBlock12(FloorTerminalBlock12):
 class Switch(Device):
     """Generic Switch class"""
 
+    _channel_type = "SWITCH_CHANNEL"
+    _channel_fields = (
+        Field("on"),
+        Field("profileMode"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
         self.profileMode = None
         self.userDesiredProfileMode = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SWITCH_CHANNEL", js)
-        if c:
-            self.on = c["on"]
-            self.profileMode = c["profileMode"]
-            self.userDesiredProfileMode = c["userDesiredProfileMode"]
-
     def __str__(self):
         return f"{super().__str__()} on({self.on}) profileMode({self.profileMode}) userDesiredProfileMode({self.userDesiredProfileMode})"
 
@@ -994,16 +1103,15 @@ class SwitchMeasuring(Switch):
 class MultiIOBox(Switch):
     """HMIP-MIOB (Multi IO Box for floor heating & cooling)"""
 
+    _channel_type = "ANALOG_OUTPUT_CHANNEL"
+    _channel_fields = (
+        Field("analogOutputLevel"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.analogOutputLevel = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("ANALOG_OUTPUT_CHANNEL", js)
-        if c:
-            self.analogOutputLevel = c["analogOutputLevel"]
-
     def __str__(self):
         return f"{super().__str__()} analogOutputLevel({self.analogOutputLevel})"
 
@@ -1189,17 +1297,16 @@ class AlarmSirenIndoor(SabotageDevice):
 class AlarmSirenOutdoor(AlarmSirenIndoor):
     """HMIP-ASIR-O (Alarm Siren Outdoor)"""
 
+    _channel_type = "DEVICE_RECHARGEABLE_WITH_SABOTAGE"
+    _channel_fields = (
+        Field("badBatteryHealth", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.badBatteryHealth = False
         self._baseChannel = "DEVICE_RECHARGEABLE_WITH_SABOTAGE"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DEVICE_RECHARGEABLE_WITH_SABOTAGE", js)
-        if c:
-            self.set_attr_from_dict("badBatteryHealth", c)
-
 
 class CombinationSignallingDevice(Device):
     """HmIP-MP3P (Combination Signalling Device)
@@ -1248,6 +1355,16 @@ class CombinationSignallingDevice(Device):
 class MotionDetectorIndoor(SabotageDevice):
     """HMIP-SMI (Motion Detector with Brightness Sensor - indoor)"""
 
+    _channel_type = "MOTION_DETECTION_CHANNEL"
+    _channel_fields = (
+        Field("motionDetected"),
+        Field("illumination"),
+        Field("motionBufferActive"),
+        Field("motionDetectionSendInterval", converter=MotionDetectionSendInterval),
+        Field("numberOfBrightnessMeasurements"),
+        Field("currentIllumination"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.currentIllumination = None
@@ -1257,19 +1374,6 @@ class MotionDetectorIndoor(SabotageDevice):
         self.motionDetectionSendInterval = MotionDetectionSendInterval.SECONDS_30
         self.numberOfBrightnessMeasurements = 0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("MOTION_DETECTION_CHANNEL", js)
-        if c:
-            self.motionDetected = c["motionDetected"]
-            self.illumination = c["illumination"]
-            self.motionBufferActive = c["motionBufferActive"]
-            self.motionDetectionSendInterval = MotionDetectionSendInterval.from_str(
-                c["motionDetectionSendInterval"]
-            )
-            self.numberOfBrightnessMeasurements = c["numberOfBrightnessMeasurements"]
-            self.currentIllumination = c["currentIllumination"]
-
     def __str__(self):
         return f"{super().__str__()} motionDetected({self.motionDetected}) illumination({self.illumination}) motionBufferActive({self.motionBufferActive}) motionDetectionSendInterval({self.motionDetectionSendInterval}) numberOfBrightnessMeasurements({self.numberOfBrightnessMeasurements})"
 
@@ -1277,6 +1381,16 @@ class MotionDetectorIndoor(SabotageDevice):
 class MotionDetectorOutdoor(Device):
     """HMIP-SMO-A (Motion Detector with Brightness Sensor - outdoor)"""
 
+    _channel_type = "MOTION_DETECTION_CHANNEL"
+    _channel_fields = (
+        Field("motionDetected", optional=True),
+        Field("illumination", optional=True),
+        Field("motionBufferActive", optional=True),
+        Field("motionDetectionSendInterval", optional=True),
+        Field("numberOfBrightnessMeasurements", optional=True),
+        Field("currentIllumination", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.currentIllumination = None
@@ -1286,32 +1400,20 @@ class MotionDetectorOutdoor(Device):
         self.motionDetectionSendInterval = MotionDetectionSendInterval.SECONDS_30
         self.numberOfBrightnessMeasurements = 0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("MOTION_DETECTION_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("motionDetected", c)
-            self.set_attr_from_dict("illumination", c)
-            self.set_attr_from_dict("motionBufferActive", c)
-            self.set_attr_from_dict("motionDetectionSendInterval", c)
-            self.set_attr_from_dict("numberOfBrightnessMeasurements", c)
-            self.set_attr_from_dict("currentIllumination", c)
-
 
 class MotionDetectorPushButton(MotionDetectorOutdoor):
     """HMIP-SMI55 (Motion Detector with Brightness Sensor and Remote Control - 2-button)"""
 
+    _channel_type = "DEVICE_PERMANENT_FULL_RX"
+    _channel_fields = (
+        Field("permanentFullRx", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self._baseChannel = "DEVICE_PERMANENT_FULL_RX"
         self.permanentFullRx = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DEVICE_PERMANENT_FULL_RX", js)
-        if c:
-            self.set_attr_from_dict("permanentFullRx", c)
-
 
 class WiredMotionDetectorPushButton(MotionDetectorOutdoor):
     """HmIPW-SMI55"""
@@ -1320,6 +1422,16 @@ class WiredMotionDetectorPushButton(MotionDetectorOutdoor):
 class PresenceDetectorIndoor(SabotageDevice):
     """HMIP-SPI (Presence Sensor - indoor)"""
 
+    _channel_type = "PRESENCE_DETECTION_CHANNEL"
+    _channel_fields = (
+        Field("presenceDetected"),
+        Field("currentIllumination"),
+        Field("illumination"),
+        Field("motionBufferActive"),
+        Field("motionDetectionSendInterval", converter=MotionDetectionSendInterval),
+        Field("numberOfBrightnessMeasurements"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.presenceDetected = False
@@ -1329,19 +1441,6 @@ class PresenceDetectorIndoor(SabotageDevice):
         self.motionDetectionSendInterval = MotionDetectionSendInterval.SECONDS_30
         self.numberOfBrightnessMeasurements = 0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("PRESENCE_DETECTION_CHANNEL", js)
-        if c:
-            self.presenceDetected = c["presenceDetected"]
-            self.currentIllumination = c["currentIllumination"]
-            self.illumination = c["illumination"]
-            self.motionBufferActive = c["motionBufferActive"]
-            self.motionDetectionSendInterval = MotionDetectionSendInterval.from_str(
-                c["motionDetectionSendInterval"]
-            )
-            self.numberOfBrightnessMeasurements = c["numberOfBrightnessMeasurements"]
-
     def __str__(self):
         return f"{super().__str__()} presenceDetected({self.presenceDetected}) illumination({self.illumination}) motionBufferActive({self.motionBufferActive}) motionDetectionSendInterval({self.motionDetectionSendInterval}) numberOfBrightnessMeasurements({self.numberOfBrightnessMeasurements})"
 
@@ -1349,6 +1448,17 @@ class PresenceDetectorIndoor(SabotageDevice):
 class PassageDetector(SabotageDevice):
     """HMIP-SPDR (Passage Detector)"""
 
+    _channel_type = "PASSAGE_DETECTOR_CHANNEL"
+    _channel_fields = (
+        Field("leftCounter"),
+        Field("leftRightCounterDelta"),
+        Field("passageBlindtime"),
+        Field("passageDirection", converter=PassageDirection),
+        Field("passageSensorSensitivity"),
+        Field("passageTimeout"),
+        Field("rightCounter"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.leftCounter = 0
@@ -1359,18 +1469,6 @@ class PassageDetector(SabotageDevice):
         self.passageTimeout = 0.0
         self.rightCounter = 0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("PASSAGE_DETECTOR_CHANNEL", js)
-        if c:
-            self.leftCounter = c["leftCounter"]
-            self.leftRightCounterDelta = c["leftRightCounterDelta"]
-            self.passageBlindtime = c["passageBlindtime"]
-            self.passageDirection = PassageDirection.from_str(c["passageDirection"])
-            self.passageSensorSensitivity = c["passageSensorSensitivity"]
-            self.passageTimeout = c["passageTimeout"]
-            self.rightCounter = c["rightCounter"]
-
     def __str__(self):
         return f"{super().__str__()} leftCounter({self.leftCounter}) leftRightCounterDelta({self.leftRightCounterDelta}) passageBlindtime({self.passageBlindtime}) passageDirection({self.passageDirection}) passageSensorSensitivity({self.passageSensorSensitivity}) passageTimeout({self.passageTimeout}) rightCounter({self.rightCounter})"
 
@@ -1473,6 +1571,24 @@ class Blind(Shutter):
 class FullFlushShutter(Shutter):
     """HMIP-FROLL (Shutter Actuator - flush-mount) / HMIP-BROLL (Shutter Actuator - Brand-mount)"""
 
+    _channel_type = "SHUTTER_CHANNEL"
+    _channel_fields = (
+        Field("shutterLevel"),
+        Field("changeOverDelay"),
+        Field("delayCompensationValue"),
+        Field("bottomToTopReferenceTime"),
+        Field("topToBottomReferenceTime"),
+        Field("endpositionAutoDetectionEnabled"),
+        Field("previousShutterLevel"),
+        Field("processing"),
+        Field("profileMode"),
+        Field("selfCalibrationInProgress"),
+        Field("supportingDelayCompensation"),
+        Field("supportingEndpositionAutoDetection"),
+        Field("supportingSelfCalibration"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.shutterLevel = 0
@@ -1490,27 +1606,6 @@ class FullFlushShutter(Shutter):
         self.supportingSelfCalibration = False
         self.userDesiredProfileMode = "AUTOMATIC"
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SHUTTER_CHANNEL", js)
-        if c:
-            self.shutterLevel = c["shutterLevel"]
-            self.changeOverDelay = c["changeOverDelay"]
-            self.delayCompensationValue = c["delayCompensationValue"]
-            self.bottomToTopReferenceTime = c["bottomToTopReferenceTime"]
-            self.topToBottomReferenceTime = c["topToBottomReferenceTime"]
-            self.endpositionAutoDetectionEnabled = c["endpositionAutoDetectionEnabled"]
-            self.previousShutterLevel = c["previousShutterLevel"]
-            self.processing = c["processing"]
-            self.profileMode = c["profileMode"]
-            self.selfCalibrationInProgress = c["selfCalibrationInProgress"]
-            self.supportingDelayCompensation = c["supportingDelayCompensation"]
-            self.supportingEndpositionAutoDetection = c[
-                "supportingEndpositionAutoDetection"
-            ]
-            self.supportingSelfCalibration = c["supportingSelfCalibration"]
-            self.userDesiredProfileMode = c["userDesiredProfileMode"]
-
     def __str__(self):
         return f"{super().__str__()} shutterLevel({self.shutterLevel}) topToBottom({self.topToBottomReferenceTime}) bottomToTop({self.bottomToTopReferenceTime})"
 
@@ -1518,6 +1613,28 @@ class FullFlushShutter(Shutter):
 class FullFlushBlind(FullFlushShutter, Blind):
     """HMIP-FBL (Blind Actuator - flush-mount)"""
 
+    _channel_type = "BLIND_CHANNEL"
+    _channel_fields = (
+        Field("shutterLevel"),
+        Field("changeOverDelay"),
+        Field("delayCompensationValue"),
+        Field("bottomToTopReferenceTime"),
+        Field("topToBottomReferenceTime"),
+        Field("endpositionAutoDetectionEnabled"),
+        Field("previousShutterLevel"),
+        Field("processing"),
+        Field("profileMode"),
+        Field("selfCalibrationInProgress"),
+        Field("supportingDelayCompensation"),
+        Field("supportingEndpositionAutoDetection"),
+        Field("supportingSelfCalibration"),
+        Field("userDesiredProfileMode"),
+        Field("slatsLevel"),
+        Field("slatsReferenceTime"),
+        Field("previousSlatsLevel"),
+        Field("blindModeActive"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.slatsLevel = 0
@@ -1525,32 +1642,6 @@ class FullFlushBlind(FullFlushShutter, Blind):
         self.previousSlatsLevel = 0
         self.blindModeActive = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("BLIND_CHANNEL", js)
-        if c:
-            self.shutterLevel = c["shutterLevel"]
-            self.changeOverDelay = c["changeOverDelay"]
-            self.delayCompensationValue = c["delayCompensationValue"]
-            self.bottomToTopReferenceTime = c["bottomToTopReferenceTime"]
-            self.topToBottomReferenceTime = c["topToBottomReferenceTime"]
-            self.endpositionAutoDetectionEnabled = c["endpositionAutoDetectionEnabled"]
-            self.previousShutterLevel = c["previousShutterLevel"]
-            self.processing = c["processing"]
-            self.profileMode = c["profileMode"]
-            self.selfCalibrationInProgress = c["selfCalibrationInProgress"]
-            self.supportingDelayCompensation = c["supportingDelayCompensation"]
-            self.supportingEndpositionAutoDetection = c[
-                "supportingEndpositionAutoDetection"
-            ]
-            self.supportingSelfCalibration = c["supportingSelfCalibration"]
-            self.userDesiredProfileMode = c["userDesiredProfileMode"]
-
-            self.slatsLevel = c["slatsLevel"]
-            self.slatsReferenceTime = c["slatsReferenceTime"]
-            self.previousSlatsLevel = c["previousSlatsLevel"]
-            self.blindModeActive = c["blindModeActive"]
-
     def __str__(self):
         return f"{super().__str__()} slatsLevel({self.slatsLevel}) blindModeActive({self.blindModeActive})"
 
@@ -1677,6 +1768,32 @@ class PushButton6LedSwitch(WiredPushButton):
 class BlindModule(Device):
     """HMIP-HDM1 (Hunter Douglas & erfal window blinds)"""
 
+    _channel_type = "SHADING_CHANNEL"
+    _channel_fields = (
+        Field("automationDriveSpeed", converter=DriveSpeed, optional=True),
+        Field("manualDriveSpeed", converter=DriveSpeed, optional=True),
+        Field("favoritePrimaryShadingPosition", optional=True),
+        Field("favoriteSecondaryShadingPosition", optional=True),
+        Field("primaryCloseAdjustable", optional=True),
+        Field("primaryOpenAdjustable", optional=True),
+        Field("primaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("secondaryCloseAdjustable", optional=True),
+        Field("secondaryOpenAdjustable", optional=True),
+        Field("secondaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("primaryShadingLevel", optional=True),
+        Field("secondaryShadingLevel", optional=True),
+        Field("previousPrimaryShadingLevel", optional=True),
+        Field("previousSecondaryShadingLevel", optional=True),
+        Field("identifyOemSupported", optional=True),
+        Field("productId", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+        Field("shadingDriveVersion", optional=True),
+        Field("shadingPackagePosition", converter=ShadingPackagePosition, optional=True),
+        Field("shadingPositionAdjustmentActive", optional=True),
+        Field("shadingPositionAdjustmentClientId", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.automationDriveSpeed = DriveSpeed.CREEP_SPEED
@@ -1703,40 +1820,6 @@ class BlindModule(Device):
         self.shadingPositionAdjustmentActive = None
         self.shadingPositionAdjustmentClientId = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("SHADING_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("automationDriveSpeed", c, DriveSpeed)
-            self.set_attr_from_dict("manualDriveSpeed", c, DriveSpeed)
-
-            self.set_attr_from_dict("favoritePrimaryShadingPosition", c)
-            self.set_attr_from_dict("favoriteSecondaryShadingPosition", c)
-
-            self.set_attr_from_dict("primaryCloseAdjustable", c)
-            self.set_attr_from_dict("primaryOpenAdjustable", c)
-            self.set_attr_from_dict("primaryShadingStateType", c, ShadingStateType)
-            self.set_attr_from_dict("secondaryCloseAdjustable", c)
-            self.set_attr_from_dict("secondaryOpenAdjustable", c)
-            self.set_attr_from_dict("secondaryShadingStateType", c, ShadingStateType)
-
-            self.set_attr_from_dict("primaryShadingLevel", c)
-            self.set_attr_from_dict("secondaryShadingLevel", c)
-
-            self.set_attr_from_dict("previousPrimaryShadingLevel", c)
-            self.set_attr_from_dict("previousSecondaryShadingLevel", c)
-
-            self.set_attr_from_dict("identifyOemSupported", c)
-            self.set_attr_from_dict("productId", c)
-
-            self.set_attr_from_dict("profileMode", c, ProfileMode)
-            self.set_attr_from_dict("userDesiredProfileMode", c, ProfileMode)
-
-            self.set_attr_from_dict("shadingDriveVersion", c)
-            self.set_attr_from_dict("shadingPackagePosition", c, ShadingPackagePosition)
-            self.set_attr_from_dict("shadingPositionAdjustmentActive", c)
-            self.set_attr_from_dict("shadingPositionAdjustmentClientId", c)
-
     def set_primary_shading_level(self, primaryShadingLevel: float):
         return self._run_non_async(lambda: self.set_primary_shading_level_async(primaryShadingLevel))
 
@@ -1786,6 +1869,14 @@ class BlindModule(Device):
 class LightSensor(Device):
     """HMIP-SLO (Light Sensor outdoor)"""
 
+    _channel_type = "LIGHT_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("averageIllumination"),
+        Field("currentIllumination"),
+        Field("highestIllumination"),
+        Field("lowestIllumination"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float:the average illumination value
@@ -1797,15 +1888,6 @@ class LightSensor(Device):
         #:float:the lowest illumination value
         self.lowestIllumination = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("LIGHT_SENSOR_CHANNEL", js)
-        if c:
-            self.averageIllumination = c["averageIllumination"]
-            self.currentIllumination = c["currentIllumination"]
-            self.highestIllumination = c["highestIllumination"]
-            self.lowestIllumination = c["lowestIllumination"]
-
     def __str__(self):
         return f"{super().__str__()} averageIllumination({self.averageIllumination}) currentIllumination({self.currentIllumination}) highestIllumination({self.highestIllumination}) lowestIllumination({self.lowestIllumination})"
 
@@ -1813,20 +1895,19 @@ class LightSensor(Device):
 class Dimmer(Device):
     """Base dimmer device class"""
 
+    _channel_type = "DIMMER_CHANNEL"
+    _channel_fields = (
+        Field("dimLevel"),
+        Field("profileMode"),
+        Field("userDesiredProfileMode"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.dimLevel = 0.0
         self.profileMode = ""
         self.userDesiredProfileMode = ""
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DIMMER_CHANNEL", js)
-        if c:
-            self.dimLevel = c["dimLevel"]
-            self.profileMode = c["profileMode"]
-            self.userDesiredProfileMode = c["userDesiredProfileMode"]
-
     def __str__(self):
         return f"{super().__str__()} dimLevel({self.dimLevel}) profileMode({self.profileMode}) userDesiredProfileMode({self.userDesiredProfileMode})"
 
@@ -1879,6 +1960,22 @@ class DinRailDimmer3(Dimmer):
 class WeatherSensor(Device):
     """HMIP-SWO-B"""
 
+    _channel_type = "WEATHER_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("illumination"),
+        Field("illuminationThresholdSunshine"),
+        Field("storm"),
+        Field("sunshine"),
+        Field("todaySunshineDuration"),
+        Field("totalSunshineDuration"),
+        Field("windSpeed"),
+        Field("windValueType", converter=WindValueType),
+        Field("yesterdaySunshineDuration"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0
@@ -1894,24 +1991,6 @@ class WeatherSensor(Device):
         self.yesterdaySunshineDuration = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-
-        c = get_functional_channel("WEATHER_SENSOR_CHANNEL", js)
-        if c:
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.illumination = c["illumination"]
-            self.illuminationThresholdSunshine = c["illuminationThresholdSunshine"]
-            self.storm = c["storm"]
-            self.sunshine = c["sunshine"]
-            self.todaySunshineDuration = c["todaySunshineDuration"]
-            self.totalSunshineDuration = c["totalSunshineDuration"]
-            self.windSpeed = c["windSpeed"]
-            self.windValueType = WindValueType.from_str(c["windValueType"])
-            self.yesterdaySunshineDuration = c["yesterdaySunshineDuration"]
-            self.vaporAmount = c["vaporAmount"]
-
     def __str__(self):
         return (
             f"{super().__str__()} actualTemperature({self.actualTemperature}) humidity({self.humidity}) vaporAmount({self.vaporAmount}) illumination({self.illumination}) illuminationThresholdSunshine({self.illuminationThresholdSunshine}) storm({self.storm}) sunshine({self.sunshine}) "
@@ -1924,6 +2003,26 @@ class WeatherSensor(Device):
 class WeatherSensorPlus(Device):
     """HMIP-SWO-PL"""
 
+    _channel_type = "WEATHER_SENSOR_PLUS_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("illumination"),
+        Field("illuminationThresholdSunshine"),
+        Field("raining"),
+        Field("storm"),
+        Field("sunshine"),
+        Field("todayRainCounter"),
+        Field("todaySunshineDuration"),
+        Field("totalRainCounter"),
+        Field("totalSunshineDuration"),
+        Field("windSpeed"),
+        Field("windValueType", converter=WindValueType),
+        Field("yesterdayRainCounter"),
+        Field("yesterdaySunshineDuration"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0
@@ -1943,28 +2042,6 @@ class WeatherSensorPlus(Device):
         self.yesterdaySunshineDuration = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-
-        c = get_functional_channel("WEATHER_SENSOR_PLUS_CHANNEL", js)
-        if c:
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.illumination = c["illumination"]
-            self.illuminationThresholdSunshine = c["illuminationThresholdSunshine"]
-            self.raining = c["raining"]
-            self.storm = c["storm"]
-            self.sunshine = c["sunshine"]
-            self.todayRainCounter = c["todayRainCounter"]
-            self.todaySunshineDuration = c["todaySunshineDuration"]
-            self.totalRainCounter = c["totalRainCounter"]
-            self.totalSunshineDuration = c["totalSunshineDuration"]
-            self.windSpeed = c["windSpeed"]
-            self.windValueType = WindValueType.from_str(c["windValueType"])
-            self.yesterdayRainCounter = c["yesterdayRainCounter"]
-            self.yesterdaySunshineDuration = c["yesterdaySunshineDuration"]
-            self.vaporAmount = c["vaporAmount"]
-
     def __str__(self):
         return (
             f"{super().__str__()} actualTemperature({self.actualTemperature}) humidity({self.humidity}) vaporAmount({self.vaporAmount}) illumination({self.illumination}) illuminationThresholdSunshine({self.illuminationThresholdSunshine}) raining({self.raining}) storm({self.storm}) sunshine({self.sunshine}) "
@@ -1976,6 +2053,29 @@ class WeatherSensorPlus(Device):
 class WeatherSensorPro(Device):
     """HMIP-SWO-PR"""
 
+    _channel_type = "WEATHER_SENSOR_PRO_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature"),
+        Field("humidity"),
+        Field("illumination"),
+        Field("illuminationThresholdSunshine"),
+        Field("raining"),
+        Field("storm"),
+        Field("sunshine"),
+        Field("todayRainCounter"),
+        Field("todaySunshineDuration"),
+        Field("totalRainCounter"),
+        Field("totalSunshineDuration"),
+        Field("weathervaneAlignmentNeeded"),
+        Field("windDirection"),
+        Field("windDirectionVariation"),
+        Field("windSpeed"),
+        Field("windValueType", converter=WindValueType),
+        Field("yesterdayRainCounter"),
+        Field("yesterdaySunshineDuration"),
+        Field("vaporAmount"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0
@@ -1998,31 +2098,6 @@ class WeatherSensorPro(Device):
         self.yesterdaySunshineDuration = 0
         self.vaporAmount = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-
-        c = get_functional_channel("WEATHER_SENSOR_PRO_CHANNEL", js)
-        if c:
-            self.actualTemperature = c["actualTemperature"]
-            self.humidity = c["humidity"]
-            self.illumination = c["illumination"]
-            self.illuminationThresholdSunshine = c["illuminationThresholdSunshine"]
-            self.raining = c["raining"]
-            self.storm = c["storm"]
-            self.sunshine = c["sunshine"]
-            self.todayRainCounter = c["todayRainCounter"]
-            self.todaySunshineDuration = c["todaySunshineDuration"]
-            self.totalRainCounter = c["totalRainCounter"]
-            self.totalSunshineDuration = c["totalSunshineDuration"]
-            self.weathervaneAlignmentNeeded = c["weathervaneAlignmentNeeded"]
-            self.windDirection = c["windDirection"]
-            self.windDirectionVariation = c["windDirectionVariation"]
-            self.windSpeed = c["windSpeed"]
-            self.windValueType = WindValueType.from_str(c["windValueType"])
-            self.yesterdayRainCounter = c["yesterdayRainCounter"]
-            self.yesterdaySunshineDuration = c["yesterdaySunshineDuration"]
-            self.vaporAmount = c["vaporAmount"]
-
     def __str__(self):
         return (
             f"{super().__str__()} actualTemperature({self.actualTemperature}) humidity({self.humidity}) vaporAmount({self.vaporAmount}) illumination({self.illumination}) illuminationThresholdSunshine({self.illuminationThresholdSunshine}) raining({self.raining}) storm({self.storm}) sunshine({self.sunshine}) "
@@ -2165,24 +2240,19 @@ class WaterSensor(Device):
 class FullFlushContactInterface(Device):
     """HMIP-FCI1 (Contact Interface flush-mount – 1 channel)"""
 
+    _channel_type = "MULTI_MODE_INPUT_CHANNEL"
+    _channel_fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType),
+        Field("multiModeInputMode", converter=MultiModeInputMode),
+        Field("windowState", converter=WindowState),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_OPEN
         self.multiModeInputMode = MultiModeInputMode.BINARY_BEHAVIOR
         self.windowState = WindowState.OPEN
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("MULTI_MODE_INPUT_CHANNEL", js)
-        if c:
-            self.binaryBehaviorType = BinaryBehaviorType.from_str(
-                c["binaryBehaviorType"]
-            )
-            self.multiModeInputMode = MultiModeInputMode.from_str(
-                c["multiModeInputMode"]
-            )
-            self.windowState = WindowState.from_str(c["windowState"])
-
     def __str__(self):
         return (
             f"{super().__str__()} binaryBehaviorType({self.binaryBehaviorType}) multiModeInputMode({self.multiModeInputMode}) windowState({self.windowState})"
@@ -2200,6 +2270,15 @@ class WiredInput32(FullFlushContactInterface):
 class FullFlushInputSwitch(Switch):
     """HMIP-FSI16 (Switch Actuator with Push-button Input 230V, 16A)"""
 
+    _channel_type = "MULTI_MODE_INPUT_SWITCH_CHANNEL"
+    _channel_fields = (
+        Field("binaryBehaviorType", converter=BinaryBehaviorType, optional=True),
+        Field("multiModeInputMode", converter=MultiModeInputMode, optional=True),
+        Field("on", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("userDesiredProfileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.binaryBehaviorType = BinaryBehaviorType.NORMALLY_OPEN
@@ -2208,16 +2287,6 @@ class FullFlushInputSwitch(Switch):
         self.profileMode = ProfileMode.MANUAL
         self.userDesiredProfileMode = ProfileMode.MANUAL
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("MULTI_MODE_INPUT_SWITCH_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("binaryBehaviorType", c, BinaryBehaviorType)
-            self.set_attr_from_dict("multiModeInputMode", c, MultiModeInputMode)
-            self.set_attr_from_dict("on", c)
-            self.set_attr_from_dict("profileMode", c, ProfileMode)
-            self.set_attr_from_dict("userDesiredProfileMode", c, ProfileMode)
-
 
 class DinRailSwitch(FullFlushInputSwitch):
     """HMIP-DRSI1 (Switch Actuator for DIN rail mount – 1x channel)"""
@@ -2226,6 +2295,18 @@ class DinRailSwitch(FullFlushInputSwitch):
 class AccelerationSensor(Device):
     """HMIP-SAM (Contact Interface flush-mount – 1 channel)"""
 
+    _channel_type = "ACCELERATION_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("accelerationSensorEventFilterPeriod", optional=True),
+        Field("accelerationSensorMode", converter=AccelerationSensorMode, optional=True),
+        Field("accelerationSensorNeutralPosition", converter=AccelerationSensorNeutralPosition, optional=True),
+        Field("accelerationSensorSensitivity", converter=AccelerationSensorSensitivity, optional=True),
+        Field("accelerationSensorTriggerAngle", optional=True),
+        Field("accelerationSensorTriggered", optional=True),
+        Field("notificationSoundTypeHighToLow", converter=NotificationSoundType, optional=True),
+        Field("notificationSoundTypeLowToHigh", converter=NotificationSoundType, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float:
@@ -2249,29 +2330,6 @@ class AccelerationSensor(Device):
         #:NotificationSoundType:
         self.notificationSoundTypeLowToHigh = NotificationSoundType.SOUND_NO_SOUND
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("ACCELERATION_SENSOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("accelerationSensorEventFilterPeriod", c)
-            self.set_attr_from_dict("accelerationSensorMode", c, AccelerationSensorMode)
-            self.set_attr_from_dict(
-                "accelerationSensorNeutralPosition",
-                c,
-                AccelerationSensorNeutralPosition,
-            )
-            self.set_attr_from_dict(
-                "accelerationSensorSensitivity", c, AccelerationSensorSensitivity
-            )
-            self.set_attr_from_dict("accelerationSensorTriggerAngle", c)
-            self.set_attr_from_dict("accelerationSensorTriggered", c)
-            self.set_attr_from_dict(
-                "notificationSoundTypeHighToLow", c, NotificationSoundType
-            )
-            self.set_attr_from_dict(
-                "notificationSoundTypeLowToHigh", c, NotificationSoundType
-            )
-
     def set_acceleration_sensor_mode(
             self, mode: AccelerationSensorMode, channelIndex=1
     ):
@@ -2389,6 +2447,14 @@ class AccelerationSensor(Device):
 class DoorModule(Device):
     """Generic class for a door module"""
 
+    _channel_type = "DOOR_CHANNEL"
+    _channel_fields = (
+        Field("doorState", converter=DoorState, optional=True),
+        Field("on", optional=True),
+        Field("processing", optional=True),
+        Field("ventilationPositionSupported", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.doorState = DoorState.POSITION_UNKNOWN
@@ -2396,15 +2462,6 @@ class DoorModule(Device):
         self.processing = False
         self.ventilationPositionSupported = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DOOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("doorState", c, DoorState)
-            self.set_attr_from_dict("on", c)
-            self.set_attr_from_dict("processing", c)
-            self.set_attr_from_dict("ventilationPositionSupported", c)
-
     def send_door_command(self, doorCommand=DoorCommand.STOP):
         logging.warning("function is deprecated, use send_door_command_async instead")
         return self._run_non_async(lambda: self.send_door_command_async(doorCommand))
@@ -2426,34 +2483,32 @@ class HoermannDrivesModule(DoorModule):
 class PluggableMainsFailureSurveillance(Device):
     """HMIP-PMFS (Plugable Power Supply Monitoring)"""
 
+    _channel_type = "MAINS_FAILURE_CHANNEL"
+    _channel_fields = (
+        Field("powerMainsFailure", optional=True),
+        Field("genericAlarmSignal", converter=AlarmSignalType, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.powerMainsFailure = False
         self.genericAlarmSignal = AlarmSignalType.NO_ALARM
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("MAINS_FAILURE_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("powerMainsFailure", c)
-            self.set_attr_from_dict("genericAlarmSignal", c, AlarmSignalType)
-
 
 class WallMountedGarageDoorController(Device):
     """HmIP-WGC Wall mounted Garage Door Controller"""
 
+    _channel_type = "IMPULSE_OUTPUT_CHANNEL"
+    _channel_fields = (
+        Field("impulseDuration", optional=True),
+        Field("processing", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.impulseDuration = 0
         self.processing = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("IMPULSE_OUTPUT_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("impulseDuration", c)
-            self.set_attr_from_dict("processing", c)
-
     def send_start_impulse(self, channelIndex=2):
         """Toggle Wall mounted Garage Door Controller."""
         return self._run_non_async(lambda: self.send_start_impulse_async(channelIndex))
@@ -2592,6 +2647,15 @@ class FullFlushDoorController(Device):
 class TiltVibrationSensor(Device):
     """HMIP-STV (Inclination and vibration Sensor)"""
 
+    _channel_type = "TILT_VIBRATION_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("accelerationSensorEventFilterPeriod", optional=True),
+        Field("accelerationSensorMode", converter=AccelerationSensorMode, optional=True),
+        Field("accelerationSensorSensitivity", converter=AccelerationSensorSensitivity, optional=True),
+        Field("accelerationSensorTriggerAngle", optional=True),
+        Field("accelerationSensorTriggered", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float:
@@ -2607,18 +2671,6 @@ class TiltVibrationSensor(Device):
         #:bool:
         self.accelerationSensorTriggered = False
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("TILT_VIBRATION_SENSOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("accelerationSensorEventFilterPeriod", c)
-            self.set_attr_from_dict("accelerationSensorMode", c, AccelerationSensorMode)
-            self.set_attr_from_dict(
-                "accelerationSensorSensitivity", c, AccelerationSensorSensitivity
-            )
-            self.set_attr_from_dict("accelerationSensorTriggerAngle", c)
-            self.set_attr_from_dict("accelerationSensorTriggered", c)
-
     def set_acceleration_sensor_mode(
             self, mode: AccelerationSensorMode, channelIndex=1
     ):
@@ -2696,6 +2748,12 @@ class TiltVibrationSensor(Device):
 class RainSensor(Device):
     """HMIP-SRD (Rain Sensor)"""
 
+    _channel_type = "RAIN_DETECTION_CHANNEL"
+    _channel_fields = (
+        Field("rainSensorSensitivity", optional=True),
+        Field("raining", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:bool:
@@ -2703,17 +2761,17 @@ class RainSensor(Device):
         #:float:
         self.rainSensorSensitivity = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("RAIN_DETECTION_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("rainSensorSensitivity", c)
-            self.set_attr_from_dict("raining", c)
-
 
 class TemperatureDifferenceSensor2(Device):
     """HmIP-STE2-PCB (Temperature Difference Sensors - 2x sensors)"""
 
+    _channel_type = "TEMPERATURE_SENSOR_2_EXTERNAL_DELTA_CHANNEL"
+    _channel_fields = (
+        Field("temperatureExternalDelta", optional=True),
+        Field("temperatureExternalOne", optional=True),
+        Field("temperatureExternalTwo", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:float:
@@ -2723,18 +2781,19 @@ class TemperatureDifferenceSensor2(Device):
         #:float:
         self.temperatureExternalTwo = 0.0
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("TEMPERATURE_SENSOR_2_EXTERNAL_DELTA_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("temperatureExternalDelta", c)
-            self.set_attr_from_dict("temperatureExternalOne", c)
-            self.set_attr_from_dict("temperatureExternalTwo", c)
-
 
 class ParticulateMatterSensor(Device):
     """HmIP-SFD (Fine Dust Sensor)"""
 
+    _channel_type = "PARTICULATE_MATTER_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("actualTemperature", optional=True),
+        Field("humidity", optional=True),
+        Field("particulateMassConcentrationTen", optional=True),
+        Field("particulateMassConcentrationTwoPointFive", optional=True),
+        Field("particulateMassConcentrationOne", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = None
@@ -2743,20 +2802,22 @@ class ParticulateMatterSensor(Device):
         self.particulateMassConcentrationTwoPointFive = None
         self.particulateMassConcentrationOne = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("PARTICULATE_MATTER_SENSOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("actualTemperature", c)
-            self.set_attr_from_dict("humidity", c)
-            self.set_attr_from_dict("particulateMassConcentrationTen", c)
-            self.set_attr_from_dict("particulateMassConcentrationTwoPointFive", c)
-            self.set_attr_from_dict("particulateMassConcentrationOne", c)
-
 
 class DoorLockDrive(OperationLockableDevice):
     """HmIP-DLD"""
 
+    _channel_type = "DOOR_LOCK_CHANNEL"
+    _channel_fields = (
+        Field("autoRelockDelay", optional=True),
+        Field("doorHandleType", optional=True),
+        Field("doorLockDirection", optional=True),
+        Field("doorLockNeutralPosition", optional=True),
+        Field("doorLockTurns", optional=True),
+        Field("lockState", converter=LockState, optional=True),
+        Field("motorState", converter=MotorState, optional=True),
+        Field("index", "door_lock_channel"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.autoRelockDelay = False
@@ -2769,19 +2830,6 @@ class DoorLockDrive(OperationLockableDevice):
 
         self.door_lock_channel = 1
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DOOR_LOCK_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("autoRelockDelay", c)
-            self.set_attr_from_dict("doorHandleType", c)
-            self.set_attr_from_dict("doorLockDirection", c)
-            self.set_attr_from_dict("doorLockNeutralPosition", c)
-            self.set_attr_from_dict("doorLockTurns", c)
-            self.set_attr_from_dict("lockState", c, LockState)
-            self.set_attr_from_dict("motorState", c, MotorState)
-            self.door_lock_channel = c["index"]
-
     def set_lock_state(self, doorLockState: LockState, pin="", channelIndex=1):
         """sets the door lock state
 
@@ -2849,6 +2897,15 @@ class DoorLockDrivePro(DoorLockDrive):
 class DoorLockSensor(Device):
     """HmIP-DLS"""
 
+    _channel_type = "DOOR_LOCK_SENSOR_CHANNEL"
+    _channel_fields = (
+        Field("doorLockDirection", optional=True),
+        Field("doorLockNeutralPosition", optional=True),
+        Field("doorLockTurns", optional=True),
+        Field("lockState", converter=LockState, optional=True),
+        Field("index", "door_lock_channel"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.door_lock_channel = None
@@ -2857,16 +2914,6 @@ class DoorLockSensor(Device):
         self.doorLockTurns = 0
         self.lockState = LockState.OPEN
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel("DOOR_LOCK_SENSOR_CHANNEL", js)
-        if c:
-            self.set_attr_from_dict("doorLockDirection", c)
-            self.set_attr_from_dict("doorLockNeutralPosition", c)
-            self.set_attr_from_dict("doorLockTurns", c)
-            self.set_attr_from_dict("lockState", c, LockState)
-            self.door_lock_channel = c["index"]
-
 
 class EnergySensorsInterface(Device):
     """HmIP-ESI"""
@@ -2967,6 +3014,15 @@ class MotionDetectorSwitchOutdoor(SabotageDevice):
 class FullFlushWiegandInterface(Device):
     """HmIP-FWI (Wiegand Interface)"""
 
+    _channel_type = "DEVICE_BLOCKING_WITH_TEACHABLE_CODE"
+    _channel_fields = (
+        Field("doorBellLabel", optional=True),
+        Field("sabotage", optional=True),
+        Field("blockedSabotage", optional=True),
+        Field("blockedWrongCodePermanently", optional=True),
+        Field("blockedWrongCodeTemporarily", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.doorBellLabel = None
@@ -2975,18 +3031,6 @@ class FullFlushWiegandInterface(Device):
         self.blockedWrongCodePermanently = None
         self.blockedWrongCodeTemporarily = None
 
-    def from_json(self, js):
-        super().from_json(js)
-        c = get_functional_channel(
-            "DEVICE_BLOCKING_WITH_TEACHABLE_CODE", js
-        )
-        if c:
-            self.set_attr_from_dict("doorBellLabel", c)
-            self.set_attr_from_dict("sabotage", c)
-            self.set_attr_from_dict("blockedSabotage", c)
-            self.set_attr_from_dict("blockedWrongCodePermanently", c)
-            self.set_attr_from_dict("blockedWrongCodeTemporarily", c)
-
 
 class WallMountedKeyPad(Device):
     pass
@@ -14,8 +14,20 @@ class HmipServerCloseError(HmipConnectionError):
 
 
 class HmipThrottlingError(HmipConnectionError):
-    pass
+    """
+    Exception raised when the HomematicIP cloud throttles requests (HTTP 429).
+
+    :param message: Optional error message
+    :param retry_after: Seconds to wait before the next request as announced by the cloud, if any
+    """
+    def __init__(self, message: str | None = None, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class HmipAuthenticationError(HmipConnectionError):
     """Exception raised when the HomematicIP cloud returns an authentication error (HTTP 403)."""
+
+
+class HmipOfflineQueueFullError(HmipConnectionError):
+    """Exception raised when a command is sent while offline and the offline command queue is full."""
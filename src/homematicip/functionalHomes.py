@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from homematicip.base.enums import *
+from homematicip.base.helpers import id_lookup
 from homematicip.base.homematicip_object import HomeMaticIPObject
 from homematicip.group import Group
 
@@ -22,9 +23,12 @@ class FunctionalHome(HomeMaticIPObject):
         self.functionalGroups = self.assignGroups(js["functionalGroups"], groups)
 
     def assignGroups(self, gids, groups: list[Group]):
+        groups = id_lookup(groups)
         ret = []
         for gid in gids:
-            ret.extend(g for g in groups if g.id == gid)
+            g = groups.get(gid)
+            if g is not None:
+                ret.append(g)
         return ret
 
 
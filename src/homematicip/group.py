@@ -3,7 +3,9 @@ from datetime import datetime
 from operator import attrgetter
 
 from homematicip.base.enums import *
+from homematicip.base.helpers import id_lookup
 from homematicip.base.homematicip_object import HomeMaticIPObject
+from homematicip.base.schema import Field
 
 
 class Group(HomeMaticIPObject):
@@ -35,11 +37,12 @@ class Group(HomeMaticIPObject):
 
         self.groupType = js["type"]
 
+        devices = id_lookup(devices)
         self.devices = []
         for channel in js["channels"]:
-            for d in devices:
-                if d.id == channel["deviceId"]:
-                    self.devices.append(d)
+            d = devices.get(channel["deviceId"])
+            if d is not None:
+                self.devices.append(d)
 
     def __str__(self):
         return f"{self.groupType} {self.label}"
@@ -80,15 +83,29 @@ class MetaGroup(Group):
         self.dutyCycle = js["dutyCycle"]
         self.incorrectPositioned = js["incorrectPositioned"]
 
+        groups = id_lookup(groups)
         self.groups = []
         for group in js["groups"]:
-            for g in groups:
-                if g.id == group:
-                    g.metaGroup = self
-                    self.groups.append(g)
+            g = groups.get(group)
+            if g is not None:
+                g.metaGroup = self
+                self.groups.append(g)
 
 
 class SecurityGroup(Group):
+    _fields = (
+        Field("windowState"),
+        Field("motionDetected"),
+        Field("presenceDetected"),
+        Field("sabotage"),
+        Field("smokeDetectorAlarmType", converter=SmokeDetectorAlarmType),
+        Field("dutyCycle"),
+        Field("lowBat"),
+        Field("moistureDetected"),
+        Field("powerMainsFailure"),
+        Field("waterlevelDetected"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windowState = None
@@ -102,26 +119,18 @@ class SecurityGroup(Group):
         self.powerMainsFailure = None
         self.waterlevelDetected = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.windowState = js["windowState"]
-        self.motionDetected = js["motionDetected"]
-        self.presenceDetected = js["presenceDetected"]
-        self.sabotage = js["sabotage"]
-        self.smokeDetectorAlarmType = SmokeDetectorAlarmType.from_str(
-            js["smokeDetectorAlarmType"]
-        )
-        self.dutyCycle = js["dutyCycle"]
-        self.lowBat = js["lowBat"]
-        self.moistureDetected = js["moistureDetected"]
-        self.powerMainsFailure = js["powerMainsFailure"]
-        self.waterlevelDetected = js["waterlevelDetected"]
-
     def __str__(self):
         return f"{super().__str__()} windowState({self.windowState}) motionDetected({self.motionDetected}) presenceDetected({self.presenceDetected}) sabotage({self.sabotage}) smokeDetectorAlarmType({self.smokeDetectorAlarmType}) dutyCycle({self.dutyCycle}) lowBat({self.lowBat}) powerMainsFailure({self.powerMainsFailure}) moistureDetected({self.moistureDetected}) waterlevelDetected({self.waterlevelDetected})"
 
 
 class SwitchGroupBase(Group):
+    _fields = (
+        Field("on", optional=True),
+        Field("dimLevel", optional=True),
+        Field("dutyCycle", optional=True),
+        Field("lowBat", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
@@ -129,13 +138,6 @@ class SwitchGroupBase(Group):
         self.dutyCycle = None
         self.lowBat = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("dutyCycle", js)
-        self.set_attr_from_dict("lowBat", js)
-
     def set_switch_state(self, on=True):
         return self._run_non_async(self.set_switch_state_async, on)
 
@@ -160,6 +162,16 @@ class SwitchGroupBase(Group):
 
 
 class SwitchingGroup(SwitchGroupBase):
+    _fields = (
+        Field("processing", optional=True),
+        Field("shutterLevel", optional=True),
+        Field("slatsLevel", optional=True),
+        Field("primaryShadingLevel", optional=True),
+        Field("primaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("secondaryShadingLevel", optional=True),
+        Field("secondaryShadingStateType", converter=ShadingStateType, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.processing = None
@@ -171,16 +183,6 @@ class SwitchingGroup(SwitchGroupBase):
         self.secondaryShadingLevel = 0.0
         self.secondaryShadingStateType = ShadingStateType.NOT_EXISTENT
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("processing", js)
-        self.set_attr_from_dict("shutterLevel", js)
-        self.set_attr_from_dict("slatsLevel", js)
-        self.set_attr_from_dict("primaryShadingLevel", js)
-        self.set_attr_from_dict("primaryShadingStateType", js, ShadingStateType)
-        self.set_attr_from_dict("secondaryShadingLevel", js)
-        self.set_attr_from_dict("secondaryShadingStateType", js, ShadingStateType)
-
     def set_shutter_level(self, level):
         return self._run_non_async(self.set_shutter_level_async, level)
 
@@ -214,6 +216,20 @@ class SwitchingGroup(SwitchGroupBase):
 
 
 class ShutterProfile(Group):
+    _fields = (
+        Field("dutyCycle", optional=True),
+        Field("lowBat", optional=True),
+        Field("unreach", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+        Field("processing", optional=True),
+        Field("shutterLevel", optional=True),
+        Field("slatsLevel", optional=True),
+        Field("primaryShadingLevel", optional=True),
+        Field("primaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("secondaryShadingLevel", optional=True),
+        Field("secondaryShadingStateType", converter=ShadingStateType, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.dutyCycle = None
@@ -230,22 +246,6 @@ class ShutterProfile(Group):
         self.secondaryShadingStateType = ShadingStateType.NOT_EXISTENT
         self.profileMode = ProfileMode.MANUAL
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("dutyCycle", js)
-        self.set_attr_from_dict("lowBat", js)
-        self.set_attr_from_dict("unreach", js)
-
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-
-        self.set_attr_from_dict("processing", js)
-        self.set_attr_from_dict("shutterLevel", js)
-        self.set_attr_from_dict("slatsLevel", js)
-        self.set_attr_from_dict("primaryShadingLevel", js)
-        self.set_attr_from_dict("primaryShadingStateType", js, ShadingStateType)
-        self.set_attr_from_dict("secondaryShadingLevel", js)
-        self.set_attr_from_dict("secondaryShadingStateType", js, ShadingStateType)
-
     def set_profile_mode(self, profileMode: ProfileMode):
         return self._run_non_async(self.set_profile_mode_async, profileMode)
 
@@ -302,18 +302,18 @@ class LinkedSwitchingGroup(Group):
 
 
 class ExtendedLinkedSwitchingGroup(SwitchGroupBase):
+    _fields = (
+        Field("onTime"),
+        Field("onLevel"),
+        Field("sensorSpecificParameters"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.onTime = None
         self.onLevel = None
         self.sensorSpecificParameters = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.onTime = js["onTime"]
-        self.onLevel = js["onLevel"]
-        self.sensorSpecificParameters = js["sensorSpecificParameters"]
-
     def __str__(self):
         return f"{super().__str__()} onTime({self.onTime}) onLevel({self.onLevel})"
 
@@ -326,6 +326,16 @@ class ExtendedLinkedSwitchingGroup(SwitchGroupBase):
 
 
 class ExtendedLinkedNotificationGroup(SwitchGroupBase):
+    _fields = (
+        Field("onTime", optional=True),
+        Field("onLevel", optional=True),
+        Field("sensorSpecificParameters", optional=True),
+        Field("opticalSignalBehaviour", converter=OpticalSignalBehaviour, optional=True),
+        Field("simpleRGBColorState", converter=RGBColorState, default="BLACK"),
+        Field("onOpticalSignalBehaviour", converter=OpticalSignalBehaviour, optional=True),
+        Field("onSimpleRGBColor", converter=RGBColorState, default="BLACK"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.onTime = None
@@ -336,20 +346,6 @@ class ExtendedLinkedNotificationGroup(SwitchGroupBase):
         self.onOpticalSignalBehaviour = None
         self.onSimpleRGBColor = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("onTime", js)
-        self.set_attr_from_dict("onLevel", js)
-        self.set_attr_from_dict("sensorSpecificParameters", js)
-        self.set_attr_from_dict("opticalSignalBehaviour", js, OpticalSignalBehaviour)
-        self.simpleRGBColorState = RGBColorState.from_str(
-            js.get("simpleRGBColorState", "BLACK")
-        )
-        self.set_attr_from_dict("onOpticalSignalBehaviour", js, OpticalSignalBehaviour)
-        self.onSimpleRGBColor = RGBColorState.from_str(
-            js.get("onSimpleRGBColor", "BLACK")
-        )
-
     def __str__(self):
         return f"{super().__str__()} onTime({self.onTime}) onLevel({self.onLevel}) opticalSignalBehaviour({self.opticalSignalBehaviour}) simpleRGBColorState({self.simpleRGBColorState})"
 
@@ -362,6 +358,23 @@ class ExtendedLinkedNotificationGroup(SwitchGroupBase):
 
 
 class ExtendedLinkedShutterGroup(Group):
+    _fields = (
+        Field("dutyCycle", optional=True),
+        Field("lowBat", optional=True),
+        Field("groupVisibility", converter=GroupVisibility, optional=True),
+        Field("topSlatsLevel", optional=True),
+        Field("bottomSlatsLevel", optional=True),
+        Field("topShutterLevel", optional=True),
+        Field("bottomShutterLevel", optional=True),
+        Field("processing", optional=True),
+        Field("shutterLevel", optional=True),
+        Field("slatsLevel", optional=True),
+        Field("primaryShadingLevel", optional=True),
+        Field("primaryShadingStateType", converter=ShadingStateType, optional=True),
+        Field("secondaryShadingLevel", optional=True),
+        Field("secondaryShadingStateType", converter=ShadingStateType, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.dutyCycle = None
@@ -379,23 +392,6 @@ class ExtendedLinkedShutterGroup(Group):
         self.secondaryShadingStateType = ShadingStateType.NOT_EXISTENT
         self.groupVisibility = GroupVisibility.INVISIBLE_GROUP_AND_CONTROL
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("dutyCycle", js)
-        self.set_attr_from_dict("lowBat", js)
-        self.set_attr_from_dict("groupVisibility", js, GroupVisibility)
-        self.set_attr_from_dict("topSlatsLevel", js)
-        self.set_attr_from_dict("bottomSlatsLevel", js)
-        self.set_attr_from_dict("topShutterLevel", js)
-        self.set_attr_from_dict("bottomShutterLevel", js)
-        self.set_attr_from_dict("processing", js)
-        self.set_attr_from_dict("shutterLevel", js)
-        self.set_attr_from_dict("slatsLevel", js)
-        self.set_attr_from_dict("primaryShadingLevel", js)
-        self.set_attr_from_dict("primaryShadingStateType", js, ShadingStateType)
-        self.set_attr_from_dict("secondaryShadingLevel", js)
-        self.set_attr_from_dict("secondaryShadingStateType", js, ShadingStateType)
-
     def __str__(self):
         return f"{super().__str__()} shutterLevel({self.shutterLevel}) slatsLevel({self.slatsLevel})"
 
@@ -429,6 +425,16 @@ class ExtendedLinkedShutterGroup(Group):
 
 
 class ExtendedLinkedGarageDoorGroup(Group):
+    _fields = (
+        Field("doorState", optional=True),
+        Field("dutyCycle", optional=True),
+        Field("groupVisibility", converter=GroupVisibility, optional=True),
+        Field("lowBat", optional=True),
+        Field("processing", optional=True),
+        Field("unreach", optional=True),
+        Field("ventilationPositionSupported", optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.doorState = None
@@ -439,21 +445,21 @@ class ExtendedLinkedGarageDoorGroup(Group):
         self.unreach = None
         self.ventilationPositionSupported = False
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("doorState", js)
-        self.set_attr_from_dict("dutyCycle", js)
-        self.set_attr_from_dict("groupVisibility", js, GroupVisibility)
-        self.set_attr_from_dict("lowBat", js)
-        self.set_attr_from_dict("processing", js)
-        self.set_attr_from_dict("unreach", js)
-        self.set_attr_from_dict("ventilationPositionSupported", js)
-
     def __str__(self):
         return f"{super().__str__()} doorState({self.doorState}) dutyCycle({self.dutyCycle}) lowBat({self.lowBat}) ventilationPositionSupported({self.ventilationPositionSupported})"
 
 
 class AlarmSwitchingGroup(Group):
+    _fields = (
+        Field("onTime"),
+        Field("on"),
+        Field("dimLevel"),
+        Field("signalAcoustic", converter=AcousticAlarmSignal),
+        Field("signalOptical", converter=OpticalAlarmSignal),
+        Field("smokeDetectorAlarmType", converter=SmokeDetectorAlarmType),
+        Field("acousticFeedbackEnabled"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
@@ -464,18 +470,6 @@ class AlarmSwitchingGroup(Group):
         self.smokeDetectorAlarmType = SmokeDetectorAlarmType.IDLE_OFF
         self.acousticFeedbackEnabled = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.onTime = js["onTime"]
-        self.on = js["on"]
-        self.dimLevel = js["dimLevel"]
-        self.signalAcoustic = AcousticAlarmSignal.from_str(js["signalAcoustic"])
-        self.signalOptical = OpticalAlarmSignal.from_str(js["signalOptical"])
-        self.smokeDetectorAlarmType = SmokeDetectorAlarmType.from_str(
-            js["smokeDetectorAlarmType"]
-        )
-        self.acousticFeedbackEnabled = js["acousticFeedbackEnabled"]
-
     def set_on_time(self, onTimeSeconds):
         return self._run_non_async(self.set_on_time_async, onTimeSeconds)
 
@@ -541,15 +535,15 @@ class HeatingTemperatureLimiterGroup(Group):
 
 
 class HeatingChangeoverGroup(Group):
+    _fields = (
+        Field("on"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
         self.dimLevel = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.on = js["on"]
-
     def __str__(self):
         return f"{super().__str__()} on({self.on})"
 
@@ -559,6 +553,13 @@ class InboxGroup(Group):
 
 
 class IndoorClimateGroup(Group):
+    _fields = (
+        Field("sabotage"),
+        Field("ventilationLevel"),
+        Field("ventilationState"),
+        Field("windowState"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.sabotage = None
@@ -566,13 +567,6 @@ class IndoorClimateGroup(Group):
         self.ventilationState = None
         self.windowState = ""
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.sabotage = js["sabotage"]
-        self.ventilationLevel = js["ventilationLevel"]
-        self.ventilationState = js["ventilationState"]
-        self.windowState = js["windowState"]
-
     def __str__(self):
         return f"{super().__str__()} sabotage({self.sabotage}) ventilationLevel({self.ventilationLevel}) ventilationState({self.ventilationState}) windowState({self.windowState})"
 
@@ -595,14 +589,16 @@ class SecurityZoneGroup(Group):
         self.windowState = js["windowState"]
         self.motionDetected = js["motionDetected"]
         self.sabotage = js["sabotage"]
+        devices = id_lookup(devices)
         self.ignorableDevices = []
         for channel in js["ignorableDeviceChannels"]:
             # there are multiple channels per device and we only need each deviceId once
             # as each device has at least channel 0, we skip the other ones
             if channel["channelIndex"] == 0:
-                self.ignorableDevices.append(
-                    [d for d in devices if d.id == channel["deviceId"]][0]
-                )
+                d = devices.get(channel["deviceId"])
+                if d is None:
+                    raise LookupError(f"Unknown ignorable device {channel['deviceId']}")
+                self.ignorableDevices.append(d)
 
     def __str__(self):
         return f"{super().__str__()} active({self.active}) silent({self.silent}) windowState({self.windowState}) motionDetected({self.motionDetected}) sabotage({self.sabotage}) presenceDetected({self.presenceDetected}) ignorableDevices(#{len(self.ignorableDevices)})"
@@ -853,34 +849,42 @@ class HeatingGroup(Group):
 
 
 class HeatingDehumidifierGroup(Group):
+    _fields = (
+        Field("on"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.on = js["on"]
-
     def __str__(self):
         return f"{super().__str__()} on({self.on})"
 
 
 class HeatingCoolingDemandGroup(Group):
+    _fields = (
+        Field("on"),
+        Field("dimLevel"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
         self.dimLevel = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.on = js["on"]
-        self.dimLevel = js["dimLevel"]
-
     def __str__(self):
         return f"{super().__str__()} on({self.on}) dimLevel({self.dimLevel}) "
 
 
 class HeatingFailureAlertRuleGroup(Group):
+    _fields = (
+        Field("enabled"),
+        Field("heatingFailureValidationResult", converter=HeatingFailureValidationType),
+        Field("checkInterval"),
+        Field("validationTimeout"),
+        Field("lastExecutionTimestamp", converter=HomeMaticIPObject.fromtimestamp),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         #:bool: is this rule active
@@ -896,16 +900,6 @@ class HeatingFailureAlertRuleGroup(Group):
         #:datetime: last time of execution
         self.lastExecutionTimestamp = 0
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.enabled = js["enabled"]
-        self.heatingFailureValidationResult = HeatingFailureValidationType.from_str(
-            js["heatingFailureValidationResult"]
-        )
-        self.checkInterval = js["checkInterval"]
-        self.validationTimeout = js["validationTimeout"]
-        self.lastExecutionTimestamp = self.fromtimestamp(js["lastExecutionTimestamp"])
-
     def __str__(self):
         return (
             f"{super().__str__()} enabled({self.enabled}) heatingFailureValidationResult({self.heatingFailureValidationResult}) "
@@ -952,11 +946,9 @@ class HumidityWarningRuleGroup(Group):
 
         jsOutdoorClimateSensor = js["outdoorClimateSensor"]
         if jsOutdoorClimateSensor != None:
-            did = jsOutdoorClimateSensor["deviceId"]
-            for d in devices:
-                if d.id == did:
-                    self.outdoorClimateSensor = d
-                    break
+            d = id_lookup(devices).get(jsOutdoorClimateSensor["deviceId"])
+            if d is not None:
+                self.outdoorClimateSensor = d
 
     def __str__(self):
         return (
@@ -972,6 +964,12 @@ class HeatingExternalClockGroup(Group):
 
 
 class HeatingCoolingDemandBoilerGroup(Group):
+    _fields = (
+        Field("on"),
+        Field("boilerLeadTime"),
+        Field("boilerFollowUpTime"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.boilerFollowUpTime = None
@@ -979,17 +977,19 @@ class HeatingCoolingDemandBoilerGroup(Group):
         self.on = None
         self.dimLevel = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.on = js["on"]
-        self.boilerLeadTime = js["boilerLeadTime"]
-        self.boilerFollowUpTime = js["boilerFollowUpTime"]
-
     def __str__(self):
         return f"{super().__str__()} on({self.on}) boilerFollowUpTime({self.boilerFollowUpTime}) boilerLeadTime({self.boilerLeadTime})"
 
 
 class HeatingCoolingDemandPumpGroup(Group):
+    _fields = (
+        Field("on"),
+        Field("pumpProtectionSwitchingInterval"),
+        Field("pumpProtectionDuration"),
+        Field("pumpFollowUpTime"),
+        Field("pumpLeadTime"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.pumpProtectionDuration = 0
@@ -998,14 +998,6 @@ class HeatingCoolingDemandPumpGroup(Group):
         self.pumpLeadTime = 0
         self.on = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.on = js["on"]
-        self.pumpProtectionSwitchingInterval = js["pumpProtectionSwitchingInterval"]
-        self.pumpProtectionDuration = js["pumpProtectionDuration"]
-        self.pumpFollowUpTime = js["pumpFollowUpTime"]
-        self.pumpLeadTime = js["pumpLeadTime"]
-
     def __str__(self):
         return (
             f"{super().__str__()} on({self.on}) pumpProtectionDuration({self.pumpProtectionDuration}) pumpProtectionSwitchingInterval({self.pumpProtectionSwitchingInterval}) pumpFollowUpTime({self.pumpFollowUpTime}) "
@@ -1064,6 +1056,13 @@ class TimeProfile(HomeMaticIPObject):
 
 
 class SwitchingProfileGroup(Group):
+    _fields = (
+        Field("on", optional=True),
+        Field("dimLevel", optional=True),
+        Field("profileId", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
@@ -1073,13 +1072,6 @@ class SwitchingProfileGroup(Group):
         )
         self.profileMode = ProfileMode.MANUAL
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("dimLevel", js)
-        self.set_attr_from_dict("profileId", js)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-
     def __str__(self):
         return f"{super().__str__()} on({self.on}) dimLevel({self.dimLevel}) profileMode({self.profileMode})"
 
@@ -1125,6 +1117,19 @@ class SwitchingProfileGroup(Group):
 
 
 class OverHeatProtectionRule(Group):
+    _fields = (
+        Field("temperatureLowerThreshold"),
+        Field("temperatureUpperThreshold"),
+        Field("targetShutterLevel"),
+        Field("targetSlatsLevel"),
+        Field("startHour"),
+        Field("startMinute"),
+        Field("startSunrise"),
+        Field("endHour"),
+        Field("endMinute"),
+        Field("endSunset"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.temperatureLowerThreshold = None
@@ -1138,67 +1143,62 @@ class OverHeatProtectionRule(Group):
         self.endMinute = None
         self.endSunset = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.temperatureLowerThreshold = js["temperatureLowerThreshold"]
-        self.temperatureUpperThreshold = js["temperatureUpperThreshold"]
-        self.targetShutterLevel = js["targetShutterLevel"]
-        self.targetSlatsLevel = js["targetSlatsLevel"]
-        self.startHour = js["startHour"]
-        self.startMinute = js["startMinute"]
-        self.startSunrise = js["startSunrise"]
-        self.endHour = js["endHour"]
-        self.endMinute = js["endMinute"]
-        self.endSunset = js["endSunset"]
-
     def __str__(self):
         return f"{super().__str__()} tempLower({self.temperatureLowerThreshold}) tempUpper({self.temperatureUpperThreshold}) targetShutterLevel({self.targetShutterLevel}) targetSlatsLevel({self.targetSlatsLevel})"
 
 
 class SmokeAlarmDetectionRule(Group):
+    _fields = (
+        Field("smokeDetectorAlarmType"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.smokeDetectorAlarmType = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.smokeDetectorAlarmType = js["smokeDetectorAlarmType"]
-
     def __str__(self):
         return f"{super().__str__()} smokeDetectorAlarmType({self.smokeDetectorAlarmType})"
 
 
 class ShutterWindProtectionRule(Group):
+    _fields = (
+        Field("windSpeedThreshold"),
+        Field("targetShutterLevel"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.windSpeedThreshold = None
         self.targetShutterLevel = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.windSpeedThreshold = js["windSpeedThreshold"]
-        self.targetShutterLevel = js["targetShutterLevel"]
-
     def __str__(self):
         return f"{super().__str__()} windSpeedThreshold({self.windSpeedThreshold}) targetShutterLevel({self.targetShutterLevel})"
 
 
 class LockOutProtectionRule(Group):
+    _fields = (
+        Field("triggered"),
+        Field("windowState"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.triggered = None
         self.windowState = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.triggered = js["triggered"]
-        self.windowState = js["windowState"]
-
     def __str__(self):
         return f"{super().__str__()} triggered({self.triggered}) windowState({self.windowState})"
 
 
 class EnvironmentGroup(Group):
+    _fields = (
+        Field("actualTemperature"),
+        Field("illumination"),
+        Field("raining"),
+        Field("windSpeed"),
+        Field("humidity"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.actualTemperature = 0.0
@@ -1207,19 +1207,18 @@ class EnvironmentGroup(Group):
         self.windSpeed = 0.0
         self.humidity = 0.0
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.actualTemperature = js["actualTemperature"]
-        self.illumination = js["illumination"]
-        self.raining = js["raining"]
-        self.windSpeed = js["windSpeed"]
-        self.humidity = js["humidity"]
-
     def __str__(self):
         return f"{super().__str__()} actualTemperature({self.actualTemperature}) illumination({self.illumination}) raining({self.raining}) windSpeed({self.windSpeed}) humidity({self.humidity})"
 
 
 class HotWaterGroup(Group):
+    _fields = (
+        Field("on", optional=True),
+        Field("onTime", optional=True),
+        Field("profileId", optional=True),
+        Field("profileMode", converter=ProfileMode, optional=True),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.on = None
@@ -1229,13 +1228,6 @@ class HotWaterGroup(Group):
         )
         self.profileMode = ProfileMode.MANUAL
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.set_attr_from_dict("on", js)
-        self.set_attr_from_dict("onTime", js)
-        self.set_attr_from_dict("profileId", js)
-        self.set_attr_from_dict("profileMode", js, ProfileMode)
-
     def __str__(self):
         return f"{super().__str__()} on({self.on}) onTime({self.onTime}) profileMode({self.profileMode})"
 
@@ -1248,20 +1240,27 @@ class HotWaterGroup(Group):
 
 
 class AccessAuthorizationProfileGroup(Group):
+    _fields = (
+        Field("active"),
+        Field("authorizationPinAssigned"),
+        Field("authorized"),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.active = False
         self.authorizationPinAssigned = False
         self.authorized = False
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.active = js["active"]
-        self.authorizationPinAssigned = js["authorizationPinAssigned"]
-        self.authorized = js["authorized"]
-
 
 class DoorLockAuthorizationProfileGroup(Group):
+    _fields = (
+        Field("active"),
+        Field("authorizationPinAssigned"),
+        Field("authorized"),
+        Field("profileId", default=None),
+    )
+
     def __init__(self, connection):
         super().__init__(connection)
         self.active = False
@@ -1269,21 +1268,11 @@ class DoorLockAuthorizationProfileGroup(Group):
         self.authorized = False
         self.profileId = None
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-        self.active = js["active"]
-        self.authorizationPinAssigned = js["authorizationPinAssigned"]
-        self.authorized = js["authorized"]
-        self.profileId = js.get("profileId")
-
 
 class AccessControlGroup(Group):
     def __init__(self, connection):
         super().__init__(connection)
 
-    def from_json(self, js, devices):
-        super().from_json(js, devices)
-
 
 class EnergyGroup(Group):
     pass
@@ -0,0 +1,110 @@
+"""Binary snapshots of the home state for a warm start of AsyncHome.
+
+A snapshot holds the json of the last home/getCurrentState download, serialized with marshal and
+compressed with zlib, behind a header with a schema tag, the time it was taken and a small metadata
+dict (e.g. the urls of the connection, never credentials). marshal is
+several times faster to load than json and keeps the snapshot compact, but its format depends on
+the Python version, so the tag includes it and a snapshot with a different tag is ignored.
+
+Snapshots are meant to be written and read by the same installation. Like pickle, marshal must
+not be used to load data from untrusted sources.
+"""
+
+import logging
+import marshal
+import os
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+
+LOGGER = logging.getLogger(__name__)
+
+#: Increase when the layout of the snapshot changes.
+SNAPSHOT_FORMAT_VERSION = 2
+
+_MAGIC = b"HMIPSNAP"
+# magic, length of the tag, time the snapshot was taken, length of the metadata
+_HEADER = struct.Struct("<8sHdI")
+
+
+def snapshot_tag() -> bytes:
+    """Return the schema tag a snapshot has to carry to be loaded by this installation."""
+    return (
+        f"format={SNAPSHOT_FORMAT_VERSION};marshal={marshal.version};"
+        f"python={sys.version_info.major}.{sys.version_info.minor}"
+    ).encode()
+
+
+@dataclass
+class StateSnapshot:
+    """A restored snapshot."""
+
+    #: the json of home/getCurrentState
+    json_state: dict
+    #: the time.time() the snapshot was taken
+    saved_at: float
+    #: the metadata passed to write_snapshot
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.time() - self.saved_at
+
+
+def dump_state(json_state: dict) -> bytes:
+    """Serialize json_state. Run it before the state is handed to anything which could change it."""
+    return marshal.dumps(json_state)
+
+
+def write_snapshot(path: str | os.PathLike, payload: bytes, saved_at: float | None = None,
+                   metadata: dict | None = None) -> None:
+    """Compress payload (from dump_state) and write it to path together with metadata. The file is
+    replaced atomically, so a crash while writing leaves the previous snapshot intact."""
+    tag = snapshot_tag()
+    meta = marshal.dumps(metadata or {})
+    header = _HEADER.pack(_MAGIC, len(tag), time.time() if saved_at is None else saved_at, len(meta))
+    tmp = f"{os.fspath(path)}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(tag)
+        f.write(meta)
+        f.write(zlib.compress(payload, 1))
+    os.replace(tmp, path)
+
+
+def read_snapshot(path: str | os.PathLike) -> StateSnapshot | None:
+    """Read a snapshot written by write_snapshot.
+
+    Returns None if there is no snapshot, it cannot be read or it was written with a different schema tag
+    or is damaged."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as err:
+        LOGGER.warning("Ignoring unreadable state snapshot %s: %s", path, err)
+        return None
+
+    try:
+        magic, tag_length, saved_at, meta_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            LOGGER.warning("Ignoring state snapshot %s: not a snapshot file", path)
+            return None
+        start = _HEADER.size + tag_length
+        tag = data[_HEADER.size:start]
+        if tag != snapshot_tag():
+            LOGGER.info("Ignoring state snapshot %s: written with %s", path, tag.decode(errors="replace"))
+            return None
+        metadata = marshal.loads(data[start:start + meta_length])
+        json_state = marshal.loads(zlib.decompress(data[start + meta_length:]))
+    except (struct.error, zlib.error, ValueError, EOFError, TypeError) as err:
+        LOGGER.warning("Ignoring damaged state snapshot %s: %s", path, err)
+        return None
+    if not isinstance(json_state, dict) or not isinstance(metadata, dict):
+        LOGGER.warning("Ignoring damaged state snapshot %s", path)
+        return None
+    return StateSnapshot(json_state, saved_at, metadata)
@@ -0,0 +1,183 @@
+"""Incremental decoding of the home/getCurrentState body.
+
+The state is one json object whose collections ("devices", "groups", "clients") map ids to objects.
+StateStreamDecoder is fed the body chunk by chunk while it downloads and returns every entry of a
+collection as soon as it is complete, so the objects can be built before the download finishes and
+neither the whole body nor a second copy of the state has to be held at once. Other top level values,
+e.g. "home", are returned whole.
+"""
+
+import codecs
+import json
+import re
+from typing import Any
+
+#: the top level keys whose entries are returned one by one
+STREAMED_COLLECTIONS = frozenset({"devices", "groups", "clients"})
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# parser states
+_START, _TOP_KEY, _TOP_VALUE, _TOP_NEXT, _ENTRY_KEY, _ENTRY_VALUE, _ENTRY_NEXT, _DONE = range(8)
+
+
+class StateStreamDecoder:
+    """Decodes a home/getCurrentState body fed in chunks of bytes.
+
+    feed() and close() return a list of (key, id, value) tuples in the order of the body: an entry of a
+    collection as (collection, entry id, entry) and any other top level value as (key, None, value).
+    The keys of the collections which were read completely are in ``completed``.
+    """
+
+    def __init__(self, collections: frozenset[str] = STREAMED_COLLECTIONS):
+        self.collections = collections
+        #: the top level keys whose value was read completely
+        self.completed: set[str] = set()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        # json.loads shares equal keys within a document, raw_decode only within one call. The memo keeps
+        # one copy of every key across the entries, which otherwise holds most of the decoded state.
+        self._keys: dict[str, str] = {}
+        self._decoder = json.JSONDecoder(object_pairs_hook=self._object)
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: str | None = None
+        self._entry_id: str | None = None
+        self._first = True
+        # text received after the buffer while waiting for _needed characters
+        self._pending: list[str] = []
+        self._pending_length = 0
+        # the number of characters needed before the incomplete value at self._pos is decoded again
+        self._needed = 0
+
+    def feed(self, chunk: bytes) -> list[tuple[str, str | None, Any]]:
+        """Decode the next chunk of the body and return the values it completed."""
+        text = self._text.decode(chunk)
+        self._pending.append(text)
+        self._pending_length += len(text)
+        if len(self._buffer) - self._pos + self._pending_length < self._needed:
+            return []
+        self._take_pending()
+        items = []
+        self._parse(items, final=False)
+        return items
+
+    def close(self) -> list[tuple[str, str | None, Any]]:
+        """Decode the rest of the body and return the values it completed.
+
+        @raises ValueError: If the body is not a complete json object
+        """
+        self._pending.append(self._text.decode(b"", final=True))
+        self._take_pending()
+        items = []
+        self._parse(items, final=True)
+        if self._state != _DONE:
+            raise ValueError("getCurrentState body ended before the state was complete")
+        if self._buffer[self._pos:].strip():
+            raise ValueError("Extra data after the getCurrentState body")
+        return items
+
+    def _take_pending(self) -> None:
+        self._buffer = "".join((self._buffer[self._pos:], *self._pending))
+        self._pos = 0
+        self._pending.clear()
+        self._pending_length = 0
+
+    def _parse(self, items: list, final: bool) -> None:
+        while self._state != _DONE:
+            pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if pos == len(self._buffer):
+                self._needed = 0
+                return
+            char = self._buffer[pos]
+            state = self._state
+
+            if state == _START:
+                self._expect(char, "{")
+                self._pos = pos + 1
+                self._state = _TOP_KEY
+                self._first = True
+            elif state in (_TOP_KEY, _ENTRY_KEY):
+                if char == "}" and self._first:
+                    self._pos = pos + 1
+                    self._close_object(state)
+                    continue
+                self._expect(char, '"')
+                key = self._decode_value(pos, final, key=True)
+                if key is None:
+                    return
+                if state == _TOP_KEY:
+                    self._key = key
+                    self._state = _TOP_VALUE
+                else:
+                    self._entry_id = key
+                    self._state = _ENTRY_VALUE
+            elif state == _TOP_VALUE:
+                if char == "{" and self._key in self.collections:
+                    self._pos = pos + 1
+                    self._state = _ENTRY_KEY
+                    self._first = True
+                    continue
+                value = self._decode_value(pos, final)
+                if value is None:
+                    return
+                items.append((self._key, None, value[0]))
+                self.completed.add(self._key)
+                self._state = _TOP_NEXT
+            elif state == _ENTRY_VALUE:
+                value = self._decode_value(pos, final)
+                if value is None:
+                    return
+                items.append((self._key, self._entry_id, value[0]))
+                self._state = _ENTRY_NEXT
+            else:  # _TOP_NEXT, _ENTRY_NEXT
+                self._pos = pos + 1
+                if char == "}":
+                    self._close_object(state)
+                else:
+                    self._expect(char, ",")
+                    self._state = _TOP_KEY if state == _TOP_NEXT else _ENTRY_KEY
+                    self._first = False
+
+    def _object(self, pairs: list[tuple[str, Any]]) -> dict:
+        keys = self._keys
+        return {keys.setdefault(key, key): value for key, value in pairs}
+
+    def _close_object(self, state: int) -> None:
+        if state in (_TOP_KEY, _TOP_NEXT):
+            self._state = _DONE
+        else:
+            self.completed.add(self._key)
+            self._state = _TOP_NEXT
+
+    def _decode_value(self, pos: int, final: bool, key: bool = False):
+        """decodes the value at pos, for a key including the colon after it. Returns None if more data is
+        needed, a key as str and any other value as a tuple of one element."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return self._wait()
+        if key:
+            end = _WHITESPACE.match(self._buffer, end).end()
+            if end == len(self._buffer):
+                return self._wait()
+            self._expect(self._buffer[end], ":")
+            self._pos = end + 1
+            return value
+        if end == len(self._buffer) and not final:
+            # a number could go on in the next chunk
+            return self._wait()
+        self._pos = end
+        return (value,)
+
+    def _wait(self) -> None:
+        """waits until the pending part of the buffer doubled before decoding it again, so a large value
+        split into many small chunks is not decoded from its start for every chunk"""
+        self._needed = 2 * (len(self._buffer) - self._pos)
+
+    @staticmethod
+    def _expect(char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected '{expected}' in the getCurrentState body, got '{char}'")
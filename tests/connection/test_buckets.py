@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 import pytest
 
@@ -77,4 +78,97 @@ async def test_wait_and_take_no_oversubscription_under_concurrency():
     timeouts = sum(1 for r in results if isinstance(r, TimeoutError))
     assert successes == 5
     assert timeouts == 15
-    assert bucket._tokens == 0  # never went negative
+    # never went negative; only the fractional refill of the 2s wait is left
+    assert 0 <= bucket._tokens < 1
+
+
+async def test_wait_and_take_serves_waiters_in_fifo_order():
+    """Waiters are granted tokens in the order they started waiting."""
+    bucket = Buckets(tokens=1, fill_rate=0.01)
+    await bucket.take()
+    order = []
+
+    async def caller(i):
+        await bucket.wait_and_take(timeout=5)
+        order.append(i)
+
+    await asyncio.gather(*(caller(i) for i in range(10)))
+
+    assert order == list(range(10))
+
+
+async def test_take_does_not_jump_the_queue():
+    """take() must fail while earlier callers are waiting."""
+    bucket = Buckets(tokens=1, fill_rate=0.05)
+    await bucket.take()
+    waiter = asyncio.create_task(bucket.wait_and_take(timeout=5))
+    await asyncio.sleep(0)
+
+    assert bucket.waiting() == 1
+    assert await bucket.take() is False
+    assert await waiter is True
+
+
+async def test_wait_and_take_wakes_at_refill_instant():
+    """The waiter is released once the refill is due instead of on a fixed polling tick."""
+    bucket = Buckets(tokens=1, fill_rate=0.05)
+    await bucket.take()
+
+    start = time.monotonic()
+    await bucket.wait_and_take(timeout=5)
+    waited = time.monotonic() - start
+
+    assert 0.04 <= waited < 0.5
+
+
+def test_fractional_refill_is_kept():
+    """Partial refill time accumulates instead of being truncated."""
+    bucket = Buckets(tokens=2, fill_rate=1)
+    bucket._tokens = 0
+    bucket.timestamp -= 0.5
+    bucket._refill()
+    bucket.timestamp -= 0.6
+    bucket._refill()
+
+    assert bucket._tokens >= 1
+
+
+async def test_cancelled_waiter_leaves_queue():
+    bucket = Buckets(tokens=1, fill_rate=3600)
+    await bucket.take()
+    waiter = asyncio.create_task(bucket.wait_and_take(timeout=5))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert bucket.waiting() == 0
+
+
+async def test_wait_and_take_rejects_more_than_capacity():
+    bucket = Buckets(tokens=1, fill_rate=1)
+
+    with pytest.raises(ValueError, match="Cannot take 2 tokens"):
+        await bucket.wait_and_take(tokens=2)
+
+
+async def test_pause_delays_refill():
+    bucket = Buckets(tokens=2, fill_rate=0.01)
+    bucket.pause(0.1)
+
+    assert await bucket.take() is False
+    start = time.monotonic()
+    await bucket.wait_and_take(timeout=5)
+
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_set_fill_rate_reschedules_waiters():
+    bucket = Buckets(tokens=1, fill_rate=3600)
+    await bucket.take()
+    waiter = asyncio.create_task(bucket.wait_and_take(timeout=5))
+    await asyncio.sleep(0)
+
+    bucket.set_fill_rate(0.01)
+
+    assert await asyncio.wait_for(waiter, 1) is True
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock
 import httpx
 import pytest
 
+from homematicip.base.enums import WebsocketOverflowPolicy
 from homematicip.connection.connection_context import (
     ConnectionContextBuilder,
 )
@@ -97,3 +98,29 @@ async def test_build_context_carries_websocket_settings(mocker):
     assert context.websocket_message_stale_timeout == 90
     assert context.websocket_initial_backoff == 3
     assert context.websocket_max_backoff == 111
+
+
+def test_build_context_with_urls_carries_websocket_settings():
+    context = ConnectionContextBuilder.build_context_with_urls(
+        "access_point_id",
+        "https://example.com/rest",
+        "wss://example.com/ws",
+        auth_token="auth_token",
+        websocket_heartbeat_interval=15,
+        websocket_max_backoff=111,
+        websocket_dispatch_queue_size=10,
+        websocket_overflow_policy=WebsocketOverflowPolicy.DROP_OLDEST,
+        websocket_handler_concurrency=4,
+        websocket_handler_timeout=2.5,
+    )
+
+    assert context.rest_url == "https://example.com/rest"
+    assert context.websocket_url == "wss://example.com/ws"
+    assert context.auth_token == "auth_token"
+    assert context.client_auth_token is not None
+    assert context.websocket_heartbeat_interval == 15
+    assert context.websocket_max_backoff == 111
+    assert context.websocket_dispatch_queue_size == 10
+    assert context.websocket_overflow_policy == WebsocketOverflowPolicy.DROP_OLDEST
+    assert context.websocket_handler_concurrency == 4
+    assert context.websocket_handler_timeout == 2.5
@@ -1,9 +1,19 @@
+import asyncio
+
 import httpx
+import pytest
 
+from homematicip.base.enums import RequestPriority
+from homematicip.connection import RATE_LIMITER_INCREASE_AFTER
 from homematicip.connection.rate_limited_rest_connection import (
     RateLimitedRestConnection,
 )
+from homematicip.connection.request_priority import (
+    get_request_priority,
+    request_priority,
+)
 from homematicip.connection.rest_connection import ConnectionContext
+from homematicip.exceptions.connection_exceptions import HmipThrottlingError
 
 
 async def test_send_single_request(mocker):
@@ -19,7 +29,7 @@ async def test_send_single_request(mocker):
 
     assert patched.called
     assert patched.call_args[0][0] == "http://asdf/hmip/url"
-    assert patched.call_args[1] == {"json": {"a": "b"}, "headers": {"c": "d"}}
+    assert patched.call_args[1] == {"content": b'{"a":"b"}', "headers": {"c": "d"}}
     assert result.status == 200
 
 
@@ -36,4 +46,179 @@ async def test_send_and_wait_requests(mocker):
     await conn.async_post("url", {"a": "b"}, {"c": "d"})
     await conn.async_post("url", {"a": "b"}, {"c": "d"})
 
-    assert patched.call_count == 3
\ No newline at end of file
+    assert patched.call_count == 3
+
+async def test_interactive_request_overtakes_bulk_queue(mocker):
+    response = mocker.Mock(spec=httpx.Response)
+    response.status_code = 200
+    mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post", return_value=response)
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 1, 0.02)
+    order = []
+
+    async def post(name, priority):
+        with request_priority(priority):
+            await conn.async_post("url")
+        order.append(name)
+
+    bulk = [asyncio.create_task(post(f"bulk{i}", RequestPriority.BULK)) for i in range(10)]
+    await asyncio.sleep(0.03)
+    interactive = asyncio.create_task(post("interactive", RequestPriority.INTERACTIVE))
+    await asyncio.gather(interactive, *bulk)
+
+    assert order.index("interactive") <= 3
+    assert conn.queued_requests() == dict.fromkeys(RequestPriority, 0)
+    await conn.close()
+
+
+async def test_weighted_share_while_saturated(mocker):
+    response = mocker.Mock(spec=httpx.Response)
+    response.status_code = 200
+    mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post", return_value=response)
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(
+        context, 1, 0.005,
+        priority_weights={RequestPriority.NORMAL: 1, RequestPriority.BULK: 1},
+    )
+    await conn.async_post("url")  # drain the bucket
+    order = []
+
+    async def post(priority):
+        with request_priority(priority):
+            await conn.async_post("url")
+        order.append(priority)
+
+    await asyncio.gather(
+        *(post(RequestPriority.BULK) for _ in range(6)),
+        *(post(RequestPriority.NORMAL) for _ in range(6)),
+    )
+
+    # equal weights alternate between the lanes instead of serving bulk first
+    assert order[:4].count(RequestPriority.NORMAL) == 2
+    await conn.close()
+
+
+def test_request_priority_context():
+    assert get_request_priority() is None
+    with request_priority(RequestPriority.BULK):
+        assert get_request_priority() == RequestPriority.BULK
+        with request_priority(RequestPriority.INTERACTIVE):
+            assert get_request_priority() == RequestPriority.INTERACTIVE
+        assert get_request_priority() == RequestPriority.BULK
+    assert get_request_priority() is None
+
+
+def _response(status, headers=None):
+    return httpx.Response(status, headers=headers, request=httpx.Request("POST", "http://asdf/url"))
+
+
+async def test_throttled_request_is_requeued_and_rate_lowered(mocker):
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.side_effect = [_response(429, {"Retry-After": "0.05"}), _response(200)]
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 5, 0.01)
+
+    result = await conn.async_post("url")
+
+    assert result.status == 200
+    assert patched.call_count == 2
+    assert conn.throttle_event_count() == 1
+    assert conn.current_rate() == pytest.approx(50)
+    await conn.close()
+
+
+async def test_throttled_request_raises_after_max_retries(mocker):
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.return_value = _response(429)
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 5, 0.001, max_throttle_retries=2)
+
+    with pytest.raises(HmipThrottlingError):
+        await conn.async_post("url")
+
+    assert patched.call_count == 3
+    assert conn.throttle_event_count() == 3
+    await conn.close()
+
+
+async def test_rate_recovers_additively_up_to_configured_rate(mocker):
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.return_value = _response(200)
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 10, 0.001)
+    conn._on_throttled(None)
+    assert conn.current_rate() == pytest.approx(500)
+
+    for _ in range(RATE_LIMITER_INCREASE_AFTER):
+        await conn.async_post("url")
+    assert conn.current_rate() == pytest.approx(600)
+
+    for _ in range(RATE_LIMITER_INCREASE_AFTER * 10):
+        await conn.async_post("url")
+    assert conn.current_rate() == pytest.approx(1000)
+    assert conn.current_fill_rate() == pytest.approx(0.001)
+    await conn.close()
+
+
+async def test_server_errors_do_not_raise_the_rate(mocker):
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.return_value = _response(503)
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 10, 0.001)
+    conn._on_throttled(None)
+
+    for _ in range(RATE_LIMITER_INCREASE_AFTER * 2):
+        result = await conn.async_post("url")
+        assert result.status == 503
+    assert conn.current_rate() == pytest.approx(500)
+
+    # a 5xx breaks the streak of 2xx responses
+    patched.return_value = _response(200)
+    for _ in range(RATE_LIMITER_INCREASE_AFTER - 1):
+        await conn.async_post("url")
+    patched.return_value = _response(500)
+    await conn.async_post("url")
+    patched.return_value = _response(200)
+    await conn.async_post("url")
+    assert conn.current_rate() == pytest.approx(500)
+    await conn.close()
+
+
+async def test_token_granted_to_a_cancelled_request_is_returned():
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 1, 1000)
+    assert await conn._buckets.take()
+
+    request = asyncio.create_task(conn._acquire_token(RequestPriority.NORMAL))
+    await asyncio.sleep(0)
+    waiter = conn._lanes[RequestPriority.NORMAL][0]
+    # the dispatcher grants the token in the same loop iteration the request is cancelled
+    waiter.set_result(None)
+    request.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await request
+
+    await asyncio.wait_for(conn._dispatcher, 1)
+    assert await conn._buckets.tokens() == pytest.approx(1, abs=0.01)
+    await conn.close()
+
+
+async def test_dispatcher_gives_up_after_repeated_timeouts():
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RateLimitedRestConnection(context, 1, 1000, token_timeout=0.01)
+    assert await conn._buckets.take()
+    waiter = asyncio.get_running_loop().create_future()
+    conn._lanes[RequestPriority.BULK].append(waiter)
+
+    await asyncio.wait_for(conn._dispatch(), 1)
+
+    with pytest.raises(TimeoutError):
+        waiter.result()
+    assert not any(conn._lanes.values())
+    await conn.close()
@@ -3,12 +3,18 @@ from unittest.mock import AsyncMock
 import httpx
 import pytest
 
+from homematicip.connection import RATE_LIMITER_MAX_RETRY_AFTER
+from homematicip.connection.offline_queue import OfflineCommandQueue
 from homematicip.connection.rest_connection import (
     ConnectionContext,
     RestConnection,
     RestResult,
 )
-from homematicip.exceptions.connection_exceptions import HmipThrottlingError
+from homematicip.exceptions.connection_exceptions import (
+    HmipConnectionError,
+    HmipOfflineQueueFullError,
+    HmipThrottlingError,
+)
 
 
 def test_rest_result():
@@ -47,16 +53,28 @@ async def test_conn_async_post(mocker):
 
     assert patched.called
     assert patched.call_args[0][0] == "http://asdf/hmip/url"
-    assert patched.call_args[1] == {"json": {"a": "b"}, "headers": {"c": "d"}}
+    assert patched.call_args[1] == {"content": b'{"a":"b"}', "headers": {"c": "d"}}
     assert result.status == 200
 
 
+@pytest.mark.asyncio
+async def test_conn_async_post_without_decoding(mocker):
+    response = httpx.Response(200, content=b'{"a": "b"}', request=httpx.Request("POST", "http://asdf"))
+    mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post", return_value=response)
+
+    conn = RestConnection(ConnectionContext(rest_url="http://asdf"))
+    result = await conn.async_post("url", decode_json=False)
+    assert result.json is None
+    assert result.content == b'{"a": "b"}'
+
+    result = await conn.async_post("url")
+    assert result.json == {"a": "b"}
+
+
 @pytest.mark.asyncio
 async def test_conn_async_post_throttle(mocker):
-    response = mocker.Mock(spec=httpx.Response)
-    response.status_code = 429
     patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
-    patched.return_value = response
+    patched.return_value = httpx.Response(429, request=httpx.Request("POST", "http://asdf/url"))
 
     context = ConnectionContext(rest_url="http://asdf")
     conn = RestConnection(context)
@@ -79,7 +97,7 @@ async def test_conn_async_post_with_httpx_client_session(mocker):
 
     assert mock_client.post.called
     assert mock_client.post.call_args[0][0] == "http://asdf/hmip/url"
-    assert mock_client.post.call_args[1] == {"json": {"a": "b"}, "headers": {"c": "d"}}
+    assert mock_client.post.call_args[1] == {"content": b'{"a":"b"}', "headers": {"c": "d"}}
     assert result.status == 200
 
 
@@ -138,3 +156,141 @@ def test_get_verify_disables_ssl_when_enforce_false():
 
 def test_get_verify_enforces_ssl_when_enforce_true():
     assert RestConnection._get_verify(enforce_ssl=True, ssl_context=None) is True
+
+
+@pytest.mark.asyncio
+async def test_conn_reuses_pooled_client(mocker):
+    response = mocker.Mock(spec=httpx.Response)
+    response.status_code = 200
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.return_value = response
+
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RestConnection(context)
+
+    await conn.async_post("url", {"a": "b"})
+    client = conn._owned_client
+    await conn.async_post("url", {"a": "b"})
+
+    assert client is not None
+    assert conn._owned_client is client
+    assert patched.call_count == 2
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_conn_close_closes_owned_client():
+    context = ConnectionContext(rest_url="http://asdf")
+    async with RestConnection(context) as conn:
+        client = await conn._get_client()
+        assert not client.is_closed
+
+    assert client.is_closed
+    assert conn._owned_client is None
+
+
+@pytest.mark.asyncio
+async def test_conn_close_keeps_external_client_open():
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RestConnection(context, httpx_client_session=mock_client)
+
+    assert await conn._get_client() is mock_client
+    await conn.close()
+
+    mock_client.aclose.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_conn_recreates_client_when_verify_changes():
+    context = ConnectionContext(rest_url="http://asdf")
+    conn = RestConnection(context, limits=httpx.Limits(max_connections=2))
+    client = await conn._get_client()
+
+    conn.update_connection_context(ConnectionContext(rest_url="http://asdf", enforce_ssl=False))
+    new_client = await conn._get_client()
+
+    assert client.is_closed
+    assert new_client is not client
+    await conn.close()
+
+
+def test_get_retry_after():
+    def response(headers):
+        return httpx.Response(429, headers=headers)
+
+    assert RestConnection._get_retry_after(response({"Retry-After": "12"})) == 12
+    assert RestConnection._get_retry_after(response({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert RestConnection._get_retry_after(response({"Retry-After": "soon"})) is None
+    assert RestConnection._get_retry_after(response({})) is None
+    for invalid in ("inf", "-inf", "nan", "-5"):
+        assert RestConnection._get_retry_after(response({"Retry-After": invalid})) is None
+    assert RestConnection._get_retry_after(response({"Retry-After": "1e12"})) == RATE_LIMITER_MAX_RETRY_AFTER
+    assert RestConnection._get_retry_after(response({"Retry-After": "Wed, 21 Oct 2999 07:28:00 GMT"})) == (
+        RATE_LIMITER_MAX_RETRY_AFTER
+    )
+
+
+@pytest.mark.asyncio
+async def test_conn_async_post_throttle_retry_after(mocker):
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post")
+    patched.return_value = httpx.Response(429, headers={"Retry-After": "3"})
+
+    conn = RestConnection(ConnectionContext(rest_url="http://asdf"))
+
+    with pytest.raises(HmipThrottlingError) as exc_info:
+        await conn.async_post("url")
+    assert exc_info.value.retry_after == 3
+
+
+@pytest.mark.asyncio
+async def test_conn_queues_commands_while_offline(mocker):
+    response = mocker.Mock(spec=httpx.Response)
+    response.status_code = 200
+    patched = mocker.patch("homematicip.connection.rest_connection.httpx.AsyncClient.post", return_value=response)
+
+    conn = RestConnection(ConnectionContext(rest_url="http://asdf"))
+    queue = OfflineCommandQueue(maxsize=2)
+    conn.set_offline_queue(queue)
+
+    result = await conn.async_post("device/control/setSwitchState", {"on": True})
+    assert result.status == 202
+    # queued, not executed
+    assert not result.success
+    assert result.queued is not None
+    assert (await conn.async_post("home/getCurrentState")).status == 200
+    await conn.async_post("group/switching/setState", {"on": False})
+    with pytest.raises(HmipOfflineQueueFullError):
+        await conn.async_post("device/control/setSwitchState", {"on": False})
+    assert patched.call_count == 1
+    assert len(queue) == 2
+
+    conn.set_offline_queue(None)
+    assert await queue.flush(conn)
+    assert [c[0][0] for c in patched.call_args_list[1:]] == [
+        "http://asdf/hmip/device/control/setSwitchState",
+        "http://asdf/hmip/group/switching/setState",
+    ]
+    assert (await result.queued).status == 200
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_offline_queue_keeps_commands_while_unreachable_and_drops_expired():
+    conn = AsyncMock()
+    conn.async_post.return_value = RestResult(status=-1)
+    queue = OfflineCommandQueue(max_age=60)
+    first = queue.put("device/control/setSwitchState", {"on": True})
+    assert not await queue.flush(conn)
+    assert len(queue) == 1
+    assert not first.done()
+
+    queue._commands[0].queued_at -= 120
+    second = queue.put("device/control/setSwitchState", {"on": False})
+    conn.async_post.return_value = RestResult(status=200)
+    assert await queue.flush(conn)
+    with pytest.raises(HmipConnectionError):
+        await first
+    assert (await second).status == 200
+    assert queue.expired == 1
+    assert conn.async_post.call_count == 2
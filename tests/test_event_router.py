@@ -0,0 +1,60 @@
+import pytest
+
+from homematicip.base.enums import EventType
+from homematicip.base.event_router import EventRouter, RoutedEvent
+
+
+class _Base:
+    pass
+
+
+class _Child(_Base):
+    pass
+
+
+def test_subscribe_dispatch_and_unsubscribe():
+    router = EventRouter()
+    calls = []
+    device = router.subscribe(lambda e: calls.append(("device", e.obj)), device_id="d1")
+    router.subscribe(lambda e: calls.append(("channel", e.obj)), channel=["d1", 1])
+    base = router.subscribe(lambda e: calls.append(("class", e.obj)), object_type=_Base)
+    assert len(router) == 3
+    assert router.wants_device("d1")
+    # a class subscription could receive the events of any device
+    assert router.wants_device("d2")
+
+    obj = _Child()
+    event = RoutedEvent(EventType.DEVICE_CHANGED, obj)
+    router.dispatch(event, (("device", "d2"), ("channel", ("d1", 1)), *router.class_keys(obj)))
+    assert calls == [("channel", obj), ("class", obj)]
+
+    device.unsubscribe()
+    device.unsubscribe()
+    assert not device.active
+    assert router.wants_device("d1")
+    base.unsubscribe()
+    assert router.class_keys(obj) == ()
+    assert not router.wants_device("d2")
+    assert len(router) == 1
+
+    router.subscribe(print, event_type=EventType.DEVICE_CHANGED)
+    assert router.wants_device("d2", EventType.DEVICE_CHANGED)
+    assert not router.wants_device("d2", EventType.DEVICE_CHANNEL_EVENT)
+
+
+def test_subscribe_needs_exactly_one_key():
+    router = EventRouter()
+    with pytest.raises(ValueError, match="exactly one of"):
+        router.subscribe(print)
+    with pytest.raises(ValueError, match="exactly one of"):
+        router.subscribe(print, device_id="d1", group_id="g1")
+
+
+def test_failing_handler_does_not_stop_dispatch():
+    router = EventRouter()
+    calls = []
+    router.subscribe(lambda e: 1 / 0, event_type=EventType.HOME_CHANGED)
+    router.subscribe(calls.append, event_type=EventType.HOME_CHANGED)
+    event = RoutedEvent(EventType.HOME_CHANGED, None)
+    router.dispatch(event, (("event", EventType.HOME_CHANGED),))
+    assert calls == [event]
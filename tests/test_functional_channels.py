@@ -8,6 +8,7 @@ from homematicip_demo.helper import (
 from homematicip.base.channel_event import ChannelEvent
 from homematicip.base.enums import ChannelEventTypes, FunctionalChannelType
 from homematicip.base.functionalChannels import *
+from homematicip.base.schema import Field, define_class
 from homematicip.device import *
 from homematicip.home import Home
 
@@ -686,4 +687,91 @@ async def test_notification_mp3_sound_channel_control(fake_home: Home):
         await ch.stop_sound_async()
         await ch.turn_off_async()
 
-        assert len(connection_mock.mock_calls) == 4
\ No newline at end of file
+        assert len(connection_mock.mock_calls) == 4
+
+def test_channel_defined_by_field_table():
+    device = Mock()
+    channel_class = define_class(
+        "TestLockChannel",
+        SwitchChannel,
+        [
+            Field("lockState", converter=LockState, optional=True),
+            Field("motorState", attr="motor", default="STOPPED"),
+            Field("hidden", optional=True, str_output=False),
+        ],
+    )
+    js = {
+        "index": 1,
+        "groupIndex": 1,
+        "label": "lock",
+        "functionalChannelType": "SWITCH_CHANNEL",
+        "groups": [],
+        "on": True,
+        "profileMode": "AUTOMATIC",
+        "userDesiredProfileMode": "AUTOMATIC",
+        "lockState": "LOCKED",
+        "hidden": 1,
+    }
+
+    ch = channel_class(device, None)
+    assert ch.lockState is None
+    assert ch.motor is None
+
+    ch.from_json(js, [])
+    # the fields of SwitchChannel are applied as well
+    assert ch.on is True
+    assert ch.powerUpSwitchState == ""
+    assert ch.lockState == LockState.LOCKED
+    assert ch.motor == "STOPPED"
+    assert ch.hidden == 1
+    assert str(ch) == "SWITCH_CHANNEL lock Index(1)"
+    assert ch.str_from_attr_map() == "lockState(LOCKED)"
+    assert ch._rawJSONData is js
+
+    del js["on"]
+    with pytest.raises(KeyError):
+        channel_class(device, None).from_json(js, [])
+
+
+def test_field_table_and_from_json_are_exclusive():
+    with pytest.raises(TypeError):
+
+        class BrokenChannel(FunctionalChannel):
+            _fields = (Field("on"),)
+
+            def from_json(self, js, groups):
+                pass
+
+    with pytest.raises(ValueError, match="isn't a valid attribute name"):
+        Field("valid-key")
+
+
+def test_field_rejects_keywords_as_attribute_names():
+    # the generated from_json would not compile
+    with pytest.raises(ValueError, match="'class' isn't a valid attribute name"):
+        Field("class")
+    with pytest.raises(ValueError, match="'from' isn't a valid attribute name"):
+        Field("from", "from")
+    assert Field("from", "from_").attr == "from_"
+
+
+def test_device_channel_field_table(fake_home: Home):
+    class TestThermostat(WallMountedThermostatPro):
+        _channel_type = "WALL_MOUNTED_THERMOSTAT_PRO_CHANNEL"
+        _channel_fields = (Field("humidity", attr="roomHumidity"),)
+
+    js = fake_home.search_device_by_id("3014F7110000000000000022")._rawJSONData
+    d = TestThermostat(None)
+    d.from_json(js)
+    # the tables of both parents are applied as well
+    assert d.roomHumidity == d.humidity == 43
+    assert d.operationLockActive is False
+    assert TestThermostat.from_json.__qualname__.endswith("TestThermostat.from_json")
+
+    with pytest.raises(TypeError, match="defines both _channel_fields and from_json"):
+
+        class BrokenThermostat(WallMountedThermostatPro):
+            _channel_fields = (Field("humidity"),)
+
+            def from_json(self, js):
+                pass
@@ -1,4 +1,6 @@
+import asyncio
 import json
+from collections import Counter
 from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,10 +12,12 @@ from homematicip_demo.helper import (
 )
 
 from conftest import utc_offset
+from homematicip.async_home import AsyncHome
 from homematicip.base.channel_event import ChannelEvent
 from homematicip.base.code_state_event import CodeStateEvent
-from homematicip.base.enums import EventType
+from homematicip.base.enums import UNKNOWN_VALUES, EventType
 from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.rest_connection import RestResult
 from homematicip.device import BaseDevice, Device
 from homematicip.exceptions.connection_exceptions import (
     HmipAuthenticationError,
@@ -21,7 +25,7 @@ from homematicip.exceptions.connection_exceptions import (
 )
 from homematicip.exceptions.home_exceptions import HomeNotInitializedError
 from homematicip.functionalHomes import *
-from homematicip.group import Group
+from homematicip.group import Group, MetaGroup
 from homematicip.home import Home
 from homematicip.rule import *
 from homematicip.securityEvent import *
@@ -161,6 +165,72 @@ async def test_home_download_configuration_auth_error(fake_home: Home):
         await fake_home.download_configuration_async()
 
 
+@pytest.mark.asyncio
+async def test_get_current_state_async_coalesces_concurrent_calls(fake_home: Home):
+    """Concurrent callers share a single download and parse."""
+    config = fake_home_download_configuration()
+
+    async def slow_download():
+        await asyncio.sleep(0.05)
+        return config
+
+    with patch.object(fake_home, "download_configuration_async", new=AsyncMock(side_effect=slow_download)) as dl, \
+         patch.object(fake_home, "update_home", wraps=fake_home.update_home) as update:
+        results = await asyncio.gather(*(fake_home.get_current_state_async() for _ in range(3)))
+
+    assert results == [True, True, True]
+    assert dl.await_count == 1
+    assert update.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_state_async_propagates_error_to_all_callers(fake_home: Home):
+
+    async def failing_download():
+        await asyncio.sleep(0.01)
+        raise HmipConnectionError("boom")
+
+    with patch.object(fake_home, "download_configuration_async", new=AsyncMock(side_effect=failing_download)) as dl:
+        results = await asyncio.gather(
+            *(fake_home.get_current_state_async() for _ in range(2)), return_exceptions=True
+        )
+
+    assert all(isinstance(r, HmipConnectionError) for r in results)
+    assert dl.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_state_async_clearing_callers_share_one_follow_up(fake_home: Home):
+    """Clearing callers waiting for the same non-clearing refresh run one clearing refresh together."""
+    config = fake_home_download_configuration()
+
+    async def slow_download():
+        await asyncio.sleep(0.02)
+        return config
+
+    with patch.object(fake_home, "download_configuration_async", new=AsyncMock(side_effect=slow_download)) as dl:
+        first = asyncio.ensure_future(fake_home.get_current_state_async())
+        await asyncio.sleep(0)
+        results = await asyncio.gather(*(fake_home.get_current_state_async(clear_config=True) for _ in range(3)))
+        await first
+
+    assert results == [True, True, True]
+    assert dl.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_state_async_reuses_fresh_result(fake_home: Home):
+    config = fake_home_download_configuration()
+    with patch.object(fake_home, "download_configuration_async", new=AsyncMock(return_value=config)) as dl:
+        await fake_home.get_current_state_async()
+        await fake_home.get_current_state_async(max_age=60)
+        assert dl.await_count == 1
+
+        await fake_home.get_current_state_async()
+        await fake_home.get_current_state_async(max_age=60, clear_config=True)
+        assert dl.await_count == 3
+
+
 @pytest.mark.asyncio
 async def test_get_current_state_async_with_retry_succeeds_first_try(fake_home: Home):
     """Returns immediately when get_current_state_async succeeds."""
@@ -207,7 +277,6 @@ async def test_get_current_state_async_with_retry_raises_home_not_initialized_im
 @pytest.mark.asyncio
 async def test_get_current_state_async_with_retry_propagates_cancellation(fake_home: Home):
     """asyncio.CancelledError is re-raised, not swallowed."""
-    import asyncio
     with patch.object(fake_home, "get_current_state_async", new=AsyncMock(side_effect=asyncio.CancelledError())) as mocked, \
          patch("asyncio.sleep", new=AsyncMock()), \
          pytest.raises(asyncio.CancelledError):
@@ -666,6 +735,49 @@ def test_home_unknown_types(fake_home: Home):
         assert func_home.solution == "DUMMY_FUNCTIONAL_HOME"
 
 
+
+def test_home_unknown_types_are_counted_and_logged_once(fake_home: Home, caplog):
+    UNKNOWN_VALUES.clear()
+    device_json = json.loads(json.dumps(fake_home.devices[0]._rawJSONData))
+    device_json["type"] = "DUMMY_DEVICE"
+    channel_json = next(iter(device_json["functionalChannels"].values()))
+    channel_json["functionalChannelType"] = "DUMMY_CHANNEL"
+    for _ in range(3):
+        device = fake_home._parse_device(device_json)
+        device.load_functionalChannels([], [])
+
+    assert type(device) is BaseDevice
+    assert device.functionalChannels[0].functionalChannelType == "DUMMY_CHANNEL"
+    assert UNKNOWN_VALUES.seen("DeviceType") == {"DUMMY_DEVICE": 3}
+    assert UNKNOWN_VALUES.seen("device") == {"DUMMY_DEVICE": 3}
+    assert UNKNOWN_VALUES.seen("FunctionalChannelType") == {"DUMMY_CHANNEL": 3}
+    assert caplog.text.count("There is no class for device 'DUMMY_DEVICE'") == 1
+    assert caplog.text.count("There is no class for functionalChannel 'DUMMY_CHANNEL'") == 1
+    UNKNOWN_VALUES.clear()
+
+def test_home_parse_errors_are_counted_apart_from_unknown_types(fake_home: Home, caplog):
+    UNKNOWN_VALUES.clear()
+    device = fake_home.search_device_by_id("3014F7110000000000000049")
+    device_json = json.loads(json.dumps(device._rawJSONData))
+    channel_class = type(device.functionalChannels[1])
+    with patch.object(type(device), "from_json", side_effect=KeyError("broken")), \
+            patch.object(channel_class, "from_json", side_effect=KeyError("broken")):
+        for _ in range(3):
+            parsed = fake_home._parse_device(device_json)
+            parsed.load_functionalChannels([], [])
+
+    assert type(parsed) is BaseDevice
+    broken = [ch for ch in device.functionalChannels if type(ch) is channel_class]
+    assert UNKNOWN_VALUES.seen("deviceParseError") == {device.deviceType: 3}
+    assert UNKNOWN_VALUES.seen("functionalChannelParseError") == {broken[0].functionalChannelType: 3 * len(broken)}
+    assert UNKNOWN_VALUES.seen("device") == {}
+    assert UNKNOWN_VALUES.seen("functionalChannel") == {}
+    assert caplog.text.count(f"Could not parse device '{device.deviceType}'") == 1
+    assert caplog.text.count("Error while parsing functionalChannel") == 1
+    assert "There is no class" not in caplog.text
+    UNKNOWN_VALUES.clear()
+
+
 def test_home_unknown_functional_home_not_duplicated_on_reload(fake_home: Home):
     """Repeated state updates must not append duplicate FunctionalHome entries
     for unknown solution types (regression: previously the unknown-type fallback
@@ -706,6 +818,616 @@ def test_get_devices_fails(fake_home: Home):
         assert result is None
 
 
+def test_search_indexes_follow_list_changes(fake_home: Home):
+    device = fake_home.devices[0]
+    assert fake_home.search_device_by_id(device.id) is device
+
+    # replacing the list or changing an id outside of the home keeps lookups correct
+    fake_home.devices = fake_home.devices[1:]
+    assert fake_home.search_device_by_id(device.id) is None
+    fake_home.devices.append(device)
+    assert fake_home.search_device_by_id(device.id) is device
+    old_id = device.id
+    device.id = "0815"
+    assert fake_home.search_device_by_id(old_id) is None
+
+    group = fake_home.groups[0]
+    assert fake_home.search_group_by_id(group.id) is group
+    client = fake_home.clients[0]
+    assert fake_home.search_client_by_id(client.id) is client
+    rule = fake_home.rules[0]
+    assert fake_home.search_rule_by_id(rule.id) is rule
+
+
+@pytest.mark.asyncio
+async def test_search_indexes_follow_websocket_events(fake_home: Home):
+    device = fake_home.devices[0]
+    channel = device.functionalChannels[1]
+    assert fake_home.search_channel(device.id, channel.index) is channel
+
+    payload = {"events": {"0": {"pushEventType": "DEVICE_REMOVED", "id": device.id}}}
+    await fake_home._ws_on_message(json.dumps(payload))
+    assert fake_home.search_device_by_id(device.id) is None
+    assert fake_home.search_channel(device.id, channel.index) is None
+
+    payload = {"events": {"0": {"pushEventType": "DEVICE_ADDED", "device": device._rawJSONData}}}
+    await fake_home._ws_on_message(json.dumps(payload))
+    added = fake_home.search_device_by_id(device.id)
+    assert added is not None
+    assert added is not device
+    assert fake_home.search_channel(device.id, channel.index) is added.functionalChannels[1]
+
+
+def test_search_indexes_after_clear_config(fake_home: Home):
+    device = fake_home.devices[0]
+    fake_home.update_home(fake_home_download_configuration(), clear_config=True)
+
+    found = fake_home.search_device_by_id(device.id)
+    assert found is not None
+    assert found is not device
+    assert fake_home.search_channel(device.id, 0) is found.functionalChannels[0]
+
+
+def test_linking_with_id_lookup_matches_plain_lists(fake_home: Home):
+    """from_json resolves references through an IdLookup; plain lists must give the same links."""
+    devices = list(fake_home.devices)
+    groups = list(fake_home.groups)
+    for g in fake_home.groups:
+        expected = list(g.devices)
+        if isinstance(g, MetaGroup):
+            expected_groups = list(g.groups)
+            g.from_json(g._rawJSONData, devices, groups)
+            assert g.groups == expected_groups
+        else:
+            g.from_json(g._rawJSONData, devices)
+        assert g.devices == expected
+
+    for d in fake_home.devices:
+        for ch in d.functionalChannels:
+            expected = list(ch.groups)
+            ch.from_json(ch._rawJSONData, groups)
+            assert ch.groups == expected
+
+    for fh in fake_home.functionalHomes:
+        expected = list(fh.functionalGroups)
+        fh.from_json(fh._rawJSONData, groups)
+        assert fh.functionalGroups == expected
+
+
+def _config_keyed_by_id():
+    # the demo home stores one device under a key which is not its id, so it would show up as removed
+    # and added on every update
+    config = fake_home_download_configuration()
+    config["devices"] = {d["id"]: d for d in config["devices"].values()}
+    return config
+
+
+def test_update_home_incremental_skips_unchanged(fake_home: Home):
+    config = _config_keyed_by_id()
+    device = fake_home.devices[0]
+    group = fake_home.groups[0]
+    client = fake_home.clients[0]
+    updates = []
+    for obj in (fake_home, device, group, client):
+        obj.on_update(lambda *args, **kwargs: updates.append(kwargs))
+
+    with patch.object(type(device), "from_json") as device_from_json:
+        fake_home.update_home(config, incremental=True)
+    device_from_json.assert_not_called()
+    changes = fake_home.last_state_changes
+    assert changes.added == []
+    assert changes.changed == []
+    assert changes.removed == []
+    assert changes.unchanged == len(fake_home.devices) + len(fake_home.groups) + len(fake_home.clients)
+    assert updates == []
+
+    config = _config_keyed_by_id()
+    config["devices"][device.id]["label"] = "renamed"
+    config["devices"][device.id]["functionalChannels"]["0"]["label"] = "renamed channel"
+    config["groups"][group.id]["label"] = "renamed group"
+    config["clients"][client.id]["label"] = "renamed client"
+    config["home"]["connected"] = False
+    fake_home.update_home(config, incremental=True)
+
+    changes = fake_home.last_state_changes
+    assert changes.changed == [device, client, group, fake_home]
+    assert device.label == "renamed"
+    assert device.functionalChannels[0].label == "renamed channel"
+    assert group.label == "renamed group"
+    assert client.label == "renamed client"
+    assert fake_home.connected is False
+    assert [u["obj"] for u in updates] == [device, client, group, fake_home]
+    assert [u["event_type"] for u in updates] == [
+        EventType.DEVICE_CHANGED,
+        EventType.CLIENT_CHANGED,
+        EventType.GROUP_CHANGED,
+        EventType.HOME_CHANGED,
+    ]
+
+
+def test_update_home_incremental_added_and_removed(fake_home: Home):
+    config = _config_keyed_by_id()
+    device = fake_home.devices[0]
+    removed = []
+    created = []
+    device.on_remove(lambda *args, **kwargs: removed.append(kwargs["event_type"]))
+    fake_home.on_create(lambda *args, **kwargs: created.append(kwargs["obj"]))
+
+    del config["devices"][device.id]
+    fake_home.update_home(config, incremental=True)
+    assert fake_home.last_state_changes.removed == [device]
+    assert removed == [EventType.DEVICE_REMOVED]
+    assert fake_home.search_device_by_id(device.id) is None
+
+    fake_home.update_home(_config_keyed_by_id(), incremental=True)
+    added = fake_home.search_device_by_id(device.id)
+    assert fake_home.last_state_changes.added == [added]
+    assert created == [added]
+    assert fake_home.search_channel(device.id, 0) is added.functionalChannels[0]
+
+
+def test_update_home_incremental_default_and_clear_config(fake_home: Home):
+    fake_home.update_home(fake_home_download_configuration())
+    assert fake_home.last_state_changes is None
+
+    fake_home.incremental_update = True
+    fake_home.update_home(fake_home_download_configuration())
+    assert fake_home.last_state_changes is not None
+
+    device = fake_home.devices[0]
+    fake_home.update_home(fake_home_download_configuration(), clear_config=True)
+    assert fake_home.last_state_changes is None
+    assert fake_home.search_device_by_id(device.id) is not device
+
+
+@pytest.mark.asyncio
+async def test_get_current_state_async_off_loop(fake_home: Home):
+    fake_home.parse_state_off_loop = True
+    expected = {d.id: type(d) for d in fake_home.devices}
+    device = fake_home.devices[0]
+
+    await fake_home.get_current_state_async(clear_config=True)
+    assert {d.id: type(d) for d in fake_home.devices} == expected
+    found = fake_home.search_device_by_id(device.id)
+    assert found is not device
+    assert fake_home.search_channel(device.id, 0) is found.functionalChannels[0]
+    assert fake_home.search_group_by_id(fake_home.groups[0].id) is fake_home.groups[0]
+    assert fake_home.functionalHomes
+    assert fake_home.weather is not None
+
+    # a refresh keeps the objects and only parses the changed ones on the loop
+    config = _config_keyed_by_id()
+    config["devices"][found.id]["label"] = "renamed"
+    content = json.dumps(config).encode()
+    updates = []
+    found.on_update(lambda *args, **kwargs: updates.append(kwargs["event_type"]))
+    with patch.object(fake_home, "_rest_call_async", new=AsyncMock(return_value=RestResult(200, content=content))):
+        await fake_home.get_current_state_async()
+        assert fake_home.search_device_by_id(found.id) is found
+        assert found.label == "renamed"
+        assert updates == []
+
+        fake_home.incremental_update = True
+        config["devices"][found.id]["label"] = "renamed again"
+        fake_home._rest_call_async.return_value = RestResult(200, content=json.dumps(config).encode())
+        await fake_home.get_current_state_async()
+        assert found.label == "renamed again"
+        assert fake_home.last_state_changes.changed == [found]
+        assert updates == [EventType.DEVICE_CHANGED]
+
+
+
+def _home_summary(home: AsyncHome) -> dict:
+    return {
+        "devices": {d.id: (type(d), d.label, [(ch.index, sorted(g.id for g in ch.groups)) for ch in d.functionalChannels])
+                    for d in home.devices},
+        "groups": {g.id: (type(g), g.label) for g in home.groups},
+        "clients": {c.id: c.label for c in home.clients},
+        "home": (home.id, [type(fh) for fh in home.functionalHomes]),
+    }
+
+
+def _streamed_download(config: dict, chunk_size: int = 4096) -> AsyncMock:
+    """a _rest_call_async which passes the body of config to on_chunk in chunks"""
+
+    async def download(path, body=None, custom_header=None, decode_json=True, on_chunk=None):
+        content = json.dumps(config).encode()
+        for i in range(0, len(content), chunk_size):
+            on_chunk(content[i:i + chunk_size])
+        return RestResult(200)
+
+    return AsyncMock(side_effect=download)
+
+
+@pytest.mark.asyncio
+async def test_stream_current_state_from_the_cloud(fake_home: Home):
+    home = AsyncHome()
+    home.init_with_context(fake_home._connection_context, use_rate_limiting=False)
+    home.stream_current_state = True
+    with no_ssl_verification():
+        assert await home.get_current_state_async()
+    assert _home_summary(home) == _home_summary(fake_home)
+    await home.close_connection_async()
+
+
+@pytest.mark.asyncio
+async def test_stream_current_state_updates_in_place(fake_home: Home, tmp_path):
+    config = _config_keyed_by_id()
+    fake_home.stream_current_state = True
+    fake_home.incremental_update = True
+    fake_home.snapshot_path = tmp_path / "state.snapshot"
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    removed = fake_home.search_device_by_id("3014F7110000000000000049")
+    config["devices"][device.id]["label"] = "renamed"
+    del config["devices"][removed.id]
+    with patch.object(fake_home, "_rest_call_async", new=_streamed_download(config, 100)):
+        assert await fake_home.get_current_state_async()
+    assert fake_home.search_device_by_id(device.id) is device
+    assert device.label == "renamed"
+    assert fake_home.search_device_by_id(removed.id) is None
+    assert fake_home.last_state_changes.changed == [device]
+    assert fake_home.last_state_changes.removed == [removed]
+
+    home = AsyncHome(fake_home._connection)
+    home._connection_context = fake_home._connection_context
+    home.snapshot_path = tmp_path / "state.snapshot"
+    assert await home.restore_snapshot_async(reconcile=False)
+    assert _home_summary(home) == _home_summary(fake_home)
+
+
+@pytest.mark.asyncio
+async def test_stream_current_state_keeps_the_home_on_a_broken_body(fake_home: Home):
+    home = AsyncHome(fake_home._connection)
+    home._connection_context = fake_home._connection_context
+    home.stream_current_state = True
+    config = _config_keyed_by_id()
+    del config["home"]
+    with (
+        patch.object(home, "_rest_call_async", new=_streamed_download(config)),
+        pytest.raises(ValueError, match="The current state has no home"),
+    ):
+        await home.get_current_state_async()
+    assert home.devices == []
+    assert home.groups == []
+
+
+@pytest.mark.asyncio
+async def test_stream_current_state_keeps_the_objects_on_a_broken_refresh(fake_home: Home):
+    config = _config_keyed_by_id()
+    fake_home.stream_current_state = True
+    fake_home.incremental_update = True
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    removed = fake_home.search_device_by_id("3014F7110000000000000049")
+    label = device.label
+    config["devices"][device.id]["label"] = "renamed"
+    del config["devices"][removed.id]
+    content = json.dumps(config).encode()
+
+    async def broken_download(path, body=None, custom_header=None, decode_json=True, on_chunk=None):
+        # the devices and groups arrived, the home did not
+        on_chunk(content[: content.index(b'"home": {')])
+        raise HmipConnectionError("connection reset")
+
+    with (
+        patch.object(fake_home, "_rest_call_async", new=AsyncMock(side_effect=broken_download)),
+        pytest.raises(HmipConnectionError),
+    ):
+        await fake_home.get_current_state_async()
+    assert device.label == label
+    assert fake_home.search_device_by_id(removed.id) is removed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("off_loop", [False, True])
+async def test_restore_snapshot_async(fake_home: Home, tmp_path, off_loop):
+    path = tmp_path / "state.snapshot"
+    fake_home.snapshot_path = path
+    fake_home.parse_state_off_loop = off_loop
+    config = _config_keyed_by_id()
+    download = AsyncMock(return_value=RestResult(200, json=config, content=json.dumps(config).encode()))
+    with patch.object(fake_home, "_rest_call_async", new=download):
+        await fake_home.get_current_state_async()
+    assert path.exists()
+    assert not fake_home.state_from_snapshot
+
+    home = AsyncHome(fake_home._connection)
+    home._connection_context = fake_home._connection_context
+    home.snapshot_path = path
+    home.incremental_update = True
+    assert await home.restore_snapshot_async(reconcile=False)
+    assert {d.id: type(d) for d in home.devices} == {d.id: type(d) for d in fake_home.devices}
+    assert home.search_group_by_id(fake_home.groups[0].id).label == fake_home.groups[0].label
+    assert home.id == fake_home.id
+    assert home.state_from_snapshot
+    assert home.state_timestamp == fake_home.state_timestamp
+    assert home.snapshot_reconcile_task is None
+
+    # the background reconcile refreshes the restored objects like update_home
+    device = home.search_device_by_id("3014F7110000000000000031")
+    config["devices"][device.id]["label"] = "renamed"
+    download.return_value = RestResult(200, json=config, content=json.dumps(config).encode())
+    with patch.object(home, "_rest_call_async", new=download):
+        assert await home.restore_snapshot_async()
+        device = home.search_device_by_id(device.id)
+        assert await home.snapshot_reconcile_task
+    assert home.search_device_by_id(device.id) is device
+    assert device.label == "renamed"
+    assert home.last_state_changes.changed == [device]
+    assert not home.state_from_snapshot
+
+
+@pytest.mark.asyncio
+async def test_restore_snapshot_async_without_snapshot(fake_home: Home, tmp_path):
+    home = AsyncHome(fake_home._connection)
+    assert not await home.restore_snapshot_async()
+    home.snapshot_path = tmp_path / "missing.snapshot"
+    assert not await home.restore_snapshot_async()
+    (tmp_path / "damaged.snapshot").write_bytes(b"HMIPSNAP" + b"\0" * 30)
+    home.snapshot_path = tmp_path / "damaged.snapshot"
+    assert not await home.restore_snapshot_async()
+    assert home.devices == []
+    assert home.state_timestamp is None
+
+@pytest.mark.asyncio
+async def test_offline_fallback_serves_snapshot_and_queues_commands(fake_home: Home, tmp_path):
+    path = tmp_path / "state.snapshot"
+    fake_home.snapshot_path = path
+    config = _config_keyed_by_id()
+    with patch.object(fake_home, "_rest_call_async", new=AsyncMock(return_value=RestResult(200, json=config))):
+        await fake_home.get_current_state_async()
+
+    # the lookup fails, init_async falls back to the urls of the snapshot
+    home = AsyncHome()
+    home.snapshot_path = path
+    home.offline_fallback = True
+    ap_id = fake_home._connection_context.accesspoint_id
+    with patch(
+        "homematicip.connection.connection_context.ConnectionContextBuilder.build_context_async",
+        side_effect=httpx.ConnectError("lookup failed"),
+    ):
+        await home.init_async(ap_id, "auth_token")
+    assert home._connection_context.rest_url == fake_home._connection_context.rest_url
+    assert home._connection_context.websocket_url == fake_home._connection_context.websocket_url
+    assert home._connection_context.auth_token == "auth_token"
+
+    # the download fails, the home serves the snapshot and queues commands
+    home._connection = fake_home._connection
+    failed = AsyncMock(side_effect=HmipConnectionError("unreachable"))
+    with patch.object(home, "_download_current_state_async", new=failed), pytest.raises(HmipConnectionError):
+        await home.get_current_state_async()
+    assert home.offline
+    assert home.stale
+    assert home.state_age >= 0
+    device = home.search_device_by_id("3014F7110000000000000031")
+    assert device is not None
+    result = await device.set_label_async("renamed offline")
+    assert result.status == 202
+    assert not result.success
+    assert len(home.offline_commands) == 1
+
+    # the next download succeeds, the queued command is sent
+    with patch.object(home, "_rest_call_async", new=AsyncMock(return_value=RestResult(200, json=config))):
+        await home.get_current_state_async()
+    assert not home.offline
+    assert not home.stale
+    assert (await result.queued).success
+    assert await home.offline_flush_task
+    assert len(home.offline_commands) == 0
+
+
+@pytest.mark.asyncio
+async def test_offline_fallback_without_state(fake_home: Home):
+    home = AsyncHome(fake_home._connection)
+    home._connection_context = fake_home._connection_context
+    home.offline_fallback = True
+    failed = AsyncMock(side_effect=HmipConnectionError("unreachable"))
+    with patch.object(home, "_download_current_state_async", new=failed), pytest.raises(HmipConnectionError):
+        await home.get_current_state_async()
+    assert not home.offline
+    assert home.state_age is None
+
+    with patch(
+        "homematicip.connection.connection_context.ConnectionContextBuilder.build_context_async",
+        side_effect=httpx.ConnectError("lookup failed"),
+    ), pytest.raises(httpx.ConnectError):
+        await home.init_async("access_point_id")
+
+
+@pytest.mark.asyncio
+async def test_device_changed_skips_unchanged_channels(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000049")
+    channels = list(device.functionalChannels)
+    versions = [ch.version for ch in channels]
+    count = Counter(device.functionalChannelCount)
+
+    raw = json.loads(json.dumps(device._rawJSONData))
+    raw["functionalChannels"]["3"]["valveState"] = "ADAPTION_IN_PROGRESS"
+    channel_class = type(channels[1])
+    with patch.object(channel_class, "from_json", autospec=True, side_effect=channel_class.from_json) as parse:
+        await fake_home._ws_on_message(
+            json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}})
+        )
+    assert [call.args[0].index for call in parse.call_args_list] == [3]
+    assert device.functionalChannels == channels
+    assert [ch.version - v for ch, v in zip(channels, versions, strict=True)] == [1 if ch.index == 3 else 0 for ch in channels]
+    changed = next(ch for ch in channels if ch.index == 3)
+    assert changed.changed_fields == {"valveState"}
+    assert all(not ch.changed_fields for ch in channels if ch.index != 3)
+    assert all(ch._rawJSONData is device._rawJSONData["functionalChannels"][str(ch.index)] for ch in channels)
+    assert device.functionalChannelCount == count
+    assert device.get_functional_channel(changed.functionalChannelType, 3) is changed
+    assert device.get_functional_channel(FunctionalChannelType.SWITCH_CHANNEL, 3) is None
+
+
+def test_channel_index_is_kept_until_channels_are_assigned(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000049")
+    channels = list(device.functionalChannels)
+    # an unparseable channel is kept as None and must not make every lookup rebuild the index
+    device.functionalChannels = [*channels, None]
+    by_index = device._channels_by_index()
+    assert device._channels_by_index() is by_index
+    assert by_index == {ch.index: ch for ch in channels}
+
+    device.functionalChannels = channels[:1]
+    assert device._channels_by_index() == {channels[0].index: channels[0]}
+    assert device.get_functional_channel(channels[1].functionalChannelType, channels[1].index) is None
+
+
+@pytest.mark.asyncio
+async def test_device_changed_relinks_replaced_groups(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000148")
+    channel = device.functionalChannels[2]
+    (group,) = channel.groups
+    group_json = json.loads(json.dumps(group._rawJSONData))
+
+    events = {
+        "0": {"pushEventType": "GROUP_REMOVED", "id": group.id},
+        "1": {"pushEventType": "GROUP_ADDED", "group": group_json},
+    }
+    await fake_home._ws_on_message(json.dumps({"events": events}))
+    replaced = fake_home.search_group_by_id(group.id)
+    assert replaced is not group
+
+    # the channel json did not change, but its group is a new object now
+    raw = json.loads(json.dumps(device._rawJSONData))
+    raw["label"] = "renamed"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert channel.groups == [replaced]
+    assert channel.groups[0] is replaced
+
+
+def test_update_from_json_records_changed_fields(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    version = device.version
+    raw = json.loads(json.dumps(device._rawJSONData))
+    raw["label"] = "renamed"
+    raw["lastStatusUpdate"] += 1000
+
+    assert device.update_from_json(raw) == {"label", "lastStatusUpdate"}
+    assert device.changed_fields == {"label", "lastStatusUpdate"}
+    assert device.version == version + 1
+
+    assert device.update_from_json(json.loads(json.dumps(raw))) == frozenset()
+    assert device.changed_fields == frozenset()
+    assert device.version == version + 1
+
+
+@pytest.mark.asyncio
+async def test_device_changed_event_exposes_changed_fields(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    channel = device.functionalChannels[1]
+    version = device.version
+    channel_version = channel.version
+    updates = []
+
+    # handlers with the explicit signature of the update event keep working
+    def handler(data, event_type, obj):
+        updates.append(obj.changed_fields)
+
+    device.on_update(handler)
+
+    raw = json.loads(json.dumps(device._rawJSONData))
+    raw["functionalChannels"]["1"]["label"] = "renamed channel"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert updates == [{"functionalChannels"}]
+    assert channel.changed_fields == {"label"}
+    assert channel.version == channel_version + 1
+    assert device.version == version + 1
+
+    raw = json.loads(json.dumps(raw))
+    raw["label"] = "renamed"
+    raw["functionalChannels"]["1"]["label"] = "renamed again"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert updates[-1] == {"label", "functionalChannels"}
+    assert device.version == version + 2
+
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert updates[-1] == frozenset()
+    assert device.version == version + 2
+
+
+@pytest.mark.asyncio
+async def test_update_home_without_retained_raw_json(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    expected = str(device), [str(ch) for ch in device.functionalChannels]
+
+    fake_home.retain_raw_json = False
+    fake_home.update_home(_config_keyed_by_id())
+    assert not device._rawJSONData
+    assert all(not ch._rawJSONData for ch in device.functionalChannels)
+    assert (str(device), [str(ch) for ch in device.functionalChannels]) == expected
+
+    # without the raw json there is nothing to compare with, every device is parsed again
+    fake_home.update_home(_config_keyed_by_id(), incremental=True)
+    assert device in fake_home.last_state_changes.changed
+    assert not device._rawJSONData
+
+    payload = {"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": _config_keyed_by_id()["devices"][device.id]}}}
+    await fake_home._ws_on_message(json.dumps(payload))
+    assert not device._rawJSONData
+
+
+def test_handler_lists_and_attribute_names_are_shared(fake_home: Home):
+    devices = [d for d in fake_home.devices if d.deviceType == "PLUGABLE_SWITCH_MEASURING"]
+    assert devices[0]._on_update == ()
+    assert devices[0]._dictAttributes is devices[1]._dictAttributes
+    assert "_rawJSONData" not in devices[0].__dict__
+
+    handler = Mock()
+    devices[0].on_update(handler)
+    devices[0].fire_update_event()
+    handler.assert_called_once()
+    assert devices[1]._on_update == ()
+
+
+@pytest.mark.asyncio
+async def test_lazy_materialization(fake_home: Home):
+    config = _config_keyed_by_id()
+    expected = {d.id: (type(d), [str(ch) for ch in d.functionalChannels]) for d in fake_home.devices}
+    expected_groups = {g.id: sorted(d.id for d in g.devices) for g in fake_home.groups}
+
+    fake_home.lazy_materialization = True
+    fake_home.update_home(config, clear_config=True)
+    # groups link their devices, all others stay raw json
+    linked = {d.id for g in fake_home.groups for d in g.devices}
+    assert {d.id for d in fake_home._devices} == linked
+    assert len(fake_home._pending_devices) == len(expected) - len(linked)
+
+    device_id = next(iter(fake_home._pending_devices))
+    device = fake_home.search_device_by_id(device_id)
+    assert device_id not in fake_home._pending_devices
+    assert device._pending_channels is not None
+    assert device.functionalChannelCount
+    channel = fake_home.search_channel(device_id, 0)
+    assert channel is device.functionalChannels[0]
+    assert device._pending_channels is None
+
+    # events of devices nobody accessed or listens to only update the raw json
+    pending_id = next(iter(fake_home._pending_devices))
+    raw = json.loads(json.dumps(config["devices"][pending_id]))
+    raw["label"] = "renamed"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert fake_home._pending_devices[pending_id] is not config["devices"][pending_id]
+
+    # onEvent handlers get the id of the device instead of creating it
+    events = []
+    fake_home.onEvent += events.append
+    raw = json.loads(json.dumps(raw))
+    raw["label"] = "renamed again"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert fake_home._pending_devices[pending_id]["label"] == "renamed again"
+    assert events == [[{"eventType": EventType.DEVICE_CHANGED, "data": None, "id": pending_id}]]
+    assert fake_home.search_device_by_id(pending_id).label == "renamed again"
+
+    devices = fake_home.devices
+    assert not fake_home._pending_devices
+    assert len(fake_home.channels) == sum(len(v[1]) for v in expected.values())
+    actual = {d.id: (type(d), [str(ch) for ch in d.functionalChannels]) for d in devices}
+    assert actual.keys() == expected.keys()
+    assert all(actual[i][0] is expected[i][0] for i in expected)
+    assert {g.id: sorted(d.id for d in g.devices) for g in fake_home.groups} == expected_groups
+
+
 def test_search_channel_not_found(fake_home: Home):
     ch = fake_home.search_channel("3014F71100000000000WWRC6", 100)
     assert ch is None
@@ -984,6 +1706,141 @@ async def test_on_message_home_changed(fake_home):
     assert fake_handler.called
 
 
+@pytest.mark.asyncio
+async def test_websocket_events_are_routed_to_subscriptions(fake_home: Home):
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    group = fake_home.groups[0]
+    routed = {}
+
+    def record(name):
+        return lambda event: routed.setdefault(name, []).append(event)
+
+    fake_home.subscribe(record("device"), device_id=device.id)
+    fake_home.subscribe(record("channel"), channel=(device.id, 1))
+    fake_home.subscribe(record("other_channel"), channel=(device.id, 0))
+    fake_home.subscribe(record("group"), group_id=group.id)
+    fake_home.subscribe(record("home"), event_type=EventType.HOME_CHANGED)
+    fake_home.subscribe(record("devices"), object_type=BaseDevice)
+    other = fake_home.subscribe(record("unsubscribed"), device_id=device.id)
+    other.unsubscribe()
+
+    raw = json.loads(json.dumps(device._rawJSONData))
+    raw["functionalChannels"]["1"]["label"] = "renamed channel"
+    group_raw = json.loads(json.dumps(group._rawJSONData))
+    await fake_home._ws_on_message(json.dumps({"events": {
+        "0": {"pushEventType": "DEVICE_CHANGED", "device": raw},
+        "1": {"pushEventType": "GROUP_CHANGED", "group": group_raw},
+        "2": {"pushEventType": "DEVICE_CHANNEL_EVENT", "deviceId": device.id, "channelIndex": 1,
+              "channelEventType": "DOOR_BELL_SENSOR_EVENT"},
+    }}))
+
+    assert [(e.event_type, e.obj) for e in routed["device"]] == [
+        (EventType.DEVICE_CHANGED, device),
+        (EventType.DEVICE_CHANNEL_EVENT, device.functionalChannels[1]),
+    ]
+    assert routed["device"][0].changed_fields == {"functionalChannels"}
+    assert routed["device"][1].data.channelEventType == "DOOR_BELL_SENSOR_EVENT"
+    assert [(e.obj, e.changed_fields) for e in routed["channel"]] == [
+        (device.functionalChannels[1], {"label"}),
+        (device.functionalChannels[1], frozenset()),
+    ]
+    assert "other_channel" not in routed
+    assert [e.obj for e in routed["group"]] == [group]
+    assert "home" not in routed
+    assert "unsubscribed" not in routed
+    assert [e.obj for e in routed["devices"]] == [device]
+
+
+@pytest.mark.asyncio
+async def test_subscription_materializes_pending_device(fake_home: Home, mocker):
+    config = _config_keyed_by_id()
+    fake_home.lazy_materialization = True
+    fake_home.update_home(config, clear_config=True)
+    pending_id = next(iter(fake_home._pending_devices))
+    routed = []
+    fake_home.subscribe(routed.append, device_id=pending_id)
+
+    raw = json.loads(json.dumps(config["devices"][pending_id]))
+    raw["label"] = "renamed"
+    parse_device = mocker.spy(fake_home, "_parse_device")
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert pending_id not in fake_home._pending_devices
+    # the device is created from the event, the replaced raw json isn't parsed
+    parse_device.assert_called_once_with(raw)
+    assert [e.obj.label for e in routed] == ["renamed"]
+    assert routed[0].event_type == EventType.DEVICE_CHANGED
+    assert {"id", "label"} <= routed[0].changed_fields
+
+
+@pytest.mark.asyncio
+async def test_type_and_class_subscriptions_see_pending_devices(fake_home: Home):
+    config = _config_keyed_by_id()
+    fake_home.lazy_materialization = True
+    fake_home.update_home(config, clear_config=True)
+    pending = iter(fake_home._pending_devices)
+    first_id, second_id = next(pending), next(pending)
+
+    by_type = []
+    subscription = fake_home.subscribe(by_type.append, event_type=EventType.DEVICE_CHANGED)
+    raw = json.loads(json.dumps(config["devices"][first_id]))
+    raw["label"] = "renamed"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert first_id not in fake_home._pending_devices
+    assert [(e.obj.id, e.obj.label) for e in by_type] == [(first_id, "renamed")]
+    subscription.unsubscribe()
+
+    by_class = []
+    fake_home.subscribe(by_class.append, object_type=BaseDevice)
+    raw = json.loads(json.dumps(config["devices"][second_id]))
+    raw["label"] = "renamed"
+    await fake_home._ws_on_message(json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}}))
+    assert second_id not in fake_home._pending_devices
+    assert [e.obj.id for e in by_class] == [second_id]
+
+
+@pytest.mark.asyncio
+async def test_event_coalescing_window(fake_home: Home):
+    fake_home.event_coalescing_window = 0.05
+    device = fake_home.search_device_by_id("3014F7110000000000000031")
+    group = fake_home.groups[0]
+    updates = []
+    device.on_update(lambda *args, **kwargs: updates.append(device.label))
+    routed = []
+    fake_home.subscribe(routed.append, device_id=device.id)
+    events = []
+    fake_home.onEvent += events.append
+
+    raw = json.loads(json.dumps(device._rawJSONData))
+    for i in range(5):
+        raw["label"] = f"label {i}"
+        await fake_home._ws_on_message(
+            json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": raw}}})
+        )
+    assert device.label != "label 4"
+    assert updates == []
+    assert events == []
+
+    await asyncio.sleep(0.1)
+    assert device.label == "label 4"
+    assert updates == ["label 4"]
+    assert [(e.obj, e.collapsed) for e in routed] == [(device, 4)]
+    assert events == [[{"eventType": EventType.DEVICE_CHANGED, "data": device}]]
+    assert fake_home.coalesced_event_count == 4
+
+    # an event which can't be coalesced applies the deferred changes first
+    raw["label"] = "before removal"
+    group_raw = json.loads(json.dumps(group._rawJSONData))
+    await fake_home._ws_on_message(json.dumps({"events": {
+        "0": {"pushEventType": "DEVICE_CHANGED", "device": raw},
+        "1": {"pushEventType": "GROUP_CHANGED", "group": group_raw},
+        "2": {"pushEventType": "DEVICE_REMOVED", "id": device.id},
+    }}))
+    assert updates == ["label 4", "before removal"]
+    assert fake_home.search_device_by_id(device.id) is None
+    assert fake_home._deferred_events == {}
+    assert fake_home._deferred_events_timer is None
+
+
 async def test_websocket_channel_event(fake_home: Home):
     # preparing event data for channel event
     payload = {
@@ -1075,6 +1932,21 @@ async def test_enable_events():
         assert len(mock_websocket_handler.add_on_message_handler.mock_calls) == 2
 
 
+@pytest.mark.asyncio
+async def test_enable_events_with_aiohttp_session():
+    fake_home = Home()
+    fake_home._connection_context = Mock(spec=ConnectionContext)
+    mock_websocket_handler = Mock()
+    mock_websocket_handler.start = AsyncMock()
+    session = Mock()
+
+    with patch('homematicip.async_home.WebsocketHandler', return_value=mock_websocket_handler) as handler_class:
+        await fake_home.enable_events(aiohttp_client_session=session)
+
+    handler_class.assert_called_once_with(session)
+    mock_websocket_handler.start.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_enable_events_active():
     fake_home = Home()
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from homematicip.async_home import AsyncHome
+from homematicip.base.helpers import handle_config
+from homematicip.base.json_codec import (
+    JSON_CODECS,
+    JsonCodec,
+    default_json_codec,
+    get_json_codec,
+)
+from homematicip.connection.connection_context import ConnectionContext
+from homematicip.connection.websocket_handler import WebsocketHandler
+
+
+def _installed_codecs():
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _installed_codecs(), ids=lambda codec: codec.name)
+def test_codecs_agree_with_the_standard_library(codec):
+    with open("homematicip_demo/json_data/home.json", encoding="utf-8") as file:
+        content = file.read()
+    state = json.loads(content)
+
+    assert codec.loads(content) == state
+    assert codec.loads(content.encode()) == state
+    assert json.loads(codec.dumps(state)) == state
+    assert codec.dumps({"a": "b", "c": [1, None, True]}) == b'{"a":"b","c":[1,null,true]}'
+    assert codec.dumps({"label": "Küche"}) == '{"label":"Küche"}'.encode()
+    # config dumps do not depend on the installed backend
+    assert codec.dumps_pretty(state) == json.dumps(state, indent=4, sort_keys=True)
+    assert codec.dumps_pretty({"b": 1, "a": {"label": "Küche"}}) == JsonCodec().dumps_pretty(
+        {"b": 1, "a": {"label": "Küche"}}
+    )
+    # the backends word their errors differently, the standard library and orjson name the position
+    with pytest.raises(ValueError, match=r"\(char 0\)|truncated"):
+        codec.loads(b"")
+    with pytest.raises(ValueError, match=r"\(char 1\)|malformed"):
+        codec.loads("{not json")
+
+
+def test_codec_selection():
+    # every context and home gets a codec of its own
+    assert default_json_codec() is not default_json_codec()
+    assert default_json_codec().name == _installed_codecs()[0].name
+    assert type(get_json_codec("json")) is JsonCodec
+    with pytest.raises(ValueError, match="Unknown json codec 'yaml'"):
+        get_json_codec("yaml")
+    assert ConnectionContext().json_codec is not ConnectionContext().json_codec
+    assert type(ConnectionContext().json_codec) is type(default_json_codec())
+    home = AsyncHome()
+    assert home.json_codec is home.json_codec
+
+
+def test_home_json_codec_is_the_one_of_the_context():
+    codec = JsonCodec()
+    home = AsyncHome()
+    home.json_codec = codec
+    context = ConnectionContext(rest_url="http://asdf")
+    home.init_with_context(context)
+    assert context.json_codec is codec
+    assert home.json_codec is codec
+    websocket = WebsocketHandler()
+    websocket._apply_context_settings(context)
+    assert codec.loads == websocket.JSON_LOADS
+
+    other = JsonCodec()
+    home.json_codec = other
+    assert context.json_codec is other
+
+
+def test_handle_config_uses_the_codec():
+    class MarkedCodec(JsonCodec):
+        def dumps_pretty(self, obj):
+            return "marked " + super().dumps_pretty(obj)
+
+    assert handle_config({"b": 1, "a": 2}, False, MarkedCodec()) == 'marked {\n    "a": 2,\n    "b": 1\n}'
+    assert handle_config({"b": 1, "a": 2}, False) == '{\n    "a": 2,\n    "b": 1\n}'
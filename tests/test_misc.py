@@ -54,3 +54,18 @@ def test_auto_name_enum():
     assert DeviceType.from_str(None) is None
     assert DeviceType.from_str("I_DONT_EXIST", DeviceType.DEVICE) == DeviceType.DEVICE
     assert DeviceType.from_str("I_DONT_EXIST_EITHER") is None
+    assert DeviceType.from_str(DeviceType.PUSH_BUTTON) is DeviceType.PUSH_BUTTON
+    assert DeviceType.from_str({"not": "hashable"}) is None
+
+
+def test_auto_name_enum_unknown_values(caplog):
+    UNKNOWN_VALUES.clear()
+    for _ in range(3):
+        assert GroupType.from_str("NEW_GROUP_TYPE") is None
+    assert DeviceType.from_str("NEW_DEVICE_TYPE", DeviceType.DEVICE) == DeviceType.DEVICE
+
+    assert caplog.text.count("NEW_GROUP_TYPE") == 1
+    assert GroupType.unknown_values() == {"NEW_GROUP_TYPE": 3}
+    assert UNKNOWN_VALUES.seen() == {"GroupType": {"NEW_GROUP_TYPE": 3}, "DeviceType": {"NEW_DEVICE_TYPE": 1}}
+    UNKNOWN_VALUES.clear()
+    assert GroupType.unknown_values() == {}
@@ -0,0 +1,48 @@
+import marshal
+
+from homematicip.state_snapshot import (
+    dump_state,
+    read_snapshot,
+    snapshot_tag,
+    write_snapshot,
+)
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = tmp_path / "state.snapshot"
+    state = {"home": {"id": "home", "weather": None}, "devices": {"d1": {"label": "ä", "values": [1, 2.5, True]}}}
+
+    write_snapshot(path, dump_state(state), saved_at=1000.0)
+    snapshot = read_snapshot(path)
+    assert snapshot.json_state == state
+    assert snapshot.saved_at == 1000.0
+    assert snapshot.age > 0
+    assert snapshot.metadata == {}
+    assert not (tmp_path / "state.snapshot.tmp").exists()
+
+    write_snapshot(path, dump_state(state), metadata={"rest_url": "https://rest"})
+    assert read_snapshot(path).metadata == {"rest_url": "https://rest"}
+
+
+def test_snapshot_with_other_tag_or_damaged_is_ignored(tmp_path, monkeypatch):
+    path = tmp_path / "state.snapshot"
+    assert read_snapshot(path) is None
+
+    write_snapshot(path, dump_state({"home": {}}))
+    monkeypatch.setattr("homematicip.state_snapshot.snapshot_tag", lambda: snapshot_tag() + b";other")
+    assert read_snapshot(path) is None
+    monkeypatch.undo()
+    assert read_snapshot(path) is not None
+
+    path.write_bytes(path.read_bytes()[:-4])
+    assert read_snapshot(path) is None
+    path.write_bytes(b"something else entirely")
+    assert read_snapshot(path) is None
+
+    write_snapshot(path, marshal.dumps([1, 2, 3]))
+    assert read_snapshot(path) is None
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path, caplog):
+    assert read_snapshot(tmp_path) is None
+    assert "unreadable state snapshot" in caplog.text
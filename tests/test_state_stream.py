@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from homematicip.state_stream import StateStreamDecoder
+
+
+def _decode(body: bytes, chunk_size: int):
+    decoder = StateStreamDecoder()
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(decoder.feed(body[i:i + chunk_size]))
+    items.extend(decoder.close())
+    return decoder, items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1000, 1 << 20])
+def test_stream_decoder_yields_the_entries_in_order(chunk_size):
+    with open("homematicip_demo/json_data/home.json", "rb") as file:
+        body = file.read()
+    state = json.loads(body)
+
+    decoder, items = _decode(body, chunk_size)
+    rebuilt = {}
+    for key, id_, value in items:
+        if id_ is None:
+            rebuilt[key] = value
+        else:
+            rebuilt.setdefault(key, {})[id_] = value
+    assert rebuilt == state
+    assert [(key, id_) for key, id_, _ in items if key == "devices"] == [("devices", id_) for id_ in state["devices"]]
+    assert decoder.completed == {"clients", "devices", "groups", "home"}
+
+
+def test_stream_decoder_reports_completed_collections():
+    decoder = StateStreamDecoder()
+    assert decoder.feed(b' {"devices": {"d1": {"label": "K\xc3') == []
+    assert decoder.feed(b'\xbcche"}, "d2": {}') == [("devices", "d1", {"label": "Küche"})]
+    assert decoder.feed(b'}, "x": 1') == [("devices", "d2", {})]
+    assert decoder.completed == {"devices"}
+    # 1 could be the start of a longer number
+    assert decoder.feed(b"2") == []
+    assert decoder.feed(b', "groups": {}}') == [("x", None, 12)]
+    assert decoder.close() == []
+    assert decoder.completed == {"devices", "x", "groups"}
+
+
+@pytest.mark.parametrize(
+    ("body", "match"),
+    [
+        (b'{"devices": {"d1": {}}', "ended before the state was complete"),
+        (b'["devices"]', "Expected '{'"),
+        (b'{"devices" {}}', "Expected ':'"),
+        (b'{"a": 1} x', "Extra data"),
+        (b'{"a": tru}', "Expecting value"),
+    ],
+)
+def test_stream_decoder_rejects_broken_bodies(body, match):
+    with pytest.raises(ValueError, match=match):
+        _decode(body, 3)
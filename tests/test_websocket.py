@@ -1,6 +1,8 @@
 import asyncio
 import contextlib
+import json
 import time
+from typing import ClassVar
 from unittest.mock import AsyncMock, MagicMock
 
 import aiohttp
@@ -24,6 +26,12 @@ def _receive_side_effect(messages):
     return _receive
 
 
+async def _listen_and_dispatch(client, ws):
+    """Runs _listen with a dispatcher like _connect does and returns once the handlers are done."""
+    async with client._dispatching():
+        await client._listen(ws)
+
+
 @pytest.mark.asyncio
 async def test_add_on_message_handler():
     client = WebsocketHandler()
@@ -134,7 +142,7 @@ async def test_listen_calls_handlers():
         )
     )
 
-    await client._listen(ws_mock)
+    await _listen_and_dispatch(client, ws_mock)
 
     handler.assert_any_await("test")
     handler.assert_any_await("test2")
@@ -158,7 +166,7 @@ async def test_listen_stops_on_close_without_calling_handlers():
         )
     )
 
-    await client._listen(ws_mock)
+    await _listen_and_dispatch(client, ws_mock)
 
     handler.assert_not_awaited()
 
@@ -176,7 +184,7 @@ async def test_listen_logs_error_on_error_message(caplog):
     )
 
     with caplog.at_level("ERROR"):
-        await client._listen(ws_mock)
+        await _listen_and_dispatch(client, ws_mock)
 
     assert "Error in websocket" in caplog.text
 
@@ -195,7 +203,7 @@ async def test_listen_stale_timeout_triggers_close_and_warning(monkeypatch, capl
     )
 
     with caplog.at_level("WARNING"):
-        await client._listen(ws_mock)
+        await _listen_and_dispatch(client, ws_mock)
 
     ws_mock.close.assert_awaited_once()
     assert "stale-connection safety net" in caplog.text
@@ -229,12 +237,10 @@ def test_seconds_since_last_message_works_without_running_loop():
 
 
 @pytest.mark.asyncio
-async def test_connect_passes_enforce_ssl_false_to_ws_connect(monkeypatch):
+async def test_connect_passes_enforce_ssl_false_to_ws_connect():
     """When context.enforce_ssl=False and ssl_ctx is None, ws_connect must
     receive ssl=False. Regression: the handler used to pass only ssl_ctx
     (defaulting to True), ignoring context.enforce_ssl entirely."""
-    client = WebsocketHandler()
-    client.INITIAL_BACKOFF = 0  # don't sleep on the reconnect loop after our raise
     captured = {}
 
     class FakeSession:
@@ -249,10 +255,8 @@ async def test_connect_passes_enforce_ssl_false_to_ws_connect(monkeypatch):
             client._stop_event.set()
             raise TimeoutError("stop after capture")
 
-    monkeypatch.setattr(
-        "homematicip.connection.websocket_handler.aiohttp.ClientSession",
-        FakeSession,
-    )
+    client = WebsocketHandler(FakeSession())
+    client.INITIAL_BACKOFF = 0  # don't sleep on the reconnect loop after our raise
 
     context = MagicMock()
     context.websocket_url = "wss://example.invalid/ws"
@@ -268,10 +272,8 @@ async def test_connect_passes_enforce_ssl_false_to_ws_connect(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_connect_passes_ssl_ctx_when_provided(monkeypatch):
+async def test_connect_passes_ssl_ctx_when_provided():
     """When context.ssl_ctx is set, it takes precedence over enforce_ssl."""
-    client = WebsocketHandler()
-    client.INITIAL_BACKOFF = 0
     captured = {}
     sentinel = object()
 
@@ -287,10 +289,8 @@ async def test_connect_passes_ssl_ctx_when_provided(monkeypatch):
             client._stop_event.set()
             raise TimeoutError("stop after capture")
 
-    monkeypatch.setattr(
-        "homematicip.connection.websocket_handler.aiohttp.ClientSession",
-        FakeSession,
-    )
+    client = WebsocketHandler(FakeSession())
+    client.INITIAL_BACKOFF = 0
 
     context = MagicMock()
     context.websocket_url = "wss://example.invalid/ws"
@@ -305,14 +305,59 @@ async def test_connect_passes_ssl_ctx_when_provided(monkeypatch):
     assert captured["ssl"] is sentinel
 
 
+@pytest.mark.asyncio
+async def test_reconnect_does_not_wait_for_the_handlers():
+    release = asyncio.Event()
+    reconnected = asyncio.Event()
+    handled = []
+
+    async def slow_handler(data):
+        await release.wait()
+        handled.append(data)
+
+    class FakeWebsocket:
+        def __init__(self):
+            self.messages = [DummyMsg("m0", aiohttp.WSMsgType.TEXT), DummyMsg(None, aiohttp.WSMsgType.CLOSE)]
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def receive(self):
+            return self.messages.pop(0)
+
+    class FakeSession:
+        connects = 0
+
+        async def ws_connect(self, url, **kwargs):
+            self.connects += 1
+            if self.connects == 1:
+                return FakeWebsocket()
+            reconnected.set()
+            client._stop_event.set()
+            raise TimeoutError("stop after the reconnect")
+
+    client = WebsocketHandler(FakeSession())
+    client.INITIAL_BACKOFF = 0
+    client.add_on_message_handler(slow_handler)
+
+    task = asyncio.create_task(client._connect(_failing_context()))
+    await asyncio.wait_for(reconnected.wait(), 1)
+    # the message of the lost connection is still being handled
+    assert handled == []
+    assert not task.done()
+    release.set()
+    await asyncio.wait_for(task, 1)
+    assert handled == ["m0"]
+
+
 @pytest.mark.asyncio
 async def test_connect_relookups_host_after_repeated_failures(monkeypatch):
     """After RELOOKUP_AFTER_ATTEMPTS consecutive failures the handler re-resolves
     the cloud host and connects to the freshly looked-up url instead of retrying
     the dead one forever."""
-    client = WebsocketHandler()
-    client.INITIAL_BACKOFF = 0
-    client.RELOOKUP_AFTER_ATTEMPTS = 2
     tried = []
 
     class FakeSession:
@@ -328,10 +373,9 @@ async def test_connect_relookups_host_after_repeated_failures(monkeypatch):
                 client._stop_event.set()
             raise TimeoutError("dead host")
 
-    monkeypatch.setattr(
-        "homematicip.connection.websocket_handler.aiohttp.ClientSession",
-        FakeSession,
-    )
+    client = WebsocketHandler(FakeSession())
+    client.INITIAL_BACKOFF = 0
+    client.RELOOKUP_AFTER_ATTEMPTS = 2
 
     fresh = MagicMock()
     fresh.websocket_url = "wss://healthy.invalid/ws"
@@ -369,6 +413,133 @@ async def test_relookup_context_falls_back_on_error(monkeypatch):
     assert result is context
 
 
+class CountingSession:
+    """aiohttp.ClientSession whose connects fail, counting the sessions and connects"""
+
+    created: ClassVar[list["CountingSession"]] = []
+
+    def __init__(self, connector=None):
+        self.connector = connector
+        self.closed = False
+        self.urls = []
+        CountingSession.created.append(self)
+
+    async def ws_connect(self, url, **kwargs):
+        self.urls.append(url)
+        raise aiohttp.ClientConnectionError("cloud down")
+
+    async def close(self):
+        self.closed = True
+
+
+def _failing_context():
+    context = MagicMock()
+    context.websocket_url = "wss://dead.invalid/ws"
+    context.ssl_ctx = None
+    context.enforce_ssl = True
+    return context
+
+
+async def _connect_attempts(client: WebsocketHandler, attempts: int):
+    """runs the reconnect loop of client until it tried attempts more times"""
+    client.INITIAL_BACKOFF = 0
+    client._stop_event.clear()
+    attempts += client.reconnect_attempt_count()
+    reached = asyncio.Event()
+
+    def on_reconnect(reason):
+        if client.reconnect_attempt_count() >= attempts:
+            reached.set()
+
+    client.add_on_reconnect_handler(on_reconnect)
+    task = asyncio.create_task(client._connect(_failing_context()))
+    await reached.wait()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    client._on_reconnect_handler.remove(on_reconnect)
+
+
+@pytest.mark.asyncio
+async def test_owned_session_is_reused_across_reconnects(monkeypatch):
+    CountingSession.created = []
+    connectors = []
+
+    def connector(**kwargs):
+        connectors.append(kwargs)
+        return MagicMock()
+
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.ClientSession", CountingSession)
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.TCPConnector", connector)
+    client = WebsocketHandler()
+    client.RELOOKUP_AFTER_ATTEMPTS = 100
+
+    await _connect_attempts(client, 5)
+
+    assert len(CountingSession.created) == 1
+    session = CountingSession.created[0]
+    assert len(session.urls) >= 5
+    assert connectors == [{"use_dns_cache": True, "ttl_dns_cache": client.DNS_CACHE_TTL}]
+
+    await client.stop()
+    assert session.closed
+
+    # the next start opens a new session
+    await _connect_attempts(client, 1)
+    assert len(CountingSession.created) == 2
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_relookup_clears_the_dns_cache(monkeypatch):
+    CountingSession.created = []
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.ClientSession", CountingSession)
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.TCPConnector", MagicMock)
+    client = WebsocketHandler()
+    client.RELOOKUP_AFTER_ATTEMPTS = 2
+    client._relookup_context = AsyncMock(side_effect=lambda context: context)
+
+    await _connect_attempts(client, 3)
+
+    client._relookup_context.assert_awaited()
+    CountingSession.created[0].connector.clear_dns_cache.assert_called()
+    await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_external_session_is_used_and_left_open(monkeypatch):
+    CountingSession.created = []
+    external = CountingSession()
+    monkeypatch.setattr(
+        "homematicip.connection.websocket_handler.aiohttp.ClientSession",
+        MagicMock(side_effect=AssertionError("no session must be created")),
+    )
+    client = WebsocketHandler(external)
+
+    await _connect_attempts(client, 3)
+    await client.stop()
+
+    assert len(external.urls) >= 3
+    assert not external.closed
+
+
+@pytest.mark.asyncio
+async def test_closed_owned_session_is_replaced(monkeypatch):
+    CountingSession.created = []
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.ClientSession", CountingSession)
+    monkeypatch.setattr("homematicip.connection.websocket_handler.aiohttp.TCPConnector", MagicMock)
+    client = WebsocketHandler()
+
+    first = await client._get_session()
+    assert await client._get_session() is first
+    first.closed = True
+
+    second = await client._get_session()
+    assert second is not first
+    await client.close_session()
+    assert second.closed
+
+
 @pytest.mark.asyncio
 async def test_add_on_stale_handler_registers():
     client = WebsocketHandler()
@@ -483,3 +654,174 @@ async def test_staleness_monitor_resets_on_fresh_message():
     task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await task
+
+
+@pytest.mark.asyncio
+async def test_listen_keeps_receiving_while_a_handler_is_slow():
+    client = WebsocketHandler()
+    release = asyncio.Event()
+    handled = []
+
+    async def slow_handler(data):
+        await release.wait()
+        handled.append(data)
+
+    client.add_on_message_handler(slow_handler)
+    received = asyncio.Event()
+    messages = [DummyMsg(f"m{i}", type_=aiohttp.WSMsgType.TEXT) for i in range(3)]
+
+    async def _receive():
+        if messages:
+            return messages.pop(0)
+        received.set()
+        await release.wait()
+        return DummyMsg(None, type_=aiohttp.WSMsgType.CLOSE)
+
+    ws_mock = MagicMock()
+    ws_mock.receive = AsyncMock(side_effect=_receive)
+    listen = asyncio.create_task(_listen_and_dispatch(client, ws_mock))
+    await asyncio.wait_for(received.wait(), 1)
+    assert client.message_count() == 3
+    assert client.dispatch_stats().depth == 2
+    release.set()
+    await listen
+    assert handled == ["m0", "m1", "m2"]
+    stats = client.dispatch_stats()
+    assert stats.depth == 0
+    assert stats.max_depth >= 2
+    assert stats.max_lag > 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queue_overflow_policies():
+    from homematicip.base.enums import WebsocketOverflowPolicy
+    from homematicip.connection.dispatch_queue import DispatchQueue, entity_coalesce_key
+
+    queue = DispatchQueue(2, WebsocketOverflowPolicy.DROP_OLDEST)
+    for message in ("a", "b", "c"):
+        await queue.put(message)
+    assert queue.stats.dropped == 1
+    assert [await queue.get(), await queue.get()] == ["b", "c"]
+
+    def changed(device_id, label):
+        return json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": {"id": device_id, "label": label}}}})
+
+    queue = DispatchQueue(2, WebsocketOverflowPolicy.COALESCE)
+    await queue.put(changed("d1", "first"))
+    await queue.put(changed("d2", "first"))
+    await queue.put(changed("d1", "second"))
+    assert queue.stats.coalesced == 1
+    assert json.loads(await queue.get())["events"]["0"]["device"]["label"] == "second"
+
+    await queue.put(changed("d3", "first"))
+    await queue.put(changed("d3", "second"))
+    assert queue.stats.coalesced == 2
+
+    # without a queued message of the same entity COALESCE waits like BLOCK
+    blocked = asyncio.create_task(queue.put(changed("d4", "first")))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    assert json.loads(await queue.get())["events"]["0"]["device"]["id"] == "d2"
+    await blocked
+    assert queue.stats.blocked == 1
+    queue.close()
+    assert json.loads(await queue.get())["events"]["0"]["device"]["label"] == "second"
+    assert json.loads(await queue.get())["events"]["0"]["device"]["id"] == "d4"
+    assert await queue.get() is None
+
+    assert entity_coalesce_key(changed("d1", "x")) == ("DEVICE_CHANGED", "d1")
+    assert entity_coalesce_key("not json") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_handlers_keep_their_order_and_time_out_alone(caplog):
+    client = WebsocketHandler()
+    client.HANDLER_CONCURRENCY = 2
+    client.HANDLER_TIMEOUT = 0.2
+    calls = []
+    running = set()
+    overlapped = []
+
+    def make_handler(name, delay):
+        async def handler(data):
+            running.add(name)
+            overlapped.append(len(running))
+            await asyncio.sleep(delay)
+            running.discard(name)
+            calls.append((name, data))
+
+        handler.__name__ = name
+        return handler
+
+    async def hanging(data):
+        await asyncio.sleep(10)
+
+    client.add_on_message_handler(make_handler("slow", 0.02))
+    client.add_on_message_handler(make_handler("fast", 0))
+    client.add_on_message_handler(hanging)
+    client.add_on_message_handler(lambda data: calls.append(("sync", data)))
+    ws_mock = MagicMock()
+    ws_mock.receive = AsyncMock(
+        side_effect=_receive_side_effect(
+            [DummyMsg(f"m{i}", type_=aiohttp.WSMsgType.TEXT) for i in range(3)]
+            + [DummyMsg(None, type_=aiohttp.WSMsgType.CLOSE)]
+        )
+    )
+
+    with caplog.at_level("ERROR"):
+        await asyncio.wait_for(_listen_and_dispatch(client, ws_mock), 2)
+
+    for name in ("slow", "fast", "sync"):
+        assert [data for n, data in calls if n == name] == ["m0", "m1", "m2"]
+    # the fast handler is not held back by the slow one
+    assert calls.index(("fast", "m2")) < calls.index(("slow", "m2"))
+    assert max(overlapped) == 2
+    assert caplog.text.count("Handler 'hanging' timed out") == 3
+
+
+@pytest.mark.asyncio
+async def test_text_frames_are_decoded_once_for_all_handlers(fake_home):
+    from homematicip.base.enums import WebsocketOverflowPolicy
+    from homematicip.connection.websocket_message import ReadOnlyDict, WebsocketMessage
+
+    raw = fake_home.search_device_by_id("3014F711A000000BAD0C0DED")._rawJSONData
+    frame = json.dumps({"events": {"0": {"pushEventType": "DEVICE_CHANGED", "device": dict(raw, label="renamed")}}})
+    decodes = []
+
+    def loads(text):
+        decodes.append(text)
+        return json.loads(text)
+
+    seen = []
+
+    def additional_handler(message):
+        seen.append(message)
+
+    client = WebsocketHandler()
+    client.JSON_LOADS = loads
+    client.OVERFLOW_POLICY = WebsocketOverflowPolicy.COALESCE
+    client.add_on_message_handler(fake_home._ws_on_message)
+    client.add_on_message_handler(additional_handler)
+    ws_mock = MagicMock()
+    ws_mock.receive = AsyncMock(
+        side_effect=_receive_side_effect(
+            [DummyMsg(frame, type_=aiohttp.WSMsgType.TEXT), DummyMsg(None, type_=aiohttp.WSMsgType.CLOSE)]
+        )
+    )
+    await asyncio.wait_for(_listen_and_dispatch(client, ws_mock), 2)
+
+    assert decodes == [frame]
+    assert fake_home.search_device_by_id("3014F711A000000BAD0C0DED").label == "renamed"
+    (message,) = seen
+    assert isinstance(message, WebsocketMessage)
+    assert message == frame
+    assert type(message.raw) is str
+    assert message.raw == frame
+    event = message.json["events"]["0"]
+    assert isinstance(event, ReadOnlyDict)
+    assert event["device"]["label"] == "renamed"
+    with pytest.raises(TypeError):
+        event["device"]["label"] = "changed by a handler"
+    with pytest.raises(AttributeError):
+        message.json["events"].pop("0")
+    assert json.loads(message) == message.decoded()